@@ -0,0 +1,74 @@
+import time
+
+import numba
+import numpy as np
+import pandas as pd
+
+from evaluation import evaluation
+
+
+def random_walk_bars(number_bars: int) -> pd.DataFrame:
+    """
+    Random walk OHLC data with an ATR column, see ``benchmark_breakthroughs``.
+
+    Parameters
+    ----------
+    number_bars : int
+        How many candles to generate.
+
+    Returns
+    -------
+    pd.DataFrame
+        Open, high, low and ATR of every candle.
+    """
+    rng = np.random.default_rng(0)
+    open_array = 1000 + np.cumsum(rng.normal(0, 0.1, number_bars))
+    return pd.DataFrame(
+        {
+            "open": open_array,
+            "high": open_array + rng.exponential(0.1, number_bars),
+            "low": open_array - rng.exponential(0.1, number_bars),
+            "ATR": np.full(number_bars, 0.3),
+        }
+    )
+
+
+def benchmark_breakthroughs(number_bars: int = 500_000, repeats: int = 5) -> None:
+    """
+    Microbenchmark of the stop loss/take profit breakthrough kernels.
+
+    The first call includes compiling the kernels or loading them from the numba
+    cache. Tight margins are resolved by the linear scan after the entry candle, the
+    fast path; wide margins and a margin sweep by the sparse tables.
+
+    Parameters
+    ----------
+    number_bars : int, optional, default 500_000
+        Number of candles of the random walk.
+    repeats : int, optional, default 5
+        Number of timed calls of every case, the fastest one is reported.
+    """
+    bars = random_walk_bars(number_bars)
+    print(f"{number_bars} candles, {numba.get_num_threads()} numba threads")
+
+    t = time.perf_counter()
+    evaluation.first_passage_outcomes(bars, {"ATR": None})
+    print(f"{'first call (compile or cache)':<32}{time.perf_counter() - t:8.3f}s")
+
+    cases = {
+        "fast path, ATR": [{"ATR": None}],
+        "wide, percentage 1%": [{"percentage": 1}],
+        "wide, constant 3": [{"constant": 3}],
+        "sweep, 6 ATR margins": [{"ATR": m} for m in [0.5, 1, 1.5, 2, 2.5, 3]],
+    }
+    for case, margin_grid in cases.items():
+        timings = []
+        for _ in range(repeats):
+            t = time.perf_counter()
+            evaluation.first_passage_grid(bars, margin_grid)
+            timings.append(time.perf_counter() - t)
+        print(f"{case:<32}{min(timings):8.3f}s")
+
+
+if __name__ == "__main__":
+    benchmark_breakthroughs()
@@ -1,10 +1,10 @@
-import os
-
 import matplotlib.pyplot as plt
 import mplfinance as mpf
 import numpy as np
 import pandas as pd
-import pyarrow.parquet as pq
+
+from detection import pattern_registry
+from shared import pattern_matrix
 
 pd.options.mode.copy_on_write = True
 
@@ -44,46 +44,24 @@ reference_set = data[data.index < "2007-01-01"]
 main_set = data[data.index >= "2007-01-01"]
 main_set["idx"] = np.arange(len(main_set)) + 1
 
-for number, n in list(
-    zip(
-        [
-            "one",
-            "two",
-            "three",
-            "four",
-            "five",
-            "eight",
-            "ten",
-            "eleven",
-            "twelve",
-            "thirteen",
-        ],
-        [1, 2, 3, 4, 5, 8, 10, 11, 12, 13],
-        strict=False,
+header, data = pattern_matrix.read_pattern_matrix(
+    "src/data/runs/30c90d00_SPY_5min_SMA_monotonic/detection/1.patterns"
+)
+for i, pattern in enumerate(header["names"]):
+    n = pattern_registry.PATTERNS_BY_NAME[pattern]["number_candles"]
+    main_set["pattern"] = pattern_matrix.pattern_mask(header, data, i)
+    subset = main_set[main_set["pattern"]]
+    if len(subset) == 0:
+        continue
+    idx = subset.sample()["idx"].to_numpy()[0] - n
+    cm = 1 / 2.54
+    fig, axlist = mpf.plot(
+        main_set.iloc[idx : idx + n],
+        type="candle",
+        returnfig=True,
+        figsize=(14.8 * cm, 10.5 * cm),
+        axisoff=True,
     )
-):
-    for pattern in os.listdir(
-        f"src/data/runs/30c90d00_SPY_5min_SMA_monotonic/detection/{number}"
-    ):
-        main_set["pattern"] = (
-            pq.read_table(
-                f"src/data/runs/30c90d00_SPY_5min_SMA_monotonic/detection/{number}/{pattern}"
-            )
-            .to_pandas()
-            .set_index(main_set.index)
-        )
-        subset = main_set[main_set["pattern"]]
-        if len(subset) == 0:
-            continue
-        idx = subset.sample()["idx"].to_numpy()[0] - n
-        cm = 1 / 2.54
-        fig, axlist = mpf.plot(
-            main_set.iloc[idx : idx + n],
-            type="candle",
-            returnfig=True,
-            figsize=(14.8 * cm, 10.5 * cm),
-            axisoff=True,
-        )
-        plt.tight_layout()
-        fig.savefig(f"plots/{pattern.removesuffix('.parquet')}.pdf")
-        plt.close(fig)
+    plt.tight_layout()
+    fig.savefig(f"plots/{pattern}.pdf")
+    plt.close(fig)
@@ -0,0 +1,144 @@
+import os
+
+import numpy as np
+from scipy import sparse
+
+from shared import pattern_matrix
+
+
+def hit_matrix(
+    hit_indices: list[np.ndarray], number_bars: int, *, lag: int = 0
+) -> sparse.csr_array:
+    """
+    Builds a sparse matrix with a row per pattern and a column per bar.
+
+    Parameters
+    ----------
+    hit_indices : list[np.ndarray]
+        Sorted indices of the candles with a pattern, one array per pattern.
+    number_bars : int
+        Number of bars (candles).
+    lag : int, optional, default 0
+        Number of bars the patterns are moved back, so that column ``t`` holds the
+        patterns of bar ``t + lag``.
+
+    Returns
+    -------
+    sparse.csr_array
+        Matrix with a one where a pattern ends on a bar.
+    """
+    lagged_hits = [
+        pattern_hits[pattern_hits >= lag] - lag for pattern_hits in hit_indices
+    ]
+    indices = (
+        np.concatenate(lagged_hits) if lagged_hits else np.empty(0, dtype=np.int64)
+    )
+    return sparse.csr_array(
+        (
+            np.ones(len(indices), dtype=np.int64),
+            indices,
+            np.concatenate([[0], np.cumsum([len(hits) for hits in lagged_hits])]),
+        ),
+        shape=(len(hit_indices), number_bars),
+    )
+
+
+def co_occurrence(
+    hit_indices: list[np.ndarray], number_bars: int, *, lags: list[int]
+) -> np.ndarray:
+    """
+    Counts how often every pair of patterns occurs together, or a number of bars
+    apart, as products of sparse hit matrices.
+
+    Parameters
+    ----------
+    hit_indices : list[np.ndarray]
+        Sorted indices of the candles with a pattern, one array per pattern.
+    number_bars : int
+        Number of bars (candles).
+    lags : list[int]
+        Non-negative numbers of bars between the patterns.
+
+    Returns
+    -------
+    np.ndarray
+        Counts of shape (number of lags, number of patterns, number of patterns):
+        the number of bars on which pattern ``i`` ends with pattern ``j`` ending the
+        lag later. The transpose counts pattern ``j`` ending the lag earlier.
+    """
+    hits = hit_matrix(hit_indices, number_bars)
+    return np.stack(
+        [
+            (hits @ hit_matrix(hit_indices, number_bars, lag=lag).T).toarray()
+            for lag in lags
+        ]
+    )
+
+
+def jaccard(counts: np.ndarray) -> np.ndarray:
+    """
+    Calculates the Jaccard similarity of every pair of patterns.
+
+    Parameters
+    ----------
+    counts : np.ndarray
+        Co-occurrence counts of the patterns on the same bar, see ``co_occurrence``.
+
+    Returns
+    -------
+    np.ndarray
+        Number of bars with both patterns over the number of bars with either, NaN
+        if neither pattern occurs.
+    """
+    detected = np.diag(counts)
+    union = detected[:, None] + detected[None, :] - counts
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return counts / union
+
+
+def co_occurrence_analysis(*, run_name: str, lags: list[int]) -> None:
+    """
+    Analyses which patterns of a run occur together, from its detection files.
+
+    The counts of all splits are added up, lags do not cross splits.
+
+    Parameters
+    ----------
+    run_name : str
+        The run name.
+    lags : list[int]
+        Non-negative numbers of bars between the patterns, see ``co_occurrence``. The
+        patterns on the same bar are always counted.
+
+    Returns
+    -------
+    None
+        Outputs ``co_occurrence.npz`` to the analysis folder of the run, with the
+        pattern ``names``, the ``lags``, the ``counts`` for every lag and the
+        ``jaccard`` similarity.
+    """
+    lags = sorted({0, *lags})
+    folder = f"data/runs/{run_name}/detection"
+    counts = None
+    for file in sorted(os.listdir(folder)):
+        if not file.endswith(".patterns"):
+            continue
+        header, data = pattern_matrix.read_pattern_matrix(f"{folder}/{file}")
+        split_counts = co_occurrence(
+            [
+                pattern_matrix.pattern_hits(header, data, i)
+                for i in range(len(header["names"]))
+            ],
+            header["number_bars"],
+            lags=lags,
+        )
+        counts = split_counts if counts is None else counts + split_counts
+    os.makedirs(f"data/runs/{run_name}/analysis", exist_ok=True)
+    # The counts never exceed the number of bars.
+    np.savez_compressed(
+        f"data/runs/{run_name}/analysis/co_occurrence.npz",
+        names=np.array(header["names"]),
+        lags=np.array(lags),
+        counts=counts.astype(pattern_matrix.hit_dtype(int(counts.max(initial=0)))),
+        jaccard=jaccard(counts[0]).astype(np.float32),
+    )
@@ -1,8 +1,14 @@
+import json
+
 import numpy as np
 from scipy.stats import ks_2samp
 
 from shared import constants
 
+# Number of arrays in a tuple of length percentiles with the same body percentiles for
+# black and white candles.
+UNIFIED_PERCENTILE_LENGTH = 3
+
 
 def calculate_percentiles(df: np.ndarray) -> tuple:
     """
@@ -22,6 +28,92 @@ def calculate_percentiles(df: np.ndarray) -> tuple:
         Kolmogorov-Smirnov test), as well as lists of the 10th, 30th, 70th and 90th
         percentiles of the upper and lower shadows.
     """
+    return length_percentiles(
+        candle_lengths(df),
+        body_percentiles=constants.BODY_PERCENTILES,
+        shadow_percentiles=constants.SHADOW_PERCENTILES,
+    )
+
+
+def percentile_grid(df: np.ndarray, grid: list[dict]) -> dict[str, dict]:
+    """
+    Calibrates the data for several levels of the percentiles, measuring the candles
+    once.
+
+    Parameters
+    ----------
+    df : np.ndarray
+        An array containing OHLC (Open, High, Low, Close) data.
+    grid : list[dict]
+        Levels of the ``"body"`` and ``"shadow"`` percentiles, like
+        ``constants.BODY_PERCENTILES`` and ``constants.SHADOW_PERCENTILES``.
+
+    Returns
+    -------
+    dict[str, dict]
+        Calibration by tag of the levels, see ``grid_tag`` and
+        ``resolve_calibration``.
+
+    Raises
+    ------
+    ValueError
+        If levels have a different number of percentiles than the candle classes.
+    """
+    lengths = candle_lengths(df)
+    calibrations = {}
+    for levels in grid:
+        if len(levels["body"]) != len(constants.BODY_PERCENTILES) or len(
+            levels["shadow"]
+        ) != len(constants.SHADOW_PERCENTILES):
+            raise ValueError(
+                f"Levels {levels} need {len(constants.BODY_PERCENTILES)} body and "
+                f"{len(constants.SHADOW_PERCENTILES)} shadow percentiles."
+            )
+        calibrations[grid_tag(levels)] = resolve_calibration(
+            length_percentiles(
+                lengths,
+                body_percentiles=levels["body"],
+                shadow_percentiles=levels["shadow"],
+            )
+        )
+    return calibrations
+
+
+def grid_tag(levels: dict) -> str:
+    """
+    Names levels of the percentiles of ``percentile_grid``.
+
+    Parameters
+    ----------
+    levels : dict
+        The ``"body"`` and ``"shadow"`` percentiles.
+
+    Returns
+    -------
+    str
+        Tag such as ``"body_10-30-70_shadow_10-30-70-90"``.
+    """
+    return "_".join(
+        f"{part}_{'-'.join(map(str, levels[part]))}" for part in ["body", "shadow"]
+    )
+
+
+def candle_lengths(df: np.ndarray) -> dict[str, np.ndarray | bool]:
+    """
+    Measures the bodies and shadows of the candles, see ``calculate_percentiles``.
+
+    Parameters
+    ----------
+    df : np.ndarray
+        An array containing OHLC (Open, High, Low, Close) data.
+
+    Returns
+    -------
+    dict[str, np.ndarray | bool]
+        Lengths of the black, white and all bodies and of the upper and lower
+        shadows, and whether the black and white bodies have a different
+        distribution.
+    """
 
     def body_length(OP: np.ndarray, C: np.ndarray) -> np.ndarray:
         return np.abs(OP - C)
@@ -41,19 +133,150 @@ def calculate_percentiles(df: np.ndarray) -> tuple:
     white_idx = C > OP
     black_lengths = body_length(OP[black_idx], C[black_idx])
     white_lengths = body_length(OP[white_idx], C[white_idx])
-    combined_lengths = body_length(OP, C)
-    upper_shadow_lengths = upper_shadow_length(OP, H, C)
-    lower_shadow_lengths = lower_shadow_length(OP, L, C)
+    return {
+        "black": black_lengths,
+        "white": white_lengths,
+        "combined": body_length(OP, C),
+        "upper_shadow": upper_shadow_length(OP, H, C),
+        "lower_shadow": lower_shadow_length(OP, L, C),
+        "split": ks_2samp(black_lengths, white_lengths).pvalue
+        < constants.ONE_STAR_SIGNIFICANCE,
+    }
 
-    if ks_2samp(black_lengths, white_lengths).pvalue < constants.ONE_STAR_SIGNIFICANCE:
+
+def length_percentiles(
+    lengths: dict[str, np.ndarray | bool],
+    *,
+    body_percentiles: list[float],
+    shadow_percentiles: list[float],
+) -> tuple:
+    """
+    Calculates the percentiles of measured candles, see ``calculate_percentiles``.
+
+    Parameters
+    ----------
+    lengths : dict[str, np.ndarray | bool]
+        Candle lengths, see ``candle_lengths``.
+    body_percentiles : list[float]
+        Percentiles of the body lengths.
+    shadow_percentiles : list[float]
+        Percentiles of the shadow lengths.
+
+    Returns
+    -------
+    tuple
+        Tuple of length percentiles.
+    """
+    if lengths["split"]:
         return (
-            np.percentile(black_lengths, constants.BODY_PERCENTILES),
-            np.percentile(white_lengths, constants.BODY_PERCENTILES),
-            np.percentile(upper_shadow_lengths, constants.SHADOW_PERCENTILES),
-            np.percentile(lower_shadow_lengths, constants.SHADOW_PERCENTILES),
+            np.percentile(lengths["black"], body_percentiles),
+            np.percentile(lengths["white"], body_percentiles),
+            np.percentile(lengths["upper_shadow"], shadow_percentiles),
+            np.percentile(lengths["lower_shadow"], shadow_percentiles),
         )
     return (
-        np.percentile(combined_lengths, constants.BODY_PERCENTILES),
-        np.percentile(upper_shadow_lengths, constants.SHADOW_PERCENTILES),
-        np.percentile(lower_shadow_lengths, constants.SHADOW_PERCENTILES),
+        np.percentile(lengths["combined"], body_percentiles),
+        np.percentile(lengths["upper_shadow"], shadow_percentiles),
+        np.percentile(lengths["lower_shadow"], shadow_percentiles),
+    )
+
+
+def resolve_calibration(percentile: tuple) -> dict[str, np.ndarray]:
+    """
+    Resolves the thresholds of the candle classes from the length percentiles, so
+    that classifying a candle compares it to a single threshold.
+
+    Parameters
+    ----------
+    percentile : tuple
+        Tuple of length percentiles, see ``calculate_percentiles``.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Calibration with the thresholds:
+
+        * ``"black_body"``, ``"white_body"``: the lower bounds of the short, normal
+          and tall bodies of that color, the same for both colors if the body
+          percentiles are unified;
+        * ``"short_body"``: the lower and upper bound of short bodies of either
+          color;
+        * ``"doji"``: the upper bound of doji bodies;
+        * ``"near"``: the relative distance below which prices are near;
+        * ``"upper_shadow"``, ``"lower_shadow"``: the upper bounds of the no, small,
+          normal and long shadows.
+    """
+    black = np.asarray(percentile[0], dtype=float)
+    if len(percentile) == UNIFIED_PERCENTILE_LENGTH:
+        white = black
+        doji, near = black[0], black[1]
+    else:
+        white = np.asarray(percentile[1], dtype=float)
+        doji, near = (black[0] + white[0]) / 2, (black[1] + white[1]) / 2
+    return {
+        "black_body": black,
+        "white_body": white,
+        "short_body": np.array(
+            [max(black[0], white[0]), min(black[1], white[1])], dtype=float
+        ),
+        "doji": np.float64(doji),
+        "near": np.float64(near),
+        "upper_shadow": np.asarray(percentile[-2], dtype=float),
+        "lower_shadow": np.asarray(percentile[-1], dtype=float),
+    }
+
+
+def save_calibration(path: str, calibration: dict[str, np.ndarray]) -> None:
+    """
+    Writes a calibration to disk as JSON, which also identifies it in cache keys.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+    calibration : dict[str, np.ndarray]
+        Calibration, see ``resolve_calibration``.
+    """
+    with open(path, "w") as file:
+        file.write(calibration_json(calibration))
+
+
+def load_calibration(path: str) -> dict[str, np.ndarray]:
+    """
+    Reads a calibration written by ``save_calibration``.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Calibration, see ``resolve_calibration``.
+    """
+    with open(path) as file:
+        return {
+            name: np.asarray(value, dtype=float)[()]
+            for name, value in json.load(file).items()
+        }
+
+
+def calibration_json(calibration: dict[str, np.ndarray]) -> str:
+    """
+    Serializes a calibration, with the thresholds in a fixed order.
+
+    Parameters
+    ----------
+    calibration : dict[str, np.ndarray]
+        Calibration, see ``resolve_calibration``.
+
+    Returns
+    -------
+    str
+        JSON of the thresholds by name, equal for equal calibrations.
+    """
+    return json.dumps(
+        {name: np.asarray(value).tolist() for name, value in calibration.items()},
+        sort_keys=True,
     )
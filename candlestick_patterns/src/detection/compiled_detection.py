@@ -0,0 +1,1212 @@
+import ast
+import functools
+import itertools
+import re
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import numba
+import numpy as np
+
+from detection.patterns.functions import candlestick_functions as cf
+
+# Largest number of candles a pattern looks back, the thirteen candle patterns look
+# back twelve candles.
+MAX_LAG = 12
+
+COMPARISONS = {
+    ast.Lt: "<",
+    ast.LtE: "<=",
+    ast.Gt: ">",
+    ast.GtE: ">=",
+    ast.Eq: "==",
+    ast.NotEq: "!=",
+}
+OPERATORS = {ast.Add: "+", ast.Sub: "-", ast.Mult: "*", ast.Div: "/"}
+THRESHOLD_NAMES = ["near", *(f"{s}_{k}" for s in ["us", "ls"] for k in range(4))]
+LOGICAL_OPERATORS = {ast.BitAnd: "and", ast.BitOr: "or"}
+FUNCTIONS = ["max", "min", "mean", "abs"]
+# Features of the candles passed to the gap helpers, e.g. ``up_body_gap(c1, c2)``.
+CANDLE_ARGUMENTS = {
+    "down_shadow_gap": (["low"], ["high"]),
+    "up_shadow_gap": (["high"], ["low"]),
+    "down_body_gap": (["open", "close"], ["open", "close"]),
+    "up_body_gap": (["open", "close"], ["open", "close"]),
+}
+# Operations where the order of the operands does not matter, and comparisons that
+# are rewritten with their operands swapped, so more sub-expressions can be shared.
+COMMUTATIVE = {"and", "or", "max", "min", "+", "*", "==", "!="}
+MIRRORED = {">": "<", ">=": "<="}
+NUMPY_OPERATIONS = {
+    "<": np.less,
+    "<=": np.less_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "==": np.equal,
+    "!=": np.not_equal,
+    "+": np.add,
+    "-": np.subtract,
+    "*": np.multiply,
+    "/": np.divide,
+    "and": np.logical_and,
+    "or": np.logical_or,
+    "not": np.logical_not,
+    "max": np.maximum,
+    "min": np.minimum,
+    "abs": np.abs,
+}
+# Lookup table of every candle class feature, by candle code.
+CODE_TABLES = cf.code_features(np.arange(2**cf.CODE_BITS, dtype=np.uint16))
+# Number of candles the numpy backend evaluates at once, which bounds the memory
+# used by the intermediate arrays.
+NUMPY_CHUNK_SIZE = 65_536
+# Number of candles the selective backend measures the selectivity of the conditions
+# on, evenly spread over the data.
+SELECTIVITY_SAMPLE_SIZE = 4096
+# Above this fraction of candidates, gathering their features costs more than
+# evaluating a condition on all candles.
+SPARSE_FRACTION = 0.25
+
+# Scalar versions of the helpers in ``candlestick_functions`` that are not (or not
+# with these arguments) part of the candle features.
+HELPER_EXPRESSIONS = {
+    "near": lambda x, y: (
+        "compare",
+        "<",
+        ("arith", "/", ("abs", ("arith", "-", x, y)), ("max", (x, y))),
+        ("threshold", "near"),
+    ),
+    "near_up": lambda x, y: (
+        "and",
+        (HELPER_EXPRESSIONS["near"](x, y), ("compare", "<", x, y)),
+    ),
+    "down_shadow_gap": lambda first_L, second_H: ("compare", ">", first_L, second_H),
+    "up_shadow_gap": lambda first_H, second_L: ("compare", "<", first_H, second_L),
+    "down_body_gap": lambda first_O, first_C, second_O, second_C: (
+        "compare",
+        ">",
+        ("min", (first_O, first_C)),
+        ("max", (second_O, second_C)),
+    ),
+    "up_body_gap": lambda first_O, first_C, second_O, second_C: (
+        "compare",
+        "<",
+        ("max", (first_O, first_C)),
+        ("min", (second_O, second_C)),
+    ),
+    "body_height": lambda OP, C: ("abs", ("arith", "-", OP, C)),
+    "upper_shadow_length": lambda OP, H, C: ("arith", "-", H, ("max", (OP, C))),
+    "lower_shadow_length": lambda OP, L, C: ("arith", "-", ("min", (OP, C)), L),
+}
+for _shadow, _length in [("us", "upper_shadow_length"), ("ls", "lower_shadow_length")]:
+    HELPER_EXPRESSIONS[f"no_{_shadow}"] = lambda *args, s=_shadow, f=_length: (
+        "compare",
+        "<=",
+        HELPER_EXPRESSIONS[f](*args),
+        ("threshold", f"{s}_0"),
+    )
+    for _k, _size in enumerate(["small", "normal", "long"]):
+        HELPER_EXPRESSIONS[f"{_size}_{_shadow}"] = (
+            lambda *args, s=_shadow, f=_length, k=_k: (
+                "and",
+                (
+                    (
+                        "compare",
+                        ">",
+                        HELPER_EXPRESSIONS[f](*args),
+                        ("threshold", f"{s}_{k}"),
+                    ),
+                    (
+                        "compare",
+                        "<=",
+                        HELPER_EXPRESSIONS[f](*args),
+                        ("threshold", f"{s}_{k + 1}"),
+                    ),
+                ),
+            )
+        )
+    HELPER_EXPRESSIONS[f"exlong_{_shadow}"] = lambda *args, s=_shadow, f=_length: (
+        "compare",
+        ">",
+        HELPER_EXPRESSIONS[f](*args),
+        ("threshold", f"{s}_3"),
+    )
+
+
+def thresholds(calibration: dict) -> dict[str, float | np.ndarray]:
+    """
+    Names the thresholds of a calibration used by the compiled helper expressions.
+
+    Parameters
+    ----------
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``, or of a panel of
+        assets, see ``candlestick_functions.panel_calibration``.
+
+    Returns
+    -------
+    dict[str, float | np.ndarray]
+        Threshold for ``near`` and the upper/lower shadow thresholds. Of shape
+        (number of assets, 1) for a panel.
+    """
+    return {
+        "near": calibration["near"],
+        **{f"us_{k}": value for k, value in enumerate(calibration["upper_shadow"])},
+        **{f"ls_{k}": value for k, value in enumerate(calibration["lower_shadow"])},
+    }
+
+
+def spec_expression(spec: dict) -> tuple:
+    """
+    Translates a pattern definition into an expression tree.
+
+    Every leaf refers to a candle feature at a given lag (number of candles before
+    the current one), a constant, a percentile threshold or a mean.
+
+    Parameters
+    ----------
+    spec : dict
+        Pattern definition, see ``pattern_specs``.
+
+    Returns
+    -------
+    tuple
+        Nested tuples describing the pattern.
+
+    Raises
+    ------
+    ValueError
+        If the definition uses a construct the compiler does not know about.
+    """
+    number_candles = spec["candles"]
+
+    def candle_lag(node: ast.expr) -> int | None:
+        if (
+            isinstance(node, ast.Name)
+            and re.fullmatch(r"c\d+", node.id)
+            and 1 <= int(node.id[1:]) <= number_candles
+        ):
+            return number_candles - int(node.id[1:])
+        return None
+
+    def translate(node: ast.expr) -> tuple:  # noqa: PLR0911, PLR0912
+        if isinstance(node, ast.Attribute) and candle_lag(node.value) is not None:
+            return ("field", node.attr, candle_lag(node.value))
+        if isinstance(node, ast.Constant):
+            return ("const", node.value)
+        if (
+            isinstance(node, ast.UnaryOp)
+            and isinstance(node.op, ast.USub)
+            and isinstance(node.operand, ast.Constant)
+        ):
+            return ("const", -node.operand.value)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Invert):
+            return ("not", translate(node.operand))
+        if isinstance(node, ast.Compare) and len(node.ops) == 1:
+            return (
+                "compare",
+                COMPARISONS[type(node.ops[0])],
+                translate(node.left),
+                translate(node.comparators[0]),
+            )
+        if isinstance(node, ast.BinOp) and type(node.op) in OPERATORS:
+            return (
+                "arith",
+                OPERATORS[type(node.op)],
+                translate(node.left),
+                translate(node.right),
+            )
+        if isinstance(node, ast.BinOp) and type(node.op) in LOGICAL_OPERATORS:
+            kind = LOGICAL_OPERATORS[type(node.op)]
+            children = []
+            for child in map(translate, [node.left, node.right]):
+                children += child[1] if child[0] == kind else [child]
+            return (kind, tuple(children))
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            name = node.func.id
+            if name == "abs":
+                return ("abs", translate(node.args[0]))
+            if name in FUNCTIONS:
+                return (name, tuple(translate(arg) for arg in node.args))
+            if name in HELPER_EXPRESSIONS:
+                args = []
+                for position, arg in enumerate(node.args):
+                    lag = candle_lag(arg)
+                    if lag is None or name not in CANDLE_ARGUMENTS:
+                        args.append(translate(arg))
+                    else:
+                        args += [
+                            ("field", field, lag)
+                            for field in CANDLE_ARGUMENTS[name][position]
+                        ]
+                return HELPER_EXPRESSIONS[name](*args)
+        raise ValueError(f"Cannot compile `{ast.unparse(node)}`.")
+
+    conditions = [
+        translate(ast.parse(condition, mode="eval").body)
+        for condition in spec["conditions"]
+    ]
+    return ("and", tuple(conditions)) if len(conditions) > 1 else conditions[0]
+
+
+def fold_codes(expression: tuple) -> tuple:  # noqa: PLR0911
+    """
+    Replaces the candle classes in an expression tree by lookups of candle codes.
+
+    Every class feature, and every combination of class features of the same candle
+    with and, or and not, becomes a single lookup table indexed by the code of that
+    candle, see ``candlestick_functions.candle_codes``. Only the relations between
+    prices remain numeric.
+
+    Parameters
+    ----------
+    expression : tuple
+        Expression tree, see ``spec_expression``.
+
+    Returns
+    -------
+    tuple
+        Expression tree where the candle classes are ``("code", table, lag)`` nodes,
+        with as table the bytes of a boolean array with an entry for every code.
+    """
+    kind = expression[0]
+    if kind == "field" and expression[1] in CODE_TABLES:
+        return ("code", CODE_TABLES[expression[1]].tobytes(), expression[2])
+    if kind == "not":
+        operand = fold_codes(expression[1])
+        if operand[0] == "code":
+            table = np.frombuffer(operand[1], dtype=bool)
+            return ("code", np.logical_not(table).tobytes(), operand[2])
+        return ("not", operand)
+    if kind in {"and", "or"}:
+        tables, operands = {}, []
+        for operand in map(fold_codes, expression[1]):
+            if operand[0] == "code":
+                table = np.frombuffer(operand[1], dtype=bool)
+                tables[operand[2]] = (
+                    NUMPY_OPERATIONS[kind](tables[operand[2]], table)
+                    if operand[2] in tables
+                    else table
+                )
+            else:
+                operands.append(operand)
+        operands = [
+            ("code", table.tobytes(), lag) for lag, table in sorted(tables.items())
+        ] + operands
+        return operands[0] if len(operands) == 1 else (kind, tuple(operands))
+    if kind in {"compare", "arith"}:
+        return (kind, expression[1], *map(fold_codes, expression[2:]))
+    if kind == "abs":
+        return (kind, fold_codes(expression[1]))
+    if kind in {"max", "min"}:
+        return (kind, tuple(map(fold_codes, expression[1])))
+    return expression
+
+
+def evaluation_plan(
+    expressions: list[tuple],
+) -> tuple[list[tuple], list[tuple[int, int]]]:
+    """
+    Merges the expression trees of all patterns into one evaluation plan.
+
+    Every distinct sub-expression becomes one step of the plan, shared by all
+    patterns using it. Sub-expressions that only differ by a lag share a step as
+    well: ``near(c1.close, c2.close)`` of a two candle pattern is the same step as
+    ``near(c2.close, c3.close)`` of a three candle pattern, read one candle later.
+
+    Parameters
+    ----------
+    expressions : list[tuple]
+        Expression trees of the patterns, see ``spec_expression``.
+
+    Returns
+    -------
+    tuple[list[tuple], list[tuple[int, int]]]
+        Steps, in an order where operands come before the steps using them. A step is
+        a tuple ``(kind, argument, operands)``, with the feature, constant, threshold
+        name or fields of the mean as argument of the leaves, the operator of
+        comparisons and arithmetic, the table of code lookups, and the operands as
+        ``(step, lag)`` (lag None for scalars). Then the step and lag of every
+        pattern.
+    """
+    steps, index = [], {}
+
+    def visit(node: tuple) -> tuple[int, int | None]:
+        kind = node[0]
+        if kind == "field":
+            step, lag = (kind, node[1], ()), node[2]
+        elif kind in {"const", "threshold", "mean"}:
+            step, lag = (kind, node[1], ()), None
+        else:
+            if kind in {"compare", "arith"}:
+                operator, operands = node[1], node[2:]
+                if operator in MIRRORED:
+                    operator, operands = MIRRORED[operator], operands[::-1]
+            elif kind in {"not", "abs"}:
+                operator, operands = None, node[1:]
+            elif kind == "code":
+                operator, operands = node[1], [("field", "code", node[2])]
+            else:
+                operator, operands = None, node[1]
+            visited = [visit(operand) for operand in operands]
+            lag = min((lag for _, lag in visited if lag is not None), default=None)
+            visited = tuple(
+                (operand, None if operand_lag is None else operand_lag - lag)
+                for operand, operand_lag in visited
+            )
+            if operator in COMMUTATIVE:
+                visited = tuple(sorted(visited))
+            elif kind in COMMUTATIVE:
+                visited = tuple(sorted(set(visited)))
+            step = (kind, operator, visited)
+        if step not in index:
+            index[step] = len(steps)
+            steps.append(step)
+        return index[step], lag
+
+    outputs = [visit(expression) for expression in expressions]
+    return steps, outputs
+
+
+def run_plan(
+    plan: tuple[list[tuple], list[tuple[int, int]]],
+    padded: dict[str, np.ndarray],
+    scalars: dict[int, float],
+    out: np.ndarray,
+) -> None:
+    """
+    Evaluates an evaluation plan with numpy, one step at a time.
+
+    A step is computed once for all candles and read at the lags the patterns need,
+    through views. Intermediate arrays are released after their last use. Time is
+    along the last axis of the candle features, so a panel with one row per asset is
+    evaluated at once.
+
+    Parameters
+    ----------
+    plan : tuple[list[tuple], list[tuple[int, int]]]
+        Steps and patterns, see ``evaluation_plan``.
+    padded : dict[str, np.ndarray]
+        Candle features preceded by ``MAX_LAG`` missing values (NaN or False).
+    scalars : dict[int, float | np.ndarray]
+        Value of the constants, thresholds and means, by step. Thresholds of a panel
+        have one row per asset.
+    out : np.ndarray
+        Boolean matrix of shape (number of candles, number of patterns), preceded by
+        the asset axis for a panel, filled in place.
+    """
+    steps, outputs = plan
+    length = out.shape[-2] + MAX_LAG
+    last_use = {
+        operand: i
+        for i, (_, _, operands) in enumerate(steps)
+        for operand, _ in operands
+    }
+    columns = {}
+    for column, (step, lag) in enumerate(outputs):
+        columns.setdefault(step, []).append((column, lag))
+
+    # Every array covers the padded candles from its start on, the first candles are
+    # missing when they would look back before the padding.
+    values = {}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for i, (kind, argument, operands) in enumerate(steps):
+            if kind == "field":
+                values[i] = (padded[argument], 0)
+            elif not operands:
+                values[i] = (scalars[i], None)
+            else:
+                start = max(
+                    (
+                        values[operand][1] + lag
+                        for operand, lag in operands
+                        if lag is not None
+                    ),
+                    default=None,
+                )
+                args = [
+                    values[operand][0]
+                    if lag is None
+                    else values[operand][0][
+                        ...,
+                        start - lag - values[operand][1] : length
+                        - lag
+                        - values[operand][1],
+                    ]
+                    for operand, lag in operands
+                ]
+                if kind == "code":
+                    value = np.frombuffer(argument, dtype=bool)[args[0]]
+                elif kind in {"not", "abs"}:
+                    value = NUMPY_OPERATIONS[kind](args[0])
+                else:
+                    value = functools.reduce(NUMPY_OPERATIONS[argument or kind], args)
+                values[i] = (value, start)
+            for column, lag in columns.get(i, []):
+                value, start = values[i]
+                out[..., column] = value[
+                    ..., MAX_LAG - lag - start : length - lag - start
+                ]
+            if i not in last_use:
+                del values[i]
+            for operand, _ in operands:
+                if last_use[operand] == i:
+                    values.pop(operand, None)
+
+
+def expression_nodes(expression: tuple) -> Iterator[tuple]:
+    """
+    Walks an expression tree.
+
+    Parameters
+    ----------
+    expression : tuple
+        Expression tree, see ``spec_expression``.
+
+    Yields
+    ------
+    tuple
+        Every node of the tree, parents before their operands. Means are leaves.
+    """
+    yield expression
+    kind = expression[0]
+    if kind in {"compare", "arith"}:
+        operands = expression[2:]
+    elif kind in {"not", "abs"}:
+        operands = expression[1:]
+    elif kind in {"and", "or", "max", "min"}:
+        operands = expression[1]
+    else:
+        operands = ()
+    for operand in operands:
+        yield from expression_nodes(operand)
+
+
+def evaluate_expression(  # noqa: PLR0911
+    expression: tuple,
+    padded: dict[str, np.ndarray],
+    scalars: dict,
+    index: np.ndarray | slice,
+) -> np.ndarray | float:
+    """
+    Evaluates an expression tree on some of the candles only.
+
+    Parameters
+    ----------
+    expression : tuple
+        Expression tree, see ``spec_expression`` and ``fold_codes``.
+    padded : dict[str, np.ndarray]
+        Candle features preceded by ``MAX_LAG`` missing values, see
+        ``pad_features``.
+    scalars : dict
+        Value of every threshold by name and of every mean by its argument.
+    index : np.ndarray | slice
+        Indices of the candles to evaluate, or a slice of consecutive candles, which
+        reads the features through views.
+
+    Returns
+    -------
+    np.ndarray | float
+        Value of the expression for every candle in ``index``, or a scalar.
+    """
+    kind = expression[0]
+    if kind in {"field", "code"}:
+        offset = MAX_LAG - expression[2]
+        lagged_index = (
+            slice(index.start + offset, index.stop + offset)
+            if isinstance(index, slice)
+            else index + offset
+        )
+    if kind == "field":
+        return padded[expression[1]][lagged_index]
+    if kind == "code":
+        return np.frombuffer(expression[1], dtype=bool)[padded["code"][lagged_index]]
+    if kind == "const":
+        return expression[1]
+    if kind in {"threshold", "mean"}:
+        return scalars[expression[1]]
+    if kind in {"compare", "arith"}:
+        return NUMPY_OPERATIONS[expression[1]](
+            *(
+                evaluate_expression(operand, padded, scalars, index)
+                for operand in expression[2:]
+            )
+        )
+    if kind in {"not", "abs"}:
+        return NUMPY_OPERATIONS[kind](
+            evaluate_expression(expression[1], padded, scalars, index)
+        )
+    return functools.reduce(
+        NUMPY_OPERATIONS[kind],
+        (
+            evaluate_expression(operand, padded, scalars, index)
+            for operand in expression[1]
+        ),
+    )
+
+
+def run_selective(
+    conditions: dict[str, list[tuple[str, tuple]]],
+    padded: dict[str, np.ndarray],
+    scalars: dict,
+    out: np.ndarray,
+    *,
+    workers: int = 1,
+) -> dict[str, list[dict]]:
+    """
+    Evaluates the conditions of every pattern in order of selectivity, each on the
+    candles that passed the previous ones.
+
+    The selectivity of a condition is the fraction of a sample of candles passing
+    it, so the order adapts to the data. Conditions are ordered by their cost (the
+    number of operations) divided by the fraction of the candles they rule out,
+    which puts cheap conditions that rule out most candles first. A rare pattern is
+    then only evaluated in full on a few candidates. The first condition is
+    evaluated on all candles, and shared by all patterns starting with it, as are
+    conditions with more than ``SPARSE_FRACTION`` of the candles as candidates.
+
+    Parameters
+    ----------
+    conditions : dict[str, list[tuple[str, tuple]]]
+        Source and expression tree of the conditions of every pattern, see
+        ``pattern_specs``, ``spec_expression`` and ``fold_codes``.
+    padded : dict[str, np.ndarray]
+        Candle features preceded by ``MAX_LAG`` missing values, see
+        ``pad_features``.
+    scalars : dict
+        Value of every threshold by name and of every mean by its argument.
+    out : np.ndarray
+        Boolean matrix of shape (number of candles, number of patterns), filled in
+        place.
+    workers : int, optional, default 1
+        Number of threads, which evaluate different patterns.
+
+    Returns
+    -------
+    dict[str, list[dict]]
+        Statistics of the conditions of every pattern, in evaluation order, with keys
+        ``condition`` (source), ``sample_pass_rate`` (fraction of the sample passing
+        the condition on its own), ``evaluated`` (number of candles evaluated) and
+        ``passed`` (number of those passing).
+    """
+    length = out.shape[0]
+    sample = np.arange(0, length, max(1, length // SELECTIVITY_SAMPLE_SIZE))
+    pass_rates, first_conditions = {}, {}
+
+    def run_pattern(column: int, pattern_conditions: list[tuple[str, tuple]]) -> list:
+        ranks = []
+        for source, expression in pattern_conditions:
+            if expression not in pass_rates:
+                pass_rates[expression] = float(
+                    np.mean(evaluate_expression(expression, padded, scalars, sample))
+                )
+            pass_rate = pass_rates[expression]
+            cost = sum(
+                node[0] not in {"const", "threshold", "mean"}
+                for node in expression_nodes(expression)
+            )
+            ranks.append(
+                (
+                    cost / (1 - pass_rate) if pass_rate < 1 else np.inf,
+                    source,
+                    expression,
+                    pass_rate,
+                )
+            )
+        ranks.sort(key=lambda rank: rank[0])
+
+        statistics = []
+        candidates = None
+        for _, source, expression, pass_rate in ranks:
+            if statistics and len(candidates) < length * SPARSE_FRACTION:
+                passed = evaluate_expression(expression, padded, scalars, candidates)
+            elif statistics:
+                passed = evaluate_expression(
+                    expression, padded, scalars, slice(0, length)
+                )[candidates]
+            else:
+                if expression not in first_conditions:
+                    first_conditions[expression] = np.flatnonzero(
+                        evaluate_expression(
+                            expression, padded, scalars, slice(0, length)
+                        )
+                    )
+                passed = first_conditions[expression]
+            statistics.append(
+                {
+                    "condition": source,
+                    "sample_pass_rate": pass_rate,
+                    "evaluated": length if candidates is None else len(candidates),
+                }
+            )
+            candidates = passed if candidates is None else candidates[passed]
+            statistics[-1]["passed"] = len(candidates)
+        if candidates is not None:
+            out[candidates, column] = True
+        return statistics
+
+    def run_pattern_quietly(
+        column: int, pattern_conditions: list[tuple[str, tuple]]
+    ) -> list:
+        # The error state is per thread, NaNs are compared like in the pattern
+        # functions.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return run_pattern(column, pattern_conditions)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        statistics = executor.map(
+            run_pattern_quietly, range(out.shape[1]), conditions.values()
+        )
+        return dict(zip(conditions, statistics, strict=True))
+
+
+def kernel_source(
+    plan: tuple[list[tuple], list[tuple[int, int]]],
+    *,
+    fields: dict[str, tuple[str, int]],
+    means: dict[tuple, int],
+    tables: dict[bytes, int],
+) -> str:
+    """
+    Generates the source of a kernel evaluating all patterns in a single pass.
+
+    Every step the patterns need is computed once per candle and lag, and kept in a
+    local variable.
+
+    Parameters
+    ----------
+    plan : tuple[list[tuple], list[tuple[int, int]]]
+        Steps and patterns, see ``evaluation_plan``.
+    fields : dict[str, tuple[str, int]]
+        Padded array (``"values"`` for float features, ``"flags"`` for boolean ones
+        and ``"codes"`` for the candle codes) and column of every candle feature.
+    means : dict[tuple, int]
+        Index of every precomputed mean in the means array.
+    tables : dict[bytes, int]
+        Row of every code lookup table in the tables array.
+
+    Returns
+    -------
+    str
+        Source of the kernel function.
+    """
+    steps, outputs = plan
+    needed = set()
+
+    def need(step: int, lag: int | None) -> None:
+        if (step, lag) not in needed:
+            needed.add((step, lag))
+            for operand, operand_lag in steps[step][2]:
+                need(operand, None if operand_lag is None else lag + operand_lag)
+
+    for step, lag in outputs:
+        need(step, lag)
+
+    def emit(step: int, lag: int | None) -> str:
+        kind, argument, _ = steps[step]
+        if kind == "field":
+            array, column = fields[argument]
+            return f"{array}[i + {MAX_LAG - lag}, {column}]"
+        if kind == "const":
+            return repr(argument)
+        if kind == "threshold":
+            return f"thresholds[{THRESHOLD_NAMES.index(argument)}]"
+        if kind == "mean":
+            return f"means[{means[argument]}]"
+        return f"x{step}" if lag is None else f"x{step}_{lag}"
+
+    def define(step: int, lag: int | None) -> str:
+        kind, argument, operands = steps[step]
+        args = [
+            emit(operand, None if operand_lag is None else lag + operand_lag)
+            for operand, operand_lag in operands
+        ]
+        if kind in {"and", "or"}:
+            # Bitwise operators keep the kernel free of branches, which compiles a
+            # lot faster than short-circuiting ``and``/``or``.
+            return "(" + (" & " if kind == "and" else " | ").join(args) + ")"
+        if kind == "not":
+            return f"(not {args[0]})"
+        if kind == "abs":
+            return f"abs({args[0]})"
+        if kind == "code":
+            return f"tables[{tables[argument]}, {args[0]}]"
+        if kind in {"compare", "arith"}:
+            return f"({args[0]} {argument} {args[1]})"
+        # "max" and "min", which propagate NaNs like np.maximum and np.minimum
+        *rest, out = args
+        for arg in reversed(rest):
+            out = f"_{kind}imum({arg}, {out})"
+        return out
+
+    lines = [
+        "def kernel(values, flags, codes, thresholds, means, tables, out):",
+        "    for i in range(out.shape[0]):",
+    ]
+    lines += [
+        f"        {emit(step, lag)} = {define(step, lag)}"
+        for step, lag in sorted(needed, key=lambda node: (node[0], node[1] or 0))
+        if steps[step][2]
+    ]
+    lines += [
+        f"        out[i, {column}] = {emit(step, lag)}"
+        for column, (step, lag) in enumerate(outputs)
+    ]
+    return "\n".join(lines)
+
+
+@numba.njit
+def _maximum(x: float, y: float) -> float:
+    if np.isnan(x) or np.isnan(y):
+        return np.nan
+    return max(x, y)
+
+
+@numba.njit
+def _minimum(x: float, y: float) -> float:
+    if np.isnan(x) or np.isnan(y):
+        return np.nan
+    return min(x, y)
+
+
+def compile_kernel(
+    plan: tuple[list[tuple], list[tuple[int, int]]],
+    *,
+    fields: dict[str, tuple[str, int]],
+    means: dict[tuple, int],
+    tables: dict[bytes, int],
+) -> Callable:
+    """
+    Compiles an evaluation plan into a single numba kernel.
+
+    Parameters
+    ----------
+    plan : tuple[list[tuple], list[tuple[int, int]]]
+        Steps and patterns, see ``evaluation_plan``.
+    fields : dict[str, tuple[str, int]]
+        Padded array and column of every candle feature.
+    means : dict[tuple, int]
+        Index of every precomputed mean in the means array.
+    tables : dict[bytes, int]
+        Row of every code lookup table in the tables array.
+
+    Returns
+    -------
+    Callable
+        The compiled kernel.
+    """
+    namespace = {"_maximum": _maximum, "_minimum": _minimum}
+    exec(kernel_source(plan, fields=fields, means=means, tables=tables), namespace)
+    return numba.njit(error_model="numpy", nogil=True)(namespace["kernel"])
+
+
+def pad_features(
+    feature_dict: dict[str, np.ndarray], fields: list[str]
+) -> dict[str, np.ndarray]:
+    """
+    Precedes the candle features with ``MAX_LAG`` missing candles.
+
+    Parameters
+    ----------
+    feature_dict : dict[str, np.ndarray]
+        Candle features, with time along the last axis.
+    fields : list[str]
+        Features to pad.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Padded features: float features with NaN, boolean features with False and
+        candle codes with 0. Codes are indices into the lookup tables, which numpy
+        looks up fastest as ``np.intp``.
+    """
+    padded = {}
+    for field in fields:
+        feature = feature_dict[field]
+        if feature.dtype.kind == "u":
+            feature = feature.astype(np.intp)
+        missing = np.full(
+            (*feature.shape[:-1], MAX_LAG), np.nan if feature.dtype.kind == "f" else 0
+        )
+        padded[field] = np.concatenate(
+            (missing.astype(feature.dtype), feature), axis=-1
+        )
+    return padded
+
+
+_plans = {}
+_kernels = {}
+_conditions = {}
+
+
+def pattern_plan(specs: dict[str, dict]) -> tuple[list[tuple], list[tuple[int, int]]]:
+    """
+    Builds the evaluation plan of the patterns, once per process.
+
+    Parameters
+    ----------
+    specs : dict[str, dict]
+        Definition of every pattern by name, see ``pattern_specs``.
+
+    Returns
+    -------
+    tuple[list[tuple], list[tuple[int, int]]]
+        Steps and patterns, see ``evaluation_plan``.
+    """
+    key = tuple(specs)
+    if key not in _plans:
+        _plans[key] = evaluation_plan(
+            [fold_codes(spec_expression(spec)) for spec in specs.values()]
+        )
+    return _plans[key]
+
+
+def plan_kernel(
+    specs: dict[str, dict], feature_dict: dict[str, np.ndarray]
+) -> tuple[Callable, dict[str, tuple[str, int]], dict[bytes, int]]:
+    """
+    Compiles the kernel of the evaluation plan of the patterns, once per process.
+
+    Parameters
+    ----------
+    specs : dict[str, dict]
+        Definition of every pattern by name, see ``pattern_specs``.
+    feature_dict : dict[str, np.ndarray]
+        Candle features and codes, only their types are used.
+
+    Returns
+    -------
+    tuple[Callable, dict[str, tuple[str, int]], dict[bytes, int]]
+        The kernel, the padded array and column of every candle feature and the row
+        of every code lookup table, see ``compile_kernel``.
+    """
+    key = tuple(specs)
+    if key not in _kernels:
+        plan = pattern_plan(specs)
+        steps, _ = plan
+        used_fields = sorted(
+            {argument for kind, argument, _ in steps if kind == "field"}
+        )
+        fields = {}
+        for array, dtype_kind in [("values", "f"), ("flags", "b"), ("codes", "u")]:
+            fields |= {
+                field: (array, column)
+                for column, field in enumerate(
+                    f for f in used_fields if feature_dict[f].dtype.kind == dtype_kind
+                )
+            }
+        means, tables = (
+            {
+                argument: index
+                for index, argument in enumerate(
+                    argument for kind, argument, _ in steps if kind == step_kind
+                )
+            }
+            for step_kind in ["mean", "code"]
+        )
+        _kernels[key] = (
+            compile_kernel(plan, fields=fields, means=means, tables=tables),
+            fields,
+            tables,
+        )
+    return _kernels[key]
+
+
+def kernel_arrays(
+    fields: dict[str, tuple[str, int]], rows: int
+) -> dict[str, np.ndarray]:
+    """
+    Allocates the candle feature arrays of a kernel, filled with missing candles.
+
+    Parameters
+    ----------
+    fields : dict[str, tuple[str, int]]
+        Array and column of every candle feature, see ``plan_kernel``.
+    rows : int
+        Number of candles.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        ``"values"`` filled with NaN, ``"flags"`` with False and ``"codes"`` with 0.
+    """
+    return {
+        array: np.full(
+            (rows, sum(a == array for a, _ in fields.values())), fill, dtype=dtype
+        )
+        for array, fill, dtype in [
+            ("values", np.nan, float),
+            ("flags", False, bool),
+            ("codes", 0, np.uint16),
+        ]
+    }
+
+
+def table_array(tables: dict[bytes, int]) -> np.ndarray:
+    """
+    Stacks the code lookup tables of a kernel.
+
+    Parameters
+    ----------
+    tables : dict[bytes, int]
+        Row of every code lookup table.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean array of shape (number of tables, number of codes).
+    """
+    return np.array(
+        [np.frombuffer(table, dtype=bool) for table in tables], dtype=bool
+    ).reshape(len(tables), 2**cf.CODE_BITS)
+
+
+def detect(
+    specs: dict[str, dict],
+    feature_dict: dict[str, np.ndarray],
+    calibration: dict,
+    *,
+    backend: str = "numba",
+    workers: int = 1,
+) -> np.ndarray:
+    """
+    Detects patterns by evaluating their definitions as a single evaluation plan.
+
+    * "numpy": evaluates the steps of the plan one at a time on all candles, of all
+    assets at once for a panel.
+    * "numba": compiles the plan into a kernel that evaluates all steps candle by
+    candle. Compiling takes a while, but only happens once per process.
+    Both backends release the GIL, so with multiple workers the candles are split
+    into chunks that are processed by a pool of threads.
+
+    Parameters
+    ----------
+    specs : dict[str, dict]
+        Definition of every pattern by name, see ``pattern_specs``.
+    feature_dict : dict[str, np.ndarray]
+        Candle features, see ``candlestick_functions.numeric_features``, and the
+        candle codes as ``"code"``, see ``candlestick_functions.candle_codes``. Of
+        shape (number of assets, number of candles) for a panel.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``, and
+        ``candlestick_functions.panel_calibration`` for a panel.
+    backend : {"numba", "numpy"}, optional, default "numba"
+        How the plan is evaluated.
+    workers : int, optional, default 1
+        Number of threads.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean matrix of shape (number of candles, number of patterns), preceded by
+        the asset axis for a panel, in column major order so every pattern is
+        contiguous.
+
+    Raises
+    ------
+    ValueError
+        If the backend is unknown.
+    """
+    plan = pattern_plan(specs)
+    steps, outputs = plan
+
+    # A single asset is evaluated as a panel of one asset.
+    panel = feature_dict["open"].ndim > 1
+    feature_dict = {
+        name: np.atleast_2d(feature) for name, feature in feature_dict.items()
+    }
+    number_assets, length = feature_dict["open"].shape
+
+    threshold_values = thresholds(calibration)
+    scalars = {}
+    for i, (kind, argument, _) in enumerate(steps):
+        if kind == "const":
+            scalars[i] = argument
+        elif kind == "threshold":
+            scalars[i] = threshold_values[argument]
+        elif kind == "mean":
+            scalars[i] = np.mean(
+                [cf.shift(feature_dict[field], lag) for _, field, lag in argument]
+            )
+
+    if backend == "numpy":
+        padded = pad_features(
+            feature_dict, [argument for kind, argument, _ in steps if kind == "field"]
+        )
+        out = np.zeros((number_assets, length, len(outputs)), dtype=bool, order="F")
+        number_chunks = max(workers, -(-length * number_assets // NUMPY_CHUNK_SIZE))
+        tasks = [
+            (slice(None), start, stop)
+            for start, stop in itertools.pairwise(
+                np.linspace(0, length, number_chunks + 1, dtype=int)
+            )
+        ]
+
+        def run_chunk(assets: slice, start: int, stop: int) -> None:
+            run_plan(
+                plan,
+                {
+                    field: array[assets, start : stop + MAX_LAG]
+                    for field, array in padded.items()
+                },
+                scalars,
+                out[assets, start:stop],
+            )
+
+    elif backend == "numba":
+        kernel, fields, tables = plan_kernel(specs, feature_dict)
+
+        # The assets follow each other, each preceded by its own missing candles.
+        rows = MAX_LAG + length
+        arrays = kernel_arrays(fields, number_assets * rows)
+        for field, (array, column) in fields.items():
+            arrays[array].reshape(number_assets, rows, -1)[:, MAX_LAG:, column] = (
+                feature_dict[field]
+            )
+        means_array = np.array(
+            [scalars[i] for i, (kind, _, _) in enumerate(steps) if kind == "mean"],
+            dtype=float,
+        )
+        thresholds_array = np.column_stack(
+            [
+                np.broadcast_to(np.reshape(threshold_values[n], -1), number_assets)
+                for n in THRESHOLD_NAMES
+            ]
+        )
+        tables_array = table_array(tables)
+        out = np.zeros((number_assets, length, len(outputs)), dtype=bool)
+        tasks = [
+            (asset, start, stop)
+            for asset in range(number_assets)
+            for start, stop in itertools.pairwise(
+                np.linspace(0, length, -(-workers // number_assets) + 1, dtype=int)
+            )
+        ]
+
+        def run_chunk(asset: int, start: int, stop: int) -> None:
+            # Row slices keep every array C-contiguous, so all chunks share one
+            # compiled version of the kernel.
+            first, last = asset * rows + start, asset * rows + stop + MAX_LAG
+            kernel(
+                arrays["values"][first:last],
+                arrays["flags"][first:last],
+                arrays["codes"][first:last],
+                thresholds_array[asset],
+                means_array,
+                tables_array,
+                out[asset, start:stop],
+            )
+
+    else:
+        raise ValueError(f"Unknown backend {backend}.")
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(run_chunk, *zip(*tasks, strict=True)))
+    out = np.asfortranarray(out)
+    return out if panel else out[0]
+
+
+def selective_conditions(spec: dict) -> list[tuple[str, tuple]]:
+    """
+    Translates the conditions of a pattern definition separately, for
+    ``run_selective``.
+
+    Conditions only on the classes of the same candle are merged into a single code
+    lookup, which costs as much as one of them and is more selective.
+
+    Parameters
+    ----------
+    spec : dict
+        Pattern definition, see ``pattern_specs``.
+
+    Returns
+    -------
+    list[tuple[str, tuple]]
+        Source and expression tree of every condition, see ``fold_codes``.
+    """
+    tables, conditions = {}, []
+    for condition in spec["conditions"]:
+        expression = fold_codes(spec_expression({**spec, "conditions": [condition]}))
+        if expression[0] == "code":
+            sources, table = tables.get(expression[2], ([], True))
+            tables[expression[2]] = (
+                [*sources, condition],
+                np.frombuffer(expression[1], dtype=bool) & table,
+            )
+        else:
+            conditions.append((condition, expression))
+    return [
+        (" & ".join(sources), ("code", table.tobytes(), lag))
+        for lag, (sources, table) in sorted(tables.items())
+    ] + conditions
+
+
+def detect_selective(
+    specs: dict[str, dict],
+    feature_dict: dict[str, np.ndarray],
+    calibration: dict,
+    *,
+    workers: int = 1,
+) -> tuple[np.ndarray, dict[str, list[dict]]]:
+    """
+    Detects patterns by evaluating their conditions in order of selectivity, each
+    only on the candles passing the previous ones, see ``run_selective``.
+
+    Unlike ``detect``, conditions are not shared between patterns beyond the first
+    one, but a rare pattern is only evaluated in full on a few candidates.
+
+    Parameters
+    ----------
+    specs : dict[str, dict]
+        Definition of every pattern by name, see ``pattern_specs``.
+    feature_dict : dict[str, np.ndarray]
+        Candle features and codes, as for ``detect``.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
+    workers : int, optional, default 1
+        Number of threads, which evaluate different patterns.
+
+    Returns
+    -------
+    tuple[np.ndarray, dict[str, list[dict]]]
+        Boolean matrix of shape (number of candles, number of patterns), in column
+        major order, and the statistics of the conditions of every pattern by name.
+    """
+    length = len(feature_dict["open"])
+    key = tuple(specs)
+    if key not in _conditions:
+        _conditions[key] = {
+            name: selective_conditions(spec) for name, spec in specs.items()
+        }
+    conditions = _conditions[key]
+    scalars = thresholds(calibration)
+    for pattern_conditions in conditions.values():
+        for _, expression in pattern_conditions:
+            for kind, argument, *_ in expression_nodes(expression):
+                if kind == "mean":
+                    scalars[argument] = np.mean(
+                        [
+                            cf.shift(feature_dict[field], lag)
+                            for _, field, lag in argument
+                        ]
+                    )
+    out = np.zeros((length, len(specs)), dtype=bool, order="F")
+    statistics = run_selective(
+        conditions,
+        pad_features(
+            feature_dict,
+            list(
+                {
+                    "code" if node[0] == "code" else node[1]: None
+                    for pattern_conditions in conditions.values()
+                    for _, expression in pattern_conditions
+                    for node in expression_nodes(expression)
+                    if node[0] in {"field", "code"}
+                }
+            ),
+        ),
+        scalars,
+        out,
+        workers=workers,
+    )
+    return out, statistics
@@ -1,32 +1,28 @@
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
-import pyarrow.parquet
-from word2number import w2n
-
-from detection.patterns import (
-    eight_patterns,  # noqa: F401
-    eleven_patterns,  # noqa: F401
-    five_patterns,  # noqa: F401
-    four_patterns,  # noqa: F401
-    one_patterns,  # noqa: F401
-    ten_patterns,  # noqa: F401
-    thirteen_patterns,  # noqa: F401
-    three_patterns,  # noqa: F401
-    twelve_patterns,  # noqa: F401
-    two_patterns,  # noqa: F401
-)
+
+from detection import compiled_detection, pattern_registry
+from detection.patterns.functions import candlestick_functions as cf
 from indicators import filtering
-from shared import constants, shared_functions
+from shared import pattern_matrix, shared_functions
 
 
 def detection(  # noqa: PLR0913
     df: pd.DataFrame,
-    percentile: tuple,
+    calibration: dict,
     data_gap_handling: str,
     *,
     run_name: str,
     filter_kwargs: dict,
     split: int,
+    engine: str,
+    workers: int,
+    patterns: list[dict],
+    storage: str = "hits",
 ) -> None:
     """
     Performs pattern detection.
@@ -35,105 +31,642 @@ def detection(  # noqa: PLR0913
     ----------
     df : pd.DataFrame
         A Dataframe with OHLC data.
-    percentile : tuple
-        Tuple of length percentiles.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
     data_gap_handling : {"exclude", "ignore", "only"}
         Mode of handling gaps in the data.
+    engine : {"functions", "numpy", "numba", "selective"}
+        Detection engine, see ``detect_patterns``.
+    workers : int
+        Number of threads used for detection.
+    patterns : list[dict]
+        Patterns to detect, see ``pattern_registry.select_patterns``.
+    storage : {"hits", "packed"}, optional, default "hits"
+        Layout of the output file, see ``pattern_matrix``.
 
     Returns
     -------
     None
-        Outputs the 309 candlestick patterns to disk in `.parquet` format.
+        Outputs the candlestick patterns of the split to disk as a single pattern
+        matrix, see ``pattern_matrix``.
+
+    Raises
+    ------
+    ValueError
+        If the storage layout is unknown.
     """
-    column_dict = {
-        f"{col}_{shift}": df[col].shift(shift).to_numpy()
-        for col in ["open", "high", "low", "close", "volume"]
-        for shift in range(13)
-    }
+    if storage not in pattern_matrix.LAYOUTS:
+        raise ValueError(
+            f"Unknown storage {storage}, choose from {pattern_matrix.LAYOUTS}."
+        )
+    hit_indices = detect_hit_indices(
+        df,
+        calibration,
+        data_gap_handling,
+        filter_kwargs=filter_kwargs,
+        split=split,
+        engine=engine,
+        workers=workers,
+        patterns=patterns,
+    )
+    write_detection(
+        f"data/runs/{run_name}/detection/{split}.patterns",
+        hit_indices,
+        patterns=patterns,
+        number_bars=len(df),
+        storage=storage,
+    )
 
-    candle_dict = {
-        f"candle_minus_{n}": np.array(
-            [
-                column_dict[f"open_{n}"],
-                column_dict[f"high_{n}"],
-                column_dict[f"low_{n}"],
-                column_dict[f"close_{n}"],
-                column_dict[f"volume_{n}"],
-            ]
-        ).T
-        for n in range(13)
-    }
 
-    T = np.array(df["trend"].values)
+def detection_grid(  # noqa: PLR0913
+    df: pd.DataFrame,
+    grid_calibrations: dict[str, dict],
+    data_gap_handling: str,
+    *,
+    run_name: str,
+    filter_kwargs: dict,
+    split: int,
+    engine: str,
+    workers: int,
+    patterns: list[dict],
+    storage: str = "hits",
+) -> None:
+    """
+    Performs pattern detection for every calibration of a percentile sweep, see
+    ``calibration.percentile_grid``.
 
-    one_candle = candle_dict["candle_minus_0"]
-    two_candle = [candle_dict[f"candle_minus_{n}"] for n in range(1, -1, -1)]
-    three_candle = [candle_dict[f"candle_minus_{n}"] for n in range(2, -1, -1)]
-    four_candle = [candle_dict[f"candle_minus_{n}"] for n in range(3, -1, -1)]
-    five_candle = [candle_dict[f"candle_minus_{n}"] for n in range(4, -1, -1)]
-    eight_candle = [candle_dict[f"candle_minus_{n}"] for n in range(7, -1, -1)]
-    ten_candle = [candle_dict[f"candle_minus_{n}"] for n in range(9, -1, -1)]
-    eleven_candle = [candle_dict[f"candle_minus_{n}"] for n in range(10, -1, -1)]
-    twelve_candle = [candle_dict[f"candle_minus_{n}"] for n in range(11, -1, -1)]
-    thirteen_candle = [candle_dict[f"candle_minus_{n}"] for n in range(12, -1, -1)]
+    The candles are measured once and only classified again for every calibration.
 
-    i = 0
+    Parameters
+    ----------
+    df : pd.DataFrame
+        A Dataframe with OHLC data.
+    grid_calibrations : dict[str, dict]
+        Calibration by tag, see ``calibration.percentile_grid``.
+    data_gap_handling : {"exclude", "ignore", "only"}
+        Mode of handling gaps in the data.
+    engine : {"functions", "numpy", "numba", "selective"}
+        Detection engine, see ``detect_patterns``.
+    workers : int
+        Number of threads used for detection.
+    patterns : list[dict]
+        Patterns to detect, see ``pattern_registry.select_patterns``.
+    storage : {"hits", "packed"}, optional, default "hits"
+        Layout of the output files, see ``pattern_matrix``.
+
+    Returns
+    -------
+    None
+        Outputs the candlestick patterns of the split for every calibration to disk,
+        as ``sweep/{tag}/{split}.patterns`` in the run folder.
+
+    Raises
+    ------
+    ValueError
+        If the storage layout is unknown.
+    """
+    if storage not in pattern_matrix.LAYOUTS:
+        raise ValueError(
+            f"Unknown storage {storage}, choose from {pattern_matrix.LAYOUTS}."
+        )
+    features = cf.numeric_features(
+        *(df[col].to_numpy(dtype=float) for col in ["open", "high", "low", "close"])
+    )
+    for tag, calibration in grid_calibrations.items():
+        hit_indices = detect_hit_indices(
+            df,
+            calibration,
+            data_gap_handling,
+            filter_kwargs=filter_kwargs,
+            split=split,
+            engine=engine,
+            workers=workers,
+            patterns=patterns,
+            features=features,
+        )
+        os.makedirs(f"data/runs/{run_name}/sweep/{tag}", exist_ok=True)
+        write_detection(
+            f"data/runs/{run_name}/sweep/{tag}/{split}.patterns",
+            hit_indices,
+            patterns=patterns,
+            number_bars=len(df),
+            storage=storage,
+        )
+
+
+def detect_hit_indices(  # noqa: PLR0913
+    df: pd.DataFrame,
+    calibration: dict,
+    data_gap_handling: str,
+    *,
+    filter_kwargs: dict,
+    split: int,
+    engine: str,
+    workers: int,
+    patterns: list[dict],
+    features: dict[str, np.ndarray] | None = None,
+) -> list[np.ndarray]:
+    """
+    Detects the patterns and handles gaps and indicator filters, see ``detection``.
+    The numeric features of the candles can be passed, see ``detect_patterns``.
 
+    Returns
+    -------
+    list[np.ndarray]
+        Sorted indices of the candles with a pattern, one array per pattern.
+    """
+    # The gap windows and the filter are shared by all patterns.
+    windows = gap_windows(
+        df["gap"], {pattern["number_candles"] for pattern in patterns}
+    )
     if filter_kwargs:
-        filter_index = filtering.filter_indicators(df, indicators=filter_kwargs)
+        excluded = filtering.filter_indicators(df, indicators=filter_kwargs).to_numpy(
+            dtype=bool
+        )
+
+    hit_indices = []
+    for i, (pattern, pattern_mask) in enumerate(
+        detect_patterns(
+            df,
+            calibration,
+            engine=engine,
+            workers=workers,
+            patterns=patterns,
+            features=features,
+        )
+    ):
+        shared_functions.print_status_bar(pattern["name"], i, len(patterns), split)
+
+        pattern_hits = handle_gaps(
+            pattern_matrix.mask_to_hits(pattern_mask),
+            df["gap"],
+            pattern["number_candles"],
+            mode=data_gap_handling,
+            windows=windows,
+        )
+        if filter_kwargs:
+            pattern_hits = filtering.filter_patterns(pattern_hits, excluded)
+        hit_indices.append(pattern_hits)
+    return hit_indices
+
+
+def write_detection(
+    path: str,
+    hit_indices: list[np.ndarray],
+    *,
+    patterns: list[dict],
+    number_bars: int,
+    storage: str,
+) -> None:
+    """
+    Writes the detected patterns to disk in the given layout, see ``pattern_matrix``.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+    hit_indices : list[np.ndarray]
+        Sorted indices of the candles with a pattern, one array per pattern.
+    patterns : list[dict]
+        The detected patterns.
+    number_bars : int
+        Number of bars (candles) of the patterns.
+    storage : {"hits", "packed"}
+        Layout of the file.
+    """
+    numbers = [pattern["number"] for pattern in patterns]
+    func_names = [pattern["name"] for pattern in patterns]
+    # Patterns with the same hits are evaluated once, see ``evaluation``.
+    aliases = pattern_matrix.pattern_aliases(hit_indices)
+    if storage == "hits":
+        pattern_matrix.write_hit_indices(
+            path,
+            hit_indices,
+            numbers=numbers,
+            names=func_names,
+            number_bars=number_bars,
+            aliases=aliases,
+        )
+    else:
+        pattern_matrix.write_pattern_matrix(
+            path,
+            np.array(
+                [
+                    np.packbits(pattern_matrix.hits_to_mask(pattern_hits, number_bars))
+                    for pattern_hits in hit_indices
+                ]
+            ),
+            numbers=numbers,
+            names=func_names,
+            number_bars=number_bars,
+            aliases=aliases,
+        )
+
+
+def detect_patterns(  # noqa: PLR0913
+    df: pd.DataFrame,
+    calibration: dict,
+    *,
+    engine: str,
+    workers: int = 1,
+    patterns: list[dict] | None = None,
+    features: dict[str, np.ndarray] | None = None,
+) -> Iterator[tuple[dict, np.ndarray]]:
+    """
+    Detects all candlestick patterns, without handling gaps or filtering.
+
+    * "functions": calls the pattern functions one by one.
+    * "numpy": evaluates the pattern definitions in ``pattern_specs`` as a single plan
+    that shares sub-expressions between patterns, see ``compiled_detection``. The
+    candle classes are encoded once per candle and looked up by code.
+    * "numba": compiles that plan into a kernel evaluating all patterns in a single
+    pass. Compiling takes a while, but only happens once per process.
+    * "selective": evaluates the conditions of every pattern in the order that rules
+    out most candles soonest on this data, each only on the remaining candidates.
+    Fastest when most patterns are rare, see ``condition_statistics``.
+
+    All engines release the GIL for most of the work, so they are run by a pool of
+    threads sharing the candle arrays. The result does not depend on the number of
+    threads.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        A Dataframe with OHLC data and trend.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
+    engine : {"functions", "numpy", "numba", "selective"}
+        Detection engine.
+    workers : int, optional, default 1
+        Number of threads.
+    patterns : list[dict] | None, optional, default None
+        Patterns to detect, all patterns in ``pattern_registry.PATTERNS`` if None. Only
+        the trend-free variants these patterns derive from are evaluated.
+    features : dict[str, np.ndarray] | None, optional, default None
+        Numeric features of the candles, see ``candlestick_functions.numeric_features``,
+        computed from ``df`` if None. They do not depend on the percentiles, so
+        detections with other calibrations of the same candles can share them, see
+        ``detection_grid``.
+
+    Yields
+    ------
+    tuple[dict, np.ndarray]
+        Pattern from ``pattern_registry.PATTERNS`` and boolean array with the detected
+        patterns.
+
+    Raises
+    ------
+    ValueError
+        If the engine is unknown.
+    """
+    if features is None:
+        features = cf.numeric_features(
+            *(df[col].to_numpy(dtype=float) for col in ["open", "high", "low", "close"])
+        )
+    yield from detect_arrays(
+        features,
+        np.array(df["trend"].values),
+        calibration,
+        engine=engine,
+        workers=workers,
+        patterns=patterns,
+    )
+
+
+def detect_panel(
+    panel: dict[str, np.ndarray],
+    calibrations: list[dict],
+    *,
+    engine: str,
+    workers: int = 1,
+    patterns: list[dict] | None = None,
+) -> Iterator[tuple[dict, np.ndarray]]:
+    """
+    Detects all candlestick patterns on several assets at once, without handling gaps
+    or filtering, so the work per pattern is done once for all assets.
 
-    for number in constants.PATTERN_NUMBERS_AS_STRING:
-        func_name_list = extract_func_names(number_candles=number)
+    The calibrations of every asset are broadcast along the asset axis, see
+    ``candlestick_functions.panel_calibration``. The patterns of every asset are the
+    same as detected by ``detect_patterns`` on that asset alone. The "selective"
+    engine orders the conditions on every asset separately, so it detects the
+    patterns asset by asset.
 
-        for func_name in func_name_list:
-            shared_functions.print_status_bar(
-                func_name, i, constants.TOTAL_NUMBER_OF_PATTERNS, split
+    Parameters
+    ----------
+    panel : dict[str, np.ndarray]
+        Open, high, low, close and trend, aligned arrays of shape (number of assets,
+        number of candles).
+    calibrations : list[dict]
+        Calibration of every asset, see ``calibration.resolve_calibration``.
+    engine : {"functions", "numpy", "numba", "selective"}
+        Detection engine, see ``detect_patterns``.
+    workers : int, optional, default 1
+        Number of threads.
+    patterns : list[dict] | None, optional, default None
+        Patterns to detect, all patterns in ``pattern_registry.PATTERNS`` if None.
+
+    Yields
+    ------
+    tuple[dict, np.ndarray]
+        Pattern from ``pattern_registry.PATTERNS`` and boolean array of shape (number
+        of assets, number of candles) with the detected patterns.
+    """
+    yield from detect_arrays(
+        cf.numeric_features(
+            *(
+                np.asarray(panel[col], dtype=float)
+                for col in ["open", "high", "low", "close"]
             )
+        ),
+        np.asarray(panel["trend"]),
+        cf.panel_calibration(calibrations),
+        engine=engine,
+        workers=workers,
+        patterns=patterns,
+    )
+
+
+def detect_arrays(  # noqa: PLR0913
+    features: dict[str, np.ndarray],
+    T: np.ndarray,
+    calibration: dict,
+    *,
+    engine: str,
+    workers: int,
+    patterns: list[dict] | None,
+) -> Iterator[tuple[dict, np.ndarray]]:
+    """
+    Detects all candlestick patterns on OHLC arrays, see ``detect_patterns`` and
+    ``detect_panel``.
 
-            i += 1
+    Parameters
+    ----------
+    features : dict[str, np.ndarray]
+        Numeric features of the candles, see ``candlestick_functions.numeric_features``,
+        with time along the last axis.
+    T : np.ndarray
+        Trend.
+    calibration : dict
+        Calibration, of a panel for arrays with an asset axis.
+    engine : {"functions", "numpy", "numba", "selective"}
+        Detection engine.
+    workers : int
+        Number of threads.
+    patterns : list[dict] | None
+        Patterns to detect, all patterns in ``pattern_registry.PATTERNS`` if None.
+
+    Yields
+    ------
+    tuple[dict, np.ndarray]
+        Pattern from ``pattern_registry.PATTERNS`` and boolean array with the detected
+        patterns.
+
+    Raises
+    ------
+    ValueError
+        If the engine is unknown.
+    """
+    if patterns is None:
+        patterns = pattern_registry.PATTERNS
+    shape_patterns = trend_free_patterns(patterns)
 
-            func_call = getattr(globals().get(f"{number}_patterns"), func_name)
-            patterns = func_call(locals().get(f"{number}_candle"), T, percentile)
-            patterns_gaps_handled = handle_gaps(
-                patterns, df["gap"], w2n.word_to_num(number), mode=data_gap_handling
+    if engine in {"numpy", "numba", "selective"}:
+        specs = {pattern["name"]: pattern["spec"] for pattern in shape_patterns}
+        feature_dict = {**features, "code": cf.feature_codes(features, calibration)}
+        if engine == "selective" and T.ndim > 1:
+            shape_matrix = np.stack(
+                [
+                    compiled_detection.detect_selective(
+                        specs,
+                        {
+                            name: feature[asset]
+                            for name, feature in feature_dict.items()
+                        },
+                        {
+                            name: threshold[..., asset, 0]
+                            for name, threshold in calibration.items()
+                        },
+                        workers=workers,
+                    )[0]
+                    for asset in range(len(T))
+                ]
             )
-            if filter_kwargs:
-                patterns_gaps_handled[filter_index] = False
-            table = pyarrow.Table.from_arrays(
-                [patterns_gaps_handled], names=["pattern"]
+        elif engine == "selective":
+            shape_matrix, _ = compiled_detection.detect_selective(
+                specs, feature_dict, calibration, workers=workers
             )
-            pyarrow.parquet.write_table(
-                table,
-                f"data/runs/{run_name}/detection/{number}/{func_name}.parquet",
-                compression="brotli",
+        else:
+            shape_matrix = compiled_detection.detect(
+                specs, feature_dict, calibration, backend=engine, workers=workers
             )
+        shape_masks = {
+            pattern["id"]: shape_matrix[..., column]
+            for column, pattern in enumerate(shape_patterns)
+        }
+    elif engine == "functions":
+        feature_dict = cf.candle_features(
+            *(features[col] for col in ["open", "high", "low", "close"]), calibration
+        )
+        shape_masks = dict(
+            zip(
+                (pattern["id"] for pattern in shape_patterns),
+                call_pattern_functions(
+                    shape_patterns, feature_dict, T, calibration, workers=workers
+                ),
+                strict=True,
+            )
+        )
+    else:
+        raise ValueError(f"Unknown detection engine {engine}.")
+
+    trend_masks = {1: T == 1, -1: T == -1}
+    for pattern in patterns:
+        shape_mask = shape_masks[pattern["shape_id"]]
+        if pattern["trend"]:
+            yield pattern, np.logical_and(shape_mask, trend_masks[pattern["trend"]])
+        else:
+            yield pattern, np.array(shape_mask, dtype=bool)
 
 
-def extract_func_names(number_candles: str) -> list[str]:
+def trend_free_patterns(patterns: list[dict]) -> list[dict]:
     """
-    Extract the function names of pattern functions from number of candlesticks.
+    Finds the trend-free variants the given patterns derive from.
 
     Parameters
     ----------
-    number_candles : str
-        The number of candlesticks in the pattern.
+    patterns : list[dict]
+        Patterns from ``pattern_registry.PATTERNS``.
+
+    Returns
+    -------
+    list[dict]
+        Trend-free patterns, in order of first use.
+    """
+    return [
+        pattern_registry.PATTERNS[shape_id]
+        for shape_id in dict.fromkeys(pattern["shape_id"] for pattern in patterns)
+    ]
+
+
+def condition_statistics(
+    df: pd.DataFrame, calibration: dict, *, patterns: list[dict] | None = None
+) -> pd.DataFrame:
+    """
+    Measures how selective the conditions of the patterns are on the data, as used
+    by the "selective" engine to order them.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        A Dataframe with OHLC data.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
+    patterns : list[dict] | None, optional, default None
+        Patterns to measure, all patterns if None. Conditions belong to the
+        trend-free variants.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per condition, in evaluation order, with the function name of the
+        trend-free pattern, the condition, the fraction of a sample of candles
+        passing it on its own and the number of candidates evaluated and passing.
+    """
+    ohlc = [df[col].to_numpy(dtype=float) for col in ["open", "high", "low", "close"]]
+    _, statistics = compiled_detection.detect_selective(
+        {
+            pattern["name"]: pattern["spec"]
+            for pattern in trend_free_patterns(patterns or pattern_registry.PATTERNS)
+        },
+        {**cf.numeric_features(*ohlc), "code": cf.candle_codes(*ohlc, calibration)},
+        calibration,
+    )
+    return pd.DataFrame(
+        [
+            {"pattern": name, **condition}
+            for name, conditions in statistics.items()
+            for condition in conditions
+        ]
+    )
+
+
+def call_pattern_functions(
+    patterns: list[dict],
+    feature_dict: dict[str, np.ndarray],
+    T: np.ndarray,
+    calibration: dict,
+    *,
+    workers: int = 1,
+) -> list[np.ndarray]:
+    """
+    Calls pattern functions on the lagged candle features, using a pool of threads.
+
+    Parameters
+    ----------
+    patterns : list[dict]
+        Patterns from ``pattern_registry.PATTERNS``.
+    feature_dict : dict[str, np.ndarray]
+        Candle features, see ``candlestick_functions.candle_features``.
+    T : np.ndarray
+        Trend.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
+    workers : int, optional, default 1
+        Number of threads.
+
+    Returns
+    -------
+    list[np.ndarray]
+        Boolean array with the detected patterns of every function.
+    """
+    lagged_feature_dicts = cf.lagged_features(feature_dict, 12)
+    candles = {
+        number_candles: [
+            lagged_feature_dicts[n] for n in range(number_candles - 1, -1, -1)
+        ]
+        for number_candles, _ in pattern_registry.PATTERN_MODULES.values()
+    }
+    candles[1] = lagged_feature_dicts[0]
+
+    def call(pattern: dict) -> np.ndarray:
+        return pattern["function"](candles[pattern["number_candles"]], T, calibration)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(call, patterns))
+
+
+def engine_mismatches(
+    df: pd.DataFrame, calibration: dict, *, engine: str = "numba"
+) -> list[str]:
+    """
+    Compares a detection engine with the pattern functions, as a check on the
+    pattern definitions and their compiler.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        A Dataframe with OHLC data and trend.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
+    engine : {"numpy", "numba", "selective"}, optional, default "numba"
+        Detection engine compared with the "functions" engine.
 
     Returns
     -------
     list[str]
-        List of all the function names of the candlestick patterns.
+        Function names of the patterns where the engines disagree, empty if the
+        engines are equivalent.
     """
-    func_names = []
-    file_name = f"{number_candles}_patterns"
-    for name in dir(globals().get(file_name)):
-        attribute = getattr(globals().get(file_name), name)
-        if callable(attribute):
-            func_names.append(name)
-    return func_names
+    return [
+        pattern["name"]
+        for (pattern, patterns), (_, compiled_patterns) in zip(
+            detect_patterns(df, calibration, engine="functions"),
+            detect_patterns(df, calibration, engine=engine),
+            strict=True,
+        )
+        if not np.array_equal(np.asarray(patterns, dtype=bool), compiled_patterns)
+    ]
+
+
+def gap_windows(
+    gap: pd.Series, numbers_candles: Iterable[int]
+) -> dict[int, np.ndarray]:
+    """
+    Finds the candles with a gap among them and the candles before them, for every
+    number of candles in a pattern, from a running count of the gaps.
+
+    Parameters
+    ----------
+    gap : pd.Series
+        Boolean series with the data gaps.
+    numbers_candles : Iterable[int]
+        Numbers of candles in the patterns.
+
+    Returns
+    -------
+    dict[int, np.ndarray]
+        Boolean array by number of candles, True if one of that many candles ending
+        on the candle is a gap. Missing candles before the first one count as gaps.
+    """
+    gaps_so_far = np.concatenate(([0], np.cumsum(gap.to_numpy(dtype=bool))))
+    windows = {}
+    for number_candles in numbers_candles:
+        window = np.ones(len(gap), dtype=bool)
+        window[number_candles - 1 :] = (
+            gaps_so_far[number_candles:]
+            > gaps_so_far[: max(len(gaps_so_far) - number_candles, 0)]
+        )
+        windows[number_candles] = window
+    return windows
 
 
 def handle_gaps(
-    pattern: pd.Series, gap: pd.Series, number_candles: int, mode: str
+    pattern: np.ndarray,
+    gap: pd.Series,
+    number_candles: int,
+    mode: str,
+    *,
+    windows: dict[int, np.ndarray] | None = None,
 ) -> np.ndarray:
     """
     Handle gaps in the data according to the given mode.
@@ -146,27 +679,35 @@ def handle_gaps(
     Parameters
     ----------
     pattern : np.ndarray
-        Boolean series with the candlestick pattern.
+        Boolean array with the candlestick pattern, or its hit indices (sorted indices
+        of the candles with a pattern).
     gap : pd.Series
         Boolean series with the data gaps.
     number_candles : int
         Number of candles in the pattern
     mode : {"exclude", "ignore", "only"}
         Gap handling mode.
+    windows : dict[int, np.ndarray] | None, optional, default None
+        Gap windows of ``gap``, see ``gap_windows``, computed if None or missing the
+        number of candles.
 
     Returns
     -------
     np.ndarray
-        Boolean series with patterns included or excluded according to the gap handling
-        policy.
+        Patterns included or excluded according to the gap handling policy, as
+        boolean array or hit indices like the input.
     """
     if mode == "ignore":
         return pattern
-    gap_number_candles_adjusted = np.logical_or.reduce(
-        [np.array(gap.shift(n)) for n in range(number_candles)]
-    )
+    if windows is None or number_candles not in windows:
+        windows = gap_windows(gap, [number_candles])
+    in_gap = windows[number_candles]
+    if np.issubdtype(pattern.dtype, np.integer):
+        in_gap = in_gap[pattern]
+        keep = {"exclude": ~in_gap, "only": in_gap}.get(mode)
+        return None if keep is None else pattern[keep]
     if mode == "exclude":
-        return np.logical_and(pattern, np.logical_not(gap_number_candles_adjusted))
+        return np.logical_and(pattern, np.logical_not(in_gap))
     if mode == "only":
-        return np.logical_and(pattern, gap_number_candles_adjusted)
+        return np.logical_and(pattern, in_gap)
     return None
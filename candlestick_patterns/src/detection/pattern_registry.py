@@ -0,0 +1,205 @@
+import fnmatch
+import inspect
+import os
+import re
+from types import ModuleType
+
+from detection.patterns import (
+    eight_patterns,
+    eleven_patterns,
+    five_patterns,
+    four_patterns,
+    one_patterns,
+    pattern_specs,
+    ten_patterns,
+    thirteen_patterns,
+    three_patterns,
+    twelve_patterns,
+    two_patterns,
+)
+from shared import pattern_matrix
+
+PATTERN_MODULES = {
+    "one": (1, one_patterns),
+    "two": (2, two_patterns),
+    "three": (3, three_patterns),
+    "four": (4, four_patterns),
+    "five": (5, five_patterns),
+    "eight": (8, eight_patterns),
+    "ten": (10, ten_patterns),
+    "eleven": (11, eleven_patterns),
+    "twelve": (12, twelve_patterns),
+    "thirteen": (13, thirteen_patterns),
+}
+
+# Signal expected from the prediction in the docstring, given the trend before the
+# pattern (1 for up, -1 for down, 0 for any trend).
+EXPECTED_SIGNALS = {
+    "reversal": {1: "sell", -1: "buy"},
+    "continuation": {1: "buy", -1: "sell"},
+    "reversal if up": {1: "sell"},
+    "reversal if down": {-1: "buy"},
+}
+
+
+def trend_variant(func_name: str, module: ModuleType) -> tuple[str, str, int]:
+    """
+    Finds the trend-free pattern function a pattern function is a variant of.
+
+    Patterns come in triplets that only differ in the trend before the pattern:
+    ``_`` (the trend from the definition), ``_no_trend`` and ``_opp_trend`` (the
+    opposite trend); or, for patterns without a trend in the definition, ``_``,
+    ``_up_trend`` and ``_down_trend``.
+
+    Parameters
+    ----------
+    func_name : str
+        Function name of the pattern.
+    module : ModuleType
+        Module containing the pattern function.
+
+    Returns
+    -------
+    tuple[str, str, int]
+        Family (name without variant), function name of the trend-free variant and the
+        required trend: 1 for up, -1 for down and 0 for any trend.
+    """
+    match = re.fullmatch(r"(\w+?)_(|no_trend|opp_trend|up_trend|down_trend)", func_name)
+    if match is None:
+        return func_name, func_name, 0
+    family, variant = match.groups()
+    if hasattr(module, f"{family}_no_trend"):
+        trend = 1 if "Trend: up" in getattr(module, f"{family}_").__doc__ else -1
+        return (
+            family,
+            f"{family}_no_trend",
+            {"": trend, "no_trend": 0, "opp_trend": -trend}.get(variant, 0),
+        )
+    return family, f"{family}_", {"up_trend": 1, "down_trend": -1}.get(variant, 0)
+
+
+def build_registry() -> list[dict]:
+    """
+    Collects all pattern functions with their metadata.
+
+    Returns
+    -------
+    list[dict]
+        One dict per pattern, in the order of ``constants.PATTERN_NUMBERS_AS_STRING``
+        and then alphabetically. The index in the list is the pattern id. Keys are:
+        ``id``, ``name`` (function name), ``function``, ``number`` (number of candles
+        as a word, used in paths), ``number_candles``, ``family`` (name without the
+        trend variant), ``trend_variant`` (suffix of the name), ``shape_id`` (id of
+        the trend-free variant), ``spec`` (definition of the trend-free variant, see
+        ``pattern_specs``), ``trend`` (required trend, 1 for up, -1 for down and 0 for
+        any trend) and ``expected_signal`` (buy, sell or any).
+    """
+    registry = []
+    for number, (number_candles, module) in PATTERN_MODULES.items():
+        for name, function in inspect.getmembers(module, inspect.isfunction):
+            if function.__module__ != module.__name__:
+                continue
+            family, shape_name, trend = trend_variant(name, module)
+            prediction = re.search(r"Prediction: ([\w ]+)", function.__doc__).group(1)
+            registry.append(
+                {
+                    "id": len(registry),
+                    "name": name,
+                    "function": function,
+                    "number": number,
+                    "number_candles": number_candles,
+                    "family": family,
+                    "trend_variant": name.removeprefix(family).removeprefix("_"),
+                    "shape_name": shape_name,
+                    "spec": pattern_specs.PATTERN_SPECS[family],
+                    "trend": trend,
+                    "expected_signal": EXPECTED_SIGNALS.get(prediction, {}).get(
+                        trend, "any"
+                    ),
+                }
+            )
+    ids = {pattern["name"]: pattern["id"] for pattern in registry}
+    for pattern in registry:
+        pattern["shape_id"] = ids[pattern.pop("shape_name")]
+    return registry
+
+
+PATTERNS = build_registry()
+PATTERNS_BY_NAME = {pattern["name"]: pattern for pattern in PATTERNS}
+
+
+def select_patterns(selection_kwargs: dict) -> list[dict]:
+    """
+    Selects patterns from the registry.
+
+    A pattern is selected when it matches every given key, and for every key any of
+    the given values.
+
+    Parameters
+    ----------
+    selection_kwargs : dict
+        Lists of ``names``, ``families``, ``number_candles`` (as int) and/or ``globs``
+        (shell-style wildcards matched against the name). Empty selects all
+        patterns.
+
+    Returns
+    -------
+    list[dict]
+        Selected patterns, in registry order.
+
+    Raises
+    ------
+    ValueError
+        If a key is unknown or no pattern is selected.
+    """
+    matchers = {
+        "names": lambda pattern, names: pattern["name"] in names,
+        "families": lambda pattern, families: pattern["family"] in families,
+        "number_candles": lambda pattern, numbers: pattern["number_candles"] in numbers,
+        "globs": lambda pattern, globs: any(
+            fnmatch.fnmatchcase(pattern["name"], glob) for glob in globs
+        ),
+    }
+    if unknown := set(selection_kwargs) - set(matchers):
+        raise ValueError(
+            f"Unknown pattern selection {unknown}, choose from {list(matchers)}."
+        )
+    selected = [
+        pattern
+        for pattern in PATTERNS
+        if all(
+            matchers[key](pattern, values) for key, values in selection_kwargs.items()
+        )
+    ]
+    if not selected:
+        raise ValueError(f"No patterns match the selection {selection_kwargs}.")
+    return selected
+
+
+def run_patterns(run_name: str) -> list[dict]:
+    """
+    Patterns of a run, read from the header of its detection files.
+
+    A run made with a pattern selection only has the selected patterns.
+
+    Parameters
+    ----------
+    run_name : str
+        The run name.
+
+    Returns
+    -------
+    list[dict]
+        Patterns of the run, in the order of the detection files.
+
+    Raises
+    ------
+    ValueError
+        If the run has no detection files.
+    """
+    folder = f"data/runs/{run_name}/detection"
+    files = sorted(file for file in os.listdir(folder) if file.endswith(".patterns"))
+    if not files:
+        raise ValueError(f"Run {run_name} has no detection files.")
+    header, _ = pattern_matrix.read_pattern_matrix(f"{folder}/{files[0]}")
+    return [PATTERNS_BY_NAME[name] for name in header["names"]]
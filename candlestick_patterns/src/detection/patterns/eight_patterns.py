@@ -1,8 +1,12 @@
 import numpy as np
 
+# The highs of the eight candles are strictly increasing, see
+# ``candlestick_functions.rising_highs``.
+RISING_HIGHS = 7
+
 
 def eight_new_price_lines_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: eight candles of either color reaching a new high.
 
@@ -10,40 +14,11 @@ def eight_new_price_lines_(
 
     Prediction: reversal.
     """
-    candle_1, candle_2, candle_3, candle_4, candle_5, candle_6, candle_7, candle_8 = (
-        candles[0],
-        candles[1],
-        candles[2],
-        candles[3],
-        candles[4],
-        candles[5],
-        candles[6],
-        candles[7],
-    )
-    H_1 = candle_1[:, 1]
-    H_2 = candle_2[:, 1]
-    H_3 = candle_3[:, 1]
-    H_4 = candle_4[:, 1]
-    H_5 = candle_5[:, 1]
-    H_6 = candle_6[:, 1]
-    H_7 = candle_7[:, 1]
-    H_8 = candle_8[:, 1]
-    return np.logical_and.reduce(
-        (
-            T == 1,
-            H_1 < H_2,
-            H_2 < H_3,
-            H_3 < H_4,
-            H_4 < H_5,
-            H_5 < H_6,
-            H_6 < H_7,
-            H_7 < H_8,
-        )
-    )
+    return np.logical_and(T == 1, candles[-1]["rising_highs"] >= RISING_HIGHS)
 
 
 def eight_new_price_lines_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: eight candles of either color reaching a new high.
 
@@ -51,39 +26,11 @@ def eight_new_price_lines_no_trend(
 
     Prediction: reversal.
     """
-    candle_1, candle_2, candle_3, candle_4, candle_5, candle_6, candle_7, candle_8 = (
-        candles[0],
-        candles[1],
-        candles[2],
-        candles[3],
-        candles[4],
-        candles[5],
-        candles[6],
-        candles[7],
-    )
-    H_1 = candle_1[:, 1]
-    H_2 = candle_2[:, 1]
-    H_3 = candle_3[:, 1]
-    H_4 = candle_4[:, 1]
-    H_5 = candle_5[:, 1]
-    H_6 = candle_6[:, 1]
-    H_7 = candle_7[:, 1]
-    H_8 = candle_8[:, 1]
-    return np.logical_and.reduce(
-        (
-            H_1 < H_2,
-            H_2 < H_3,
-            H_3 < H_4,
-            H_4 < H_5,
-            H_5 < H_6,
-            H_6 < H_7,
-            H_7 < H_8,
-        )
-    )
+    return candles[-1]["rising_highs"] >= RISING_HIGHS
 
 
 def eight_new_price_lines_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: eight candles of either color reaching a new high.
 
@@ -91,33 +38,4 @@ def eight_new_price_lines_opp_trend(
 
     Prediction: reversal.
     """
-    candle_1, candle_2, candle_3, candle_4, candle_5, candle_6, candle_7, candle_8 = (
-        candles[0],
-        candles[1],
-        candles[2],
-        candles[3],
-        candles[4],
-        candles[5],
-        candles[6],
-        candles[7],
-    )
-    H_1 = candle_1[:, 1]
-    H_2 = candle_2[:, 1]
-    H_3 = candle_3[:, 1]
-    H_4 = candle_4[:, 1]
-    H_5 = candle_5[:, 1]
-    H_6 = candle_6[:, 1]
-    H_7 = candle_7[:, 1]
-    H_8 = candle_8[:, 1]
-    return np.logical_and.reduce(
-        (
-            T == -1,
-            H_1 < H_2,
-            H_2 < H_3,
-            H_3 < H_4,
-            H_4 < H_5,
-            H_5 < H_6,
-            H_6 < H_7,
-            H_7 < H_8,
-        )
-    )
+    return np.logical_and(T == -1, candles[-1]["rising_highs"] >= RISING_HIGHS)
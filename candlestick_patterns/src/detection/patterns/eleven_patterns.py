@@ -1,9 +1,9 @@
 import numpy as np
 
-from detection.patterns.functions import candlestick_functions as cf
 
-
-def long_black_day_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def long_black_day_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall black candle, with a body at least three times the average
     length of the preceding five or ten candles. The shadows are shorter than the body.
 
@@ -36,53 +36,37 @@ def long_black_day_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bo
         candles[9],
         candles[10],
     )
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
-    O_4, C_4 = candle_4[:, 0], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
-    O_6, C_6 = candle_6[:, 0], candle_6[:, 3]
-    O_7, C_7 = candle_7[:, 0], candle_7[:, 3]
-    O_8, C_8 = candle_8[:, 0], candle_8[:, 3]
-    O_9, C_9 = candle_9[:, 0], candle_9[:, 3]
-    O_10, C_10 = candle_10[:, 0], candle_10[:, 3]
-    O_11, H_11, L_11, C_11 = (
-        candle_11[:, 0],
-        candle_11[:, 1],
-        candle_11[:, 2],
-        candle_11[:, 3],
-    )
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(O_11, C_11, percentile),
-            cf.upper_shadow_length(O_11, H_11, C_11) < cf.body_height(O_11, C_11),
-            cf.lower_shadow_length(O_11, L_11, C_11) < cf.body_height(O_11, C_11),
+            candle_11["tall_black_body"],
+            candle_11["upper_shadow_length"] < candle_11["body_height"],
+            candle_11["lower_shadow_length"] < candle_11["body_height"],
             np.logical_or(
-                cf.body_height(O_11, C_11)
+                candle_11["body_height"]
                 > 3
                 * np.mean(
                     [
-                        cf.body_height(O_10, C_10),
-                        cf.body_height(O_9, C_9),
-                        cf.body_height(O_8, C_8),
-                        cf.body_height(O_7, C_7),
-                        cf.body_height(O_6, C_6),
+                        candle_10["body_height"],
+                        candle_9["body_height"],
+                        candle_8["body_height"],
+                        candle_7["body_height"],
+                        candle_6["body_height"],
                     ]
                 ),
-                cf.body_height(O_11, C_11)
+                candle_11["body_height"]
                 > 3
                 * np.mean(
                     [
-                        cf.body_height(O_10, C_10),
-                        cf.body_height(O_9, C_9),
-                        cf.body_height(O_8, C_8),
-                        cf.body_height(O_7, C_7),
-                        cf.body_height(O_6, C_6),
-                        cf.body_height(O_5, C_5),
-                        cf.body_height(O_4, C_4),
-                        cf.body_height(O_3, C_3),
-                        cf.body_height(O_2, C_2),
-                        cf.body_height(O_1, C_1),
+                        candle_10["body_height"],
+                        candle_9["body_height"],
+                        candle_8["body_height"],
+                        candle_7["body_height"],
+                        candle_6["body_height"],
+                        candle_5["body_height"],
+                        candle_4["body_height"],
+                        candle_3["body_height"],
+                        candle_2["body_height"],
+                        candle_1["body_height"],
                     ]
                 ),
             ),
@@ -91,7 +75,7 @@ def long_black_day_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bo
 
 
 def long_black_day_down_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle, with a body at least three times the average
     length of the preceding five or ten candles. The shadows are shorter than the body.
@@ -125,54 +109,38 @@ def long_black_day_down_trend(
         candles[9],
         candles[10],
     )
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
-    O_4, C_4 = candle_4[:, 0], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
-    O_6, C_6 = candle_6[:, 0], candle_6[:, 3]
-    O_7, C_7 = candle_7[:, 0], candle_7[:, 3]
-    O_8, C_8 = candle_8[:, 0], candle_8[:, 3]
-    O_9, C_9 = candle_9[:, 0], candle_9[:, 3]
-    O_10, C_10 = candle_10[:, 0], candle_10[:, 3]
-    O_11, H_11, L_11, C_11 = (
-        candle_11[:, 0],
-        candle_11[:, 1],
-        candle_11[:, 2],
-        candle_11[:, 3],
-    )
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(O_11, C_11, percentile),
-            cf.upper_shadow_length(O_11, H_11, C_11) < cf.body_height(O_11, C_11),
-            cf.lower_shadow_length(O_11, L_11, C_11) < cf.body_height(O_11, C_11),
+            candle_11["tall_black_body"],
+            candle_11["upper_shadow_length"] < candle_11["body_height"],
+            candle_11["lower_shadow_length"] < candle_11["body_height"],
             np.logical_or(
-                cf.body_height(O_11, C_11)
+                candle_11["body_height"]
                 > 3
                 * np.mean(
                     [
-                        cf.body_height(O_10, C_10),
-                        cf.body_height(O_9, C_9),
-                        cf.body_height(O_8, C_8),
-                        cf.body_height(O_7, C_7),
-                        cf.body_height(O_6, C_6),
+                        candle_10["body_height"],
+                        candle_9["body_height"],
+                        candle_8["body_height"],
+                        candle_7["body_height"],
+                        candle_6["body_height"],
                     ]
                 ),
-                cf.body_height(O_11, C_11)
+                candle_11["body_height"]
                 > 3
                 * np.mean(
                     [
-                        cf.body_height(O_10, C_10),
-                        cf.body_height(O_9, C_9),
-                        cf.body_height(O_8, C_8),
-                        cf.body_height(O_7, C_7),
-                        cf.body_height(O_6, C_6),
-                        cf.body_height(O_5, C_5),
-                        cf.body_height(O_4, C_4),
-                        cf.body_height(O_3, C_3),
-                        cf.body_height(O_2, C_2),
-                        cf.body_height(O_1, C_1),
+                        candle_10["body_height"],
+                        candle_9["body_height"],
+                        candle_8["body_height"],
+                        candle_7["body_height"],
+                        candle_6["body_height"],
+                        candle_5["body_height"],
+                        candle_4["body_height"],
+                        candle_3["body_height"],
+                        candle_2["body_height"],
+                        candle_1["body_height"],
                     ]
                 ),
             ),
@@ -181,7 +149,7 @@ def long_black_day_down_trend(
 
 
 def long_black_day_up_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle, with a body at least three times the average
     length of the preceding five or ten candles. The shadows are shorter than the body.
@@ -215,54 +183,38 @@ def long_black_day_up_trend(
         candles[9],
         candles[10],
     )
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
-    O_4, C_4 = candle_4[:, 0], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
-    O_6, C_6 = candle_6[:, 0], candle_6[:, 3]
-    O_7, C_7 = candle_7[:, 0], candle_7[:, 3]
-    O_8, C_8 = candle_8[:, 0], candle_8[:, 3]
-    O_9, C_9 = candle_9[:, 0], candle_9[:, 3]
-    O_10, C_10 = candle_10[:, 0], candle_10[:, 3]
-    O_11, H_11, L_11, C_11 = (
-        candle_11[:, 0],
-        candle_11[:, 1],
-        candle_11[:, 2],
-        candle_11[:, 3],
-    )
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(O_11, C_11, percentile),
-            cf.upper_shadow_length(O_11, H_11, C_11) < cf.body_height(O_11, C_11),
-            cf.lower_shadow_length(O_11, L_11, C_11) < cf.body_height(O_11, C_11),
+            candle_11["tall_black_body"],
+            candle_11["upper_shadow_length"] < candle_11["body_height"],
+            candle_11["lower_shadow_length"] < candle_11["body_height"],
             np.logical_or(
-                cf.body_height(O_11, C_11)
+                candle_11["body_height"]
                 > 3
                 * np.mean(
                     [
-                        cf.body_height(O_10, C_10),
-                        cf.body_height(O_9, C_9),
-                        cf.body_height(O_8, C_8),
-                        cf.body_height(O_7, C_7),
-                        cf.body_height(O_6, C_6),
+                        candle_10["body_height"],
+                        candle_9["body_height"],
+                        candle_8["body_height"],
+                        candle_7["body_height"],
+                        candle_6["body_height"],
                     ]
                 ),
-                cf.body_height(O_11, C_11)
+                candle_11["body_height"]
                 > 3
                 * np.mean(
                     [
-                        cf.body_height(O_10, C_10),
-                        cf.body_height(O_9, C_9),
-                        cf.body_height(O_8, C_8),
-                        cf.body_height(O_7, C_7),
-                        cf.body_height(O_6, C_6),
-                        cf.body_height(O_5, C_5),
-                        cf.body_height(O_4, C_4),
-                        cf.body_height(O_3, C_3),
-                        cf.body_height(O_2, C_2),
-                        cf.body_height(O_1, C_1),
+                        candle_10["body_height"],
+                        candle_9["body_height"],
+                        candle_8["body_height"],
+                        candle_7["body_height"],
+                        candle_6["body_height"],
+                        candle_5["body_height"],
+                        candle_4["body_height"],
+                        candle_3["body_height"],
+                        candle_2["body_height"],
+                        candle_1["body_height"],
                     ]
                 ),
             ),
@@ -270,7 +222,9 @@ def long_black_day_up_trend(
     )
 
 
-def long_white_day_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def long_white_day_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall white candle, with a body at least three times the average
     length of the preceding five or ten candles. The shadows are shorter than the body.
 
@@ -303,53 +257,37 @@ def long_white_day_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bo
         candles[9],
         candles[10],
     )
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
-    O_4, C_4 = candle_4[:, 0], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
-    O_6, C_6 = candle_6[:, 0], candle_6[:, 3]
-    O_7, C_7 = candle_7[:, 0], candle_7[:, 3]
-    O_8, C_8 = candle_8[:, 0], candle_8[:, 3]
-    O_9, C_9 = candle_9[:, 0], candle_9[:, 3]
-    O_10, C_10 = candle_10[:, 0], candle_10[:, 3]
-    O_11, H_11, L_11, C_11 = (
-        candle_11[:, 0],
-        candle_11[:, 1],
-        candle_11[:, 2],
-        candle_11[:, 3],
-    )
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(O_11, C_11, percentile),
-            cf.upper_shadow_length(O_11, H_11, C_11) < cf.body_height(O_11, C_11),
-            cf.lower_shadow_length(O_11, L_11, C_11) < cf.body_height(O_11, C_11),
+            candle_11["tall_white_body"],
+            candle_11["upper_shadow_length"] < candle_11["body_height"],
+            candle_11["lower_shadow_length"] < candle_11["body_height"],
             np.logical_or(
-                cf.body_height(O_11, C_11)
+                candle_11["body_height"]
                 > 3
                 * np.mean(
                     [
-                        cf.body_height(O_10, C_10),
-                        cf.body_height(O_9, C_9),
-                        cf.body_height(O_8, C_8),
-                        cf.body_height(O_7, C_7),
-                        cf.body_height(O_6, C_6),
+                        candle_10["body_height"],
+                        candle_9["body_height"],
+                        candle_8["body_height"],
+                        candle_7["body_height"],
+                        candle_6["body_height"],
                     ]
                 ),
-                cf.body_height(O_11, C_11)
+                candle_11["body_height"]
                 > 3
                 * np.mean(
                     [
-                        cf.body_height(O_10, C_10),
-                        cf.body_height(O_9, C_9),
-                        cf.body_height(O_8, C_8),
-                        cf.body_height(O_7, C_7),
-                        cf.body_height(O_6, C_6),
-                        cf.body_height(O_5, C_5),
-                        cf.body_height(O_4, C_4),
-                        cf.body_height(O_3, C_3),
-                        cf.body_height(O_2, C_2),
-                        cf.body_height(O_1, C_1),
+                        candle_10["body_height"],
+                        candle_9["body_height"],
+                        candle_8["body_height"],
+                        candle_7["body_height"],
+                        candle_6["body_height"],
+                        candle_5["body_height"],
+                        candle_4["body_height"],
+                        candle_3["body_height"],
+                        candle_2["body_height"],
+                        candle_1["body_height"],
                     ]
                 ),
             ),
@@ -358,7 +296,7 @@ def long_white_day_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bo
 
 
 def long_white_day_down_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle, with a body at least three times the average
     length of the preceding five or ten candles. The shadows are shorter than the body.
@@ -392,54 +330,38 @@ def long_white_day_down_trend(
         candles[9],
         candles[10],
     )
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
-    O_4, C_4 = candle_4[:, 0], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
-    O_6, C_6 = candle_6[:, 0], candle_6[:, 3]
-    O_7, C_7 = candle_7[:, 0], candle_7[:, 3]
-    O_8, C_8 = candle_8[:, 0], candle_8[:, 3]
-    O_9, C_9 = candle_9[:, 0], candle_9[:, 3]
-    O_10, C_10 = candle_10[:, 0], candle_10[:, 3]
-    O_11, H_11, L_11, C_11 = (
-        candle_11[:, 0],
-        candle_11[:, 1],
-        candle_11[:, 2],
-        candle_11[:, 3],
-    )
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(O_11, C_11, percentile),
-            cf.upper_shadow_length(O_11, H_11, C_11) < cf.body_height(O_11, C_11),
-            cf.lower_shadow_length(O_11, L_11, C_11) < cf.body_height(O_11, C_11),
+            candle_11["tall_white_body"],
+            candle_11["upper_shadow_length"] < candle_11["body_height"],
+            candle_11["lower_shadow_length"] < candle_11["body_height"],
             np.logical_or(
-                cf.body_height(O_11, C_11)
+                candle_11["body_height"]
                 > 3
                 * np.mean(
                     [
-                        cf.body_height(O_10, C_10),
-                        cf.body_height(O_9, C_9),
-                        cf.body_height(O_8, C_8),
-                        cf.body_height(O_7, C_7),
-                        cf.body_height(O_6, C_6),
+                        candle_10["body_height"],
+                        candle_9["body_height"],
+                        candle_8["body_height"],
+                        candle_7["body_height"],
+                        candle_6["body_height"],
                     ]
                 ),
-                cf.body_height(O_11, C_11)
+                candle_11["body_height"]
                 > 3
                 * np.mean(
                     [
-                        cf.body_height(O_10, C_10),
-                        cf.body_height(O_9, C_9),
-                        cf.body_height(O_8, C_8),
-                        cf.body_height(O_7, C_7),
-                        cf.body_height(O_6, C_6),
-                        cf.body_height(O_5, C_5),
-                        cf.body_height(O_4, C_4),
-                        cf.body_height(O_3, C_3),
-                        cf.body_height(O_2, C_2),
-                        cf.body_height(O_1, C_1),
+                        candle_10["body_height"],
+                        candle_9["body_height"],
+                        candle_8["body_height"],
+                        candle_7["body_height"],
+                        candle_6["body_height"],
+                        candle_5["body_height"],
+                        candle_4["body_height"],
+                        candle_3["body_height"],
+                        candle_2["body_height"],
+                        candle_1["body_height"],
                     ]
                 ),
             ),
@@ -448,7 +370,7 @@ def long_white_day_down_trend(
 
 
 def long_white_day_up_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle, with a body at least three times the average
     length of the preceding five or ten candles. The shadows are shorter than the body.
@@ -482,54 +404,38 @@ def long_white_day_up_trend(
         candles[9],
         candles[10],
     )
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
-    O_4, C_4 = candle_4[:, 0], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
-    O_6, C_6 = candle_6[:, 0], candle_6[:, 3]
-    O_7, C_7 = candle_7[:, 0], candle_7[:, 3]
-    O_8, C_8 = candle_8[:, 0], candle_8[:, 3]
-    O_9, C_9 = candle_9[:, 0], candle_9[:, 3]
-    O_10, C_10 = candle_10[:, 0], candle_10[:, 3]
-    O_11, H_11, L_11, C_11 = (
-        candle_11[:, 0],
-        candle_11[:, 1],
-        candle_11[:, 2],
-        candle_11[:, 3],
-    )
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(O_11, C_11, percentile),
-            cf.upper_shadow_length(O_11, H_11, C_11) < cf.body_height(O_11, C_11),
-            cf.lower_shadow_length(O_11, L_11, C_11) < cf.body_height(O_11, C_11),
+            candle_11["tall_white_body"],
+            candle_11["upper_shadow_length"] < candle_11["body_height"],
+            candle_11["lower_shadow_length"] < candle_11["body_height"],
             np.logical_or(
-                cf.body_height(O_11, C_11)
+                candle_11["body_height"]
                 > 3
                 * np.mean(
                     [
-                        cf.body_height(O_10, C_10),
-                        cf.body_height(O_9, C_9),
-                        cf.body_height(O_8, C_8),
-                        cf.body_height(O_7, C_7),
-                        cf.body_height(O_6, C_6),
+                        candle_10["body_height"],
+                        candle_9["body_height"],
+                        candle_8["body_height"],
+                        candle_7["body_height"],
+                        candle_6["body_height"],
                     ]
                 ),
-                cf.body_height(O_11, C_11)
+                candle_11["body_height"]
                 > 3
                 * np.mean(
                     [
-                        cf.body_height(O_10, C_10),
-                        cf.body_height(O_9, C_9),
-                        cf.body_height(O_8, C_8),
-                        cf.body_height(O_7, C_7),
-                        cf.body_height(O_6, C_6),
-                        cf.body_height(O_5, C_5),
-                        cf.body_height(O_4, C_4),
-                        cf.body_height(O_3, C_3),
-                        cf.body_height(O_2, C_2),
-                        cf.body_height(O_1, C_1),
+                        candle_10["body_height"],
+                        candle_9["body_height"],
+                        candle_8["body_height"],
+                        candle_7["body_height"],
+                        candle_6["body_height"],
+                        candle_5["body_height"],
+                        candle_4["body_height"],
+                        candle_3["body_height"],
+                        candle_2["body_height"],
+                        candle_1["body_height"],
                     ]
                 ),
             ),
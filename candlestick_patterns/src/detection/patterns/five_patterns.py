@@ -3,7 +3,9 @@ import numpy as np
 from detection.patterns.functions import candlestick_functions as cf
 
 
-def breakaway_bearish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def breakaway_bearish_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall white candle, white candle with an upwards body gap, candle of
     either color that closes higher, white candle that closes higher, tall black candle
     that closes within the gap between #1 and #2.
@@ -19,18 +21,18 @@ def breakaway_bearish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
         candles[3],
         candles[4],
     )
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    C_3 = candle_3[:, 3]
-    O_4, C_4 = candle_4[:, 0], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    C_3 = candle_3["close"]
+    C_4 = candle_4["close"]
+    C_5 = candle_5["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.white_body(O_2, C_2),
-            cf.white_body(O_4, C_4),
-            cf.tall_black_body(O_5, C_5, percentile),
+            candle_1["tall_white_body"],
+            candle_2["white_body"],
+            candle_4["white_body"],
+            candle_5["tall_black_body"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             C_3 > C_2,
             C_4 > C_3,
@@ -41,7 +43,7 @@ def breakaway_bearish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
 
 
 def breakaway_bearish_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle, white candle with an upwards body gap, candle of
     either color that closes higher, white candle that closes higher, tall black candle
@@ -58,17 +60,17 @@ def breakaway_bearish_no_trend(
         candles[3],
         candles[4],
     )
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    C_3 = candle_3[:, 3]
-    O_4, C_4 = candle_4[:, 0], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    C_3 = candle_3["close"]
+    C_4 = candle_4["close"]
+    C_5 = candle_5["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.white_body(O_2, C_2),
-            cf.white_body(O_4, C_4),
-            cf.tall_black_body(O_5, C_5, percentile),
+            candle_1["tall_white_body"],
+            candle_2["white_body"],
+            candle_4["white_body"],
+            candle_5["tall_black_body"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             C_3 > C_2,
             C_4 > C_3,
@@ -79,7 +81,7 @@ def breakaway_bearish_no_trend(
 
 
 def breakaway_bearish_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle, white candle with an upwards body gap, candle of
     either color that closes higher, white candle that closes higher, tall black candle
@@ -96,18 +98,18 @@ def breakaway_bearish_opp_trend(
         candles[3],
         candles[4],
     )
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    C_3 = candle_3[:, 3]
-    O_4, C_4 = candle_4[:, 0], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    C_3 = candle_3["close"]
+    C_4 = candle_4["close"]
+    C_5 = candle_5["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.white_body(O_2, C_2),
-            cf.white_body(O_4, C_4),
-            cf.tall_black_body(O_5, C_5, percentile),
+            candle_1["tall_white_body"],
+            candle_2["white_body"],
+            candle_4["white_body"],
+            candle_5["tall_black_body"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             C_3 > C_2,
             C_4 > C_3,
@@ -117,7 +119,9 @@ def breakaway_bearish_opp_trend(
     )
 
 
-def breakaway_bullish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def breakaway_bullish_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall black candle, black candle with a downwards body gap, candle of
     either color that closes lower, black candle that closes lower, tall white candle
     that closes within the gap between #1 and #2.
@@ -133,18 +137,18 @@ def breakaway_bullish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
         candles[3],
         candles[4],
     )
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    C_3 = candle_3[:, 3]
-    O_4, C_4 = candle_4[:, 0], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    C_3 = candle_3["close"]
+    C_4 = candle_4["close"]
+    C_5 = candle_5["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.black_body(O_2, C_2),
-            cf.black_body(O_4, C_4),
-            cf.tall_white_body(O_5, C_5, percentile),
+            candle_1["tall_black_body"],
+            candle_2["black_body"],
+            candle_4["black_body"],
+            candle_5["tall_white_body"],
             cf.down_body_gap(O_1, C_1, O_2, C_2),
             C_3 < C_2,
             C_4 < C_3,
@@ -155,7 +159,7 @@ def breakaway_bullish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
 
 
 def breakaway_bullish_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle, black candle with a downwards body gap, candle of
     either color that closes lower, black candle that closes lower, tall white candle
@@ -172,17 +176,17 @@ def breakaway_bullish_no_trend(
         candles[3],
         candles[4],
     )
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    C_3 = candle_3[:, 3]
-    O_4, C_4 = candle_4[:, 0], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    C_3 = candle_3["close"]
+    C_4 = candle_4["close"]
+    C_5 = candle_5["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.black_body(O_2, C_2),
-            cf.black_body(O_4, C_4),
-            cf.tall_white_body(O_5, C_5, percentile),
+            candle_1["tall_black_body"],
+            candle_2["black_body"],
+            candle_4["black_body"],
+            candle_5["tall_white_body"],
             cf.down_body_gap(O_1, C_1, O_2, C_2),
             C_3 < C_2,
             C_4 < C_3,
@@ -193,7 +197,7 @@ def breakaway_bullish_no_trend(
 
 
 def breakaway_bullish_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle, black candle with a downwards body gap, candle of
     either color that closes lower, black candle that closes lower, tall white candle
@@ -210,18 +214,18 @@ def breakaway_bullish_opp_trend(
         candles[3],
         candles[4],
     )
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    C_3 = candle_3[:, 3]
-    O_4, C_4 = candle_4[:, 0], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    C_3 = candle_3["close"]
+    C_4 = candle_4["close"]
+    C_5 = candle_5["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.black_body(O_2, C_2),
-            cf.black_body(O_4, C_4),
-            cf.tall_white_body(O_5, C_5, percentile),
+            candle_1["tall_black_body"],
+            candle_2["black_body"],
+            candle_4["black_body"],
+            candle_5["tall_white_body"],
             cf.down_body_gap(O_1, C_1, O_2, C_2),
             C_3 < C_2,
             C_4 < C_3,
@@ -232,7 +236,7 @@ def breakaway_bullish_opp_trend(
 
 
 def falling_three_methods_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle, small white candle, small candle of either color,
     small white candle, tall black candle. #2, #3 and #4 close higher, but the close of
@@ -249,19 +253,19 @@ def falling_three_methods_(
         candles[3],
         candles[4],
     )
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
-    O_4, C_4 = candle_4[:, 0], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
+    H_1, L_1, C_1 = candle_1["high"], candle_1["low"], candle_1["close"]
+    C_2 = candle_2["close"]
+    C_3 = candle_3["close"]
+    C_4 = candle_4["close"]
+    C_5 = candle_5["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.short_white_body(O_2, C_2, percentile),
-            cf.short_body(O_3, C_3, percentile),
-            cf.short_white_body(O_4, C_4, percentile),
-            cf.tall_black_body(O_5, C_5, percentile),
+            candle_1["tall_black_body"],
+            candle_2["short_white_body"],
+            candle_3["short_body"],
+            candle_4["short_white_body"],
+            candle_5["tall_black_body"],
             C_2 < C_3,
             C_3 < C_4,
             H_1 > C_4,
@@ -272,7 +276,7 @@ def falling_three_methods_(
 
 
 def falling_three_methods_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle, small white candle, small candle of either color,
     small white candle, tall black candle. #2, #3 and #4 close higher, but the close of
@@ -289,18 +293,18 @@ def falling_three_methods_no_trend(
         candles[3],
         candles[4],
     )
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
-    O_4, C_4 = candle_4[:, 0], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
+    H_1, L_1, C_1 = candle_1["high"], candle_1["low"], candle_1["close"]
+    C_2 = candle_2["close"]
+    C_3 = candle_3["close"]
+    C_4 = candle_4["close"]
+    C_5 = candle_5["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.short_white_body(O_2, C_2, percentile),
-            cf.short_body(O_3, C_3, percentile),
-            cf.short_white_body(O_4, C_4, percentile),
-            cf.tall_black_body(O_5, C_5, percentile),
+            candle_1["tall_black_body"],
+            candle_2["short_white_body"],
+            candle_3["short_body"],
+            candle_4["short_white_body"],
+            candle_5["tall_black_body"],
             C_2 < C_3,
             C_3 < C_4,
             H_1 > C_4,
@@ -311,7 +315,7 @@ def falling_three_methods_no_trend(
 
 
 def falling_three_methods_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle, small white candle, small candle of either color,
     small white candle, tall black candle. #2, #3 and #4 close higher, but the close of
@@ -328,19 +332,19 @@ def falling_three_methods_opp_trend(
         candles[3],
         candles[4],
     )
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
-    O_4, C_4 = candle_4[:, 0], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
+    H_1, L_1, C_1 = candle_1["high"], candle_1["low"], candle_1["close"]
+    C_2 = candle_2["close"]
+    C_3 = candle_3["close"]
+    C_4 = candle_4["close"]
+    C_5 = candle_5["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.short_white_body(O_2, C_2, percentile),
-            cf.short_body(O_3, C_3, percentile),
-            cf.short_white_body(O_4, C_4, percentile),
-            cf.tall_black_body(O_5, C_5, percentile),
+            candle_1["tall_black_body"],
+            candle_2["short_white_body"],
+            candle_3["short_body"],
+            candle_4["short_white_body"],
+            candle_5["tall_black_body"],
             C_2 < C_3,
             C_3 < C_4,
             H_1 > C_4,
@@ -350,7 +354,9 @@ def falling_three_methods_opp_trend(
     )
 
 
-def ladder_bottom_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def ladder_bottom_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: three tall black candles, each opening and closing lower, black
     candle with an upper shadow, white candle with an upwards body gap.
 
@@ -365,20 +371,20 @@ def ladder_bottom_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> boo
         candles[3],
         candles[4],
     )
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
-    O_4, H_4, C_4 = candle_4[:, 0], candle_4[:, 1], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
+    O_4, C_4 = candle_4["open"], candle_4["close"]
+    O_5, C_5 = candle_5["open"], candle_5["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.tall_black_body(O_3, C_3, percentile),
-            cf.black_body(O_4, C_4),
-            cf.white_body(O_5, C_5),
-            np.logical_not(cf.no_us(O_4, H_4, C_4, percentile)),
+            candle_1["tall_black_body"],
+            candle_2["tall_black_body"],
+            candle_3["tall_black_body"],
+            candle_4["black_body"],
+            candle_5["white_body"],
+            np.logical_not(candle_4["no_us"]),
             cf.up_body_gap(O_4, C_4, O_5, C_5),
             O_2 < O_1,
             O_3 < O_2,
@@ -389,7 +395,7 @@ def ladder_bottom_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> boo
 
 
 def ladder_bottom_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three tall black candles, each opening and closing lower, black
     candle with an upper shadow, white candle with an upwards body gap.
@@ -405,19 +411,19 @@ def ladder_bottom_no_trend(
         candles[3],
         candles[4],
     )
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
-    O_4, H_4, C_4 = candle_4[:, 0], candle_4[:, 1], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
+    O_4, C_4 = candle_4["open"], candle_4["close"]
+    O_5, C_5 = candle_5["open"], candle_5["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.tall_black_body(O_3, C_3, percentile),
-            cf.black_body(O_4, C_4),
-            cf.white_body(O_5, C_5),
-            np.logical_not(cf.no_us(O_4, H_4, C_4, percentile)),
+            candle_1["tall_black_body"],
+            candle_2["tall_black_body"],
+            candle_3["tall_black_body"],
+            candle_4["black_body"],
+            candle_5["white_body"],
+            np.logical_not(candle_4["no_us"]),
             cf.up_body_gap(O_4, C_4, O_5, C_5),
             O_2 < O_1,
             O_3 < O_2,
@@ -428,7 +434,7 @@ def ladder_bottom_no_trend(
 
 
 def ladder_bottom_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three tall black candles, each opening and closing lower, black
     candle with an upper shadow, white candle with an upwards body gap.
@@ -444,20 +450,20 @@ def ladder_bottom_opp_trend(
         candles[3],
         candles[4],
     )
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
-    O_4, H_4, C_4 = candle_4[:, 0], candle_4[:, 1], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
+    O_4, C_4 = candle_4["open"], candle_4["close"]
+    O_5, C_5 = candle_5["open"], candle_5["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.tall_black_body(O_3, C_3, percentile),
-            cf.black_body(O_4, C_4),
-            cf.white_body(O_5, C_5),
-            np.logical_not(cf.no_us(O_4, H_4, C_4, percentile)),
+            candle_1["tall_black_body"],
+            candle_2["tall_black_body"],
+            candle_3["tall_black_body"],
+            candle_4["black_body"],
+            candle_5["white_body"],
+            np.logical_not(candle_4["no_us"]),
             cf.up_body_gap(O_4, C_4, O_5, C_5),
             O_2 < O_1,
             O_3 < O_2,
@@ -467,7 +473,9 @@ def ladder_bottom_opp_trend(
     )
 
 
-def mat_hold_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def mat_hold_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall white candle, small black candle with an upwards body gap, short
     candle of either color and short black candle both closing lower, with close of #4
     staying above the low of #1, white candle that closes above the maximum of the
@@ -484,19 +492,24 @@ def mat_hold_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
         candles[3],
         candles[4],
     )
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, H_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 3]
-    O_4, H_4, C_4 = candle_4[:, 0], candle_4[:, 1], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
+    O_1, H_1, L_1, C_1 = (
+        candle_1["open"],
+        candle_1["high"],
+        candle_1["low"],
+        candle_1["close"],
+    )
+    O_2, H_2, C_2 = candle_2["open"], candle_2["high"], candle_2["close"]
+    H_3, C_3 = candle_3["high"], candle_3["close"]
+    H_4, C_4 = candle_4["high"], candle_4["close"]
+    C_5 = candle_5["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.short_black_body(O_2, C_2, percentile),
-            cf.short_body(O_3, C_3, percentile),
-            cf.short_black_body(O_4, C_4, percentile),
-            cf.white_body(O_5, C_5),
+            candle_1["tall_white_body"],
+            candle_2["short_black_body"],
+            candle_3["short_body"],
+            candle_4["short_black_body"],
+            candle_5["white_body"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             C_2 > C_3,
             C_3 > C_4,
@@ -506,7 +519,9 @@ def mat_hold_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
     )
 
 
-def mat_hold_no_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def mat_hold_no_trend(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall white candle, small black candle with an upwards body gap, short
     candle of either color and short black candle both closing lower, with close of #4
     staying above the low of #1, white candle that closes above the maximum of the
@@ -523,18 +538,23 @@ def mat_hold_no_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
         candles[3],
         candles[4],
     )
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, H_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 3]
-    O_4, H_4, C_4 = candle_4[:, 0], candle_4[:, 1], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
+    O_1, H_1, L_1, C_1 = (
+        candle_1["open"],
+        candle_1["high"],
+        candle_1["low"],
+        candle_1["close"],
+    )
+    O_2, H_2, C_2 = candle_2["open"], candle_2["high"], candle_2["close"]
+    H_3, C_3 = candle_3["high"], candle_3["close"]
+    H_4, C_4 = candle_4["high"], candle_4["close"]
+    C_5 = candle_5["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.short_black_body(O_2, C_2, percentile),
-            cf.short_body(O_3, C_3, percentile),
-            cf.short_black_body(O_4, C_4, percentile),
-            cf.white_body(O_5, C_5),
+            candle_1["tall_white_body"],
+            candle_2["short_black_body"],
+            candle_3["short_body"],
+            candle_4["short_black_body"],
+            candle_5["white_body"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             C_2 > C_3,
             C_3 > C_4,
@@ -544,7 +564,9 @@ def mat_hold_no_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     )
 
 
-def mat_hold_opp_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def mat_hold_opp_trend(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall white candle, small black candle with an upwards body gap, short
     candle of either color and short black candle both closing lower, with close of #4
     staying above the low of #1, white candle that closes above the maximum of the
@@ -561,19 +583,24 @@ def mat_hold_opp_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
         candles[3],
         candles[4],
     )
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, H_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 3]
-    O_4, H_4, C_4 = candle_4[:, 0], candle_4[:, 1], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
+    O_1, H_1, L_1, C_1 = (
+        candle_1["open"],
+        candle_1["high"],
+        candle_1["low"],
+        candle_1["close"],
+    )
+    O_2, H_2, C_2 = candle_2["open"], candle_2["high"], candle_2["close"]
+    H_3, C_3 = candle_3["high"], candle_3["close"]
+    H_4, C_4 = candle_4["high"], candle_4["close"]
+    C_5 = candle_5["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.short_black_body(O_2, C_2, percentile),
-            cf.short_body(O_3, C_3, percentile),
-            cf.short_black_body(O_4, C_4, percentile),
-            cf.white_body(O_5, C_5),
+            candle_1["tall_white_body"],
+            candle_2["short_black_body"],
+            candle_3["short_body"],
+            candle_4["short_black_body"],
+            candle_5["white_body"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             C_2 > C_3,
             C_3 > C_4,
@@ -584,7 +611,7 @@ def mat_hold_opp_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
 
 
 def rising_three_methods_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle, small black candle, small candle of either color,
     small black candle, tall white candle. #2, #3 and #4 close lower, but the closes of
@@ -602,19 +629,19 @@ def rising_three_methods_(
         candles[3],
         candles[4],
     )
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, H_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 3]
-    O_4, H_4, C_4 = candle_4[:, 0], candle_4[:, 1], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
+    H_1, L_1 = candle_1["high"], candle_1["low"]
+    H_2, C_2 = candle_2["high"], candle_2["close"]
+    H_3, C_3 = candle_3["high"], candle_3["close"]
+    H_4, C_4 = candle_4["high"], candle_4["close"]
+    C_5 = candle_5["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.short_black_body(O_2, C_2, percentile),
-            cf.short_body(O_3, C_3, percentile),
-            cf.short_black_body(O_4, C_4, percentile),
-            cf.tall_white_body(O_5, C_5, percentile),
+            candle_1["tall_white_body"],
+            candle_2["short_black_body"],
+            candle_3["short_body"],
+            candle_4["short_black_body"],
+            candle_5["tall_white_body"],
             C_2 > C_3,
             C_3 > C_4,
             H_1 > C_4,
@@ -625,7 +652,7 @@ def rising_three_methods_(
 
 
 def rising_three_methods_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle, small black candle, small candle of either color,
     small black candle, tall white candle. #2, #3 and #4 close lower, but the closes of
@@ -643,18 +670,18 @@ def rising_three_methods_no_trend(
         candles[3],
         candles[4],
     )
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, H_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 3]
-    O_4, H_4, C_4 = candle_4[:, 0], candle_4[:, 1], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
+    H_1, L_1 = candle_1["high"], candle_1["low"]
+    H_2, C_2 = candle_2["high"], candle_2["close"]
+    H_3, C_3 = candle_3["high"], candle_3["close"]
+    H_4, C_4 = candle_4["high"], candle_4["close"]
+    C_5 = candle_5["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.short_black_body(O_2, C_2, percentile),
-            cf.short_body(O_3, C_3, percentile),
-            cf.short_black_body(O_4, C_4, percentile),
-            cf.tall_white_body(O_5, C_5, percentile),
+            candle_1["tall_white_body"],
+            candle_2["short_black_body"],
+            candle_3["short_body"],
+            candle_4["short_black_body"],
+            candle_5["tall_white_body"],
             C_2 > C_3,
             C_3 > C_4,
             H_1 > C_4,
@@ -665,7 +692,7 @@ def rising_three_methods_no_trend(
 
 
 def rising_three_methods_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle, small black candle, small candle of either color,
     small black candle, tall white candle. #2, #3 and #4 close lower, but the closes of
@@ -683,19 +710,19 @@ def rising_three_methods_opp_trend(
         candles[3],
         candles[4],
     )
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, H_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 3]
-    O_4, H_4, C_4 = candle_4[:, 0], candle_4[:, 1], candle_4[:, 3]
-    O_5, C_5 = candle_5[:, 0], candle_5[:, 3]
+    H_1, L_1 = candle_1["high"], candle_1["low"]
+    H_2, C_2 = candle_2["high"], candle_2["close"]
+    H_3, C_3 = candle_3["high"], candle_3["close"]
+    H_4, C_4 = candle_4["high"], candle_4["close"]
+    C_5 = candle_5["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.short_black_body(O_2, C_2, percentile),
-            cf.short_body(O_3, C_3, percentile),
-            cf.short_black_body(O_4, C_4, percentile),
-            cf.tall_white_body(O_5, C_5, percentile),
+            candle_1["tall_white_body"],
+            candle_2["short_black_body"],
+            candle_3["short_body"],
+            candle_4["short_black_body"],
+            candle_5["tall_white_body"],
             C_2 > C_3,
             C_3 > C_4,
             H_1 > C_4,
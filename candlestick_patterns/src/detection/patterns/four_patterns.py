@@ -4,7 +4,7 @@ from detection.patterns.functions import candlestick_functions as cf
 
 
 def concealing_baby_swallow_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two tall black candles without shadows, black candle with long upper
     shadow and a downwards body gap compared to #1 and #2. The high of #3 is inside the
@@ -20,24 +20,29 @@ def concealing_baby_swallow_(
         candles[2],
         candles[3],
     )
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
-    O_3, H_3, L_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 2], candle_3[:, 3]
-    O_4, H_4, L_4, C_4 = candle_4[:, 0], candle_4[:, 1], candle_4[:, 2], candle_4[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, H_3, L_3, C_3 = (
+        candle_3["open"],
+        candle_3["high"],
+        candle_3["low"],
+        candle_3["close"],
+    )
+    H_4, L_4 = candle_4["high"], candle_4["low"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.black_body(O_3, C_3),
-            cf.black_body(O_4, C_4),
+            candle_1["tall_black_body"],
+            candle_2["tall_black_body"],
+            candle_3["black_body"],
+            candle_4["black_body"],
             cf.down_body_gap(O_1, C_1, O_3, C_3),
             cf.down_body_gap(O_2, C_2, O_3, C_3),
-            cf.no_us(O_1, H_1, C_1, percentile),
-            cf.no_us(O_2, H_2, C_2, percentile),
-            cf.no_ls(O_1, L_1, C_1, percentile),
-            cf.no_ls(O_2, L_2, C_2, percentile),
-            cf.long_ls(O_3, L_3, C_3, percentile),
+            candle_1["no_us"],
+            candle_2["no_us"],
+            candle_1["no_ls"],
+            candle_2["no_ls"],
+            candle_3["long_ls"],
             O_2 > H_3,
             H_3 > C_2,
             H_4 > H_3,
@@ -47,7 +52,7 @@ def concealing_baby_swallow_(
 
 
 def concealing_baby_swallow_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two tall black candles without shadows, black candle with long upper
     shadow and a downwards body gap compared to #1 and #2. The high of #3 is inside the
@@ -63,23 +68,28 @@ def concealing_baby_swallow_no_trend(
         candles[2],
         candles[3],
     )
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
-    O_3, H_3, L_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 2], candle_3[:, 3]
-    O_4, H_4, L_4, C_4 = candle_4[:, 0], candle_4[:, 1], candle_4[:, 2], candle_4[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, H_3, L_3, C_3 = (
+        candle_3["open"],
+        candle_3["high"],
+        candle_3["low"],
+        candle_3["close"],
+    )
+    H_4, L_4 = candle_4["high"], candle_4["low"]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.black_body(O_3, C_3),
-            cf.black_body(O_4, C_4),
+            candle_1["tall_black_body"],
+            candle_2["tall_black_body"],
+            candle_3["black_body"],
+            candle_4["black_body"],
             cf.down_body_gap(O_1, C_1, O_3, C_3),
             cf.down_body_gap(O_2, C_2, O_3, C_3),
-            cf.no_us(O_1, H_1, C_1, percentile),
-            cf.no_us(O_2, H_2, C_2, percentile),
-            cf.no_ls(O_1, L_1, C_1, percentile),
-            cf.no_ls(O_2, L_2, C_2, percentile),
-            cf.long_ls(O_3, L_3, C_3, percentile),
+            candle_1["no_us"],
+            candle_2["no_us"],
+            candle_1["no_ls"],
+            candle_2["no_ls"],
+            candle_3["long_ls"],
             O_2 > H_3,
             H_3 > C_2,
             H_4 > H_3,
@@ -89,7 +99,7 @@ def concealing_baby_swallow_no_trend(
 
 
 def concealing_baby_swallow_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two tall black candles without shadows, black candle with long upper
     shadow and a downwards body gap compared to #1 and #2. The high of #3 is inside the
@@ -105,24 +115,29 @@ def concealing_baby_swallow_opp_trend(
         candles[2],
         candles[3],
     )
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
-    O_3, H_3, L_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 2], candle_3[:, 3]
-    O_4, H_4, L_4, C_4 = candle_4[:, 0], candle_4[:, 1], candle_4[:, 2], candle_4[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, H_3, L_3, C_3 = (
+        candle_3["open"],
+        candle_3["high"],
+        candle_3["low"],
+        candle_3["close"],
+    )
+    H_4, L_4 = candle_4["high"], candle_4["low"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.black_body(O_3, C_3),
-            cf.black_body(O_4, C_4),
+            candle_1["tall_black_body"],
+            candle_2["tall_black_body"],
+            candle_3["black_body"],
+            candle_4["black_body"],
             cf.down_body_gap(O_1, C_1, O_3, C_3),
             cf.down_body_gap(O_2, C_2, O_3, C_3),
-            cf.no_us(O_1, H_1, C_1, percentile),
-            cf.no_us(O_2, H_2, C_2, percentile),
-            cf.no_ls(O_1, L_1, C_1, percentile),
-            cf.no_ls(O_2, L_2, C_2, percentile),
-            cf.long_ls(O_3, L_3, C_3, percentile),
+            candle_1["no_us"],
+            candle_2["no_us"],
+            candle_1["no_ls"],
+            candle_2["no_ls"],
+            candle_3["long_ls"],
             O_2 > H_3,
             H_3 > C_2,
             H_4 > H_3,
@@ -132,7 +147,7 @@ def concealing_baby_swallow_opp_trend(
 
 
 def three_line_strike_bearish_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three black candles, each one closing lower, white candle that opens
     below the close of #3 and closes above the open of #1.
@@ -147,17 +162,17 @@ def three_line_strike_bearish_(
         candles[2],
         candles[3],
     )
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
-    O_4, C_4 = candle_4[:, 0], candle_4[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    C_2 = candle_2["close"]
+    C_3 = candle_3["close"]
+    O_4, C_4 = candle_4["open"], candle_4["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.black_body(O_1, C_1),
-            cf.black_body(O_2, C_2),
-            cf.black_body(O_3, C_3),
-            cf.white_body(O_4, C_4),
+            candle_1["black_body"],
+            candle_2["black_body"],
+            candle_3["black_body"],
+            candle_4["white_body"],
             C_1 > C_2,
             C_2 > C_3,
             O_4 < C_3,
@@ -167,7 +182,7 @@ def three_line_strike_bearish_(
 
 
 def three_line_strike_bearish_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three black candles, each one closing lower, white candle that opens
     below the close of #3 and closes above the open of #1.
@@ -182,16 +197,16 @@ def three_line_strike_bearish_no_trend(
         candles[2],
         candles[3],
     )
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
-    O_4, C_4 = candle_4[:, 0], candle_4[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    C_2 = candle_2["close"]
+    C_3 = candle_3["close"]
+    O_4, C_4 = candle_4["open"], candle_4["close"]
     return np.logical_and.reduce(
         (
-            cf.black_body(O_1, C_1),
-            cf.black_body(O_2, C_2),
-            cf.black_body(O_3, C_3),
-            cf.white_body(O_4, C_4),
+            candle_1["black_body"],
+            candle_2["black_body"],
+            candle_3["black_body"],
+            candle_4["white_body"],
             C_1 > C_2,
             C_2 > C_3,
             O_4 < C_3,
@@ -201,7 +216,7 @@ def three_line_strike_bearish_no_trend(
 
 
 def three_line_strike_bearish_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three black candles, each one closing lower, white candle that opens
     below the close of #3 and closes above the open of #1.
@@ -216,17 +231,17 @@ def three_line_strike_bearish_opp_trend(
         candles[2],
         candles[3],
     )
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
-    O_4, C_4 = candle_4[:, 0], candle_4[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    C_2 = candle_2["close"]
+    C_3 = candle_3["close"]
+    O_4, C_4 = candle_4["open"], candle_4["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.black_body(O_1, C_1),
-            cf.black_body(O_2, C_2),
-            cf.black_body(O_3, C_3),
-            cf.white_body(O_4, C_4),
+            candle_1["black_body"],
+            candle_2["black_body"],
+            candle_3["black_body"],
+            candle_4["white_body"],
             C_1 > C_2,
             C_2 > C_3,
             O_4 < C_3,
@@ -236,7 +251,7 @@ def three_line_strike_bearish_opp_trend(
 
 
 def three_line_strike_bullish_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three white candles, each one closing higher, black candle that opens
     above the close of #3 and closes below the open of #1.
@@ -251,17 +266,17 @@ def three_line_strike_bullish_(
         candles[2],
         candles[3],
     )
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
-    O_4, C_4 = candle_4[:, 0], candle_4[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    C_2 = candle_2["close"]
+    C_3 = candle_3["close"]
+    O_4, C_4 = candle_4["open"], candle_4["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.white_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
-            cf.white_body(O_3, C_3),
-            cf.black_body(O_4, C_4),
+            candle_1["white_body"],
+            candle_2["white_body"],
+            candle_3["white_body"],
+            candle_4["black_body"],
             C_1 < C_2,
             C_2 < C_3,
             O_4 > C_3,
@@ -271,7 +286,7 @@ def three_line_strike_bullish_(
 
 
 def three_line_strike_bullish_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three white candles, each one closing higher, black candle that opens
     above the close of #3 and closes below the open of #1.
@@ -286,16 +301,16 @@ def three_line_strike_bullish_no_trend(
         candles[2],
         candles[3],
     )
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
-    O_4, C_4 = candle_4[:, 0], candle_4[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    C_2 = candle_2["close"]
+    C_3 = candle_3["close"]
+    O_4, C_4 = candle_4["open"], candle_4["close"]
     return np.logical_and.reduce(
         (
-            cf.white_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
-            cf.white_body(O_3, C_3),
-            cf.black_body(O_4, C_4),
+            candle_1["white_body"],
+            candle_2["white_body"],
+            candle_3["white_body"],
+            candle_4["black_body"],
             C_1 < C_2,
             C_2 < C_3,
             O_4 > C_3,
@@ -305,7 +320,7 @@ def three_line_strike_bullish_no_trend(
 
 
 def three_line_strike_bullish_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three white candles, each one closing higher, black candle that opens
     above the close of #3 and closes below the open of #1.
@@ -320,17 +335,17 @@ def three_line_strike_bullish_opp_trend(
         candles[2],
         candles[3],
     )
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
-    O_4, C_4 = candle_4[:, 0], candle_4[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    C_2 = candle_2["close"]
+    C_3 = candle_3["close"]
+    O_4, C_4 = candle_4["open"], candle_4["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.white_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
-            cf.white_body(O_3, C_3),
-            cf.black_body(O_4, C_4),
+            candle_1["white_body"],
+            candle_2["white_body"],
+            candle_3["white_body"],
+            candle_4["black_body"],
             C_1 < C_2,
             C_2 < C_3,
             O_4 > C_3,
@@ -1,7 +1,5 @@
 import numpy as np
 
-UNIFIED_PERCENTILE_LENGTH = 3
-
 
 def body_height(OP: float, C: float) -> float:
     """
@@ -22,7 +20,7 @@ def body_height(OP: float, C: float) -> float:
     return np.abs(OP - C)
 
 
-def near(x: float, y: float, percentile: tuple) -> bool:
+def near(x: float, y: float, calibration: dict) -> bool:
     """
     Checks if x and y are near to each other.
 
@@ -30,8 +28,8 @@ def near(x: float, y: float, percentile: tuple) -> bool:
     ----------
     x : float
     y : float
-    percentile : tuple
-        Tuple of length percentiles
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
 
     Returns
     -------
@@ -39,12 +37,10 @@ def near(x: float, y: float, percentile: tuple) -> bool:
         True if x and y are near, which is defined through a percentile.
         False otherwise.
     """
-    if len(percentile) == UNIFIED_PERCENTILE_LENGTH:
-        return np.abs(x - y) / np.maximum(x, y) < percentile[0][1]
-    return np.abs(x - y) / np.maximum(x, y) < (percentile[0][1] + percentile[1][1]) / 2
+    return np.abs(x - y) / np.maximum(x, y) < calibration["near"]
 
 
-def near_up(x: float, y: float, percentile: tuple) -> bool:
+def near_up(x: float, y: float, calibration: dict) -> bool:
     """
     Checks if x and y are near to each other, with x smaller than y.
 
@@ -52,8 +48,8 @@ def near_up(x: float, y: float, percentile: tuple) -> bool:
     ----------
     x : float
     y : float
-    percentile : tuple
-        Tuple of length percentiles.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
 
     Returns
     -------
@@ -61,10 +57,10 @@ def near_up(x: float, y: float, percentile: tuple) -> bool:
         True if x and y are near and x is smaller than y, which is defined through a
         percentile. False otherwise.
     """
-    return np.logical_and(near(x, y, percentile), x < y)
+    return np.logical_and(near(x, y, calibration), x < y)
 
 
-def doji(OP: float, C: float, percentile: tuple) -> bool:
+def doji(OP: float, C: float, calibration: dict) -> bool:
     """
     Checks if the candle is a doji.
 
@@ -74,20 +70,18 @@ def doji(OP: float, C: float, percentile: tuple) -> bool:
         Open.
     C : float
         Close.
-    percentile : tuple
-        Tuple of length percentiles.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
 
     Returns
     -------
     bool
         True if length of the body is in the appropriate percentile. False otherwise.
     """
-    if len(percentile) == UNIFIED_PERCENTILE_LENGTH:
-        return body_height(OP, C) < percentile[0][0]
-    return body_height(OP, C) < (percentile[0][0] + percentile[1][0]) / 2
+    return body_height(OP, C) < calibration["doji"]
 
 
-def short_body(OP: float, C: float, percentile: tuple) -> bool:
+def short_body(OP: float, C: float, calibration: dict) -> bool:
     """
     Checks if the candle has a short body.
 
@@ -97,8 +91,8 @@ def short_body(OP: float, C: float, percentile: tuple) -> bool:
         Open.
     C : float
         Close.
-    percentile : tuple
-        Tuple of length percentiles.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
 
     Returns
     -------
@@ -106,22 +100,13 @@ def short_body(OP: float, C: float, percentile: tuple) -> bool:
         True if length of the body is between the appropriate percentiles.
         False otherwise.
     """
-    if len(percentile) == UNIFIED_PERCENTILE_LENGTH:
-        return np.logical_and(
-            body_height(OP, C) >= percentile[0][0],
-            body_height(OP, C) < percentile[0][1],
-        )
-    return np.logical_and.reduce(
-        (
-            body_height(OP, C) >= percentile[0][0],
-            body_height(OP, C) < percentile[0][1],
-            body_height(OP, C) >= percentile[1][0],
-            body_height(OP, C) < percentile[1][1],
-        )
+    return np.logical_and(
+        body_height(OP, C) >= calibration["short_body"][0],
+        body_height(OP, C) < calibration["short_body"][1],
     )
 
 
-def no_us(OP: float, H: float, C: float, percentile: tuple) -> bool:
+def no_us(OP: float, H: float, C: float, calibration: dict) -> bool:
     """
     Checks if the candle has (almost) no upper shadow.
 
@@ -133,8 +118,8 @@ def no_us(OP: float, H: float, C: float, percentile: tuple) -> bool:
         High.
     C : float
         Close.
-    percentile : tuple
-        Tuple of length percentiles.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
 
     Returns
     -------
@@ -142,10 +127,10 @@ def no_us(OP: float, H: float, C: float, percentile: tuple) -> bool:
         True if length of the upper shadow is in the appropriate percentile.
         False otherwise.
     """
-    return upper_shadow_length(OP, H, C) <= percentile[-2][0]
+    return upper_shadow_length(OP, H, C) <= calibration["upper_shadow"][0]
 
 
-def small_us(OP: float, H: float, C: float, percentile: tuple) -> bool:
+def small_us(OP: float, H: float, C: float, calibration: dict) -> bool:
     """
     Checks if the upper shadow is small.
 
@@ -157,8 +142,8 @@ def small_us(OP: float, H: float, C: float, percentile: tuple) -> bool:
         High.
     C : float
         Close.
-    percentile : tuple
-        Tuple of length percentiles.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
 
     Returns
     -------
@@ -167,12 +152,12 @@ def small_us(OP: float, H: float, C: float, percentile: tuple) -> bool:
         False otherwise.
     """
     return np.logical_and(
-        upper_shadow_length(OP, H, C) > percentile[-2][0],
-        upper_shadow_length(OP, H, C) <= percentile[-2][1],
+        upper_shadow_length(OP, H, C) > calibration["upper_shadow"][0],
+        upper_shadow_length(OP, H, C) <= calibration["upper_shadow"][1],
     )
 
 
-def normal_us(OP: float, H: float, C: float, percentile: tuple) -> bool:
+def normal_us(OP: float, H: float, C: float, calibration: dict) -> bool:
     """
     Checks if the upper shadow is normal.
 
@@ -184,8 +169,8 @@ def normal_us(OP: float, H: float, C: float, percentile: tuple) -> bool:
         High.
     C : float
         Close.
-    percentile : tuple
-        Tuple of length percentiles.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
 
     Returns
     -------
@@ -194,12 +179,12 @@ def normal_us(OP: float, H: float, C: float, percentile: tuple) -> bool:
         False otherwise.
     """
     return np.logical_and(
-        upper_shadow_length(OP, H, C) > percentile[-2][1],
-        upper_shadow_length(OP, H, C) <= percentile[-2][2],
+        upper_shadow_length(OP, H, C) > calibration["upper_shadow"][1],
+        upper_shadow_length(OP, H, C) <= calibration["upper_shadow"][2],
     )
 
 
-def long_us(OP: float, H: float, C: float, percentile: tuple) -> bool:
+def long_us(OP: float, H: float, C: float, calibration: dict) -> bool:
     """
     Checks if the upper shadow is long.
 
@@ -211,8 +196,8 @@ def long_us(OP: float, H: float, C: float, percentile: tuple) -> bool:
         High.
     C : float
         Close.
-    percentile : tuple
-        Tuple of length percentiles.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
 
     Returns
     -------
@@ -221,12 +206,12 @@ def long_us(OP: float, H: float, C: float, percentile: tuple) -> bool:
         False otherwise.
     """
     return np.logical_and(
-        upper_shadow_length(OP, H, C) > percentile[-2][2],
-        upper_shadow_length(OP, H, C) <= percentile[-2][3],
+        upper_shadow_length(OP, H, C) > calibration["upper_shadow"][2],
+        upper_shadow_length(OP, H, C) <= calibration["upper_shadow"][3],
     )
 
 
-def exlong_us(OP: float, H: float, C: float, percentile: tuple) -> bool:
+def exlong_us(OP: float, H: float, C: float, calibration: dict) -> bool:
     """
     Checks if the upper shadow is extremely long.
 
@@ -238,8 +223,8 @@ def exlong_us(OP: float, H: float, C: float, percentile: tuple) -> bool:
         High.
     C : float
         Close.
-    percentile : tuple
-        Tuple of length percentiles.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
 
     Returns
     -------
@@ -247,10 +232,10 @@ def exlong_us(OP: float, H: float, C: float, percentile: tuple) -> bool:
         True if length of the upper shadow is between the appropriate percentiles.
         False otherwise.
     """
-    return upper_shadow_length(OP, H, C) > percentile[-2][3]
+    return upper_shadow_length(OP, H, C) > calibration["upper_shadow"][3]
 
 
-def no_ls(OP: float, L: float, C: float, percentile: tuple) -> bool:
+def no_ls(OP: float, L: float, C: float, calibration: dict) -> bool:
     """
     Checks if the candle has (almost) no lower shadow.
 
@@ -262,8 +247,8 @@ def no_ls(OP: float, L: float, C: float, percentile: tuple) -> bool:
         Low.
     C : float
         Close.
-    percentile : tuple
-        Tuple of length percentiles.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
 
     Returns
     -------
@@ -271,10 +256,10 @@ def no_ls(OP: float, L: float, C: float, percentile: tuple) -> bool:
         True if length of the lower shadow is in the appropriate percentile.
         False otherwise.
     """
-    return lower_shadow_length(OP, L, C) <= percentile[-1][0]
+    return lower_shadow_length(OP, L, C) <= calibration["lower_shadow"][0]
 
 
-def small_ls(OP: float, L: float, C: float, percentile: tuple) -> bool:
+def small_ls(OP: float, L: float, C: float, calibration: dict) -> bool:
     """
     Checks if the lower shadow is small.
 
@@ -286,8 +271,8 @@ def small_ls(OP: float, L: float, C: float, percentile: tuple) -> bool:
         Low.
     C : float
         Close.
-    percentile : tuple
-        Tuple of length percentiles.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
 
     Returns
     -------
@@ -296,12 +281,12 @@ def small_ls(OP: float, L: float, C: float, percentile: tuple) -> bool:
         False otherwise.
     """
     return np.logical_and(
-        lower_shadow_length(OP, L, C) > percentile[-1][0],
-        lower_shadow_length(OP, L, C) <= percentile[-1][1],
+        lower_shadow_length(OP, L, C) > calibration["lower_shadow"][0],
+        lower_shadow_length(OP, L, C) <= calibration["lower_shadow"][1],
     )
 
 
-def normal_ls(OP: float, L: float, C: float, percentile: tuple) -> bool:
+def normal_ls(OP: float, L: float, C: float, calibration: dict) -> bool:
     """
     Checks if the lower shadow is normal.
 
@@ -313,8 +298,8 @@ def normal_ls(OP: float, L: float, C: float, percentile: tuple) -> bool:
         Low.
     C : float
         Close.
-    percentile : tuple
-        Tuple of length percentiles.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
 
     Returns
     -------
@@ -323,12 +308,12 @@ def normal_ls(OP: float, L: float, C: float, percentile: tuple) -> bool:
         False otherwise.
     """
     return np.logical_and(
-        lower_shadow_length(OP, L, C) > percentile[-1][1],
-        lower_shadow_length(OP, L, C) <= percentile[-1][2],
+        lower_shadow_length(OP, L, C) > calibration["lower_shadow"][1],
+        lower_shadow_length(OP, L, C) <= calibration["lower_shadow"][2],
     )
 
 
-def long_ls(OP: float, L: float, C: float, percentile: tuple) -> bool:
+def long_ls(OP: float, L: float, C: float, calibration: dict) -> bool:
     """
     Checks if the lower shadow is long.
 
@@ -340,8 +325,8 @@ def long_ls(OP: float, L: float, C: float, percentile: tuple) -> bool:
         Low.
     C : float
         Close.
-    percentile : tuple
-        Tuple of length percentiles.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
 
     Returns
     -------
@@ -350,12 +335,12 @@ def long_ls(OP: float, L: float, C: float, percentile: tuple) -> bool:
         False otherwise.
     """
     return np.logical_and(
-        lower_shadow_length(OP, L, C) > percentile[-1][2],
-        lower_shadow_length(OP, L, C) <= percentile[-1][3],
+        lower_shadow_length(OP, L, C) > calibration["lower_shadow"][2],
+        lower_shadow_length(OP, L, C) <= calibration["lower_shadow"][3],
     )
 
 
-def exlong_ls(OP: float, L: float, C: float, percentile: tuple) -> bool:
+def exlong_ls(OP: float, L: float, C: float, calibration: dict) -> bool:
     """
     Checks if the lower shadow is extremely long.
 
@@ -367,8 +352,8 @@ def exlong_ls(OP: float, L: float, C: float, percentile: tuple) -> bool:
         Low.
     C : float
         Close.
-    percentile : tuple
-        Tuple of length percentiles.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
 
     Returns
     -------
@@ -376,7 +361,7 @@ def exlong_ls(OP: float, L: float, C: float, percentile: tuple) -> bool:
         True if length of the lower shadow is between the appropriate percentiles.
         False otherwise.
     """
-    return lower_shadow_length(OP, L, C) > percentile[-1][3]
+    return lower_shadow_length(OP, L, C) > calibration["lower_shadow"][3]
 
 
 def top_body(OP: float, C: float) -> float:
@@ -502,7 +487,7 @@ def black_body(OP: float, C: float) -> bool:
     return OP > C
 
 
-def short_black_body(OP: float, C: float, percentile: tuple) -> bool:
+def short_black_body(OP: float, C: float, calibration: dict) -> bool:
     """
     Checks if the candle is black and has a short body.
 
@@ -512,8 +497,8 @@ def short_black_body(OP: float, C: float, percentile: tuple) -> bool:
         Open.
     C : float
         Close.
-    percentile : tuple
-        Tuple of length percentiles.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
 
     Returns
     -------
@@ -524,13 +509,13 @@ def short_black_body(OP: float, C: float, percentile: tuple) -> bool:
     return np.logical_and.reduce(
         (
             OP > C,
-            body_height(OP, C) >= percentile[0][0],
-            body_height(OP, C) < percentile[0][1],
+            body_height(OP, C) >= calibration["black_body"][0],
+            body_height(OP, C) < calibration["black_body"][1],
         )
     )
 
 
-def normal_black_body(OP: float, C: float, percentile: tuple) -> bool:
+def normal_black_body(OP: float, C: float, calibration: dict) -> bool:
     """
     Checks if the candle is black and has a normal body.
 
@@ -540,8 +525,8 @@ def normal_black_body(OP: float, C: float, percentile: tuple) -> bool:
         Open.
     C : float
         Close.
-    percentile : tuple
-        Tuple of length percentiles.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
 
     Returns
     -------
@@ -552,13 +537,13 @@ def normal_black_body(OP: float, C: float, percentile: tuple) -> bool:
     return np.logical_and.reduce(
         (
             OP > C,
-            body_height(OP, C) >= percentile[0][1],
-            body_height(OP, C) < percentile[0][2],
+            body_height(OP, C) >= calibration["black_body"][1],
+            body_height(OP, C) < calibration["black_body"][2],
         )
     )
 
 
-def tall_black_body(OP: float, C: float, percentile: tuple) -> bool:
+def tall_black_body(OP: float, C: float, calibration: dict) -> bool:
     """
     Checks if the candle is black and has a tall body.
 
@@ -568,8 +553,8 @@ def tall_black_body(OP: float, C: float, percentile: tuple) -> bool:
         Open.
     C : float
         Close.
-    percentile: tuple
-        Tuple of length percentiles.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
 
     Returns
     -------
@@ -579,7 +564,7 @@ def tall_black_body(OP: float, C: float, percentile: tuple) -> bool:
     """
     return np.logical_and(
         OP > C,
-        body_height(OP, C) >= percentile[0][2],
+        body_height(OP, C) >= calibration["black_body"][2],
     )
 
 
@@ -602,7 +587,7 @@ def white_body(OP: float, C: float) -> bool:
     return OP < C
 
 
-def short_white_body(OP: float, C: float, percentile: tuple) -> bool:
+def short_white_body(OP: float, C: float, calibration: dict) -> bool:
     """
     Checks if the candle is white and the body is short.
 
@@ -612,8 +597,8 @@ def short_white_body(OP: float, C: float, percentile: tuple) -> bool:
         Open.
     C : float
         Close.
-    percentile : tuple
-        Tuple of length percentiles.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
 
     Returns
     -------
@@ -621,24 +606,16 @@ def short_white_body(OP: float, C: float, percentile: tuple) -> bool:
         True if open is strictly smaller than close and length of the body is in the
         appropriate percentile. False otherwise.
     """
-    if len(percentile) == UNIFIED_PERCENTILE_LENGTH:
-        return np.logical_and.reduce(
-            (
-                OP < C,
-                body_height(OP, C) >= percentile[0][0],
-                body_height(OP, C) < percentile[0][1],
-            )
-        )
     return np.logical_and.reduce(
         (
             OP < C,
-            body_height(OP, C) >= percentile[1][0],
-            body_height(OP, C) < percentile[1][1],
+            body_height(OP, C) >= calibration["white_body"][0],
+            body_height(OP, C) < calibration["white_body"][1],
         )
     )
 
 
-def normal_white_body(OP: float, C: float, percentile: tuple) -> bool:
+def normal_white_body(OP: float, C: float, calibration: dict) -> bool:
     """
     Checks if the candle is white and the body is normal.
 
@@ -648,8 +625,8 @@ def normal_white_body(OP: float, C: float, percentile: tuple) -> bool:
         Open.
     C : float
         Close.
-    percentile : tuple
-        Tuple of length percentiles.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
 
     Returns
     -------
@@ -657,24 +634,16 @@ def normal_white_body(OP: float, C: float, percentile: tuple) -> bool:
         True if open is strictly smaller than close and length of the body is in the
         appropriate percentile. False otherwise.
     """
-    if len(percentile) == UNIFIED_PERCENTILE_LENGTH:
-        return np.logical_and.reduce(
-            (
-                OP < C,
-                body_height(OP, C) >= percentile[0][1],
-                body_height(OP, C) < percentile[0][2],
-            )
-        )
     return np.logical_and.reduce(
         (
             OP < C,
-            body_height(OP, C) >= percentile[1][1],
-            body_height(OP, C) < percentile[1][2],
+            body_height(OP, C) >= calibration["white_body"][1],
+            body_height(OP, C) < calibration["white_body"][2],
         )
     )
 
 
-def tall_white_body(OP: float, C: float, percentile: tuple) -> bool:
+def tall_white_body(OP: float, C: float, calibration: dict) -> bool:
     """
     Checks if the candle is white and the body is tall.
 
@@ -684,8 +653,8 @@ def tall_white_body(OP: float, C: float, percentile: tuple) -> bool:
         Open.
     C : float
         Close.
-    percentile : tuple
-        Tuple of length percentiles.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
 
     Returns
     -------
@@ -693,11 +662,9 @@ def tall_white_body(OP: float, C: float, percentile: tuple) -> bool:
         True if open is strictly smaller than close and length of the body is in the
         appropriate percentile. False otherwise.
     """
-    if len(percentile) == UNIFIED_PERCENTILE_LENGTH:
-        return np.logical_and(OP < C, body_height(OP, C) >= percentile[0][2])
     return np.logical_and(
         OP < C,
-        body_height(OP, C) >= percentile[1][2],
+        body_height(OP, C) >= calibration["white_body"][2],
     )
 
 
@@ -791,3 +758,345 @@ def up_body_gap(
         of the second candles body. False otherwise.
     """
     return top_body(first_O, first_C) < bottom_body(second_O, second_C)
+
+
+def run_length(condition: np.ndarray) -> np.ndarray:
+    """
+    Counts the consecutive candles up to every candle for which a condition holds.
+
+    A condition holding on the last k candles is ``run_length(condition) >= k``, e.g.
+    k black candles in a row, which takes the same time for every k.
+
+    Parameters
+    ----------
+    condition : np.ndarray
+        Boolean array, with time along the last axis.
+
+    Returns
+    -------
+    np.ndarray
+        Number of candles, as floats like the other numeric features.
+    """
+    positions = np.arange(1, condition.shape[-1] + 1)
+    last_false = np.maximum.accumulate(np.where(condition, 0, positions), axis=-1)
+    return (positions - last_false).astype(float)
+
+
+def rising_highs(H: np.ndarray) -> np.ndarray:
+    """
+    Counts the consecutive candles up to every candle with a higher high than the
+    candle before, so the highs of the last k candles are strictly increasing if it
+    is at least k - 1.
+
+    Parameters
+    ----------
+    H : np.ndarray
+        High, with time along the last axis.
+
+    Returns
+    -------
+    np.ndarray
+        Number of candles, zero if the candle before is missing.
+    """
+    H = np.atleast_1d(H)
+    return run_length(shift(H, 1) < H)
+
+
+def candle_features(
+    OP: np.ndarray, H: np.ndarray, L: np.ndarray, C: np.ndarray, calibration: dict
+) -> dict[str, np.ndarray]:
+    """
+    Computes all features of the candles at once, so they can be shared by all the
+    pattern functions instead of being recomputed for every pattern.
+
+    Parameters
+    ----------
+    OP : np.ndarray
+        Open.
+    H : np.ndarray
+        High.
+    L : np.ndarray
+        Low.
+    C : np.ndarray
+        Close.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Dict with the OHLC data, body height, color, shadow lengths and every
+        body/shadow size class, keyed by the name of the function computing it.
+    """
+    return {
+        **numeric_features(OP, H, L, C),
+        "black_body": black_body(OP, C),
+        "white_body": white_body(OP, C),
+        "doji": doji(OP, C, calibration),
+        "short_body": short_body(OP, C, calibration),
+        "short_black_body": short_black_body(OP, C, calibration),
+        "normal_black_body": normal_black_body(OP, C, calibration),
+        "tall_black_body": tall_black_body(OP, C, calibration),
+        "short_white_body": short_white_body(OP, C, calibration),
+        "normal_white_body": normal_white_body(OP, C, calibration),
+        "tall_white_body": tall_white_body(OP, C, calibration),
+        "no_us": no_us(OP, H, C, calibration),
+        "small_us": small_us(OP, H, C, calibration),
+        "normal_us": normal_us(OP, H, C, calibration),
+        "long_us": long_us(OP, H, C, calibration),
+        "exlong_us": exlong_us(OP, H, C, calibration),
+        "no_ls": no_ls(OP, L, C, calibration),
+        "small_ls": small_ls(OP, L, C, calibration),
+        "normal_ls": normal_ls(OP, L, C, calibration),
+        "long_ls": long_ls(OP, L, C, calibration),
+        "exlong_ls": exlong_ls(OP, L, C, calibration),
+    }
+
+
+def numeric_features(
+    OP: np.ndarray, H: np.ndarray, L: np.ndarray, C: np.ndarray
+) -> dict[str, np.ndarray]:
+    """
+    Computes the prices, body and shadow lengths and the run of rising highs of the
+    candles.
+
+    Parameters
+    ----------
+    OP : np.ndarray
+        Open.
+    H : np.ndarray
+        High.
+    L : np.ndarray
+        Low.
+    C : np.ndarray
+        Close.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        The float features of ``candle_features``.
+    """
+    return {
+        "open": OP,
+        "high": H,
+        "low": L,
+        "close": C,
+        "body_height": body_height(OP, C),
+        "top_body": top_body(OP, C),
+        "bottom_body": bottom_body(OP, C),
+        "upper_shadow_length": upper_shadow_length(OP, H, C),
+        "lower_shadow_length": lower_shadow_length(OP, L, C),
+        "total_shadow_length": total_shadow_length(OP, H, L, C),
+        "rising_highs": rising_highs(H),
+    }
+
+
+# Bits of the candle codes: color (none, black or white), body class of that color
+# (none, short, normal or tall), doji, short body, and the upper and lower shadow
+# class (missing, no, small, normal, long or exlong). Missing candles have code 0,
+# for which all class features are False.
+CODE_BITS = 12
+BODY_CLASSES = ["short", "normal", "tall"]
+SHADOW_CLASSES = ["no", "small", "normal", "long", "exlong"]
+
+
+def candle_codes(
+    OP: np.ndarray, H: np.ndarray, L: np.ndarray, C: np.ndarray, calibration: dict
+) -> np.ndarray:
+    """
+    Encodes the color, body and shadow classes of every candle in a single integer.
+
+    The boolean features of ``candle_features`` follow from the codes, see
+    ``code_features``, so the classes of a candle are computed once and compared as
+    integers afterwards. Assumes increasing percentiles, as computed by the
+    calibration, so a candle is in at most one body and one shadow class.
+
+    Parameters
+    ----------
+    OP : np.ndarray
+        Open.
+    H : np.ndarray
+        High.
+    L : np.ndarray
+        Low.
+    C : np.ndarray
+        Close.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
+
+    Returns
+    -------
+    np.ndarray
+        Candle codes of type ``np.uint16``, using the lowest ``CODE_BITS`` bits.
+    """
+    return feature_codes(numeric_features(OP, H, L, C), calibration)
+
+
+def feature_codes(feature_dict: dict[str, np.ndarray], calibration: dict) -> np.ndarray:
+    """
+    Encodes the candles from their numeric features, see ``candle_codes``.
+
+    The features do not depend on the percentiles, so the candles are measured once
+    and only classified again for other percentiles.
+
+    Parameters
+    ----------
+    feature_dict : dict[str, np.ndarray]
+        The float features of the candles, see ``numeric_features``.
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
+
+    Returns
+    -------
+    np.ndarray
+        Candle codes of type ``np.uint16``, using the lowest ``CODE_BITS`` bits.
+    """
+    OP, C = feature_dict["open"], feature_dict["close"]
+    black, white = black_body(OP, C), white_body(OP, C)
+    body = feature_dict["body_height"]
+    codes = black.astype(np.uint16) | white.astype(np.uint16) << 1
+    body_class = np.zeros_like(body, dtype=np.uint16)
+    for color, color_thresholds in [
+        (black, calibration["black_body"]),
+        (white, calibration["white_body"]),
+    ]:
+        for threshold in color_thresholds:
+            body_class += color & (body >= threshold)
+    codes |= body_class << 2
+    codes |= doji(OP, C, calibration).astype(np.uint16) << 4
+    codes |= short_body(OP, C, calibration).astype(np.uint16) << 5
+    for bit, length, shadow_thresholds in [
+        (6, feature_dict["upper_shadow_length"], calibration["upper_shadow"]),
+        (9, feature_dict["lower_shadow_length"], calibration["lower_shadow"]),
+    ]:
+        shadow_class = (~np.isnan(length)).astype(np.uint16)
+        for threshold in shadow_thresholds:
+            shadow_class += length > threshold
+        codes |= shadow_class << bit
+    return codes
+
+
+def code_features(codes: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Decodes candle codes into the boolean features of ``candle_features``.
+
+    Parameters
+    ----------
+    codes : np.ndarray
+        Candle codes, see ``candle_codes``.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Dict with the color, body and shadow size classes.
+    """
+    color, body_class = codes & 3, codes >> 2 & 3
+    features = {
+        "black_body": color == 1,
+        "white_body": color == 2,  # noqa: PLR2004
+        "doji": (codes >> 4 & 1).astype(bool),
+        "short_body": (codes >> 5 & 1).astype(bool),
+    }
+    for color_code, color_name in [(1, "black"), (2, "white")]:
+        for k, size in enumerate(BODY_CLASSES, start=1):
+            features[f"{size}_{color_name}_body"] = (color == color_code) & (
+                body_class == k
+            )
+    for shift_bits, shadow in [(6, "us"), (9, "ls")]:
+        for k, size in enumerate(SHADOW_CLASSES, start=1):
+            features[f"{size}_{shadow}"] = codes >> shift_bits & 7 == k
+    return features
+
+
+def shift(feature: np.ndarray, n: int) -> np.ndarray:
+    """
+    Shifts a feature array ``n`` candles forward in time.
+
+    Parameters
+    ----------
+    feature : np.ndarray
+        Float or boolean feature array, with time along the last axis.
+    n : int
+        Number of candles to shift by.
+
+    Returns
+    -------
+    np.ndarray
+        The shifted array. The first ``n`` values are filled with ``np.nan`` for float
+        arrays and ``False`` for boolean arrays, which is what the features evaluate to
+        on missing candles.
+    """
+    if n == 0:
+        return feature
+    shifted = np.empty_like(feature)
+    shifted[..., :n] = False if feature.dtype == bool else np.nan
+    shifted[..., n:] = feature[..., :-n]
+    return shifted
+
+
+def lagged_features(
+    feature_dict: dict[str, np.ndarray], max_lag: int
+) -> list[dict[str, np.ndarray]]:
+    """
+    Lags all candle features by 0 up to ``max_lag`` candles, without a copy per lag.
+
+    Every feature is padded once with ``max_lag`` missing candles in front, the lagged
+    features are read-only views into that padded array. Time is along the last axis.
+
+    Parameters
+    ----------
+    feature_dict : dict[str, np.ndarray]
+        Candle features, see ``candle_features``.
+    max_lag : int
+        Largest number of candles to lag by.
+
+    Returns
+    -------
+    list[dict[str, np.ndarray]]
+        The features lagged by ``n`` candles at index ``n``, equal to
+        ``shift(feature, n)``.
+    """
+    padded_dict = {}
+    for name, feature in feature_dict.items():
+        padded = np.empty(
+            (*feature.shape[:-1], max_lag + feature.shape[-1]), dtype=feature.dtype
+        )
+        padded[..., :max_lag] = False if feature.dtype == bool else np.nan
+        padded[..., max_lag:] = feature
+        padded.flags.writeable = False
+        padded_dict[name] = padded
+    return [
+        {
+            name: padded[..., max_lag - n : padded.shape[-1] - n]
+            for name, padded in padded_dict.items()
+        }
+        for n in range(max_lag + 1)
+    ]
+
+
+def panel_calibration(calibrations: list[dict]) -> dict:
+    """
+    Stacks the calibrations of several assets, so the candle features of a panel
+    with one row per asset broadcast every asset against its own thresholds.
+
+    Parameters
+    ----------
+    calibrations : list[dict]
+        Calibration of every asset, see ``calibration.resolve_calibration``.
+
+    Returns
+    -------
+    dict
+        Calibration with every threshold of shape (number of assets, 1), preceded by
+        the number of thresholds for the classes.
+    """
+    return {
+        name: np.stack(
+            [
+                np.asarray(calibration[name], dtype=float)
+                for calibration in calibrations
+            ],
+            axis=-1,
+        )[..., np.newaxis]
+        for name in calibrations[0]
+    }
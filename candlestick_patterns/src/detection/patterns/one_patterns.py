@@ -3,7 +3,9 @@ import numpy as np
 from detection.patterns.functions import candlestick_functions as cf
 
 
-def belt_hold_bearish_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def belt_hold_bearish_(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall black candle in an uptrend with no upper shadow that closes near
     the low.
 
@@ -11,19 +13,18 @@ def belt_hold_bearish_(candle: np.ndarray, T: np.ndarray, percentile: tuple) ->
 
     Prediction: reversal.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(OP, C, percentile),
-            cf.no_us(OP, H, C, percentile),
-            cf.small_ls(OP, L, C, percentile),
+            candle["tall_black_body"],
+            candle["no_us"],
+            candle["small_ls"],
         )
     )
 
 
 def belt_hold_bearish_no_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle in an uptrend with no upper shadow that closes near
     the low.
@@ -32,18 +33,17 @@ def belt_hold_bearish_no_trend(
 
     Prediction: reversal.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(OP, C, percentile),
-            cf.no_us(OP, H, C, percentile),
-            cf.small_ls(OP, L, C, percentile),
+            candle["tall_black_body"],
+            candle["no_us"],
+            candle["small_ls"],
         )
     )
 
 
 def belt_hold_bearish_opp_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle in an uptrend with no upper shadow that closes near
     the low.
@@ -52,18 +52,19 @@ def belt_hold_bearish_opp_trend(
 
     Prediction: reversal.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(OP, C, percentile),
-            cf.no_us(OP, H, C, percentile),
-            cf.small_ls(OP, L, C, percentile),
+            candle["tall_black_body"],
+            candle["no_us"],
+            candle["small_ls"],
         )
     )
 
 
-def belt_hold_bullish_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def belt_hold_bullish_(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall white candle in a downtrend with no lower shadow that closes
     near the high.
 
@@ -71,19 +72,18 @@ def belt_hold_bullish_(candle: np.ndarray, T: np.ndarray, percentile: tuple) ->
 
     Prediction: reversal.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(OP, C, percentile),
-            cf.no_ls(OP, L, C, percentile),
-            cf.small_us(OP, H, C, percentile),
+            candle["tall_white_body"],
+            candle["no_ls"],
+            candle["small_us"],
         )
     )
 
 
 def belt_hold_bullish_no_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle in a downtrend with no lower shadow that closes
     near the high.
@@ -92,18 +92,17 @@ def belt_hold_bullish_no_trend(
 
     Prediction: reversal.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(OP, C, percentile),
-            cf.no_ls(OP, L, C, percentile),
-            cf.small_us(OP, H, C, percentile),
+            candle["tall_white_body"],
+            candle["no_ls"],
+            candle["small_us"],
         )
     )
 
 
 def belt_hold_bullish_opp_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle in a downtrend with no lower shadow that closes
     near the high.
@@ -112,18 +111,19 @@ def belt_hold_bullish_opp_trend(
 
     Prediction: reversal.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(OP, C, percentile),
-            cf.no_ls(OP, L, C, percentile),
-            cf.small_us(OP, H, C, percentile),
+            candle["tall_white_body"],
+            candle["no_ls"],
+            candle["small_us"],
         )
     )
 
 
-def candle_black_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def candle_black_(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: normal black candle with shadows that do not exceed the length of the
     body.
 
@@ -131,20 +131,19 @@ def candle_black_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
-            cf.normal_black_body(OP, C, percentile),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            cf.upper_shadow_length(OP, H, C) < cf.body_height(OP, C),
-            cf.lower_shadow_length(OP, L, C) < cf.body_height(OP, C),
+            candle["normal_black_body"],
+            np.logical_not(candle["no_us"]),
+            np.logical_not(candle["no_ls"]),
+            candle["upper_shadow_length"] < candle["body_height"],
+            candle["lower_shadow_length"] < candle["body_height"],
         )
     )
 
 
 def candle_black_down_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: normal black candle with shadows that do not exceed the length of the
     body.
@@ -153,20 +152,21 @@ def candle_black_down_trend(
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.normal_black_body(OP, C, percentile),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            cf.upper_shadow_length(OP, H, C) < cf.body_height(OP, C),
-            cf.lower_shadow_length(OP, L, C) < cf.body_height(OP, C),
+            candle["normal_black_body"],
+            np.logical_not(candle["no_us"]),
+            np.logical_not(candle["no_ls"]),
+            candle["upper_shadow_length"] < candle["body_height"],
+            candle["lower_shadow_length"] < candle["body_height"],
         )
     )
 
 
-def candle_black_up_trend(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def candle_black_up_trend(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: normal black candle with shadows that do not exceed the length of the
     body.
 
@@ -174,20 +174,21 @@ def candle_black_up_trend(candle: np.ndarray, T: np.ndarray, percentile: tuple)
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.normal_black_body(OP, C, percentile),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            cf.upper_shadow_length(OP, H, C) < cf.body_height(OP, C),
-            cf.lower_shadow_length(OP, L, C) < cf.body_height(OP, C),
+            candle["normal_black_body"],
+            np.logical_not(candle["no_us"]),
+            np.logical_not(candle["no_ls"]),
+            candle["upper_shadow_length"] < candle["body_height"],
+            candle["lower_shadow_length"] < candle["body_height"],
         )
     )
 
 
-def candle_short_black_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def candle_short_black_(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: normal black candle with shadows that do not exceed the length of the
     body.
 
@@ -195,20 +196,19 @@ def candle_short_black_(candle: np.ndarray, T: np.ndarray, percentile: tuple) ->
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
-            cf.short_black_body(OP, C, percentile),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            cf.upper_shadow_length(OP, H, C) < cf.body_height(OP, C),
-            cf.lower_shadow_length(OP, L, C) < cf.body_height(OP, C),
+            candle["short_black_body"],
+            np.logical_not(candle["no_us"]),
+            np.logical_not(candle["no_ls"]),
+            candle["upper_shadow_length"] < candle["body_height"],
+            candle["lower_shadow_length"] < candle["body_height"],
         )
     )
 
 
 def candle_short_black_down_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: normal black candle with shadows that do not exceed the length of the
     body.
@@ -217,21 +217,20 @@ def candle_short_black_down_trend(
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.short_black_body(OP, C, percentile),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            cf.upper_shadow_length(OP, H, C) < cf.body_height(OP, C),
-            cf.lower_shadow_length(OP, L, C) < cf.body_height(OP, C),
+            candle["short_black_body"],
+            np.logical_not(candle["no_us"]),
+            np.logical_not(candle["no_ls"]),
+            candle["upper_shadow_length"] < candle["body_height"],
+            candle["lower_shadow_length"] < candle["body_height"],
         )
     )
 
 
 def candle_short_black_up_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: normal black candle with shadows that do not exceed the length of the
     body.
@@ -240,20 +239,21 @@ def candle_short_black_up_trend(
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.short_black_body(OP, C, percentile),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            cf.upper_shadow_length(OP, H, C) < cf.body_height(OP, C),
-            cf.lower_shadow_length(OP, L, C) < cf.body_height(OP, C),
+            candle["short_black_body"],
+            np.logical_not(candle["no_us"]),
+            np.logical_not(candle["no_ls"]),
+            candle["upper_shadow_length"] < candle["body_height"],
+            candle["lower_shadow_length"] < candle["body_height"],
         )
     )
 
 
-def candle_short_white_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def candle_short_white_(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: normal white candle with shadows that do not exceed the length of the
     body.
 
@@ -261,20 +261,19 @@ def candle_short_white_(candle: np.ndarray, T: np.ndarray, percentile: tuple) ->
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
-            cf.short_white_body(OP, C, percentile),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            cf.upper_shadow_length(OP, H, C) < cf.body_height(OP, C),
-            cf.lower_shadow_length(OP, L, C) < cf.body_height(OP, C),
+            candle["short_white_body"],
+            np.logical_not(candle["no_us"]),
+            np.logical_not(candle["no_ls"]),
+            candle["upper_shadow_length"] < candle["body_height"],
+            candle["lower_shadow_length"] < candle["body_height"],
         )
     )
 
 
 def candle_short_white_down_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: normal white candle with shadows that do not exceed the length of the
     body.
@@ -283,21 +282,20 @@ def candle_short_white_down_trend(
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.short_white_body(OP, C, percentile),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            cf.upper_shadow_length(OP, H, C) < cf.body_height(OP, C),
-            cf.lower_shadow_length(OP, L, C) < cf.body_height(OP, C),
+            candle["short_white_body"],
+            np.logical_not(candle["no_us"]),
+            np.logical_not(candle["no_ls"]),
+            candle["upper_shadow_length"] < candle["body_height"],
+            candle["lower_shadow_length"] < candle["body_height"],
         )
     )
 
 
 def candle_short_white_up_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: normal white candle with shadows that do not exceed the length of the
     body.
@@ -306,20 +304,21 @@ def candle_short_white_up_trend(
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.short_white_body(OP, C, percentile),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            cf.upper_shadow_length(OP, H, C) < cf.body_height(OP, C),
-            cf.lower_shadow_length(OP, L, C) < cf.body_height(OP, C),
+            candle["short_white_body"],
+            np.logical_not(candle["no_us"]),
+            np.logical_not(candle["no_ls"]),
+            candle["upper_shadow_length"] < candle["body_height"],
+            candle["lower_shadow_length"] < candle["body_height"],
         )
     )
 
 
-def candle_white_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def candle_white_(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: normal white candle with shadows that do not exceed the length of the
     body.
 
@@ -327,20 +326,19 @@ def candle_white_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
-            cf.normal_white_body(OP, C, percentile),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            cf.upper_shadow_length(OP, H, C) < cf.body_height(OP, C),
-            cf.lower_shadow_length(OP, L, C) < cf.body_height(OP, C),
+            candle["normal_white_body"],
+            np.logical_not(candle["no_us"]),
+            np.logical_not(candle["no_ls"]),
+            candle["upper_shadow_length"] < candle["body_height"],
+            candle["lower_shadow_length"] < candle["body_height"],
         )
     )
 
 
 def candle_white_down_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: normal white candle with shadows that do not exceed the length of the
     body.
@@ -349,20 +347,21 @@ def candle_white_down_trend(
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.normal_white_body(OP, C, percentile),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            cf.upper_shadow_length(OP, H, C) < cf.body_height(OP, C),
-            cf.lower_shadow_length(OP, L, C) < cf.body_height(OP, C),
+            candle["normal_white_body"],
+            np.logical_not(candle["no_us"]),
+            np.logical_not(candle["no_ls"]),
+            candle["upper_shadow_length"] < candle["body_height"],
+            candle["lower_shadow_length"] < candle["body_height"],
         )
     )
 
 
-def candle_white_up_trend(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def candle_white_up_trend(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: normal white candle with shadows that do not exceed the length of the
     body.
 
@@ -370,38 +369,38 @@ def candle_white_up_trend(candle: np.ndarray, T: np.ndarray, percentile: tuple)
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.normal_white_body(OP, C, percentile),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            cf.upper_shadow_length(OP, H, C) < cf.body_height(OP, C),
-            cf.lower_shadow_length(OP, L, C) < cf.body_height(OP, C),
+            candle["normal_white_body"],
+            np.logical_not(candle["no_us"]),
+            np.logical_not(candle["no_ls"]),
+            candle["upper_shadow_length"] < candle["body_height"],
+            candle["lower_shadow_length"] < candle["body_height"],
         )
     )
 
 
-def doji_dragonfly_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def doji_dragonfly_(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: doji with long lower shadow , small upper shadow.
 
     Trend: either.
 
     Prediction: reversal if down.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
-            cf.doji(OP, C, percentile),
-            cf.small_us(OP, H, C, percentile),
-            cf.long_ls(OP, L, C, percentile),
+            candle["doji"],
+            candle["small_us"],
+            candle["long_ls"],
         )
     )
 
 
 def doji_dragonfly_down_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: doji with long lower shadow , small upper shadow.
 
@@ -409,19 +408,18 @@ def doji_dragonfly_down_trend(
 
     Prediction: reversal if down.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.doji(OP, C, percentile),
-            cf.small_us(OP, H, C, percentile),
-            cf.long_ls(OP, L, C, percentile),
+            candle["doji"],
+            candle["small_us"],
+            candle["long_ls"],
         )
     )
 
 
 def doji_dragonfly_up_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: doji with long lower shadow , small upper shadow.
 
@@ -429,36 +427,36 @@ def doji_dragonfly_up_trend(
 
     Prediction: reversal if down.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.doji(OP, C, percentile),
-            cf.small_us(OP, H, C, percentile),
-            cf.long_ls(OP, L, C, percentile),
+            candle["doji"],
+            candle["small_us"],
+            candle["long_ls"],
         )
     )
 
 
-def doji_gravestone_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def doji_gravestone_(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: doji with small lower shadow , long upper shadow.
 
     Trend: either.
 
     Prediction: reversal if up.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
-            cf.doji(OP, C, percentile),
-            cf.no_ls(OP, L, C, percentile),
-            cf.long_us(OP, H, C, percentile),
+            candle["doji"],
+            candle["no_ls"],
+            candle["long_us"],
         )
     )
 
 
 def doji_gravestone_down_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: doji with small lower shadow , long upper shadow.
 
@@ -466,19 +464,18 @@ def doji_gravestone_down_trend(
 
     Prediction: reversal if up.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.doji(OP, C, percentile),
-            cf.no_ls(OP, L, C, percentile),
-            cf.long_us(OP, H, C, percentile),
+            candle["doji"],
+            candle["no_ls"],
+            candle["long_us"],
         )
     )
 
 
 def doji_gravestone_up_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: doji with small lower shadow , long upper shadow.
 
@@ -486,36 +483,36 @@ def doji_gravestone_up_trend(
 
     Prediction: reversal if up.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.doji(OP, C, percentile),
-            cf.no_ls(OP, L, C, percentile),
-            cf.long_us(OP, H, C, percentile),
+            candle["doji"],
+            candle["no_ls"],
+            candle["long_us"],
         )
     )
 
 
-def doji_long_legged_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def doji_long_legged_(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: doji with long shadows.
 
     Trend: either.
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
-            cf.doji(OP, C, percentile),
-            cf.long_us(OP, H, C, percentile),
-            cf.long_ls(OP, L, C, percentile),
+            candle["doji"],
+            candle["long_us"],
+            candle["long_ls"],
         )
     )
 
 
 def doji_long_legged_down_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: doji with long shadows.
 
@@ -523,19 +520,18 @@ def doji_long_legged_down_trend(
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.doji(OP, C, percentile),
-            cf.long_us(OP, H, C, percentile),
-            cf.long_ls(OP, L, C, percentile),
+            candle["doji"],
+            candle["long_us"],
+            candle["long_ls"],
         )
     )
 
 
 def doji_long_legged_up_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: doji with long shadows.
 
@@ -543,30 +539,30 @@ def doji_long_legged_up_trend(
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.doji(OP, C, percentile),
-            cf.long_us(OP, H, C, percentile),
-            cf.long_ls(OP, L, C, percentile),
+            candle["doji"],
+            candle["long_us"],
+            candle["long_ls"],
         )
     )
 
 
-def doji_northern_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def doji_northern_(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: doji in an uptrend.
 
     Trend: up.
 
     Prediction: reversal.
     """
-    OP, C = candle[:, 0], candle[:, 3]
-    return np.logical_and.reduce((T == 1, cf.doji(OP, C, percentile)))
+    return np.logical_and.reduce((T == 1, candle["doji"]))
 
 
 def doji_northern_no_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: doji in an uptrend.
 
@@ -574,12 +570,11 @@ def doji_northern_no_trend(
 
     Prediction: reversal.
     """
-    OP, C = candle[:, 0], candle[:, 3]
-    return cf.doji(OP, C, percentile)
+    return candle["doji"]
 
 
 def doji_northern_opp_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: doji in an uptrend.
 
@@ -587,23 +582,23 @@ def doji_northern_opp_trend(
 
     Prediction: reversal.
     """
-    OP, C = candle[:, 0], candle[:, 3]
-    return np.logical_and.reduce((T == -1, cf.doji(OP, C, percentile)))
+    return np.logical_and.reduce((T == -1, candle["doji"]))
 
 
-def doji_southern_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def doji_southern_(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: doji in a downtrend.
 
     Trend: down.
 
     Prediction: reversal.
     """
-    OP, C = candle[:, 0], candle[:, 3]
-    return np.logical_and.reduce((T == -1, cf.doji(OP, C, percentile)))
+    return np.logical_and.reduce((T == -1, candle["doji"]))
 
 
 def doji_southern_no_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: doji in a downtrend.
 
@@ -611,12 +606,11 @@ def doji_southern_no_trend(
 
     Prediction: reversal.
     """
-    OP, C = candle[:, 0], candle[:, 3]
-    return cf.doji(OP, C, percentile)
+    return candle["doji"]
 
 
 def doji_southern_opp_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: doji in a downtrend.
 
@@ -624,11 +618,10 @@ def doji_southern_opp_trend(
 
     Prediction: reversal.
     """
-    OP, C = candle[:, 0], candle[:, 3]
-    return np.logical_and.reduce((T == 1, cf.doji(OP, C, percentile)))
+    return np.logical_and.reduce((T == 1, candle["doji"]))
 
 
-def hammer_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def hammer_(candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict) -> bool:
     """Definition: candle with a small body of either color, lower shadow between 2, 3
     times the length of the body, and a small or no upper shadow.
 
@@ -636,22 +629,21 @@ def hammer_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
 
     Prediction: reversal.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.short_body(OP, C, percentile),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            (2 * cf.body_height(OP, C) < cf.lower_shadow_length(OP, L, C)),
-            (cf.lower_shadow_length(OP, L, C) < 3 * cf.body_height(OP, C)),
-            np.logical_or(
-                cf.small_us(OP, H, C, percentile), cf.no_us(OP, H, C, percentile)
-            ),
+            candle["short_body"],
+            np.logical_not(candle["no_ls"]),
+            (2 * candle["body_height"] < candle["lower_shadow_length"]),
+            (candle["lower_shadow_length"] < 3 * candle["body_height"]),
+            np.logical_or(candle["small_us"], candle["no_us"]),
         )
     )
 
 
-def hammer_no_trend(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def hammer_no_trend(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: candle with a small body of either color, lower shadow between 2, 3
     times the length of the body, and a small or no upper shadow.
 
@@ -659,21 +651,20 @@ def hammer_no_trend(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> boo
 
     Prediction: reversal.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
-            cf.short_body(OP, C, percentile),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            (2 * cf.body_height(OP, C) < cf.lower_shadow_length(OP, L, C)),
-            (cf.lower_shadow_length(OP, L, C) < 3 * cf.body_height(OP, C)),
-            np.logical_or(
-                cf.small_us(OP, H, C, percentile), cf.no_us(OP, H, C, percentile)
-            ),
+            candle["short_body"],
+            np.logical_not(candle["no_ls"]),
+            (2 * candle["body_height"] < candle["lower_shadow_length"]),
+            (candle["lower_shadow_length"] < 3 * candle["body_height"]),
+            np.logical_or(candle["small_us"], candle["no_us"]),
         )
     )
 
 
-def hammer_opp_trend(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def hammer_opp_trend(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: candle with a small body of either color, lower shadow between 2, 3
     times the length of the body, and a small or no upper shadow.
 
@@ -681,22 +672,21 @@ def hammer_opp_trend(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bo
 
     Prediction: reversal.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.short_body(OP, C, percentile),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            (2 * cf.body_height(OP, C) < cf.lower_shadow_length(OP, L, C)),
-            (cf.lower_shadow_length(OP, L, C) < 3 * cf.body_height(OP, C)),
-            np.logical_or(
-                cf.small_us(OP, H, C, percentile), cf.no_us(OP, H, C, percentile)
-            ),
+            candle["short_body"],
+            np.logical_not(candle["no_ls"]),
+            (2 * candle["body_height"] < candle["lower_shadow_length"]),
+            (candle["lower_shadow_length"] < 3 * candle["body_height"]),
+            np.logical_or(candle["small_us"], candle["no_us"]),
         )
     )
 
 
-def hanging_man_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def hanging_man_(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: small candle of either color with no upper shadow , long lower
     shadow.
 
@@ -704,18 +694,19 @@ def hanging_man_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
 
     Prediction: reversal.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.no_us(OP, H, C, percentile),
-            cf.long_ls(OP, L, C, percentile),
-            cf.short_body(OP, C, percentile),
+            candle["no_us"],
+            candle["long_ls"],
+            candle["short_body"],
         )
     )
 
 
-def hanging_man_no_trend(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def hanging_man_no_trend(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: small candle of either color with no upper shadow , long lower
     shadow.
 
@@ -723,17 +714,18 @@ def hanging_man_no_trend(candle: np.ndarray, T: np.ndarray, percentile: tuple) -
 
     Prediction: reversal.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
-            cf.no_us(OP, H, C, percentile),
-            cf.long_ls(OP, L, C, percentile),
-            cf.short_body(OP, C, percentile),
+            candle["no_us"],
+            candle["long_ls"],
+            candle["short_body"],
         )
     )
 
 
-def hanging_man_opp_trend(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def hanging_man_opp_trend(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: small candle of either color with no upper shadow , long lower
     shadow.
 
@@ -741,89 +733,90 @@ def hanging_man_opp_trend(candle: np.ndarray, T: np.ndarray, percentile: tuple)
 
     Prediction: reversal.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.no_us(OP, H, C, percentile),
-            cf.long_ls(OP, L, C, percentile),
-            cf.short_body(OP, C, percentile),
+            candle["no_us"],
+            candle["long_ls"],
+            candle["short_body"],
         )
     )
 
 
-def high_wave_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def high_wave_(candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict) -> bool:
     """Definition: small candle with extremely long shadows.
 
     Trend: either.
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
-            cf.exlong_us(OP, H, C, percentile),
-            cf.exlong_ls(OP, L, C, percentile),
-            cf.short_body(OP, C, percentile),
+            candle["exlong_us"],
+            candle["exlong_ls"],
+            candle["short_body"],
         )
     )
 
 
-def high_wave_down_trend(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def high_wave_down_trend(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: small candle with extremely long shadows.
 
     Trend: either.
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.exlong_us(OP, H, C, percentile),
-            cf.exlong_ls(OP, L, C, percentile),
-            cf.short_body(OP, C, percentile),
+            candle["exlong_us"],
+            candle["exlong_ls"],
+            candle["short_body"],
         )
     )
 
 
-def high_wave_up_trend(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def high_wave_up_trend(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: small candle with extremely long shadows.
 
     Trend: either.
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.exlong_us(OP, H, C, percentile),
-            cf.exlong_ls(OP, L, C, percentile),
-            cf.short_body(OP, C, percentile),
+            candle["exlong_us"],
+            candle["exlong_ls"],
+            candle["short_body"],
         )
     )
 
 
-def marubozu_black_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def marubozu_black_(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall black candle without shadows.
 
     Trend: either.
 
     Prediction: continuation.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(OP, C, percentile),
-            cf.no_us(OP, H, C, percentile),
-            cf.no_ls(OP, L, C, percentile),
+            candle["tall_black_body"],
+            candle["no_us"],
+            candle["no_ls"],
         )
     )
 
 
 def marubozu_black_down_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle without shadows.
 
@@ -831,19 +824,18 @@ def marubozu_black_down_trend(
 
     Prediction: continuation.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(OP, C, percentile),
-            cf.no_us(OP, H, C, percentile),
-            cf.no_ls(OP, L, C, percentile),
+            candle["tall_black_body"],
+            candle["no_us"],
+            candle["no_ls"],
         )
     )
 
 
 def marubozu_black_up_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle without shadows.
 
@@ -851,19 +843,18 @@ def marubozu_black_up_trend(
 
     Prediction: continuation.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(OP, C, percentile),
-            cf.no_us(OP, H, C, percentile),
-            cf.no_ls(OP, L, C, percentile),
+            candle["tall_black_body"],
+            candle["no_us"],
+            candle["no_ls"],
         )
     )
 
 
 def marubozu_closing_black_(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle without lower shadow.
 
@@ -871,18 +862,17 @@ def marubozu_closing_black_(
 
     Prediction: continuation.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(OP, C, percentile),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
-            cf.no_ls(OP, L, C, percentile),
+            candle["tall_black_body"],
+            np.logical_not(candle["no_us"]),
+            candle["no_ls"],
         )
     )
 
 
 def marubozu_closing_black_down_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle without lower shadow.
 
@@ -890,19 +880,18 @@ def marubozu_closing_black_down_trend(
 
     Prediction: continuation.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(OP, C, percentile),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
-            cf.no_ls(OP, L, C, percentile),
+            candle["tall_black_body"],
+            np.logical_not(candle["no_us"]),
+            candle["no_ls"],
         )
     )
 
 
 def marubozu_closing_black_up_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle without lower shadow.
 
@@ -910,19 +899,18 @@ def marubozu_closing_black_up_trend(
 
     Prediction: continuation.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(OP, C, percentile),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
-            cf.no_ls(OP, L, C, percentile),
+            candle["tall_black_body"],
+            np.logical_not(candle["no_us"]),
+            candle["no_ls"],
         )
     )
 
 
 def marubozu_closing_white_(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle without upper shadow.
 
@@ -930,18 +918,17 @@ def marubozu_closing_white_(
 
     Prediction: continuation.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(OP, C, percentile),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            cf.no_us(OP, H, C, percentile),
+            candle["tall_white_body"],
+            np.logical_not(candle["no_ls"]),
+            candle["no_us"],
         )
     )
 
 
 def marubozu_closing_white_down_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle without upper shadow.
 
@@ -949,19 +936,18 @@ def marubozu_closing_white_down_trend(
 
     Prediction: continuation.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(OP, C, percentile),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            cf.no_us(OP, H, C, percentile),
+            candle["tall_white_body"],
+            np.logical_not(candle["no_ls"]),
+            candle["no_us"],
         )
     )
 
 
 def marubozu_closing_white_up_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle without upper shadow.
 
@@ -969,19 +955,18 @@ def marubozu_closing_white_up_trend(
 
     Prediction: continuation.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(OP, C, percentile),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            cf.no_us(OP, H, C, percentile),
+            candle["tall_white_body"],
+            np.logical_not(candle["no_ls"]),
+            candle["no_us"],
         )
     )
 
 
 def marubozu_opening_black_(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle without upper shadow.
 
@@ -989,18 +974,17 @@ def marubozu_opening_black_(
 
     Prediction: continuation.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(OP, C, percentile),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            cf.no_us(OP, H, C, percentile),
+            candle["tall_black_body"],
+            np.logical_not(candle["no_ls"]),
+            candle["no_us"],
         )
     )
 
 
 def marubozu_opening_black_down_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle without upper shadow.
 
@@ -1008,19 +992,18 @@ def marubozu_opening_black_down_trend(
 
     Prediction: continuation.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(OP, C, percentile),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            cf.no_us(OP, H, C, percentile),
+            candle["tall_black_body"],
+            np.logical_not(candle["no_ls"]),
+            candle["no_us"],
         )
     )
 
 
 def marubozu_opening_black_up_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle without upper shadow.
 
@@ -1028,19 +1011,18 @@ def marubozu_opening_black_up_trend(
 
     Prediction: continuation.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(OP, C, percentile),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            cf.no_us(OP, H, C, percentile),
+            candle["tall_black_body"],
+            np.logical_not(candle["no_ls"]),
+            candle["no_us"],
         )
     )
 
 
 def marubozu_opening_white_(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle without lower shadow.
 
@@ -1048,18 +1030,17 @@ def marubozu_opening_white_(
 
     Prediction: continuation.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(OP, C, percentile),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
-            cf.no_ls(OP, L, C, percentile),
+            candle["tall_white_body"],
+            np.logical_not(candle["no_us"]),
+            candle["no_ls"],
         )
     )
 
 
 def marubozu_opening_white_down_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle without lower shadow.
 
@@ -1067,19 +1048,18 @@ def marubozu_opening_white_down_trend(
 
     Prediction: continuation.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(OP, C, percentile),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
-            cf.no_ls(OP, L, C, percentile),
+            candle["tall_white_body"],
+            np.logical_not(candle["no_us"]),
+            candle["no_ls"],
         )
     )
 
 
 def marubozu_opening_white_up_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle without lower shadow.
 
@@ -1087,36 +1067,36 @@ def marubozu_opening_white_up_trend(
 
     Prediction: continuation.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(OP, C, percentile),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
-            cf.no_ls(OP, L, C, percentile),
+            candle["tall_white_body"],
+            np.logical_not(candle["no_us"]),
+            candle["no_ls"],
         )
     )
 
 
-def marubozu_white_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def marubozu_white_(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall white candle without shadows.
 
     Trend: either.
 
     Prediction: continuation.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(OP, C, percentile),
-            cf.no_us(OP, H, C, percentile),
-            cf.no_ls(OP, L, C, percentile),
+            candle["tall_white_body"],
+            candle["no_us"],
+            candle["no_ls"],
         )
     )
 
 
 def marubozu_white_down_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle without shadows.
 
@@ -1124,19 +1104,18 @@ def marubozu_white_down_trend(
 
     Prediction: continuation.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(OP, C, percentile),
-            cf.no_us(OP, H, C, percentile),
-            cf.no_ls(OP, L, C, percentile),
+            candle["tall_white_body"],
+            candle["no_us"],
+            candle["no_ls"],
         )
     )
 
 
 def marubozu_white_up_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle without shadows.
 
@@ -1144,18 +1123,19 @@ def marubozu_white_up_trend(
 
     Prediction: continuation.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(OP, C, percentile),
-            cf.no_us(OP, H, C, percentile),
-            cf.no_ls(OP, L, C, percentile),
+            candle["tall_white_body"],
+            candle["no_us"],
+            candle["no_ls"],
         )
     )
 
 
-def rickshaw_man_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def rickshaw_man_(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: doji with midpoint of the body near the midpoint of the shadows,
     those shadows being exceedingly long.
 
@@ -1163,19 +1143,19 @@ def rickshaw_man_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
+    OP, H, L, C = candle["open"], candle["high"], candle["low"], candle["close"]
     return np.logical_and.reduce(
         (
-            cf.doji(OP, C, percentile),
-            cf.exlong_us(OP, H, C, percentile),
-            cf.exlong_ls(OP, L, C, percentile),
-            cf.near(0.5 * (OP + C), 0.5 * (H + L), percentile),
+            candle["doji"],
+            candle["exlong_us"],
+            candle["exlong_ls"],
+            cf.near(0.5 * (OP + C), 0.5 * (H + L), calibration),
         )
     )
 
 
 def rickshaw_man_down_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: doji with midpoint of the body near the midpoint of the shadows,
     those shadows being exceedingly long.
@@ -1184,19 +1164,21 @@ def rickshaw_man_down_trend(
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
+    OP, H, L, C = candle["open"], candle["high"], candle["low"], candle["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.doji(OP, C, percentile),
-            cf.exlong_us(OP, H, C, percentile),
-            cf.exlong_ls(OP, L, C, percentile),
-            cf.near(0.5 * (OP + C), 0.5 * (H + L), percentile),
+            candle["doji"],
+            candle["exlong_us"],
+            candle["exlong_ls"],
+            cf.near(0.5 * (OP + C), 0.5 * (H + L), calibration),
         )
     )
 
 
-def rickshaw_man_up_trend(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def rickshaw_man_up_trend(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: doji with midpoint of the body near the midpoint of the shadows,
     those shadows being exceedingly long.
 
@@ -1204,20 +1186,20 @@ def rickshaw_man_up_trend(candle: np.ndarray, T: np.ndarray, percentile: tuple)
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
+    OP, H, L, C = candle["open"], candle["high"], candle["low"], candle["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.doji(OP, C, percentile),
-            cf.exlong_us(OP, H, C, percentile),
-            cf.exlong_ls(OP, L, C, percentile),
-            cf.near(0.5 * (OP + C), 0.5 * (H + L), percentile),
+            candle["doji"],
+            candle["exlong_us"],
+            candle["exlong_ls"],
+            cf.near(0.5 * (OP + C), 0.5 * (H + L), calibration),
         )
     )
 
 
 def shooting_star_one_candle_(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: small candle of either color with long upper shadow at least twice
     the height of the body, no lower shadow.
@@ -1226,20 +1208,19 @@ def shooting_star_one_candle_(
 
     Prediction: reversal.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.long_us(OP, H, C, percentile),
-            (cf.upper_shadow_length(OP, H, C) > 2 * cf.body_height(OP, C)),
-            cf.short_body(OP, C, percentile),
-            cf.no_ls(OP, L, C, percentile),
+            candle["long_us"],
+            (candle["upper_shadow_length"] > 2 * candle["body_height"]),
+            candle["short_body"],
+            candle["no_ls"],
         )
     )
 
 
 def shooting_star_one_candle_no_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: small candle of either color with long upper shadow at least twice
     the height of the body, no lower shadow.
@@ -1248,19 +1229,18 @@ def shooting_star_one_candle_no_trend(
 
     Prediction: reversal.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
-            cf.long_us(OP, H, C, percentile),
-            (cf.upper_shadow_length(OP, H, C) > 2 * cf.body_height(OP, C)),
-            cf.short_body(OP, C, percentile),
-            cf.no_ls(OP, L, C, percentile),
+            candle["long_us"],
+            (candle["upper_shadow_length"] > 2 * candle["body_height"]),
+            candle["short_body"],
+            candle["no_ls"],
         )
     )
 
 
 def shooting_star_one_candle_opp_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: small candle of either color with long upper shadow at least twice
     the height of the body, no lower shadow.
@@ -1269,39 +1249,39 @@ def shooting_star_one_candle_opp_trend(
 
     Prediction: reversal.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.long_us(OP, H, C, percentile),
-            (cf.upper_shadow_length(OP, H, C) > 2 * cf.body_height(OP, C)),
-            cf.short_body(OP, C, percentile),
-            cf.no_ls(OP, L, C, percentile),
+            candle["long_us"],
+            (candle["upper_shadow_length"] > 2 * candle["body_height"]),
+            candle["short_body"],
+            candle["no_ls"],
         )
     )
 
 
-def spinning_top_black_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def spinning_top_black_(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: small black candle with shadows longer than the body.
 
     Trend: either.
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
-            cf.short_black_body(OP, C, percentile),
-            (cf.upper_shadow_length(OP, H, C) > cf.body_height(OP, C)),
-            (cf.lower_shadow_length(OP, L, C) > cf.body_height(OP, C)),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
+            candle["short_black_body"],
+            (candle["upper_shadow_length"] > candle["body_height"]),
+            (candle["lower_shadow_length"] > candle["body_height"]),
+            np.logical_not(candle["no_ls"]),
+            np.logical_not(candle["no_us"]),
         )
     )
 
 
 def spinning_top_black_down_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: small black candle with shadows longer than the body.
 
@@ -1309,21 +1289,20 @@ def spinning_top_black_down_trend(
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.short_black_body(OP, C, percentile),
-            (cf.upper_shadow_length(OP, H, C) > cf.body_height(OP, C)),
-            (cf.lower_shadow_length(OP, L, C) > cf.body_height(OP, C)),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
+            candle["short_black_body"],
+            (candle["upper_shadow_length"] > candle["body_height"]),
+            (candle["lower_shadow_length"] > candle["body_height"]),
+            np.logical_not(candle["no_ls"]),
+            np.logical_not(candle["no_us"]),
         )
     )
 
 
 def spinning_top_black_up_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: small black candle with shadows longer than the body.
 
@@ -1331,40 +1310,40 @@ def spinning_top_black_up_trend(
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.short_black_body(OP, C, percentile),
-            (cf.upper_shadow_length(OP, H, C) > cf.body_height(OP, C)),
-            (cf.lower_shadow_length(OP, L, C) > cf.body_height(OP, C)),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
+            candle["short_black_body"],
+            (candle["upper_shadow_length"] > candle["body_height"]),
+            (candle["lower_shadow_length"] > candle["body_height"]),
+            np.logical_not(candle["no_ls"]),
+            np.logical_not(candle["no_us"]),
         )
     )
 
 
-def spinning_top_white_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def spinning_top_white_(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: small white candle with shadows longer than the body.
 
     Trend: either.
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
-            cf.short_white_body(OP, C, percentile),
-            (cf.upper_shadow_length(OP, H, C) > cf.body_height(OP, C)),
-            (cf.lower_shadow_length(OP, L, C) > cf.body_height(OP, C)),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
+            candle["short_white_body"],
+            (candle["upper_shadow_length"] > candle["body_height"]),
+            (candle["lower_shadow_length"] > candle["body_height"]),
+            np.logical_not(candle["no_ls"]),
+            np.logical_not(candle["no_us"]),
         )
     )
 
 
 def spinning_top_white_down_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: small white candle with shadows longer than the body.
 
@@ -1372,21 +1351,20 @@ def spinning_top_white_down_trend(
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.short_white_body(OP, C, percentile),
-            (cf.upper_shadow_length(OP, H, C) > cf.body_height(OP, C)),
-            (cf.lower_shadow_length(OP, L, C) > cf.body_height(OP, C)),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
+            candle["short_white_body"],
+            (candle["upper_shadow_length"] > candle["body_height"]),
+            (candle["lower_shadow_length"] > candle["body_height"]),
+            np.logical_not(candle["no_ls"]),
+            np.logical_not(candle["no_us"]),
         )
     )
 
 
 def spinning_top_white_up_trend(
-    candle: np.ndarray, T: np.ndarray, percentile: tuple
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: small white candle with shadows longer than the body.
 
@@ -1394,20 +1372,21 @@ def spinning_top_white_up_trend(
 
     Prediction: either.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.short_white_body(OP, C, percentile),
-            (cf.upper_shadow_length(OP, H, C) > cf.body_height(OP, C)),
-            (cf.lower_shadow_length(OP, L, C) > cf.body_height(OP, C)),
-            np.logical_not(cf.no_ls(OP, L, C, percentile)),
-            np.logical_not(cf.no_us(OP, H, C, percentile)),
+            candle["short_white_body"],
+            (candle["upper_shadow_length"] > candle["body_height"]),
+            (candle["lower_shadow_length"] > candle["body_height"]),
+            np.logical_not(candle["no_ls"]),
+            np.logical_not(candle["no_us"]),
         )
     )
 
 
-def takuri_line_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def takuri_line_(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: small  candle of either color with no upper shadow, lower shadow at
     least three times the length of the body.
 
@@ -1415,18 +1394,19 @@ def takuri_line_(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
 
     Prediction: reversal.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.short_body(OP, C, percentile),
-            cf.no_us(OP, H, C, percentile),
-            (cf.lower_shadow_length(OP, L, C) > 3 * cf.body_height(OP, C)),
+            candle["short_body"],
+            candle["no_us"],
+            (candle["lower_shadow_length"] > 3 * candle["body_height"]),
         )
     )
 
 
-def takuri_line_no_trend(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def takuri_line_no_trend(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: small  candle of either color with no upper shadow, lower shadow at
     least three times the length of the body.
 
@@ -1434,17 +1414,18 @@ def takuri_line_no_trend(candle: np.ndarray, T: np.ndarray, percentile: tuple) -
 
     Prediction: reversal.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
-            cf.short_body(OP, C, percentile),
-            cf.no_us(OP, H, C, percentile),
-            (cf.lower_shadow_length(OP, L, C) > 3 * cf.body_height(OP, C)),
+            candle["short_body"],
+            candle["no_us"],
+            (candle["lower_shadow_length"] > 3 * candle["body_height"]),
         )
     )
 
 
-def takuri_line_opp_trend(candle: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def takuri_line_opp_trend(
+    candle: dict[str, np.ndarray], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: small  candle of either color with no upper shadow, lower shadow at
     least three times the length of the body.
 
@@ -1452,12 +1433,11 @@ def takuri_line_opp_trend(candle: np.ndarray, T: np.ndarray, percentile: tuple)
 
     Prediction: reversal.
     """
-    OP, H, L, C = candle[:, 0], candle[:, 1], candle[:, 2], candle[:, 3]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.short_body(OP, C, percentile),
-            cf.no_us(OP, H, C, percentile),
-            (cf.lower_shadow_length(OP, L, C) > 3 * cf.body_height(OP, C)),
+            candle["short_body"],
+            candle["no_us"],
+            (candle["lower_shadow_length"] > 3 * candle["body_height"]),
         )
     )
@@ -0,0 +1,1321 @@
+# Declarative definitions of the trend-free candlestick patterns, compiled into a single
+# evaluation plan by ``compiled_detection``. The pattern functions in the
+# ``*_patterns`` modules are the reference implementation these definitions are tested
+# against.
+#
+# Every pattern has its number of candles, the trend before the pattern and the
+# prediction as in the docstrings of the pattern functions, and a list of conditions
+# that must all hold. A condition is a Python expression on the candles ``c1`` (the
+# oldest candle) up to ``cN`` (the current candle) using
+#
+# * candle features as attributes, e.g. ``c1.tall_black_body`` or ``c2.close``, see
+#   ``candlestick_functions.candle_features``;
+# * comparisons, arithmetic and ``&``, ``|`` and ``~`` for and, or and not;
+# * ``max``, ``min`` and ``abs``, and ``mean``, which averages all candles like
+#   ``np.mean`` in the pattern functions;
+# * the helpers of ``candlestick_functions`` without the calibration argument, e.g.
+#   ``near(c1.close, c2.close)``. The gap helpers take candles instead of prices, e.g.
+#   ``up_body_gap(c1, c2)``.
+#
+# Trend variants of the patterns are derived from these definitions, see
+# ``pattern_registry``.
+
+PATTERN_SPECS = {
+    "belt_hold_bearish": {
+        "candles": 1,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_black_body",
+            "c1.no_us",
+            "c1.small_ls",
+        ],
+    },
+    "belt_hold_bullish": {
+        "candles": 1,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_white_body",
+            "c1.no_ls",
+            "c1.small_us",
+        ],
+    },
+    "candle_black": {
+        "candles": 1,
+        "trend": "either",
+        "prediction": "either",
+        "conditions": [
+            "c1.normal_black_body",
+            "~c1.no_us",
+            "~c1.no_ls",
+            "c1.upper_shadow_length < c1.body_height",
+            "c1.lower_shadow_length < c1.body_height",
+        ],
+    },
+    "candle_short_black": {
+        "candles": 1,
+        "trend": "either",
+        "prediction": "either",
+        "conditions": [
+            "c1.short_black_body",
+            "~c1.no_us",
+            "~c1.no_ls",
+            "c1.upper_shadow_length < c1.body_height",
+            "c1.lower_shadow_length < c1.body_height",
+        ],
+    },
+    "candle_short_white": {
+        "candles": 1,
+        "trend": "either",
+        "prediction": "either",
+        "conditions": [
+            "c1.short_white_body",
+            "~c1.no_us",
+            "~c1.no_ls",
+            "c1.upper_shadow_length < c1.body_height",
+            "c1.lower_shadow_length < c1.body_height",
+        ],
+    },
+    "candle_white": {
+        "candles": 1,
+        "trend": "either",
+        "prediction": "either",
+        "conditions": [
+            "c1.normal_white_body",
+            "~c1.no_us",
+            "~c1.no_ls",
+            "c1.upper_shadow_length < c1.body_height",
+            "c1.lower_shadow_length < c1.body_height",
+        ],
+    },
+    "doji_dragonfly": {
+        "candles": 1,
+        "trend": "either",
+        "prediction": "reversal if down",
+        "conditions": [
+            "c1.doji",
+            "c1.small_us",
+            "c1.long_ls",
+        ],
+    },
+    "doji_gravestone": {
+        "candles": 1,
+        "trend": "either",
+        "prediction": "reversal if up",
+        "conditions": [
+            "c1.doji",
+            "c1.no_ls",
+            "c1.long_us",
+        ],
+    },
+    "doji_long_legged": {
+        "candles": 1,
+        "trend": "either",
+        "prediction": "either",
+        "conditions": [
+            "c1.doji",
+            "c1.long_us",
+            "c1.long_ls",
+        ],
+    },
+    "doji_northern": {
+        "candles": 1,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.doji",
+        ],
+    },
+    "doji_southern": {
+        "candles": 1,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.doji",
+        ],
+    },
+    "hammer": {
+        "candles": 1,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.short_body",
+            "~c1.no_ls",
+            "2 * c1.body_height < c1.lower_shadow_length",
+            "c1.lower_shadow_length < 3 * c1.body_height",
+            "c1.small_us | c1.no_us",
+        ],
+    },
+    "hanging_man": {
+        "candles": 1,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.no_us",
+            "c1.long_ls",
+            "c1.short_body",
+        ],
+    },
+    "high_wave": {
+        "candles": 1,
+        "trend": "either",
+        "prediction": "either",
+        "conditions": [
+            "c1.exlong_us",
+            "c1.exlong_ls",
+            "c1.short_body",
+        ],
+    },
+    "marubozu_black": {
+        "candles": 1,
+        "trend": "either",
+        "prediction": "continuation",
+        "conditions": [
+            "c1.tall_black_body",
+            "c1.no_us",
+            "c1.no_ls",
+        ],
+    },
+    "marubozu_closing_black": {
+        "candles": 1,
+        "trend": "either",
+        "prediction": "continuation",
+        "conditions": [
+            "c1.tall_black_body",
+            "~c1.no_us",
+            "c1.no_ls",
+        ],
+    },
+    "marubozu_closing_white": {
+        "candles": 1,
+        "trend": "either",
+        "prediction": "continuation",
+        "conditions": [
+            "c1.tall_white_body",
+            "~c1.no_ls",
+            "c1.no_us",
+        ],
+    },
+    "marubozu_opening_black": {
+        "candles": 1,
+        "trend": "either",
+        "prediction": "continuation",
+        "conditions": [
+            "c1.tall_black_body",
+            "~c1.no_ls",
+            "c1.no_us",
+        ],
+    },
+    "marubozu_opening_white": {
+        "candles": 1,
+        "trend": "either",
+        "prediction": "continuation",
+        "conditions": [
+            "c1.tall_white_body",
+            "~c1.no_us",
+            "c1.no_ls",
+        ],
+    },
+    "marubozu_white": {
+        "candles": 1,
+        "trend": "either",
+        "prediction": "continuation",
+        "conditions": [
+            "c1.tall_white_body",
+            "c1.no_us",
+            "c1.no_ls",
+        ],
+    },
+    "rickshaw_man": {
+        "candles": 1,
+        "trend": "either",
+        "prediction": "either",
+        "conditions": [
+            "c1.doji",
+            "c1.exlong_us",
+            "c1.exlong_ls",
+            "near(0.5 * (c1.open + c1.close), 0.5 * (c1.high + c1.low))",
+        ],
+    },
+    "shooting_star_one_candle": {
+        "candles": 1,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.long_us",
+            "c1.upper_shadow_length > 2 * c1.body_height",
+            "c1.short_body",
+            "c1.no_ls",
+        ],
+    },
+    "spinning_top_black": {
+        "candles": 1,
+        "trend": "either",
+        "prediction": "either",
+        "conditions": [
+            "c1.short_black_body",
+            "c1.upper_shadow_length > c1.body_height",
+            "c1.lower_shadow_length > c1.body_height",
+            "~c1.no_ls",
+            "~c1.no_us",
+        ],
+    },
+    "spinning_top_white": {
+        "candles": 1,
+        "trend": "either",
+        "prediction": "either",
+        "conditions": [
+            "c1.short_white_body",
+            "c1.upper_shadow_length > c1.body_height",
+            "c1.lower_shadow_length > c1.body_height",
+            "~c1.no_ls",
+            "~c1.no_us",
+        ],
+    },
+    "takuri_line": {
+        "candles": 1,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.short_body",
+            "c1.no_us",
+            "c1.lower_shadow_length > 3 * c1.body_height",
+        ],
+    },
+    "above_the_stomach": {
+        "candles": 2,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.black_body",
+            "c2.white_body",
+            "c2.open >= 0.5 * (c1.open + c1.close)",
+            "c2.close >= 0.5 * (c1.open + c1.close)",
+        ],
+    },
+    "below_the_stomach": {
+        "candles": 2,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_white_body",
+            "0.5 * (c1.open + c1.close) >= c2.open",
+            "c2.close <= 0.5 * (c1.open + c1.close)",
+        ],
+    },
+    "dark_cloud_cover": {
+        "candles": 2,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_white_body",
+            "c2.black_body",
+            "c2.open > c1.high",
+            "c2.close >= 0.5 * (c1.open + c1.close)",
+        ],
+    },
+    "doji_gapping_down": {
+        "candles": 2,
+        "trend": "down",
+        "prediction": "continuation",
+        "conditions": [
+            "c2.doji",
+            "down_shadow_gap(c1, c2)",
+        ],
+    },
+    "doji_gapping_up": {
+        "candles": 2,
+        "trend": "up",
+        "prediction": "continuation",
+        "conditions": [
+            "c2.doji",
+            "up_shadow_gap(c1, c2)",
+        ],
+    },
+    "doji_star_bearish": {
+        "candles": 2,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_white_body",
+            "up_body_gap(c1, c2)",
+            "c2.doji",
+            "~c2.exlong_ls",
+            "~exlong_us(c2.open, c2.low, c2.close)",
+            "c2.total_shadow_length < c1.body_height",
+        ],
+    },
+    "doji_star_bullish": {
+        "candles": 2,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_black_body",
+            "down_body_gap(c1, c2)",
+            "c2.doji",
+            "~c2.exlong_ls",
+            "~exlong_us(c2.open, c2.low, c2.close)",
+        ],
+    },
+    "engulfing_bearish": {
+        "candles": 2,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.white_body",
+            "c2.black_body",
+            "c1.open > c2.close",
+            "c2.open > c1.close",
+        ],
+    },
+    "engulfing_bullish": {
+        "candles": 2,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.black_body",
+            "c2.white_body",
+            "c1.close > c2.open",
+            "c2.close > c1.open",
+        ],
+    },
+    "hammer_inverted": {
+        "candles": 2,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_black_body",
+            "c1.small_ls",
+            "c2.short_body",
+            "c2.long_us",
+            "c2.no_ls",
+            "down_body_gap(c1, c2)",
+        ],
+    },
+    "harami_bearish": {
+        "candles": 2,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_white_body",
+            "c2.short_black_body",
+            (
+                "(c1.close >= c2.open) & (c2.close > c1.open) | (c1.close > "
+                "c2.open) & (c2.close >= c1.open)"
+            ),
+        ],
+    },
+    "harami_bullish": {
+        "candles": 2,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_black_body",
+            "c2.short_white_body",
+            (
+                "(c1.open >= c2.close) & (c2.open > c1.close) | (c1.open > "
+                "c2.close) & (c2.open >= c1.close)"
+            ),
+        ],
+    },
+    "harami_cross_bearish": {
+        "candles": 2,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_white_body",
+            "c2.doji",
+            "c1.low < c2.low",
+            "c2.high < c1.high",
+        ],
+    },
+    "harami_cross_bullish": {
+        "candles": 2,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_black_body",
+            "c2.doji",
+            "c1.low < c2.low",
+            "c2.high < c1.high",
+        ],
+    },
+    "homing_pigeon": {
+        "candles": 2,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_black_body",
+            "c2.short_black_body",
+            "c1.close < c2.close",
+            "c2.open < c1.open",
+        ],
+    },
+    "in_neck": {
+        "candles": 2,
+        "trend": "down",
+        "prediction": "continuation",
+        "conditions": [
+            "c1.tall_black_body",
+            "c2.white_body",
+            "c2.open < c1.low",
+            "near_up(c2.close, c1.close)",
+        ],
+    },
+    "kicking_bearish": {
+        "candles": 2,
+        "trend": "none",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_white_body",
+            "c1.no_us",
+            "c1.no_ls",
+            "c2.tall_black_body",
+            "c2.no_us",
+            "c2.no_ls",
+            "down_shadow_gap(c1, c2)",
+        ],
+    },
+    "kicking_bullish": {
+        "candles": 2,
+        "trend": "none",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_black_body",
+            "c1.no_us",
+            "c1.no_ls",
+            "c2.tall_white_body",
+            "c2.no_us",
+            "c2.no_ls",
+            "up_body_gap(c1, c2)",
+        ],
+    },
+    "last_engulfing_bottom": {
+        "candles": 2,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.white_body",
+            "c2.black_body",
+            "c1.open > c2.close",
+            "c2.open > c1.close",
+        ],
+    },
+    "last_engulfing_top": {
+        "candles": 2,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.black_body",
+            "c2.white_body",
+            "c1.close > c2.open",
+            "c2.close > c1.open",
+        ],
+    },
+    "matching_low": {
+        "candles": 2,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_black_body",
+            "c2.black_body",
+            "c1.close == c2.close",
+        ],
+    },
+    "meeting_lines_bearish": {
+        "candles": 2,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_white_body",
+            "c2.tall_black_body",
+            "near(c1.close, c2.close)",
+        ],
+    },
+    "meeting_lines_bullish": {
+        "candles": 2,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_white_body",
+            "c2.tall_black_body",
+            "c1.close == c2.close",
+        ],
+    },
+    "on_neck": {
+        "candles": 2,
+        "trend": "down",
+        "prediction": "continuation",
+        "conditions": [
+            "c1.tall_black_body",
+            "c2.white_body",
+            "down_shadow_gap(c1, c2)",
+            "c1.low == c2.low",
+        ],
+    },
+    "piercing_pattern": {
+        "candles": 2,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.black_body",
+            "c2.white_body",
+            "c2.open < c1.low",
+            "0.5 * (c1.open + c1.close) < c2.close",
+            "c2.close < c1.open",
+        ],
+    },
+    "separating_lines_bearish": {
+        "candles": 2,
+        "trend": "down",
+        "prediction": "continuation",
+        "conditions": [
+            "c1.tall_white_body",
+            "c2.tall_black_body",
+            "near(c1.open, c2.open)",
+        ],
+    },
+    "separating_lines_bullish": {
+        "candles": 2,
+        "trend": "up",
+        "prediction": "continuation",
+        "conditions": [
+            "c1.tall_black_body",
+            "c2.tall_white_body",
+            "near(c1.open, c2.open)",
+        ],
+    },
+    "shooting_star_two_candle": {
+        "candles": 2,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.white_body",
+            "~c1.no_us",
+            "c2.upper_shadow_length > 3 * c1.body_height",
+            "c2.short_body",
+            "c2.no_ls",
+            "up_body_gap(c1, c2)",
+        ],
+    },
+    "thrusting": {
+        "candles": 2,
+        "trend": "down",
+        "prediction": "continuation",
+        "conditions": [
+            "c1.black_body",
+            "c2.white_body",
+            "c2.open < c1.low",
+            "near_up(c2.close, 0.5 * (c1.open + c1.close))",
+        ],
+    },
+    "tweezers_bottom": {
+        "candles": 2,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.low == c2.low",
+        ],
+    },
+    "tweezers_top": {
+        "candles": 2,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.high == c2.high",
+        ],
+    },
+    "window_falling": {
+        "candles": 2,
+        "trend": "down",
+        "prediction": "continuation",
+        "conditions": [
+            "down_shadow_gap(c1, c2)",
+        ],
+    },
+    "window_rising": {
+        "candles": 2,
+        "trend": "up",
+        "prediction": "continuation",
+        "conditions": [
+            "up_shadow_gap(c1, c2)",
+        ],
+    },
+    "abandoned_baby_bearish": {
+        "candles": 3,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.short_white_body | c1.normal_white_body | c1.tall_white_body",
+            "c2.doji",
+            "up_shadow_gap(c1, c2)",
+            "down_shadow_gap(c2, c3)",
+            "c3.short_black_body | c3.normal_black_body | c3.tall_black_body",
+        ],
+    },
+    "abandoned_baby_bullish": {
+        "candles": 3,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.black_body",
+            "c2.doji",
+            "down_shadow_gap(c1, c2)",
+            "up_shadow_gap(c2, c3)",
+            "c3.white_body",
+        ],
+    },
+    "advance_block": {
+        "candles": 3,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.white_body",
+            "c2.white_body",
+            "c3.white_body",
+            "c1.open < c2.open",
+            "c2.open < c1.close",
+            "c2.open < c3.open",
+            "c3.open < c2.close",
+            "c2.total_shadow_length > c2.body_height",
+            "c3.total_shadow_length > c3.body_height",
+            "c2.total_shadow_length > c1.total_shadow_length",
+            "c3.total_shadow_length > c1.total_shadow_length",
+        ],
+    },
+    "deliberation": {
+        "candles": 3,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_white_body",
+            "c2.tall_white_body",
+            "c3.short_white_body",
+            "near(c3.open, c2.close)",
+            "c1.open < c2.open",
+            "c2.open < c3.open",
+            "c1.close < c2.close",
+            "c2.close < c3.close",
+        ],
+    },
+    "doji_star_collapsing": {
+        "candles": 3,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.white_body",
+            "c2.doji",
+            "c3.black_body",
+            "down_shadow_gap(c1, c2)",
+            "down_shadow_gap(c2, c3)",
+        ],
+    },
+    "doji_star_rising": {
+        "candles": 3,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.black_body",
+            "c2.doji",
+            "c3.white_body",
+            "up_shadow_gap(c1, c2)",
+            "up_shadow_gap(c2, c3)",
+        ],
+    },
+    "downside_gap_three_methods": {
+        "candles": 3,
+        "trend": "down",
+        "prediction": "continuation",
+        "conditions": [
+            "c1.tall_black_body",
+            "c2.tall_black_body",
+            "c3.white_body",
+            "down_shadow_gap(c1, c2)",
+            "c2.open > c3.open",
+            "c3.open > c2.close",
+            "c1.open > c3.close",
+            "c3.close > c1.close",
+        ],
+    },
+    "downside_tasuki_gap": {
+        "candles": 3,
+        "trend": "down",
+        "prediction": "continuation",
+        "conditions": [
+            "c1.black_body",
+            "c2.black_body",
+            "c3.white_body",
+            "down_body_gap(c1, c2)",
+            "c2.open > c3.open",
+            "c3.open > c2.close",
+            "c2.open < c3.close",
+            "c3.close < c1.close",
+        ],
+    },
+    "evening_doji_star": {
+        "candles": 3,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_white_body",
+            "c2.doji",
+            "c3.tall_black_body",
+            "up_body_gap(c1, c2)",
+            "down_body_gap(c2, c3)",
+            "c1.open < c3.close",
+            "c3.close <= 0.5 * (c1.open + c1.close)",
+        ],
+    },
+    "evening_star": {
+        "candles": 3,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_white_body",
+            "c2.short_body",
+            "c3.tall_black_body",
+            "up_body_gap(c1, c2)",
+            "down_body_gap(c2, c3)",
+            "c1.open < c3.close",
+            "c3.close <= 0.5 * (c1.open + c1.close)",
+        ],
+    },
+    "identical_three_crows": {
+        "candles": 3,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_black_body",
+            "c2.tall_black_body",
+            "c3.tall_black_body",
+            "near(c1.close, c2.open)",
+            "near(c2.close, c3.open)",
+        ],
+    },
+    "morning_doji_star": {
+        "candles": 3,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_black_body",
+            "c2.doji",
+            "c3.tall_white_body",
+            "down_body_gap(c1, c2)",
+            "up_body_gap(c2, c3)",
+        ],
+    },
+    "morning_star": {
+        "candles": 3,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_black_body",
+            "c2.short_body",
+            "c3.tall_white_body",
+            "down_body_gap(c1, c2)",
+            "up_body_gap(c2, c3)",
+            "c3.close > 0.5 * (c1.open + c1.close)",
+        ],
+    },
+    "side_by_side_white_lines_bearish": {
+        "candles": 3,
+        "trend": "down",
+        "prediction": "continuation",
+        "conditions": [
+            "c1.black_body",
+            "c2.white_body",
+            "c3.white_body",
+            "near(c2.close, c3.close)",
+            "near(c2.open, c3.open)",
+            "down_body_gap(c1, c2)",
+            "down_body_gap(c1, c3)",
+        ],
+    },
+    "side_by_side_white_lines_bullish": {
+        "candles": 3,
+        "trend": "up",
+        "prediction": "continuation",
+        "conditions": [
+            "c1.white_body",
+            "c2.white_body",
+            "c3.white_body",
+            "near(c2.close, c3.close)",
+            "near(c2.open, c3.open)",
+            "up_body_gap(c1, c2)",
+            "up_body_gap(c1, c3)",
+        ],
+    },
+    "stick_sandwich": {
+        "candles": 3,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.black_body",
+            "c2.white_body",
+            "c3.black_body",
+            "c1.close < c2.high",
+            "near(c3.close, c1.close)",
+        ],
+    },
+    "three_black_crows": {
+        "candles": 3,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_black_body",
+            "c2.tall_black_body",
+            "c3.tall_black_body",
+            "c1.close > c2.close",
+            "c2.close > c3.close",
+            "c1.close < c2.open",
+            "c2.open < c1.open",
+            "c2.close < c3.open",
+            "c3.open < c2.open",
+            "near(c1.close, c1.low)",
+            "near(c2.close, c2.low)",
+            "near(c3.close, c3.low)",
+        ],
+    },
+    "three_inside_down": {
+        "candles": 3,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_white_body",
+            "c2.short_black_body",
+            "c3.black_body",
+            "c1.close >= c2.open",
+            "c2.close >= c1.open",
+            (
+                "(c1.close == c2.open) & (c2.close != c1.open) | (c1.close !="
+                " c2.open) & (c2.close == c1.open)"
+            ),
+            "c1.close > c3.close",
+            "c2.close > c3.close",
+        ],
+    },
+    "three_inside_up": {
+        "candles": 3,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_black_body",
+            "c2.short_white_body",
+            "c3.white_body",
+            "c1.close <= c2.open",
+            "c2.close <= c1.open",
+            (
+                "(c1.close == c2.open) & (c2.close != c1.open) | (c1.close !="
+                " c2.open) & (c2.close == c1.open)"
+            ),
+            "c1.close < c3.close",
+            "c2.close < c3.close",
+        ],
+    },
+    "three_outside_down": {
+        "candles": 3,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.white_body",
+            "c2.black_body",
+            "c3.black_body",
+            "c1.close < c2.open",
+            "c2.close < c1.open",
+            "c3.close < c2.close",
+        ],
+    },
+    "three_outside_up": {
+        "candles": 3,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.black_body",
+            "c2.white_body",
+            "c3.white_body",
+            "c1.close > c2.open",
+            "c2.close > c1.open",
+            "c3.close > c2.close",
+        ],
+    },
+    "three_stars_in_the_south": {
+        "candles": 3,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_black_body",
+            "c2.black_body",
+            "c3.tall_black_body",
+            "c1.long_ls",
+            "c1.low < c2.low",
+            "c1.body_height > c2.body_height",
+            "c3.no_us",
+            "c3.no_ls",
+            "c2.high > c3.high",
+            "c2.low < c3.low",
+        ],
+    },
+    "three_white_soldiers": {
+        "candles": 3,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_white_body",
+            "c2.tall_white_body",
+            "c3.tall_white_body",
+            "c1.high < c2.high",
+            "c2.high < c3.high",
+            "c1.open < c2.open",
+            "c2.open < c1.close",
+            "c2.open < c3.open",
+            "c3.open < c2.close",
+            "near(c1.close, c1.high)",
+            "near(c2.close, c2.high)",
+            "near(c3.close, c3.high)",
+        ],
+    },
+    "tri_star_bearish": {
+        "candles": 3,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.doji",
+            "c2.doji",
+            "c3.doji",
+            "up_body_gap(c1, c2)",
+            "down_body_gap(c2, c3)",
+        ],
+    },
+    "tri_star_bullish": {
+        "candles": 3,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.doji",
+            "c2.doji",
+            "c3.doji",
+            "down_body_gap(c1, c2)",
+            "up_body_gap(c2, c3)",
+        ],
+    },
+    "two_black_gapping_candles": {
+        "candles": 3,
+        "trend": "down",
+        "prediction": "continuation",
+        "conditions": [
+            "c2.black_body",
+            "c3.black_body",
+            "down_shadow_gap(c1, c2)",
+            "c2.high > c3.high",
+        ],
+    },
+    "two_crows": {
+        "candles": 3,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_white_body",
+            "c2.black_body",
+            "c3.black_body",
+            "up_body_gap(c1, c2)",
+            "c2.close < c3.open",
+            "c3.open < c2.open",
+            "c1.open < c3.close",
+            "c3.close < c1.close",
+        ],
+    },
+    "unique_three_river_bottom": {
+        "candles": 3,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_black_body",
+            "c2.black_body",
+            "c3.short_white_body",
+            "down_body_gap(c2, c3)",
+            "c1.open > c2.open",
+            "c1.close < c2.close",
+            "c2.long_ls",
+            "c1.low > c2.low",
+        ],
+    },
+    "unique_three_river_top": {
+        "candles": 3,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_white_body",
+            "c2.white_body",
+            "c3.short_black_body",
+            "up_body_gap(c2, c3)",
+            "c1.open < c2.open",
+            "c1.close > c2.close",
+            "c2.long_us",
+            "c1.high < c2.high",
+        ],
+    },
+    "upside_gap_three_methods": {
+        "candles": 3,
+        "trend": "up",
+        "prediction": "continuation",
+        "conditions": [
+            "c1.tall_white_body",
+            "c2.tall_white_body",
+            "c3.black_body",
+            "up_shadow_gap(c1, c2)",
+            "c3.close < c1.close",
+            "c2.open < c3.open",
+        ],
+    },
+    "upside_gap_two_crows": {
+        "candles": 3,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_white_body",
+            "c2.black_body",
+            "c3.black_body",
+            "up_body_gap(c1, c2)",
+            "c3.open > c2.open",
+            "c2.close > c3.close",
+            "c3.close > c1.close",
+        ],
+    },
+    "upside_tasuki_gap": {
+        "candles": 3,
+        "trend": "up",
+        "prediction": "continuation",
+        "conditions": [
+            "c1.white_body",
+            "c2.white_body",
+            "c3.black_body",
+            "up_shadow_gap(c1, c2)",
+            "c2.open < c3.open",
+            "c3.open < c2.close",
+            "c3.close > c1.high",
+            "c3.close < c2.low",
+        ],
+    },
+    "concealing_baby_swallow": {
+        "candles": 4,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_black_body",
+            "c2.tall_black_body",
+            "c3.black_body",
+            "c4.black_body",
+            "down_body_gap(c1, c3)",
+            "down_body_gap(c2, c3)",
+            "c1.no_us",
+            "c2.no_us",
+            "c1.no_ls",
+            "c2.no_ls",
+            "c3.long_ls",
+            "c2.open > c3.high",
+            "c3.high > c2.close",
+            "c4.high > c3.high",
+            "c3.low > c4.low",
+        ],
+    },
+    "three_line_strike_bearish": {
+        "candles": 4,
+        "trend": "down",
+        "prediction": "continuation",
+        "conditions": [
+            "c1.black_body",
+            "c2.black_body",
+            "c3.black_body",
+            "c4.white_body",
+            "c1.close > c2.close",
+            "c2.close > c3.close",
+            "c4.open < c3.close",
+            "c4.close > c1.open",
+        ],
+    },
+    "three_line_strike_bullish": {
+        "candles": 4,
+        "trend": "up",
+        "prediction": "continuation",
+        "conditions": [
+            "c1.white_body",
+            "c2.white_body",
+            "c3.white_body",
+            "c4.black_body",
+            "c1.close < c2.close",
+            "c2.close < c3.close",
+            "c4.open > c3.close",
+            "c4.close < c1.open",
+        ],
+    },
+    "breakaway_bearish": {
+        "candles": 5,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_white_body",
+            "c2.white_body",
+            "c4.white_body",
+            "c5.tall_black_body",
+            "up_body_gap(c1, c2)",
+            "c3.close > c2.close",
+            "c4.close > c3.close",
+            "c1.close < c5.close",
+            "c5.close < c2.open",
+        ],
+    },
+    "breakaway_bullish": {
+        "candles": 5,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_black_body",
+            "c2.black_body",
+            "c4.black_body",
+            "c5.tall_white_body",
+            "down_body_gap(c1, c2)",
+            "c3.close < c2.close",
+            "c4.close < c3.close",
+            "c2.open < c5.close",
+            "c5.close < c1.close",
+        ],
+    },
+    "falling_three_methods": {
+        "candles": 5,
+        "trend": "down",
+        "prediction": "continuation",
+        "conditions": [
+            "c1.tall_black_body",
+            "c2.short_white_body",
+            "c3.short_body",
+            "c4.short_white_body",
+            "c5.tall_black_body",
+            "c2.close < c3.close",
+            "c3.close < c4.close",
+            "c1.high > c4.close",
+            "c1.low < c2.close",
+            "c5.close < c1.close",
+        ],
+    },
+    "ladder_bottom": {
+        "candles": 5,
+        "trend": "down",
+        "prediction": "reversal",
+        "conditions": [
+            "c1.tall_black_body",
+            "c2.tall_black_body",
+            "c3.tall_black_body",
+            "c4.black_body",
+            "c5.white_body",
+            "~c4.no_us",
+            "up_body_gap(c4, c5)",
+            "c2.open < c1.open",
+            "c3.open < c2.open",
+            "c2.close < c1.close",
+            "c3.close < c2.close",
+        ],
+    },
+    "mat_hold": {
+        "candles": 5,
+        "trend": "up",
+        "prediction": "continuation",
+        "conditions": [
+            "c1.tall_white_body",
+            "c2.short_black_body",
+            "c3.short_body",
+            "c4.short_black_body",
+            "c5.white_body",
+            "up_body_gap(c1, c2)",
+            "c2.close > c3.close",
+            "c3.close > c4.close",
+            "c1.low < c4.close",
+            "max(c1.high, c2.high, c3.high, c4.high) < c5.close",
+        ],
+    },
+    "rising_three_methods": {
+        "candles": 5,
+        "trend": "up",
+        "prediction": "continuation",
+        "conditions": [
+            "c1.tall_white_body",
+            "c2.short_black_body",
+            "c3.short_body",
+            "c4.short_black_body",
+            "c5.tall_white_body",
+            "c2.close > c3.close",
+            "c3.close > c4.close",
+            "c1.high > c4.close",
+            "c1.low < c2.close",
+            "max(c1.high, c2.high, c3.high, c4.high) < c5.close",
+        ],
+    },
+    "eight_new_price_lines": {
+        "candles": 8,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c8.rising_highs >= 7",
+        ],
+    },
+    "ten_new_price_lines": {
+        "candles": 10,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c10.rising_highs >= 9",
+        ],
+    },
+    "long_black_day": {
+        "candles": 11,
+        "trend": "either",
+        "prediction": "continuation",
+        "conditions": [
+            "c11.tall_black_body",
+            "c11.upper_shadow_length < c11.body_height",
+            "c11.lower_shadow_length < c11.body_height",
+            (
+                "(c11.body_height > 3 * mean(c10.body_height, c9.body_height,"
+                " c8.body_height, c7.body_height, c6.body_height)) | "
+                "(c11.body_height > 3 * mean(c10.body_height, c9.body_height,"
+                " c8.body_height, c7.body_height, c6.body_height, "
+                "c5.body_height, c4.body_height, c3.body_height, "
+                "c2.body_height, c1.body_height))"
+            ),
+        ],
+    },
+    "long_white_day": {
+        "candles": 11,
+        "trend": "either",
+        "prediction": "continuation",
+        "conditions": [
+            "c11.tall_white_body",
+            "c11.upper_shadow_length < c11.body_height",
+            "c11.lower_shadow_length < c11.body_height",
+            (
+                "(c11.body_height > 3 * mean(c10.body_height, c9.body_height,"
+                " c8.body_height, c7.body_height, c6.body_height)) | "
+                "(c11.body_height > 3 * mean(c10.body_height, c9.body_height,"
+                " c8.body_height, c7.body_height, c6.body_height, "
+                "c5.body_height, c4.body_height, c3.body_height, "
+                "c2.body_height, c1.body_height))"
+            ),
+        ],
+    },
+    "twelve_new_price_lines": {
+        "candles": 12,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c12.rising_highs >= 11",
+        ],
+    },
+    "thirteen_new_price_lines": {
+        "candles": 13,
+        "trend": "up",
+        "prediction": "reversal",
+        "conditions": [
+            "c13.rising_highs >= 12",
+        ],
+    },
+}
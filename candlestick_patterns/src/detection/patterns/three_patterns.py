@@ -4,7 +4,7 @@ from detection.patterns.functions import candlestick_functions as cf
 
 
 def abandoned_baby_bearish_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: first a short/normal/tall white candle, then a doji, finally a
     short/normal/tall black candle. Between the candles there are upwards and downwards
@@ -15,27 +15,27 @@ def abandoned_baby_bearish_(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 2], candle_2[:, 3]
-    O_3, H_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 3]
+    H_1 = candle_1["high"]
+    L_2 = candle_2["low"]
+    H_3 = candle_3["high"]
     return np.logical_and.reduce(
         (
             T == 1,
             np.logical_or.reduce(
                 (
-                    cf.short_white_body(O_1, C_1, percentile),
-                    cf.normal_white_body(O_1, C_1, percentile),
-                    cf.tall_white_body(O_1, C_1, percentile),
+                    candle_1["short_white_body"],
+                    candle_1["normal_white_body"],
+                    candle_1["tall_white_body"],
                 )
             ),
-            cf.doji(O_2, C_2, percentile),
+            candle_2["doji"],
             cf.up_shadow_gap(H_1, L_2),
             cf.down_shadow_gap(L_2, H_3),
             np.logical_or.reduce(
                 (
-                    cf.short_black_body(O_3, C_3, percentile),
-                    cf.normal_black_body(O_3, C_3, percentile),
-                    cf.tall_black_body(O_3, C_3, percentile),
+                    candle_3["short_black_body"],
+                    candle_3["normal_black_body"],
+                    candle_3["tall_black_body"],
                 )
             ),
         )
@@ -43,7 +43,7 @@ def abandoned_baby_bearish_(
 
 
 def abandoned_baby_bearish_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: first a short/normal/tall white candle, then a doji, finally a
     short/normal/tall black candle. Between the candles there are upwards and downwards
@@ -54,26 +54,26 @@ def abandoned_baby_bearish_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 2], candle_2[:, 3]
-    O_3, H_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 3]
+    H_1 = candle_1["high"]
+    L_2 = candle_2["low"]
+    H_3 = candle_3["high"]
     return np.logical_and.reduce(
         (
             np.logical_or.reduce(
                 (
-                    cf.short_white_body(O_1, C_1, percentile),
-                    cf.normal_white_body(O_1, C_1, percentile),
-                    cf.tall_white_body(O_1, C_1, percentile),
+                    candle_1["short_white_body"],
+                    candle_1["normal_white_body"],
+                    candle_1["tall_white_body"],
                 )
             ),
-            cf.doji(O_2, C_2, percentile),
+            candle_2["doji"],
             cf.up_shadow_gap(H_1, L_2),
             cf.down_shadow_gap(L_2, H_3),
             np.logical_or.reduce(
                 (
-                    cf.short_black_body(O_3, C_3, percentile),
-                    cf.normal_black_body(O_3, C_3, percentile),
-                    cf.tall_black_body(O_3, C_3, percentile),
+                    candle_3["short_black_body"],
+                    candle_3["normal_black_body"],
+                    candle_3["tall_black_body"],
                 )
             ),
         )
@@ -81,7 +81,7 @@ def abandoned_baby_bearish_no_trend(
 
 
 def abandoned_baby_bearish_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: first a short/normal/tall white candle, then a doji, finally a
     short/normal/tall black candle. Between the candles there are upwards and downwards
@@ -92,27 +92,27 @@ def abandoned_baby_bearish_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 2], candle_2[:, 3]
-    O_3, H_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 3]
+    H_1 = candle_1["high"]
+    L_2 = candle_2["low"]
+    H_3 = candle_3["high"]
     return np.logical_and.reduce(
         (
             T == -1,
             np.logical_or.reduce(
                 (
-                    cf.short_white_body(O_1, C_1, percentile),
-                    cf.normal_white_body(O_1, C_1, percentile),
-                    cf.tall_white_body(O_1, C_1, percentile),
+                    candle_1["short_white_body"],
+                    candle_1["normal_white_body"],
+                    candle_1["tall_white_body"],
                 )
             ),
-            cf.doji(O_2, C_2, percentile),
+            candle_2["doji"],
             cf.up_shadow_gap(H_1, L_2),
             cf.down_shadow_gap(L_2, H_3),
             np.logical_or.reduce(
                 (
-                    cf.short_black_body(O_3, C_3, percentile),
-                    cf.normal_black_body(O_3, C_3, percentile),
-                    cf.tall_black_body(O_3, C_3, percentile),
+                    candle_3["short_black_body"],
+                    candle_3["normal_black_body"],
+                    candle_3["tall_black_body"],
                 )
             ),
         )
@@ -120,7 +120,7 @@ def abandoned_baby_bearish_opp_trend(
 
 
 def abandoned_baby_bullish_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: first a black candle, then a doji, finally a white candle. Between
     the candles there are downwards and upwards shadow gaps, respectively.
@@ -130,23 +130,23 @@ def abandoned_baby_bullish_(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, L_3, C_3 = candle_3[:, 0], candle_3[:, 2], candle_3[:, 3]
+    L_1 = candle_1["low"]
+    H_2 = candle_2["high"]
+    L_3 = candle_3["low"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.black_body(O_1, C_1),
-            cf.doji(O_2, C_2, percentile),
+            candle_1["black_body"],
+            candle_2["doji"],
             cf.down_shadow_gap(L_1, H_2),
             cf.up_shadow_gap(H_2, L_3),
-            cf.white_body(O_3, C_3),
+            candle_3["white_body"],
         )
     )
 
 
 def abandoned_baby_bullish_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: first a black candle, then a doji, finally a white candle. Between
     the candles there are downwards and upwards shadow gaps, respectively.
@@ -156,22 +156,22 @@ def abandoned_baby_bullish_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, L_3, C_3 = candle_3[:, 0], candle_3[:, 2], candle_3[:, 3]
+    L_1 = candle_1["low"]
+    H_2 = candle_2["high"]
+    L_3 = candle_3["low"]
     return np.logical_and.reduce(
         (
-            cf.black_body(O_1, C_1),
-            cf.doji(O_2, C_2, percentile),
+            candle_1["black_body"],
+            candle_2["doji"],
             cf.down_shadow_gap(L_1, H_2),
             cf.up_shadow_gap(H_2, L_3),
-            cf.white_body(O_3, C_3),
+            candle_3["white_body"],
         )
     )
 
 
 def abandoned_baby_bullish_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: first a black candle, then a doji, finally a white candle. Between
     the candles there are downwards and upwards shadow gaps, respectively.
@@ -181,22 +181,24 @@ def abandoned_baby_bullish_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, L_3, C_3 = candle_3[:, 0], candle_3[:, 2], candle_3[:, 3]
+    L_1 = candle_1["low"]
+    H_2 = candle_2["high"]
+    L_3 = candle_3["low"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.black_body(O_1, C_1),
-            cf.doji(O_2, C_2, percentile),
+            candle_1["black_body"],
+            candle_2["doji"],
             cf.down_shadow_gap(L_1, H_2),
             cf.up_shadow_gap(H_2, L_3),
-            cf.white_body(O_3, C_3),
+            candle_3["white_body"],
         )
     )
 
 
-def advance_block_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def advance_block_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: three white candles, the last two opening within the previous body.
     Shadows of #2 and #3 are larger than their bodies and the shadows of #1.
 
@@ -205,31 +207,29 @@ def advance_block_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> boo
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
-    O_3, H_3, L_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 2], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3 = candle_3["open"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.white_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
-            cf.white_body(O_3, C_3),
+            candle_1["white_body"],
+            candle_2["white_body"],
+            candle_3["white_body"],
             O_1 < O_2,
             O_2 < C_1,
             O_2 < O_3,
             O_3 < C_2,
-            cf.total_shadow_length(O_2, H_2, L_2, C_2) > cf.body_height(O_2, C_2),
-            cf.total_shadow_length(O_3, H_3, L_3, C_3) > cf.body_height(O_3, C_3),
-            cf.total_shadow_length(O_2, H_2, L_2, C_2)
-            > cf.total_shadow_length(O_1, H_1, L_1, C_1),
-            cf.total_shadow_length(O_3, H_3, L_3, C_3)
-            > cf.total_shadow_length(O_1, H_1, L_1, C_1),
+            candle_2["total_shadow_length"] > candle_2["body_height"],
+            candle_3["total_shadow_length"] > candle_3["body_height"],
+            candle_2["total_shadow_length"] > candle_1["total_shadow_length"],
+            candle_3["total_shadow_length"] > candle_1["total_shadow_length"],
         )
     )
 
 
 def advance_block_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three white candles, the last two opening within the previous body.
     Shadows of #2 and #3 are larger than their bodies and the shadows of #1.
@@ -239,30 +239,28 @@ def advance_block_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
-    O_3, H_3, L_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 2], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3 = candle_3["open"]
     return np.logical_and.reduce(
         (
-            cf.white_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
-            cf.white_body(O_3, C_3),
+            candle_1["white_body"],
+            candle_2["white_body"],
+            candle_3["white_body"],
             O_1 < O_2,
             O_2 < C_1,
             O_2 < O_3,
             O_3 < C_2,
-            cf.total_shadow_length(O_2, H_2, L_2, C_2) > cf.body_height(O_2, C_2),
-            cf.total_shadow_length(O_3, H_3, L_3, C_3) > cf.body_height(O_3, C_3),
-            cf.total_shadow_length(O_2, H_2, L_2, C_2)
-            > cf.total_shadow_length(O_1, H_1, L_1, C_1),
-            cf.total_shadow_length(O_3, H_3, L_3, C_3)
-            > cf.total_shadow_length(O_1, H_1, L_1, C_1),
+            candle_2["total_shadow_length"] > candle_2["body_height"],
+            candle_3["total_shadow_length"] > candle_3["body_height"],
+            candle_2["total_shadow_length"] > candle_1["total_shadow_length"],
+            candle_3["total_shadow_length"] > candle_1["total_shadow_length"],
         )
     )
 
 
 def advance_block_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three white candles, the last two opening within the previous body.
     Shadows of #2 and #3 are larger than their bodies and the shadows of #1.
@@ -272,30 +270,30 @@ def advance_block_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
-    O_3, H_3, L_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 2], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3 = candle_3["open"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.white_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
-            cf.white_body(O_3, C_3),
+            candle_1["white_body"],
+            candle_2["white_body"],
+            candle_3["white_body"],
             O_1 < O_2,
             O_2 < C_1,
             O_2 < O_3,
             O_3 < C_2,
-            cf.total_shadow_length(O_2, H_2, L_2, C_2) > cf.body_height(O_2, C_2),
-            cf.total_shadow_length(O_3, H_3, L_3, C_3) > cf.body_height(O_3, C_3),
-            cf.total_shadow_length(O_2, H_2, L_2, C_2)
-            > cf.total_shadow_length(O_1, H_1, L_1, C_1),
-            cf.total_shadow_length(O_3, H_3, L_3, C_3)
-            > cf.total_shadow_length(O_1, H_1, L_1, C_1),
+            candle_2["total_shadow_length"] > candle_2["body_height"],
+            candle_3["total_shadow_length"] > candle_3["body_height"],
+            candle_2["total_shadow_length"] > candle_1["total_shadow_length"],
+            candle_3["total_shadow_length"] > candle_1["total_shadow_length"],
         )
     )
 
 
-def deliberation_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def deliberation_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: two tall white candles and a short white candle that opens near the
     second close. Each candle opens and closes higher then the previous open and close.
 
@@ -304,16 +302,16 @@ def deliberation_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.tall_white_body(O_2, C_2, percentile),
-            cf.short_white_body(O_3, C_3, percentile),
-            cf.near(O_3, C_2, percentile),
+            candle_1["tall_white_body"],
+            candle_2["tall_white_body"],
+            candle_3["short_white_body"],
+            cf.near(O_3, C_2, calibration),
             O_1 < O_2,
             O_2 < O_3,
             C_1 < C_2,
@@ -323,7 +321,7 @@ def deliberation_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool
 
 
 def deliberation_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two tall white candles and a short white candle that opens near the
     second close. Each candle opens and closes higher then the previous open and close.
@@ -333,15 +331,15 @@ def deliberation_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.tall_white_body(O_2, C_2, percentile),
-            cf.short_white_body(O_3, C_3, percentile),
-            cf.near(O_3, C_2, percentile),
+            candle_1["tall_white_body"],
+            candle_2["tall_white_body"],
+            candle_3["short_white_body"],
+            cf.near(O_3, C_2, calibration),
             O_1 < O_2,
             O_2 < O_3,
             C_1 < C_2,
@@ -351,7 +349,7 @@ def deliberation_no_trend(
 
 
 def deliberation_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two tall white candles and a short white candle that opens near the
     second close. Each candle opens and closes higher then the previous open and close.
@@ -361,16 +359,16 @@ def deliberation_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.tall_white_body(O_2, C_2, percentile),
-            cf.short_white_body(O_3, C_3, percentile),
-            cf.near(O_3, C_2, percentile),
+            candle_1["tall_white_body"],
+            candle_2["tall_white_body"],
+            candle_3["short_white_body"],
+            cf.near(O_3, C_2, calibration),
             O_1 < O_2,
             O_2 < O_3,
             C_1 < C_2,
@@ -380,7 +378,7 @@ def deliberation_opp_trend(
 
 
 def doji_star_collapsing_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: white candle, doji, black candle, each with a downward shadow gap.
 
@@ -389,15 +387,15 @@ def doji_star_collapsing_(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
-    O_3, H_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 3]
+    L_1 = candle_1["low"]
+    H_2, L_2 = candle_2["high"], candle_2["low"]
+    H_3 = candle_3["high"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.white_body(O_1, C_1),
-            cf.doji(O_2, C_2, percentile),
-            cf.black_body(O_3, C_3),
+            candle_1["white_body"],
+            candle_2["doji"],
+            candle_3["black_body"],
             cf.down_shadow_gap(L_1, H_2),
             cf.down_shadow_gap(L_2, H_3),
         )
@@ -405,7 +403,7 @@ def doji_star_collapsing_(
 
 
 def doji_star_collapsing_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: white candle, doji, black candle, each with a downward shadow gap.
 
@@ -414,14 +412,14 @@ def doji_star_collapsing_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
-    O_3, H_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 3]
+    L_1 = candle_1["low"]
+    H_2, L_2 = candle_2["high"], candle_2["low"]
+    H_3 = candle_3["high"]
     return np.logical_and.reduce(
         (
-            cf.white_body(O_1, C_1),
-            cf.doji(O_2, C_2, percentile),
-            cf.black_body(O_3, C_3),
+            candle_1["white_body"],
+            candle_2["doji"],
+            candle_3["black_body"],
             cf.down_shadow_gap(L_1, H_2),
             cf.down_shadow_gap(L_2, H_3),
         )
@@ -429,7 +427,7 @@ def doji_star_collapsing_no_trend(
 
 
 def doji_star_collapsing_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: white candle, doji, black candle, each with a downward shadow gap.
 
@@ -438,22 +436,24 @@ def doji_star_collapsing_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
-    O_3, H_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 3]
+    L_1 = candle_1["low"]
+    H_2, L_2 = candle_2["high"], candle_2["low"]
+    H_3 = candle_3["high"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.white_body(O_1, C_1),
-            cf.doji(O_2, C_2, percentile),
-            cf.black_body(O_3, C_3),
+            candle_1["white_body"],
+            candle_2["doji"],
+            candle_3["black_body"],
             cf.down_shadow_gap(L_1, H_2),
             cf.down_shadow_gap(L_2, H_3),
         )
     )
 
 
-def doji_star_rising_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def doji_star_rising_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: black candle, doji, white candle, each with an upward shadow gap.
 
     Trend: down.
@@ -461,15 +461,15 @@ def doji_star_rising_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
-    O_3, L_3, C_3 = candle_3[:, 0], candle_3[:, 2], candle_3[:, 3]
+    H_1 = candle_1["high"]
+    H_2, L_2 = candle_2["high"], candle_2["low"]
+    L_3 = candle_3["low"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.black_body(O_1, C_1),
-            cf.doji(O_2, C_2, percentile),
-            cf.white_body(O_3, C_3),
+            candle_1["black_body"],
+            candle_2["doji"],
+            candle_3["white_body"],
             cf.up_shadow_gap(H_1, L_2),
             cf.up_shadow_gap(H_2, L_3),
         )
@@ -477,7 +477,7 @@ def doji_star_rising_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
 
 
 def doji_star_rising_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: black candle, doji, white candle, each with an upward shadow gap.
 
@@ -486,14 +486,14 @@ def doji_star_rising_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
-    O_3, L_3, C_3 = candle_3[:, 0], candle_3[:, 2], candle_3[:, 3]
+    H_1 = candle_1["high"]
+    H_2, L_2 = candle_2["high"], candle_2["low"]
+    L_3 = candle_3["low"]
     return np.logical_and.reduce(
         (
-            cf.black_body(O_1, C_1),
-            cf.doji(O_2, C_2, percentile),
-            cf.white_body(O_3, C_3),
+            candle_1["black_body"],
+            candle_2["doji"],
+            candle_3["white_body"],
             cf.up_shadow_gap(H_1, L_2),
             cf.up_shadow_gap(H_2, L_3),
         )
@@ -501,7 +501,7 @@ def doji_star_rising_no_trend(
 
 
 def doji_star_rising_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: black candle, doji, white candle, each with an upward shadow gap.
 
@@ -510,15 +510,15 @@ def doji_star_rising_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
-    O_3, L_3, C_3 = candle_3[:, 0], candle_3[:, 2], candle_3[:, 3]
+    H_1 = candle_1["high"]
+    H_2, L_2 = candle_2["high"], candle_2["low"]
+    L_3 = candle_3["low"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.black_body(O_1, C_1),
-            cf.doji(O_2, C_2, percentile),
-            cf.white_body(O_3, C_3),
+            candle_1["black_body"],
+            candle_2["doji"],
+            candle_3["white_body"],
             cf.up_shadow_gap(H_1, L_2),
             cf.up_shadow_gap(H_2, L_3),
         )
@@ -526,7 +526,7 @@ def doji_star_rising_opp_trend(
 
 
 def downside_gap_three_methods_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two tall black candles with a downside shadow gap followed by a
     white that opens is the body of #2 and closes in the body of #1, bridging the
@@ -537,15 +537,15 @@ def downside_gap_three_methods_(
     Prediction: continuation.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, L_1, C_1 = candle_1["open"], candle_1["low"], candle_1["close"]
+    O_2, H_2, C_2 = candle_2["open"], candle_2["high"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.white_body(O_3, C_3),
+            candle_1["tall_black_body"],
+            candle_2["tall_black_body"],
+            candle_3["white_body"],
             cf.down_shadow_gap(L_1, H_2),
             O_2 > O_3,
             O_3 > C_2,
@@ -556,7 +556,7 @@ def downside_gap_three_methods_(
 
 
 def downside_gap_three_methods_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two tall black candles with a downside shadow gap followed by a
     white that opens is the body of #2 and closes in the body of #1, bridging the
@@ -567,14 +567,14 @@ def downside_gap_three_methods_no_trend(
     Prediction: continuation.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, L_1, C_1 = candle_1["open"], candle_1["low"], candle_1["close"]
+    O_2, H_2, C_2 = candle_2["open"], candle_2["high"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.white_body(O_3, C_3),
+            candle_1["tall_black_body"],
+            candle_2["tall_black_body"],
+            candle_3["white_body"],
             cf.down_shadow_gap(L_1, H_2),
             O_2 > O_3,
             O_3 > C_2,
@@ -585,7 +585,7 @@ def downside_gap_three_methods_no_trend(
 
 
 def downside_gap_three_methods_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two tall black candles with a downside shadow gap followed by a
     white that opens is the body of #2 and closes in the body of #1, bridging the
@@ -596,15 +596,15 @@ def downside_gap_three_methods_opp_trend(
     Prediction: continuation.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, L_1, C_1 = candle_1["open"], candle_1["low"], candle_1["close"]
+    O_2, H_2, C_2 = candle_2["open"], candle_2["high"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.white_body(O_3, C_3),
+            candle_1["tall_black_body"],
+            candle_2["tall_black_body"],
+            candle_3["white_body"],
             cf.down_shadow_gap(L_1, H_2),
             O_2 > O_3,
             O_3 > C_2,
@@ -614,7 +614,9 @@ def downside_gap_three_methods_opp_trend(
     )
 
 
-def downside_tasuki_gap_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def downside_tasuki_gap_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: two black candles with a downside body gap, followed by a white
     candle that opens in the previous body and closes in the body gap between #1 and #2.
 
@@ -623,15 +625,15 @@ def downside_tasuki_gap_(candles: np.ndarray, T: np.ndarray, percentile: tuple)
     Prediction: continuation.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.black_body(O_1, C_1),
-            cf.black_body(O_2, C_2),
-            cf.white_body(O_3, C_3),
+            candle_1["black_body"],
+            candle_2["black_body"],
+            candle_3["white_body"],
             cf.down_body_gap(O_1, C_1, O_2, C_2),
             O_2 > O_3,
             O_3 > C_2,
@@ -642,7 +644,7 @@ def downside_tasuki_gap_(candles: np.ndarray, T: np.ndarray, percentile: tuple)
 
 
 def downside_tasuki_gap_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two black candles with a downside body gap, followed by a white
     candle that opens in the previous body and closes in the body gap between #1 and #2.
@@ -652,14 +654,14 @@ def downside_tasuki_gap_no_trend(
     Prediction: continuation.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.black_body(O_1, C_1),
-            cf.black_body(O_2, C_2),
-            cf.white_body(O_3, C_3),
+            candle_1["black_body"],
+            candle_2["black_body"],
+            candle_3["white_body"],
             cf.down_body_gap(O_1, C_1, O_2, C_2),
             O_2 > O_3,
             O_3 > C_2,
@@ -670,7 +672,7 @@ def downside_tasuki_gap_no_trend(
 
 
 def downside_tasuki_gap_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two black candles with a downside body gap, followed by a white
     candle that opens in the previous body and closes in the body gap between #1 and #2.
@@ -680,15 +682,15 @@ def downside_tasuki_gap_opp_trend(
     Prediction: continuation.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.black_body(O_1, C_1),
-            cf.black_body(O_2, C_2),
-            cf.white_body(O_3, C_3),
+            candle_1["black_body"],
+            candle_2["black_body"],
+            candle_3["white_body"],
             cf.down_body_gap(O_1, C_1, O_2, C_2),
             O_2 > O_3,
             O_3 > C_2,
@@ -698,7 +700,9 @@ def downside_tasuki_gap_opp_trend(
     )
 
 
-def evening_doji_star_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def evening_doji_star_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall white candle, doji, and tall black candle with upside and
     downside body gaps respectively. The third candle closes at or below the midpoint of
     the first candle.
@@ -708,15 +712,15 @@ def evening_doji_star_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.doji(O_2, C_2, percentile),
-            cf.tall_black_body(O_3, C_3, percentile),
+            candle_1["tall_white_body"],
+            candle_2["doji"],
+            candle_3["tall_black_body"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             cf.down_body_gap(O_2, C_2, O_3, C_3),
             O_1 < C_3,
@@ -726,7 +730,7 @@ def evening_doji_star_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
 
 
 def evening_doji_star_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle, doji, and tall black candle with upside and
     downside body gaps respectively. The third candle closes at or below the midpoint of
@@ -737,14 +741,14 @@ def evening_doji_star_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.doji(O_2, C_2, percentile),
-            cf.tall_black_body(O_3, C_3, percentile),
+            candle_1["tall_white_body"],
+            candle_2["doji"],
+            candle_3["tall_black_body"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             cf.down_body_gap(O_2, C_2, O_3, C_3),
             O_1 < C_3,
@@ -754,7 +758,7 @@ def evening_doji_star_no_trend(
 
 
 def evening_doji_star_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle, doji, and tall black candle with upside and
     downside body gaps respectively. The third candle closes at or below the midpoint of
@@ -765,15 +769,15 @@ def evening_doji_star_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.doji(O_2, C_2, percentile),
-            cf.tall_black_body(O_3, C_3, percentile),
+            candle_1["tall_white_body"],
+            candle_2["doji"],
+            candle_3["tall_black_body"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             cf.down_body_gap(O_2, C_2, O_3, C_3),
             O_1 < C_3,
@@ -782,7 +786,9 @@ def evening_doji_star_opp_trend(
     )
 
 
-def evening_star_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def evening_star_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall white candle, small candle of either color, and tall black
     candle with upside and downside body gaps respectively. The third candle closes at
     or below the midpoint of the first candle.
@@ -792,15 +798,15 @@ def evening_star_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.short_body(O_2, C_2, percentile),
-            cf.tall_black_body(O_3, C_3, percentile),
+            candle_1["tall_white_body"],
+            candle_2["short_body"],
+            candle_3["tall_black_body"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             cf.down_body_gap(O_2, C_2, O_3, C_3),
             O_1 < C_3,
@@ -810,7 +816,7 @@ def evening_star_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool
 
 
 def evening_star_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle, small candle of either color, and tall black
     candle with upside and downside body gaps respectively. The third candle closes at
@@ -821,14 +827,14 @@ def evening_star_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.short_body(O_2, C_2, percentile),
-            cf.tall_black_body(O_3, C_3, percentile),
+            candle_1["tall_white_body"],
+            candle_2["short_body"],
+            candle_3["tall_black_body"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             cf.down_body_gap(O_2, C_2, O_3, C_3),
             O_1 < C_3,
@@ -838,7 +844,7 @@ def evening_star_no_trend(
 
 
 def evening_star_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle, small candle of either color, and tall black
     candle with upside and downside body gaps respectively. The third candle closes at
@@ -849,15 +855,15 @@ def evening_star_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.short_body(O_2, C_2, percentile),
-            cf.tall_black_body(O_3, C_3, percentile),
+            candle_1["tall_white_body"],
+            candle_2["short_body"],
+            candle_3["tall_black_body"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             cf.down_body_gap(O_2, C_2, O_3, C_3),
             O_1 < C_3,
@@ -867,7 +873,7 @@ def evening_star_opp_trend(
 
 
 def identical_three_crows_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three tall black candles, the latter two opening near the prior
     closing prices.
@@ -877,23 +883,23 @@ def identical_three_crows_(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    C_1 = candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3 = candle_3["open"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.tall_black_body(O_3, C_3, percentile),
-            cf.near(C_1, O_2, percentile),
-            cf.near(C_2, O_3, percentile),
+            candle_1["tall_black_body"],
+            candle_2["tall_black_body"],
+            candle_3["tall_black_body"],
+            cf.near(C_1, O_2, calibration),
+            cf.near(C_2, O_3, calibration),
         )
     )
 
 
 def identical_three_crows_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three tall black candles, the latter two opening near the prior
     closing prices.
@@ -903,22 +909,22 @@ def identical_three_crows_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    C_1 = candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3 = candle_3["open"]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.tall_black_body(O_3, C_3, percentile),
-            cf.near(C_1, O_2, percentile),
-            cf.near(C_2, O_3, percentile),
+            candle_1["tall_black_body"],
+            candle_2["tall_black_body"],
+            candle_3["tall_black_body"],
+            cf.near(C_1, O_2, calibration),
+            cf.near(C_2, O_3, calibration),
         )
     )
 
 
 def identical_three_crows_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three tall black candles, the latter two opening near the prior
     closing prices.
@@ -928,22 +934,24 @@ def identical_three_crows_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    C_1 = candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3 = candle_3["open"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.tall_black_body(O_3, C_3, percentile),
-            cf.near(C_1, O_2, percentile),
-            cf.near(C_2, O_3, percentile),
+            candle_1["tall_black_body"],
+            candle_2["tall_black_body"],
+            candle_3["tall_black_body"],
+            cf.near(C_1, O_2, calibration),
+            cf.near(C_2, O_3, calibration),
         )
     )
 
 
-def morning_doji_star_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def morning_doji_star_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall black candle, doji, and tall white candle with upside and
     downside body gaps respectively.
 
@@ -952,15 +960,15 @@ def morning_doji_star_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.doji(O_2, C_2, percentile),
-            cf.tall_white_body(O_3, C_3, percentile),
+            candle_1["tall_black_body"],
+            candle_2["doji"],
+            candle_3["tall_white_body"],
             cf.down_body_gap(O_1, C_1, O_2, C_2),
             cf.up_body_gap(O_2, C_2, O_3, C_3),
         )
@@ -968,7 +976,7 @@ def morning_doji_star_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
 
 
 def morning_doji_star_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle, doji, and tall white candle with upside and
     downside body gaps respectively.
@@ -978,14 +986,14 @@ def morning_doji_star_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.doji(O_2, C_2, percentile),
-            cf.tall_white_body(O_3, C_3, percentile),
+            candle_1["tall_black_body"],
+            candle_2["doji"],
+            candle_3["tall_white_body"],
             cf.down_body_gap(O_1, C_1, O_2, C_2),
             cf.up_body_gap(O_2, C_2, O_3, C_3),
         )
@@ -993,7 +1001,7 @@ def morning_doji_star_no_trend(
 
 
 def morning_doji_star_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle, doji, and tall white candle with upside and
     downside body gaps respectively.
@@ -1003,22 +1011,24 @@ def morning_doji_star_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.doji(O_2, C_2, percentile),
-            cf.tall_white_body(O_3, C_3, percentile),
+            candle_1["tall_black_body"],
+            candle_2["doji"],
+            candle_3["tall_white_body"],
             cf.down_body_gap(O_1, C_1, O_2, C_2),
             cf.up_body_gap(O_2, C_2, O_3, C_3),
         )
     )
 
 
-def morning_star_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def morning_star_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall black candle, small candle of either color, and tall white
     candle with upside and downside body gaps respectively. The third candle closes
     above the midpoint of the first candle.
@@ -1028,15 +1038,15 @@ def morning_star_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.short_body(O_2, C_2, percentile),
-            cf.tall_white_body(O_3, C_3, percentile),
+            candle_1["tall_black_body"],
+            candle_2["short_body"],
+            candle_3["tall_white_body"],
             cf.down_body_gap(O_1, C_1, O_2, C_2),
             cf.up_body_gap(O_2, C_2, O_3, C_3),
             C_3 > 0.5 * (O_1 + C_1),
@@ -1045,7 +1055,7 @@ def morning_star_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool
 
 
 def morning_star_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle, small candle of either color, and tall white
     candle with upside and downside body gaps respectively. The third candle closes
@@ -1056,14 +1066,14 @@ def morning_star_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.short_body(O_2, C_2, percentile),
-            cf.tall_white_body(O_3, C_3, percentile),
+            candle_1["tall_black_body"],
+            candle_2["short_body"],
+            candle_3["tall_white_body"],
             cf.down_body_gap(O_1, C_1, O_2, C_2),
             cf.up_body_gap(O_2, C_2, O_3, C_3),
             C_3 > 0.5 * (O_1 + C_1),
@@ -1072,7 +1082,7 @@ def morning_star_no_trend(
 
 
 def morning_star_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle, small candle of either color, and tall white
     candle with upside and downside body gaps respectively. The third candle closes
@@ -1083,15 +1093,15 @@ def morning_star_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.short_body(O_2, C_2, percentile),
-            cf.tall_white_body(O_3, C_3, percentile),
+            candle_1["tall_black_body"],
+            candle_2["short_body"],
+            candle_3["tall_white_body"],
             cf.down_body_gap(O_1, C_1, O_2, C_2),
             cf.up_body_gap(O_2, C_2, O_3, C_3),
             C_3 > 0.5 * (O_1 + C_1),
@@ -1100,7 +1110,7 @@ def morning_star_opp_trend(
 
 
 def side_by_side_white_lines_bearish_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: black candle and two white candles with a downward body gap between
     #1-#2 and #1-#3. The opening and closing prices of the white candles are similar.
@@ -1110,17 +1120,17 @@ def side_by_side_white_lines_bearish_(
     Prediction: continuation.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.black_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
-            cf.white_body(O_3, C_3),
-            cf.near(C_2, C_3, percentile),
-            cf.near(O_2, O_3, percentile),
+            candle_1["black_body"],
+            candle_2["white_body"],
+            candle_3["white_body"],
+            cf.near(C_2, C_3, calibration),
+            cf.near(O_2, O_3, calibration),
             cf.down_body_gap(O_1, C_1, O_2, C_2),
             cf.down_body_gap(O_1, C_1, O_3, C_3),
         )
@@ -1128,7 +1138,7 @@ def side_by_side_white_lines_bearish_(
 
 
 def side_by_side_white_lines_bearish_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: black candle and two white candles with a downward body gap between
     #1-#2 and #1-#3. The opening and closing prices of the white candles are similar.
@@ -1138,16 +1148,16 @@ def side_by_side_white_lines_bearish_no_trend(
     Prediction: continuation.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.black_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
-            cf.white_body(O_3, C_3),
-            cf.near(C_2, C_3, percentile),
-            cf.near(O_2, O_3, percentile),
+            candle_1["black_body"],
+            candle_2["white_body"],
+            candle_3["white_body"],
+            cf.near(C_2, C_3, calibration),
+            cf.near(O_2, O_3, calibration),
             cf.down_body_gap(O_1, C_1, O_2, C_2),
             cf.down_body_gap(O_1, C_1, O_3, C_3),
         )
@@ -1155,7 +1165,7 @@ def side_by_side_white_lines_bearish_no_trend(
 
 
 def side_by_side_white_lines_bearish_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: black candle and two white candles with a downward body gap between
     #1-#2 and #1-#3. The opening and closing prices of the white candles are similar.
@@ -1165,17 +1175,17 @@ def side_by_side_white_lines_bearish_opp_trend(
     Prediction: continuation.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.black_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
-            cf.white_body(O_3, C_3),
-            cf.near(C_2, C_3, percentile),
-            cf.near(O_2, O_3, percentile),
+            candle_1["black_body"],
+            candle_2["white_body"],
+            candle_3["white_body"],
+            cf.near(C_2, C_3, calibration),
+            cf.near(O_2, O_3, calibration),
             cf.down_body_gap(O_1, C_1, O_2, C_2),
             cf.down_body_gap(O_1, C_1, O_3, C_3),
         )
@@ -1183,7 +1193,7 @@ def side_by_side_white_lines_bearish_opp_trend(
 
 
 def side_by_side_white_lines_bullish_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three white candles with an upward body gap between #1-#2 and #1-#3.
     The opening and closing prices of #2/#3 are similar.
@@ -1193,17 +1203,17 @@ def side_by_side_white_lines_bullish_(
     Prediction: continuation.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.white_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
-            cf.white_body(O_3, C_3),
-            cf.near(C_2, C_3, percentile),
-            cf.near(O_2, O_3, percentile),
+            candle_1["white_body"],
+            candle_2["white_body"],
+            candle_3["white_body"],
+            cf.near(C_2, C_3, calibration),
+            cf.near(O_2, O_3, calibration),
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             cf.up_body_gap(O_1, C_1, O_3, C_3),
         )
@@ -1211,7 +1221,7 @@ def side_by_side_white_lines_bullish_(
 
 
 def side_by_side_white_lines_bullish_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three white candles with an upward body gap between #1-#2 and #1-#3.
     The opening and closing prices of #2/#3 are similar.
@@ -1221,16 +1231,16 @@ def side_by_side_white_lines_bullish_no_trend(
     Prediction: continuation.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.white_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
-            cf.white_body(O_3, C_3),
-            cf.near(C_2, C_3, percentile),
-            cf.near(O_2, O_3, percentile),
+            candle_1["white_body"],
+            candle_2["white_body"],
+            candle_3["white_body"],
+            cf.near(C_2, C_3, calibration),
+            cf.near(O_2, O_3, calibration),
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             cf.up_body_gap(O_1, C_1, O_3, C_3),
         )
@@ -1238,7 +1248,7 @@ def side_by_side_white_lines_bullish_no_trend(
 
 
 def side_by_side_white_lines_bullish_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three white candles with an upward body gap between #1-#2 and #1-#3.
     The opening and closing prices of #2/#3 are similar.
@@ -1248,24 +1258,26 @@ def side_by_side_white_lines_bullish_opp_trend(
     Prediction: continuation.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.white_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
-            cf.white_body(O_3, C_3),
-            cf.near(C_2, C_3, percentile),
-            cf.near(O_2, O_3, percentile),
+            candle_1["white_body"],
+            candle_2["white_body"],
+            candle_3["white_body"],
+            cf.near(C_2, C_3, calibration),
+            cf.near(O_2, O_3, calibration),
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             cf.up_body_gap(O_1, C_1, O_3, C_3),
         )
     )
 
 
-def stick_sandwich_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def stick_sandwich_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: black-white-black candles, the high of the white candle is above the
     close of the preceding black candle. The closing prices of the black candles are
     similar.
@@ -1275,23 +1287,23 @@ def stick_sandwich_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bo
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    C_1 = candle_1["close"]
+    H_2 = candle_2["high"]
+    C_3 = candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.black_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
-            cf.black_body(O_3, C_3),
+            candle_1["black_body"],
+            candle_2["white_body"],
+            candle_3["black_body"],
             C_1 < H_2,
-            cf.near(C_3, C_1, percentile),
+            cf.near(C_3, C_1, calibration),
         )
     )
 
 
 def stick_sandwich_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: black-white-black candles, the high of the white candle is above the
     close of the preceding black candle. The closing prices of the black candles are
@@ -1302,22 +1314,22 @@ def stick_sandwich_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    C_1 = candle_1["close"]
+    H_2 = candle_2["high"]
+    C_3 = candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.black_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
-            cf.black_body(O_3, C_3),
+            candle_1["black_body"],
+            candle_2["white_body"],
+            candle_3["black_body"],
             C_1 < H_2,
-            cf.near(C_3, C_1, percentile),
+            cf.near(C_3, C_1, calibration),
         )
     )
 
 
 def stick_sandwich_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: black-white-black candles, the high of the white candle is above the
     close of the preceding black candle. The closing prices of the black candles are
@@ -1328,22 +1340,24 @@ def stick_sandwich_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    C_1 = candle_1["close"]
+    H_2 = candle_2["high"]
+    C_3 = candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.black_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
-            cf.black_body(O_3, C_3),
+            candle_1["black_body"],
+            candle_2["white_body"],
+            candle_3["black_body"],
             C_1 < H_2,
-            cf.near(C_3, C_1, percentile),
+            cf.near(C_3, C_1, calibration),
         )
     )
 
 
-def three_black_crows_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def three_black_crows_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: three tall black candles, each one closing at a new low. The last
     two open in the body of the previous candle. All should close at or near the low.
 
@@ -1352,30 +1366,30 @@ def three_black_crows_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 2], candle_2[:, 3]
-    O_3, L_3, C_3 = candle_3[:, 0], candle_3[:, 2], candle_3[:, 3]
+    O_1, L_1, C_1 = candle_1["open"], candle_1["low"], candle_1["close"]
+    O_2, L_2, C_2 = candle_2["open"], candle_2["low"], candle_2["close"]
+    O_3, L_3, C_3 = candle_3["open"], candle_3["low"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.tall_black_body(O_3, C_3, percentile),
+            candle_1["tall_black_body"],
+            candle_2["tall_black_body"],
+            candle_3["tall_black_body"],
             C_1 > C_2,
             C_2 > C_3,
             C_1 < O_2,
             O_2 < O_1,
             C_2 < O_3,
             O_3 < O_2,
-            cf.near(C_1, L_1, percentile),
-            cf.near(C_2, L_2, percentile),
-            cf.near(C_3, L_3, percentile),
+            cf.near(C_1, L_1, calibration),
+            cf.near(C_2, L_2, calibration),
+            cf.near(C_3, L_3, calibration),
         )
     )
 
 
 def three_black_crows_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three tall black candles, each one closing at a new low. The last
     two open in the body of the previous candle. All should close at or near the low.
@@ -1385,29 +1399,29 @@ def three_black_crows_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 2], candle_2[:, 3]
-    O_3, L_3, C_3 = candle_3[:, 0], candle_3[:, 2], candle_3[:, 3]
+    O_1, L_1, C_1 = candle_1["open"], candle_1["low"], candle_1["close"]
+    O_2, L_2, C_2 = candle_2["open"], candle_2["low"], candle_2["close"]
+    O_3, L_3, C_3 = candle_3["open"], candle_3["low"], candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.tall_black_body(O_3, C_3, percentile),
+            candle_1["tall_black_body"],
+            candle_2["tall_black_body"],
+            candle_3["tall_black_body"],
             C_1 > C_2,
             C_2 > C_3,
             C_1 < O_2,
             O_2 < O_1,
             C_2 < O_3,
             O_3 < O_2,
-            cf.near(C_1, L_1, percentile),
-            cf.near(C_2, L_2, percentile),
-            cf.near(C_3, L_3, percentile),
+            cf.near(C_1, L_1, calibration),
+            cf.near(C_2, L_2, calibration),
+            cf.near(C_3, L_3, calibration),
         )
     )
 
 
 def three_black_crows_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three tall black candles, each one closing at a new low. The last
     two open in the body of the previous candle. All should close at or near the low.
@@ -1417,29 +1431,31 @@ def three_black_crows_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 2], candle_2[:, 3]
-    O_3, L_3, C_3 = candle_3[:, 0], candle_3[:, 2], candle_3[:, 3]
+    O_1, L_1, C_1 = candle_1["open"], candle_1["low"], candle_1["close"]
+    O_2, L_2, C_2 = candle_2["open"], candle_2["low"], candle_2["close"]
+    O_3, L_3, C_3 = candle_3["open"], candle_3["low"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.tall_black_body(O_3, C_3, percentile),
+            candle_1["tall_black_body"],
+            candle_2["tall_black_body"],
+            candle_3["tall_black_body"],
             C_1 > C_2,
             C_2 > C_3,
             C_1 < O_2,
             O_2 < O_1,
             C_2 < O_3,
             O_3 < O_2,
-            cf.near(C_1, L_1, percentile),
-            cf.near(C_2, L_2, percentile),
-            cf.near(C_3, L_3, percentile),
+            cf.near(C_1, L_1, calibration),
+            cf.near(C_2, L_2, calibration),
+            cf.near(C_3, L_3, calibration),
         )
     )
 
 
-def three_inside_down_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def three_inside_down_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall white candle followed by a small black candle which opens and
     closes within the previous body, cannot equal the bottom and top together, only one.
     The third candle is black and has to close below the first two closes.
@@ -1449,15 +1465,15 @@ def three_inside_down_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    C_3 = candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.short_black_body(O_2, C_2, percentile),
-            cf.black_body(O_3, C_3),
+            candle_1["tall_white_body"],
+            candle_2["short_black_body"],
+            candle_3["black_body"],
             C_1 >= O_2,
             C_2 >= O_1,
             np.logical_or.reduce(
@@ -1473,7 +1489,7 @@ def three_inside_down_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
 
 
 def three_inside_down_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle followed by a small black candle which opens and
     closes within the previous body, cannot equal the bottom and top together, only one.
@@ -1484,14 +1500,14 @@ def three_inside_down_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    C_3 = candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.short_black_body(O_2, C_2, percentile),
-            cf.black_body(O_3, C_3),
+            candle_1["tall_white_body"],
+            candle_2["short_black_body"],
+            candle_3["black_body"],
             C_1 >= O_2,
             C_2 >= O_1,
             np.logical_or.reduce(
@@ -1507,7 +1523,7 @@ def three_inside_down_no_trend(
 
 
 def three_inside_down_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle followed by a small black candle which opens and
     closes within the previous body, cannot equal the bottom and top together, only one.
@@ -1518,15 +1534,15 @@ def three_inside_down_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    C_3 = candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.short_black_body(O_2, C_2, percentile),
-            cf.black_body(O_3, C_3),
+            candle_1["tall_white_body"],
+            candle_2["short_black_body"],
+            candle_3["black_body"],
             C_1 >= O_2,
             C_2 >= O_1,
             np.logical_or.reduce(
@@ -1541,7 +1557,9 @@ def three_inside_down_opp_trend(
     )
 
 
-def three_inside_up_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def three_inside_up_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall black candle followed by a small white candle which opens and
     closes within the previous body, cannot equal the bottom and top together, only one.
     The third candle is white and has to close above the first two closes.
@@ -1551,15 +1569,15 @@ def three_inside_up_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> b
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    C_3 = candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.short_white_body(O_2, C_2, percentile),
-            cf.white_body(O_3, C_3),
+            candle_1["tall_black_body"],
+            candle_2["short_white_body"],
+            candle_3["white_body"],
             C_1 <= O_2,
             C_2 <= O_1,
             np.logical_or.reduce(
@@ -1575,7 +1593,7 @@ def three_inside_up_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> b
 
 
 def three_inside_up_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle followed by a small white candle which opens and
     closes within the previous body, cannot equal the bottom and top together, only one.
@@ -1586,14 +1604,14 @@ def three_inside_up_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    C_3 = candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.short_white_body(O_2, C_2, percentile),
-            cf.white_body(O_3, C_3),
+            candle_1["tall_black_body"],
+            candle_2["short_white_body"],
+            candle_3["white_body"],
             C_1 <= O_2,
             C_2 <= O_1,
             np.logical_or.reduce(
@@ -1609,7 +1627,7 @@ def three_inside_up_no_trend(
 
 
 def three_inside_up_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle followed by a small white candle which opens and
     closes within the previous body, cannot equal the bottom and top together, only one.
@@ -1620,15 +1638,15 @@ def three_inside_up_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    C_3 = candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.short_white_body(O_2, C_2, percentile),
-            cf.white_body(O_3, C_3),
+            candle_1["tall_black_body"],
+            candle_2["short_white_body"],
+            candle_3["white_body"],
             C_1 <= O_2,
             C_2 <= O_1,
             np.logical_or.reduce(
@@ -1643,7 +1661,9 @@ def three_inside_up_opp_trend(
     )
 
 
-def three_outside_down_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def three_outside_down_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: white candle, black candle that opens higher and closes lower,
     black candle that closes below the previous close.
 
@@ -1652,15 +1672,15 @@ def three_outside_down_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    C_3 = candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.white_body(O_1, C_1),
-            cf.black_body(O_2, C_2),
-            cf.black_body(O_3, C_3),
+            candle_1["white_body"],
+            candle_2["black_body"],
+            candle_3["black_body"],
             C_1 < O_2,
             C_2 < O_1,
             C_3 < C_2,
@@ -1669,7 +1689,7 @@ def three_outside_down_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -
 
 
 def three_outside_down_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: white candle, black candle that opens higher and closes lower,
     black candle that closes below the previous close.
@@ -1679,14 +1699,14 @@ def three_outside_down_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    C_3 = candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.white_body(O_1, C_1),
-            cf.black_body(O_2, C_2),
-            cf.black_body(O_3, C_3),
+            candle_1["white_body"],
+            candle_2["black_body"],
+            candle_3["black_body"],
             C_1 < O_2,
             C_2 < O_1,
             C_3 < C_2,
@@ -1695,7 +1715,7 @@ def three_outside_down_no_trend(
 
 
 def three_outside_down_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: white candle, black candle that opens higher and closes lower,
     black candle that closes below the previous close.
@@ -1705,15 +1725,15 @@ def three_outside_down_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    C_3 = candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.white_body(O_1, C_1),
-            cf.black_body(O_2, C_2),
-            cf.black_body(O_3, C_3),
+            candle_1["white_body"],
+            candle_2["black_body"],
+            candle_3["black_body"],
             C_1 < O_2,
             C_2 < O_1,
             C_3 < C_2,
@@ -1721,7 +1741,9 @@ def three_outside_down_opp_trend(
     )
 
 
-def three_outside_up_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def three_outside_up_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: black candle, white candle that opens lower and closes higher,
     white candle that closes above the previous close.
 
@@ -1730,15 +1752,15 @@ def three_outside_up_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    C_3 = candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.black_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
-            cf.white_body(O_3, C_3),
+            candle_1["black_body"],
+            candle_2["white_body"],
+            candle_3["white_body"],
             C_1 > O_2,
             C_2 > O_1,
             C_3 > C_2,
@@ -1747,7 +1769,7 @@ def three_outside_up_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
 
 
 def three_outside_up_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: black candle, white candle that opens lower and closes higher,
     white candle that closes above the previous close.
@@ -1757,14 +1779,14 @@ def three_outside_up_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    C_3 = candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.black_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
-            cf.white_body(O_3, C_3),
+            candle_1["black_body"],
+            candle_2["white_body"],
+            candle_3["white_body"],
             C_1 > O_2,
             C_2 > O_1,
             C_3 > C_2,
@@ -1773,7 +1795,7 @@ def three_outside_up_no_trend(
 
 
 def three_outside_up_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: black candle, white candle that opens lower and closes higher,
     white candle that closes above the previous close.
@@ -1783,15 +1805,15 @@ def three_outside_up_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    C_3 = candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.black_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
-            cf.white_body(O_3, C_3),
+            candle_1["black_body"],
+            candle_2["white_body"],
+            candle_3["white_body"],
             C_1 > O_2,
             C_2 > O_1,
             C_3 > C_2,
@@ -1800,7 +1822,7 @@ def three_outside_up_opp_trend(
 
 
 def three_stars_in_the_south_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle with long lower shadow, black candle with a higher
     low and a smaller body length, tall black candle without shadows with a lower high
@@ -1811,20 +1833,20 @@ def three_stars_in_the_south_(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
-    O_3, H_3, L_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 2], candle_3[:, 3]
+    L_1 = candle_1["low"]
+    H_2, L_2 = candle_2["high"], candle_2["low"]
+    H_3, L_3 = candle_3["high"], candle_3["low"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.black_body(O_2, C_2),
-            cf.tall_black_body(O_3, C_3, percentile),
-            cf.long_ls(O_1, L_1, C_1, percentile),
+            candle_1["tall_black_body"],
+            candle_2["black_body"],
+            candle_3["tall_black_body"],
+            candle_1["long_ls"],
             L_1 < L_2,
-            cf.body_height(O_1, C_1) > cf.body_height(O_2, C_2),
-            cf.no_us(O_3, H_3, C_3, percentile),
-            cf.no_ls(O_3, L_3, C_3, percentile),
+            candle_1["body_height"] > candle_2["body_height"],
+            candle_3["no_us"],
+            candle_3["no_ls"],
             H_2 > H_3,
             L_2 < L_3,
         )
@@ -1832,7 +1854,7 @@ def three_stars_in_the_south_(
 
 
 def three_stars_in_the_south_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle with long lower shadow, black candle with a higher
     low and a smaller body length, tall black candle without shadows with a lower high
@@ -1843,19 +1865,19 @@ def three_stars_in_the_south_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
-    O_3, H_3, L_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 2], candle_3[:, 3]
+    L_1 = candle_1["low"]
+    H_2, L_2 = candle_2["high"], candle_2["low"]
+    H_3, L_3 = candle_3["high"], candle_3["low"]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.black_body(O_2, C_2),
-            cf.tall_black_body(O_3, C_3, percentile),
-            cf.long_ls(O_1, L_1, C_1, percentile),
+            candle_1["tall_black_body"],
+            candle_2["black_body"],
+            candle_3["tall_black_body"],
+            candle_1["long_ls"],
             L_1 < L_2,
-            cf.body_height(O_1, C_1) > cf.body_height(O_2, C_2),
-            cf.no_us(O_3, H_3, C_3, percentile),
-            cf.no_ls(O_3, L_3, C_3, percentile),
+            candle_1["body_height"] > candle_2["body_height"],
+            candle_3["no_us"],
+            candle_3["no_ls"],
             H_2 > H_3,
             L_2 < L_3,
         )
@@ -1863,7 +1885,7 @@ def three_stars_in_the_south_no_trend(
 
 
 def three_stars_in_the_south_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle with long lower shadow, black candle with a higher
     low and a smaller body length, tall black candle without shadows with a lower high
@@ -1874,20 +1896,20 @@ def three_stars_in_the_south_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
-    O_3, H_3, L_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 2], candle_3[:, 3]
+    L_1 = candle_1["low"]
+    H_2, L_2 = candle_2["high"], candle_2["low"]
+    H_3, L_3 = candle_3["high"], candle_3["low"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.black_body(O_2, C_2),
-            cf.tall_black_body(O_3, C_3, percentile),
-            cf.long_ls(O_1, L_1, C_1, percentile),
+            candle_1["tall_black_body"],
+            candle_2["black_body"],
+            candle_3["tall_black_body"],
+            candle_1["long_ls"],
             L_1 < L_2,
-            cf.body_height(O_1, C_1) > cf.body_height(O_2, C_2),
-            cf.no_us(O_3, H_3, C_3, percentile),
-            cf.no_ls(O_3, L_3, C_3, percentile),
+            candle_1["body_height"] > candle_2["body_height"],
+            candle_3["no_us"],
+            candle_3["no_ls"],
             H_2 > H_3,
             L_2 < L_3,
         )
@@ -1895,7 +1917,7 @@ def three_stars_in_the_south_opp_trend(
 
 
 def three_white_soldiers_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three tall white candles, each reaching a new high. #2 and #3 open in
     the previous body. Closing prices should be near the high for all three candles.
@@ -1905,30 +1927,30 @@ def three_white_soldiers_(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, H_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 3]
+    O_1, H_1, C_1 = candle_1["open"], candle_1["high"], candle_1["close"]
+    O_2, H_2, C_2 = candle_2["open"], candle_2["high"], candle_2["close"]
+    O_3, H_3, C_3 = candle_3["open"], candle_3["high"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.tall_white_body(O_2, C_2, percentile),
-            cf.tall_white_body(O_3, C_3, percentile),
+            candle_1["tall_white_body"],
+            candle_2["tall_white_body"],
+            candle_3["tall_white_body"],
             H_1 < H_2,
             H_2 < H_3,
             O_1 < O_2,
             O_2 < C_1,
             O_2 < O_3,
             O_3 < C_2,
-            cf.near(C_1, H_1, percentile),
-            cf.near(C_2, H_2, percentile),
-            cf.near(C_3, H_3, percentile),
+            cf.near(C_1, H_1, calibration),
+            cf.near(C_2, H_2, calibration),
+            cf.near(C_3, H_3, calibration),
         )
     )
 
 
 def three_white_soldiers_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three tall white candles, each reaching a new high. #2 and #3 open in
     the previous body. Closing prices should be near the high for all three candles.
@@ -1938,29 +1960,29 @@ def three_white_soldiers_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, H_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 3]
+    O_1, H_1, C_1 = candle_1["open"], candle_1["high"], candle_1["close"]
+    O_2, H_2, C_2 = candle_2["open"], candle_2["high"], candle_2["close"]
+    O_3, H_3, C_3 = candle_3["open"], candle_3["high"], candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.tall_white_body(O_2, C_2, percentile),
-            cf.tall_white_body(O_3, C_3, percentile),
+            candle_1["tall_white_body"],
+            candle_2["tall_white_body"],
+            candle_3["tall_white_body"],
             H_1 < H_2,
             H_2 < H_3,
             O_1 < O_2,
             O_2 < C_1,
             O_2 < O_3,
             O_3 < C_2,
-            cf.near(C_1, H_1, percentile),
-            cf.near(C_2, H_2, percentile),
-            cf.near(C_3, H_3, percentile),
+            cf.near(C_1, H_1, calibration),
+            cf.near(C_2, H_2, calibration),
+            cf.near(C_3, H_3, calibration),
         )
     )
 
 
 def three_white_soldiers_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three tall white candles, each reaching a new high. #2 and #3 open in
     the previous body. Closing prices should be near the high for all three candles.
@@ -1970,29 +1992,31 @@ def three_white_soldiers_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, H_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 3]
+    O_1, H_1, C_1 = candle_1["open"], candle_1["high"], candle_1["close"]
+    O_2, H_2, C_2 = candle_2["open"], candle_2["high"], candle_2["close"]
+    O_3, H_3, C_3 = candle_3["open"], candle_3["high"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.tall_white_body(O_2, C_2, percentile),
-            cf.tall_white_body(O_3, C_3, percentile),
+            candle_1["tall_white_body"],
+            candle_2["tall_white_body"],
+            candle_3["tall_white_body"],
             H_1 < H_2,
             H_2 < H_3,
             O_1 < O_2,
             O_2 < C_1,
             O_2 < O_3,
             O_3 < C_2,
-            cf.near(C_1, H_1, percentile),
-            cf.near(C_2, H_2, percentile),
-            cf.near(C_3, H_3, percentile),
+            cf.near(C_1, H_1, calibration),
+            cf.near(C_2, H_2, calibration),
+            cf.near(C_3, H_3, calibration),
         )
     )
 
 
-def tri_star_bearish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def tri_star_bearish_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: three doji's, with an upward and a downward body gap between them.
 
     Trend: up.
@@ -2000,15 +2024,15 @@ def tri_star_bearish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.doji(O_1, C_1, percentile),
-            cf.doji(O_2, C_2, percentile),
-            cf.doji(O_3, C_3, percentile),
+            candle_1["doji"],
+            candle_2["doji"],
+            candle_3["doji"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             cf.down_body_gap(O_2, C_2, O_3, C_3),
         )
@@ -2016,7 +2040,7 @@ def tri_star_bearish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
 
 
 def tri_star_bearish_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three doji's, with an upward and a downward body gap between them.
 
@@ -2025,14 +2049,14 @@ def tri_star_bearish_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.doji(O_1, C_1, percentile),
-            cf.doji(O_2, C_2, percentile),
-            cf.doji(O_3, C_3, percentile),
+            candle_1["doji"],
+            candle_2["doji"],
+            candle_3["doji"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             cf.down_body_gap(O_2, C_2, O_3, C_3),
         )
@@ -2040,7 +2064,7 @@ def tri_star_bearish_no_trend(
 
 
 def tri_star_bearish_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three doji's, with an upward and a downward body gap between them.
 
@@ -2049,22 +2073,24 @@ def tri_star_bearish_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.doji(O_1, C_1, percentile),
-            cf.doji(O_2, C_2, percentile),
-            cf.doji(O_3, C_3, percentile),
+            candle_1["doji"],
+            candle_2["doji"],
+            candle_3["doji"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             cf.down_body_gap(O_2, C_2, O_3, C_3),
         )
     )
 
 
-def tri_star_bullish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def tri_star_bullish_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: three doji's, with a downward and an upward body gap between them.
 
     Trend: down.
@@ -2072,15 +2098,15 @@ def tri_star_bullish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.doji(O_1, C_1, percentile),
-            cf.doji(O_2, C_2, percentile),
-            cf.doji(O_3, C_3, percentile),
+            candle_1["doji"],
+            candle_2["doji"],
+            candle_3["doji"],
             cf.down_body_gap(O_1, C_1, O_2, C_2),
             cf.up_body_gap(O_2, C_2, O_3, C_3),
         )
@@ -2088,7 +2114,7 @@ def tri_star_bullish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
 
 
 def tri_star_bullish_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three doji's, with a downward and an upward body gap between them.
 
@@ -2097,14 +2123,14 @@ def tri_star_bullish_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.doji(O_1, C_1, percentile),
-            cf.doji(O_2, C_2, percentile),
-            cf.doji(O_3, C_3, percentile),
+            candle_1["doji"],
+            candle_2["doji"],
+            candle_3["doji"],
             cf.down_body_gap(O_1, C_1, O_2, C_2),
             cf.up_body_gap(O_2, C_2, O_3, C_3),
         )
@@ -2112,7 +2138,7 @@ def tri_star_bullish_no_trend(
 
 
 def tri_star_bullish_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: three doji's, with a downward and an upward body gap between them.
 
@@ -2121,15 +2147,15 @@ def tri_star_bullish_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.doji(O_1, C_1, percentile),
-            cf.doji(O_2, C_2, percentile),
-            cf.doji(O_3, C_3, percentile),
+            candle_1["doji"],
+            candle_2["doji"],
+            candle_3["doji"],
             cf.down_body_gap(O_1, C_1, O_2, C_2),
             cf.up_body_gap(O_2, C_2, O_3, C_3),
         )
@@ -2137,7 +2163,7 @@ def tri_star_bullish_opp_trend(
 
 
 def two_black_gapping_candles_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two black candles, such that #1 has a downward shadow gap and #2 has
     a lower high than #1.
@@ -2147,14 +2173,14 @@ def two_black_gapping_candles_(
     Prediction: continuation.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    L_1 = candle_1[:, 2]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, H_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 3]
+    L_1 = candle_1["low"]
+    H_2 = candle_2["high"]
+    H_3 = candle_3["high"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.black_body(O_2, C_2),
-            cf.black_body(O_3, C_3),
+            candle_2["black_body"],
+            candle_3["black_body"],
             cf.down_shadow_gap(L_1, H_2),
             H_2 > H_3,
         )
@@ -2162,7 +2188,7 @@ def two_black_gapping_candles_(
 
 
 def two_black_gapping_candles_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two black candles, such that #1 has a downward shadow gap and #2 has
     a lower high than #1.
@@ -2172,13 +2198,13 @@ def two_black_gapping_candles_no_trend(
     Prediction: continuation.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    L_1 = candle_1[:, 2]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, H_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 3]
+    L_1 = candle_1["low"]
+    H_2 = candle_2["high"]
+    H_3 = candle_3["high"]
     return np.logical_and.reduce(
         (
-            cf.black_body(O_2, C_2),
-            cf.black_body(O_3, C_3),
+            candle_2["black_body"],
+            candle_3["black_body"],
             cf.down_shadow_gap(L_1, H_2),
             H_2 > H_3,
         )
@@ -2186,7 +2212,7 @@ def two_black_gapping_candles_no_trend(
 
 
 def two_black_gapping_candles_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two black candles, such that #1 has a downward shadow gap and #2 has
     a lower high than #1.
@@ -2196,21 +2222,23 @@ def two_black_gapping_candles_opp_trend(
     Prediction: continuation.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    L_1 = candle_1[:, 2]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, H_3, C_3 = candle_3[:, 0], candle_3[:, 1], candle_3[:, 3]
+    L_1 = candle_1["low"]
+    H_2 = candle_2["high"]
+    H_3 = candle_3["high"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.black_body(O_2, C_2),
-            cf.black_body(O_3, C_3),
+            candle_2["black_body"],
+            candle_3["black_body"],
             cf.down_shadow_gap(L_1, H_2),
             H_2 > H_3,
         )
     )
 
 
-def two_crows_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def two_crows_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall white candle, two black candles. Upwards body gap between #1 and
     #3. #3 opens in the previous body and closes in the body of #1.
 
@@ -2219,15 +2247,15 @@ def two_crows_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.black_body(O_2, C_2),
-            cf.black_body(O_3, C_3),
+            candle_1["tall_white_body"],
+            candle_2["black_body"],
+            candle_3["black_body"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             C_2 < O_3,
             O_3 < O_2,
@@ -2237,7 +2265,9 @@ def two_crows_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
     )
 
 
-def two_crows_no_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def two_crows_no_trend(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall white candle, two black candles. Upwards body gap between #1 and
     #3. #3 opens in the previous body and closes in the body of #1.
 
@@ -2246,14 +2276,14 @@ def two_crows_no_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.black_body(O_2, C_2),
-            cf.black_body(O_3, C_3),
+            candle_1["tall_white_body"],
+            candle_2["black_body"],
+            candle_3["black_body"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             C_2 < O_3,
             O_3 < O_2,
@@ -2263,7 +2293,9 @@ def two_crows_no_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     )
 
 
-def two_crows_opp_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def two_crows_opp_trend(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall white candle, two black candles. Upwards body gap between #1 and
     #3. #3 opens in the previous body and closes in the body of #1.
 
@@ -2272,15 +2304,15 @@ def two_crows_opp_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) -
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.black_body(O_2, C_2),
-            cf.black_body(O_3, C_3),
+            candle_1["tall_white_body"],
+            candle_2["black_body"],
+            candle_3["black_body"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             C_2 < O_3,
             O_3 < O_2,
@@ -2291,7 +2323,7 @@ def two_crows_opp_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) -
 
 
 def unique_three_river_bottom_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle, black candle inside the previous body with a long
     lower shadow below the prior low. Short white candle with a downwards body gap.
@@ -2301,26 +2333,26 @@ def unique_three_river_bottom_(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 2], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, L_1, C_1 = candle_1["open"], candle_1["low"], candle_1["close"]
+    O_2, L_2, C_2 = candle_2["open"], candle_2["low"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.black_body(O_2, C_2),
-            cf.short_white_body(O_3, C_3, percentile),
+            candle_1["tall_black_body"],
+            candle_2["black_body"],
+            candle_3["short_white_body"],
             cf.down_body_gap(O_2, C_2, O_3, C_3),
             O_1 > O_2,
             C_1 < C_2,
-            cf.long_ls(O_2, L_2, C_2, percentile),
+            candle_2["long_ls"],
             L_1 > L_2,
         )
     )
 
 
 def unique_three_river_bottom_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle, black candle inside the previous body with a long
     lower shadow below the prior low. Short white candle with a downwards body gap.
@@ -2330,25 +2362,25 @@ def unique_three_river_bottom_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 2], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, L_1, C_1 = candle_1["open"], candle_1["low"], candle_1["close"]
+    O_2, L_2, C_2 = candle_2["open"], candle_2["low"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.black_body(O_2, C_2),
-            cf.short_white_body(O_3, C_3, percentile),
+            candle_1["tall_black_body"],
+            candle_2["black_body"],
+            candle_3["short_white_body"],
             cf.down_body_gap(O_2, C_2, O_3, C_3),
             O_1 > O_2,
             C_1 < C_2,
-            cf.long_ls(O_2, L_2, C_2, percentile),
+            candle_2["long_ls"],
             L_1 > L_2,
         )
     )
 
 
 def unique_three_river_bottom_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle, black candle inside the previous body with a long
     lower shadow below the prior low. Short white candle with a downwards body gap.
@@ -2358,26 +2390,26 @@ def unique_three_river_bottom_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 2], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, L_1, C_1 = candle_1["open"], candle_1["low"], candle_1["close"]
+    O_2, L_2, C_2 = candle_2["open"], candle_2["low"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.black_body(O_2, C_2),
-            cf.short_white_body(O_3, C_3, percentile),
+            candle_1["tall_black_body"],
+            candle_2["black_body"],
+            candle_3["short_white_body"],
             cf.down_body_gap(O_2, C_2, O_3, C_3),
             O_1 > O_2,
             C_1 < C_2,
-            cf.long_ls(O_2, L_2, C_2, percentile),
+            candle_2["long_ls"],
             L_1 > L_2,
         )
     )
 
 
 def unique_three_river_top_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle, white candle inside the previous body with a long
     upper shadow above the prior high. Short black candle with an upwards body gap.
@@ -2387,26 +2419,26 @@ def unique_three_river_top_(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, H_1, C_1 = candle_1["open"], candle_1["high"], candle_1["close"]
+    O_2, H_2, C_2 = candle_2["open"], candle_2["high"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.white_body(O_2, C_2),
-            cf.short_black_body(O_3, C_3, percentile),
+            candle_1["tall_white_body"],
+            candle_2["white_body"],
+            candle_3["short_black_body"],
             cf.up_body_gap(O_2, C_2, O_3, C_3),
             O_1 < O_2,
             C_1 > C_2,
-            cf.long_us(O_2, H_2, C_2, percentile),
+            candle_2["long_us"],
             H_1 < H_2,
         )
     )
 
 
 def unique_three_river_top_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle, white candle inside the previous body with a long
     upper shadow above the prior high. Short black candle with an upwards body gap.
@@ -2416,25 +2448,25 @@ def unique_three_river_top_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, H_1, C_1 = candle_1["open"], candle_1["high"], candle_1["close"]
+    O_2, H_2, C_2 = candle_2["open"], candle_2["high"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.white_body(O_2, C_2),
-            cf.short_black_body(O_3, C_3, percentile),
+            candle_1["tall_white_body"],
+            candle_2["white_body"],
+            candle_3["short_black_body"],
             cf.up_body_gap(O_2, C_2, O_3, C_3),
             O_1 < O_2,
             C_1 > C_2,
-            cf.long_us(O_2, H_2, C_2, percentile),
+            candle_2["long_us"],
             H_1 < H_2,
         )
     )
 
 
 def unique_three_river_top_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle, white candle inside the previous body with a long
     upper shadow above the prior high. Short black candle with an upwards body gap.
@@ -2444,26 +2476,26 @@ def unique_three_river_top_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, H_1, C_1 = candle_1["open"], candle_1["high"], candle_1["close"]
+    O_2, H_2, C_2 = candle_2["open"], candle_2["high"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.white_body(O_2, C_2),
-            cf.short_black_body(O_3, C_3, percentile),
+            candle_1["tall_white_body"],
+            candle_2["white_body"],
+            candle_3["short_black_body"],
             cf.up_body_gap(O_2, C_2, O_3, C_3),
             O_1 < O_2,
             C_1 > C_2,
-            cf.long_us(O_2, H_2, C_2, percentile),
+            candle_2["long_us"],
             H_1 < H_2,
         )
     )
 
 
 def upside_gap_three_methods_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two tall white candles with an upwards body gap.
     A black candle that bridges the gap.
@@ -2473,15 +2505,15 @@ def upside_gap_three_methods_(
     Prediction: continuation.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 2], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    H_1, C_1 = candle_1["high"], candle_1["close"]
+    O_2, L_2 = candle_2["open"], candle_2["low"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.tall_white_body(O_2, C_2, percentile),
-            cf.black_body(O_3, C_3),
+            candle_1["tall_white_body"],
+            candle_2["tall_white_body"],
+            candle_3["black_body"],
             cf.up_shadow_gap(H_1, L_2),
             C_3 < C_1,
             O_2 < O_3,
@@ -2490,7 +2522,7 @@ def upside_gap_three_methods_(
 
 
 def upside_gap_three_methods_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two tall white candles with an upwards body gap.
     A black candle that bridges the gap.
@@ -2500,14 +2532,14 @@ def upside_gap_three_methods_no_trend(
     Prediction: continuation.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 2], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    H_1, C_1 = candle_1["high"], candle_1["close"]
+    O_2, L_2 = candle_2["open"], candle_2["low"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.tall_white_body(O_2, C_2, percentile),
-            cf.black_body(O_3, C_3),
+            candle_1["tall_white_body"],
+            candle_2["tall_white_body"],
+            candle_3["black_body"],
             cf.up_shadow_gap(H_1, L_2),
             C_3 < C_1,
             O_2 < O_3,
@@ -2516,7 +2548,7 @@ def upside_gap_three_methods_no_trend(
 
 
 def upside_gap_three_methods_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two tall white candles with an upwards body gap.
     A black candle that bridges the gap.
@@ -2526,15 +2558,15 @@ def upside_gap_three_methods_opp_trend(
     Prediction: continuation.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 2], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    H_1, C_1 = candle_1["high"], candle_1["close"]
+    O_2, L_2 = candle_2["open"], candle_2["low"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.tall_white_body(O_2, C_2, percentile),
-            cf.black_body(O_3, C_3),
+            candle_1["tall_white_body"],
+            candle_2["tall_white_body"],
+            candle_3["black_body"],
             cf.up_shadow_gap(H_1, L_2),
             C_3 < C_1,
             O_2 < O_3,
@@ -2543,7 +2575,7 @@ def upside_gap_three_methods_opp_trend(
 
 
 def upside_gap_two_crows_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle , black candle with an upwards body gap, black
     candle that engulfs the previous candle. Close of #3 remains above close of #1.
@@ -2553,15 +2585,15 @@ def upside_gap_two_crows_(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.black_body(O_2, C_2),
-            cf.black_body(O_3, C_3),
+            candle_1["tall_white_body"],
+            candle_2["black_body"],
+            candle_3["black_body"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             O_3 > O_2,
             C_2 > C_3,
@@ -2571,7 +2603,7 @@ def upside_gap_two_crows_(
 
 
 def upside_gap_two_crows_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle , black candle with an upwards body gap, black
     candle that engulfs the previous candle. Close of #3 remains above close of #1.
@@ -2581,14 +2613,14 @@ def upside_gap_two_crows_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.black_body(O_2, C_2),
-            cf.black_body(O_3, C_3),
+            candle_1["tall_white_body"],
+            candle_2["black_body"],
+            candle_3["black_body"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             O_3 > O_2,
             C_2 > C_3,
@@ -2598,7 +2630,7 @@ def upside_gap_two_crows_no_trend(
 
 
 def upside_gap_two_crows_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle , black candle with an upwards body gap, black
     candle that engulfs the previous candle. Close of #3 remains above close of #1.
@@ -2608,15 +2640,15 @@ def upside_gap_two_crows_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.black_body(O_2, C_2),
-            cf.black_body(O_3, C_3),
+            candle_1["tall_white_body"],
+            candle_2["black_body"],
+            candle_3["black_body"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
             O_3 > O_2,
             C_2 > C_3,
@@ -2625,7 +2657,9 @@ def upside_gap_two_crows_opp_trend(
     )
 
 
-def upside_tasuki_gap_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def upside_tasuki_gap_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: two white candles with an upwards shadow gap, black candle opening in
     the prior body and closing in the gap. Close of #3 is above the high of #1 but below
     the low of #2.
@@ -2635,15 +2669,15 @@ def upside_tasuki_gap_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     Prediction: continuation.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 2], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    H_1 = candle_1["high"]
+    O_2, L_2, C_2 = candle_2["open"], candle_2["low"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.white_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
-            cf.black_body(O_3, C_3),
+            candle_1["white_body"],
+            candle_2["white_body"],
+            candle_3["black_body"],
             cf.up_shadow_gap(H_1, L_2),
             O_2 < O_3,
             O_3 < C_2,
@@ -2654,7 +2688,7 @@ def upside_tasuki_gap_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
 
 
 def upside_tasuki_gap_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two white candles with an upwards shadow gap, black candle opening in
     the prior body and closing in the gap. Close of #3 is above the high of #1 but below
@@ -2665,14 +2699,14 @@ def upside_tasuki_gap_no_trend(
     Prediction: continuation.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 2], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    H_1 = candle_1["high"]
+    O_2, L_2, C_2 = candle_2["open"], candle_2["low"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
-            cf.white_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
-            cf.black_body(O_3, C_3),
+            candle_1["white_body"],
+            candle_2["white_body"],
+            candle_3["black_body"],
             cf.up_shadow_gap(H_1, L_2),
             O_2 < O_3,
             O_3 < C_2,
@@ -2683,7 +2717,7 @@ def upside_tasuki_gap_no_trend(
 
 
 def upside_tasuki_gap_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two white candles with an upwards shadow gap, black candle opening in
     the prior body and closing in the gap. Close of #3 is above the high of #1 but below
@@ -2694,15 +2728,15 @@ def upside_tasuki_gap_opp_trend(
     Prediction: continuation.
     """
     candle_1, candle_2, candle_3 = candles[0], candles[1], candles[2]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 2], candle_2[:, 3]
-    O_3, C_3 = candle_3[:, 0], candle_3[:, 3]
+    H_1 = candle_1["high"]
+    O_2, L_2, C_2 = candle_2["open"], candle_2["low"], candle_2["close"]
+    O_3, C_3 = candle_3["open"], candle_3["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.white_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
-            cf.black_body(O_3, C_3),
+            candle_1["white_body"],
+            candle_2["white_body"],
+            candle_3["black_body"],
             cf.up_shadow_gap(H_1, L_2),
             O_2 < O_3,
             O_3 < C_2,
@@ -3,7 +3,9 @@ import numpy as np
 from detection.patterns.functions import candlestick_functions as cf
 
 
-def above_the_stomach_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def above_the_stomach_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: first a black candle, then a white candle opening and closing at or
     above the midpoint of the previous candle.
 
@@ -12,13 +14,13 @@ def above_the_stomach_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.black_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
+            candle_1["black_body"],
+            candle_2["white_body"],
             O_2 >= 0.5 * (O_1 + C_1),
             C_2 >= 0.5 * (O_1 + C_1),
         )
@@ -26,7 +28,7 @@ def above_the_stomach_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
 
 
 def above_the_stomach_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: first a black candle, then a white candle opening and closing at or
     above the midpoint of the previous candle.
@@ -36,12 +38,12 @@ def above_the_stomach_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
-            cf.black_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
+            candle_1["black_body"],
+            candle_2["white_body"],
             O_2 >= 0.5 * (O_1 + C_1),
             C_2 >= 0.5 * (O_1 + C_1),
         )
@@ -49,7 +51,7 @@ def above_the_stomach_no_trend(
 
 
 def above_the_stomach_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: first a black candle, then a white candle opening and closing at or
     above the midpoint of the previous candle.
@@ -59,20 +61,22 @@ def above_the_stomach_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.black_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
+            candle_1["black_body"],
+            candle_2["white_body"],
             O_2 >= 0.5 * (O_1 + C_1),
             C_2 >= 0.5 * (O_1 + C_1),
         )
     )
 
 
-def below_the_stomach_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def below_the_stomach_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall white candle followed by a candle that opens below the midpoint
     of the first candles body and closes at or below that midpoint.
 
@@ -81,12 +85,12 @@ def below_the_stomach_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(O_1, C_1, percentile),
+            candle_1["tall_white_body"],
             0.5 * (O_1 + C_1) >= O_2,
             C_2 <= 0.5 * (O_1 + C_1),
         )
@@ -94,7 +98,7 @@ def below_the_stomach_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
 
 
 def below_the_stomach_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle followed by a candle that opens below the midpoint
     of the first candles body and closes at or below that midpoint.
@@ -104,11 +108,11 @@ def below_the_stomach_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(O_1, C_1, percentile),
+            candle_1["tall_white_body"],
             0.5 * (O_1 + C_1) >= O_2,
             C_2 <= 0.5 * (O_1 + C_1),
         )
@@ -116,7 +120,7 @@ def below_the_stomach_no_trend(
 
 
 def below_the_stomach_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle followed by a candle that opens below the midpoint
     of the first candles body and closes at or below that midpoint.
@@ -126,19 +130,21 @@ def below_the_stomach_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(O_1, C_1, percentile),
+            candle_1["tall_white_body"],
             0.5 * (O_1 + C_1) >= O_2,
             C_2 <= 0.5 * (O_1 + C_1),
         )
     )
 
 
-def dark_cloud_cover_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def dark_cloud_cover_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall white candle followed by a black candle that opens above the
     high of the first candle and closes at or below the midpoint.
 
@@ -147,13 +153,13 @@ def dark_cloud_cover_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, H_1, C_1 = candle_1["open"], candle_1["high"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.black_body(O_2, C_2),
+            candle_1["tall_white_body"],
+            candle_2["black_body"],
             O_2 > H_1,
             C_2 >= 0.5 * (O_1 + C_1),
         )
@@ -161,7 +167,7 @@ def dark_cloud_cover_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
 
 
 def dark_cloud_cover_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle followed by a black candle that opens above the
     high of the first candle and closes at or below the midpoint.
@@ -171,12 +177,12 @@ def dark_cloud_cover_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, H_1, C_1 = candle_1["open"], candle_1["high"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.black_body(O_2, C_2),
+            candle_1["tall_white_body"],
+            candle_2["black_body"],
             O_2 > H_1,
             C_2 >= 0.5 * (O_1 + C_1),
         )
@@ -184,7 +190,7 @@ def dark_cloud_cover_no_trend(
 
 
 def dark_cloud_cover_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle followed by a black candle that opens above the
     high of the first candle and closes at or below the midpoint.
@@ -194,20 +200,22 @@ def dark_cloud_cover_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, H_1, C_1 = candle_1["open"], candle_1["high"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.black_body(O_2, C_2),
+            candle_1["tall_white_body"],
+            candle_2["black_body"],
             O_2 > H_1,
             C_2 >= 0.5 * (O_1 + C_1),
         )
     )
 
 
-def doji_gapping_down_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def doji_gapping_down_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: doji with a downwards shadow gap.
 
     Trend: down.
@@ -215,15 +223,15 @@ def doji_gapping_down_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    L_1 = candle_1[:, 2]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
+    L_1 = candle_1["low"]
+    H_2 = candle_2["high"]
     return np.logical_and.reduce(
-        (T == -1, cf.doji(O_2, C_2, percentile), cf.down_shadow_gap(L_1, H_2))
+        (T == -1, candle_2["doji"], cf.down_shadow_gap(L_1, H_2))
     )
 
 
 def doji_gapping_down_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: doji with a downwards shadow gap.
 
@@ -232,15 +240,13 @@ def doji_gapping_down_no_trend(
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    L_1 = candle_1[:, 2]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
-    return np.logical_and.reduce(
-        (cf.doji(O_2, C_2, percentile), cf.down_shadow_gap(L_1, H_2))
-    )
+    L_1 = candle_1["low"]
+    H_2 = candle_2["high"]
+    return np.logical_and.reduce((candle_2["doji"], cf.down_shadow_gap(L_1, H_2)))
 
 
 def doji_gapping_down_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: doji with a downwards shadow gap.
 
@@ -249,14 +255,16 @@ def doji_gapping_down_opp_trend(
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    L_1 = candle_1[:, 2]
-    O_2, H_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 3]
+    L_1 = candle_1["low"]
+    H_2 = candle_2["high"]
     return np.logical_and.reduce(
-        (T == 1, cf.doji(O_2, C_2, percentile), cf.down_shadow_gap(L_1, H_2))
+        (T == 1, candle_2["doji"], cf.down_shadow_gap(L_1, H_2))
     )
 
 
-def doji_gapping_up_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def doji_gapping_up_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: doji with an upwards shadow gap.
 
     Trend: up.
@@ -264,15 +272,13 @@ def doji_gapping_up_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> b
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    H_1 = candle_1[:, 1]
-    O_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 2], candle_2[:, 3]
-    return np.logical_and.reduce(
-        (T == 1, cf.doji(O_2, C_2, percentile), cf.up_shadow_gap(H_1, L_2))
-    )
+    H_1 = candle_1["high"]
+    L_2 = candle_2["low"]
+    return np.logical_and.reduce((T == 1, candle_2["doji"], cf.up_shadow_gap(H_1, L_2)))
 
 
 def doji_gapping_up_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: doji with an upwards shadow gap.
 
@@ -281,15 +287,13 @@ def doji_gapping_up_no_trend(
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    H_1 = candle_1[:, 1]
-    O_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 2], candle_2[:, 3]
-    return np.logical_and.reduce(
-        (cf.doji(O_2, C_2, percentile), cf.up_shadow_gap(H_1, L_2))
-    )
+    H_1 = candle_1["high"]
+    L_2 = candle_2["low"]
+    return np.logical_and.reduce((candle_2["doji"], cf.up_shadow_gap(H_1, L_2)))
 
 
 def doji_gapping_up_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: doji with an upwards shadow gap.
 
@@ -298,14 +302,16 @@ def doji_gapping_up_opp_trend(
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    H_1 = candle_1[:, 1]
-    O_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 2], candle_2[:, 3]
+    H_1 = candle_1["high"]
+    L_2 = candle_2["low"]
     return np.logical_and.reduce(
-        (T == -1, cf.doji(O_2, C_2, percentile), cf.up_shadow_gap(H_1, L_2))
+        (T == -1, candle_2["doji"], cf.up_shadow_gap(H_1, L_2))
     )
 
 
-def doji_star_bearish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def doji_star_bearish_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: long white candle followed by a doji with an upwards body gap, the
     doji cannot have extremely long shadows and the total height of the shadows cannot
     exceed the body length of the first candle.
@@ -315,23 +321,23 @@ def doji_star_bearish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, L_2, C_2 = candle_2["open"], candle_2["low"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(O_1, C_1, percentile),
+            candle_1["tall_white_body"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
-            cf.doji(O_2, C_2, percentile),
-            np.logical_not(cf.exlong_ls(O_2, L_2, C_2, percentile)),
-            np.logical_not(cf.exlong_us(O_2, L_2, C_2, percentile)),
-            cf.total_shadow_length(O_2, H_2, L_2, C_2) < cf.body_height(O_1, C_1),
+            candle_2["doji"],
+            np.logical_not(candle_2["exlong_ls"]),
+            np.logical_not(cf.exlong_us(O_2, L_2, C_2, calibration)),
+            candle_2["total_shadow_length"] < candle_1["body_height"],
         )
     )
 
 
 def doji_star_bearish_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: long white candle followed by a doji with an upwards body gap, the
     doji cannot have extremely long shadows and the total height of the shadows cannot
@@ -342,22 +348,22 @@ def doji_star_bearish_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, L_2, C_2 = candle_2["open"], candle_2["low"], candle_2["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(O_1, C_1, percentile),
+            candle_1["tall_white_body"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
-            cf.doji(O_2, C_2, percentile),
-            np.logical_not(cf.exlong_ls(O_2, L_2, C_2, percentile)),
-            np.logical_not(cf.exlong_us(O_2, L_2, C_2, percentile)),
-            cf.total_shadow_length(O_2, H_2, L_2, C_2) < cf.body_height(O_1, C_1),
+            candle_2["doji"],
+            np.logical_not(candle_2["exlong_ls"]),
+            np.logical_not(cf.exlong_us(O_2, L_2, C_2, calibration)),
+            candle_2["total_shadow_length"] < candle_1["body_height"],
         )
     )
 
 
 def doji_star_bearish_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: long white candle followed by a doji with an upwards body gap, the
     doji cannot have extremely long shadows and the total height of the shadows cannot
@@ -368,22 +374,24 @@ def doji_star_bearish_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, L_2, C_2 = candle_2["open"], candle_2["low"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(O_1, C_1, percentile),
+            candle_1["tall_white_body"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
-            cf.doji(O_2, C_2, percentile),
-            np.logical_not(cf.exlong_ls(O_2, L_2, C_2, percentile)),
-            np.logical_not(cf.exlong_us(O_2, L_2, C_2, percentile)),
-            cf.total_shadow_length(O_2, H_2, L_2, C_2) < cf.body_height(O_1, C_1),
+            candle_2["doji"],
+            np.logical_not(candle_2["exlong_ls"]),
+            np.logical_not(cf.exlong_us(O_2, L_2, C_2, calibration)),
+            candle_2["total_shadow_length"] < candle_1["body_height"],
         )
     )
 
 
-def doji_star_bullish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def doji_star_bullish_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: long black candle followed by a doji with a downward body gap, the
     doji cannot have extremely long shadows and the total height of the shadows cannot
     exceed the body length of the first candle.
@@ -393,22 +401,22 @@ def doji_star_bullish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 2], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, L_2, C_2 = candle_2["open"], candle_2["low"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(O_1, C_1, percentile),
+            candle_1["tall_black_body"],
             cf.down_body_gap(O_1, C_1, O_2, C_2),
-            cf.doji(O_2, C_2, percentile),
-            np.logical_not(cf.exlong_ls(O_2, L_2, C_2, percentile)),
-            np.logical_not(cf.exlong_us(O_2, L_2, C_2, percentile)),
+            candle_2["doji"],
+            np.logical_not(candle_2["exlong_ls"]),
+            np.logical_not(cf.exlong_us(O_2, L_2, C_2, calibration)),
         )
     )
 
 
 def doji_star_bullish_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: long black candle followed by a doji with a downward body gap, the
     doji cannot have extremely long shadows and the total height of the shadows cannot
@@ -419,21 +427,21 @@ def doji_star_bullish_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 2], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, L_2, C_2 = candle_2["open"], candle_2["low"], candle_2["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(O_1, C_1, percentile),
+            candle_1["tall_black_body"],
             cf.down_body_gap(O_1, C_1, O_2, C_2),
-            cf.doji(O_2, C_2, percentile),
-            np.logical_not(cf.exlong_ls(O_2, L_2, C_2, percentile)),
-            np.logical_not(cf.exlong_us(O_2, L_2, C_2, percentile)),
+            candle_2["doji"],
+            np.logical_not(candle_2["exlong_ls"]),
+            np.logical_not(cf.exlong_us(O_2, L_2, C_2, calibration)),
         )
     )
 
 
 def doji_star_bullish_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: long black candle followed by a doji with a downward body gap, the
     doji cannot have extremely long shadows and the total height of the shadows cannot
@@ -444,21 +452,23 @@ def doji_star_bullish_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 2], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, L_2, C_2 = candle_2["open"], candle_2["low"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(O_1, C_1, percentile),
+            candle_1["tall_black_body"],
             cf.down_body_gap(O_1, C_1, O_2, C_2),
-            cf.doji(O_2, C_2, percentile),
-            np.logical_not(cf.exlong_ls(O_2, L_2, C_2, percentile)),
-            np.logical_not(cf.exlong_us(O_2, L_2, C_2, percentile)),
+            candle_2["doji"],
+            np.logical_not(candle_2["exlong_ls"]),
+            np.logical_not(cf.exlong_us(O_2, L_2, C_2, calibration)),
         )
     )
 
 
-def engulfing_bearish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def engulfing_bearish_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: white candle followed by an 'engulfing' black candle (opens above
     the previous close, closes below the previous open).
 
@@ -467,15 +477,15 @@ def engulfing_bearish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
-        (T == 1, cf.white_body(O_1, C_1), cf.black_body(O_2, C_2), O_1 > C_2, O_2 > C_1)
+        (T == 1, candle_1["white_body"], candle_2["black_body"], O_1 > C_2, O_2 > C_1)
     )
 
 
 def engulfing_bearish_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: white candle followed by an 'engulfing' black candle (opens above
     the previous close, closes below the previous open).
@@ -485,15 +495,15 @@ def engulfing_bearish_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
-        (cf.white_body(O_1, C_1), cf.black_body(O_2, C_2), O_1 > C_2, O_2 > C_1)
+        (candle_1["white_body"], candle_2["black_body"], O_1 > C_2, O_2 > C_1)
     )
 
 
 def engulfing_bearish_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: white candle followed by an 'engulfing' black candle (opens above
     the previous close, closes below the previous open).
@@ -503,20 +513,22 @@ def engulfing_bearish_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.white_body(O_1, C_1),
-            cf.black_body(O_2, C_2),
+            candle_1["white_body"],
+            candle_2["black_body"],
             O_1 > C_2,
             O_2 > C_1,
         )
     )
 
 
-def engulfing_bullish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def engulfing_bullish_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: black candle followed by an 'engulfing' white candle (opens below
     the previous closes, closes above the previous open).
 
@@ -525,13 +537,13 @@ def engulfing_bullish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.black_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
+            candle_1["black_body"],
+            candle_2["white_body"],
             C_1 > O_2,
             C_2 > O_1,
         )
@@ -539,7 +551,7 @@ def engulfing_bullish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
 
 
 def engulfing_bullish_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: black candle followed by an 'engulfing' white candle (opens below
     the previous closes, closes above the previous open).
@@ -549,15 +561,15 @@ def engulfing_bullish_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
-        (cf.black_body(O_1, C_1), cf.white_body(O_2, C_2), C_1 > O_2, C_2 > O_1)
+        (candle_1["black_body"], candle_2["white_body"], C_1 > O_2, C_2 > O_1)
     )
 
 
 def engulfing_bullish_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: black candle followed by an 'engulfing' white candle (opens below
     the previous closes, closes above the previous open).
@@ -567,14 +579,16 @@ def engulfing_bullish_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
-        (T == 1, cf.black_body(O_1, C_1), cf.white_body(O_2, C_2), C_1 > O_2, C_2 > O_1)
+        (T == 1, candle_1["black_body"], candle_2["white_body"], C_1 > O_2, C_2 > O_1)
     )
 
 
-def hammer_inverted_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def hammer_inverted_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall black candle with a small lower shadow followed by a short
     candle of either color with a long upper shadow and no lower shadow. There is a
     downwards body gap between the two candles.
@@ -584,23 +598,23 @@ def hammer_inverted_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> b
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.small_ls(O_1, L_1, C_1, percentile),
-            cf.short_body(O_2, C_2, percentile),
-            cf.long_us(O_2, H_2, C_2, percentile),
-            cf.no_ls(O_2, L_2, C_2, percentile),
+            candle_1["tall_black_body"],
+            candle_1["small_ls"],
+            candle_2["short_body"],
+            candle_2["long_us"],
+            candle_2["no_ls"],
             cf.down_body_gap(O_1, C_1, O_2, C_2),
         )
     )
 
 
 def hammer_inverted_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle with a small lower shadow followed by a short
     candle of either color with a long upper shadow and no lower shadow. There is a
@@ -611,22 +625,22 @@ def hammer_inverted_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.small_ls(O_1, L_1, C_1, percentile),
-            cf.short_body(O_2, C_2, percentile),
-            cf.long_us(O_2, H_2, C_2, percentile),
-            cf.no_ls(O_2, L_2, C_2, percentile),
+            candle_1["tall_black_body"],
+            candle_1["small_ls"],
+            candle_2["short_body"],
+            candle_2["long_us"],
+            candle_2["no_ls"],
             cf.down_body_gap(O_1, C_1, O_2, C_2),
         )
     )
 
 
 def hammer_inverted_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle with a small lower shadow followed by a short
     candle of either color with a long upper shadow and no lower shadow. There is a
@@ -637,22 +651,24 @@ def hammer_inverted_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.small_ls(O_1, L_1, C_1, percentile),
-            cf.short_body(O_2, C_2, percentile),
-            cf.long_us(O_2, H_2, C_2, percentile),
-            cf.no_ls(O_2, L_2, C_2, percentile),
+            candle_1["tall_black_body"],
+            candle_1["small_ls"],
+            candle_2["short_body"],
+            candle_2["long_us"],
+            candle_2["no_ls"],
             cf.down_body_gap(O_1, C_1, O_2, C_2),
         )
     )
 
 
-def harami_bearish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def harami_bearish_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall white candle followed by a short black candle. The open and
     close of the second candle lies within the body of the first candle. The tops and
     bottoms can be equal, but not both at the same time.
@@ -662,13 +678,13 @@ def harami_bearish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bo
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.short_black_body(O_2, C_2, percentile),
+            candle_1["tall_white_body"],
+            candle_2["short_black_body"],
             np.logical_or(
                 np.logical_and(C_1 >= O_2, C_2 > O_1),
                 np.logical_and(C_1 > O_2, C_2 >= O_1),
@@ -678,7 +694,7 @@ def harami_bearish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bo
 
 
 def harami_bearish_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle followed by a short black candle. The open and
     close of the second candle lies within the body of the first candle. The tops and
@@ -689,12 +705,12 @@ def harami_bearish_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.short_black_body(O_2, C_2, percentile),
+            candle_1["tall_white_body"],
+            candle_2["short_black_body"],
             np.logical_or(
                 np.logical_and(C_1 >= O_2, C_2 > O_1),
                 np.logical_and(C_1 > O_2, C_2 >= O_1),
@@ -704,7 +720,7 @@ def harami_bearish_no_trend(
 
 
 def harami_bearish_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle followed by a short black candle. The open and
     close of the second candle lies within the body of the first candle. The tops and
@@ -715,13 +731,13 @@ def harami_bearish_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.short_black_body(O_2, C_2, percentile),
+            candle_1["tall_white_body"],
+            candle_2["short_black_body"],
             np.logical_or(
                 np.logical_and(C_1 >= O_2, C_2 > O_1),
                 np.logical_and(C_1 > O_2, C_2 >= O_1),
@@ -730,7 +746,9 @@ def harami_bearish_opp_trend(
     )
 
 
-def harami_bullish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def harami_bullish_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall black candle followed by a short white candle. The open and
     close of the second candle lies within the body of the first candle. The tops and
     bottoms can be equal, but not both at the same time.
@@ -740,13 +758,13 @@ def harami_bullish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bo
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.short_white_body(O_2, C_2, percentile),
+            candle_1["tall_black_body"],
+            candle_2["short_white_body"],
             np.logical_or(
                 np.logical_and(O_1 >= C_2, O_2 > C_1),
                 np.logical_and(O_1 > C_2, O_2 >= C_1),
@@ -756,7 +774,7 @@ def harami_bullish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bo
 
 
 def harami_bullish_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle followed by a short white candle. The open and
     close of the second candle lies within the body of the first candle. The tops and
@@ -767,12 +785,12 @@ def harami_bullish_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.short_white_body(O_2, C_2, percentile),
+            candle_1["tall_black_body"],
+            candle_2["short_white_body"],
             np.logical_or(
                 np.logical_and(O_1 >= C_2, O_2 > C_1),
                 np.logical_and(O_1 > C_2, O_2 >= C_1),
@@ -782,7 +800,7 @@ def harami_bullish_no_trend(
 
 
 def harami_bullish_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle followed by a short white candle. The open and
     close of the second candle lies within the body of the first candle. The tops and
@@ -793,13 +811,13 @@ def harami_bullish_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.short_white_body(O_2, C_2, percentile),
+            candle_1["tall_black_body"],
+            candle_2["short_white_body"],
             np.logical_or(
                 np.logical_and(O_1 >= C_2, O_2 > C_1),
                 np.logical_and(O_1 > C_2, O_2 >= C_1),
@@ -809,7 +827,7 @@ def harami_bullish_opp_trend(
 
 
 def harami_cross_bearish_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle followed by a doji with shadows inside the
     previous candle.
@@ -819,13 +837,13 @@ def harami_cross_bearish_(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    H_1, L_1 = candle_1["high"], candle_1["low"]
+    H_2, L_2 = candle_2["high"], candle_2["low"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.doji(O_2, C_2, percentile),
+            candle_1["tall_white_body"],
+            candle_2["doji"],
             L_1 < L_2,
             H_2 < H_1,
         )
@@ -833,7 +851,7 @@ def harami_cross_bearish_(
 
 
 def harami_cross_bearish_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle followed by a doji with shadows inside the
     previous candle.
@@ -843,12 +861,12 @@ def harami_cross_bearish_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    H_1, L_1 = candle_1["high"], candle_1["low"]
+    H_2, L_2 = candle_2["high"], candle_2["low"]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.doji(O_2, C_2, percentile),
+            candle_1["tall_white_body"],
+            candle_2["doji"],
             L_1 < L_2,
             H_2 < H_1,
         )
@@ -856,7 +874,7 @@ def harami_cross_bearish_no_trend(
 
 
 def harami_cross_bearish_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle followed by a doji with shadows inside the
     previous candle.
@@ -866,13 +884,13 @@ def harami_cross_bearish_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    H_1, L_1 = candle_1["high"], candle_1["low"]
+    H_2, L_2 = candle_2["high"], candle_2["low"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.doji(O_2, C_2, percentile),
+            candle_1["tall_white_body"],
+            candle_2["doji"],
             L_1 < L_2,
             H_2 < H_1,
         )
@@ -880,7 +898,7 @@ def harami_cross_bearish_opp_trend(
 
 
 def harami_cross_bullish_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle followed by a doji with shadows inside the
     previous candle.
@@ -890,13 +908,13 @@ def harami_cross_bullish_(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    H_1, L_1 = candle_1["high"], candle_1["low"]
+    H_2, L_2 = candle_2["high"], candle_2["low"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.doji(O_2, C_2, percentile),
+            candle_1["tall_black_body"],
+            candle_2["doji"],
             L_1 < L_2,
             H_2 < H_1,
         )
@@ -904,7 +922,7 @@ def harami_cross_bullish_(
 
 
 def harami_cross_bullish_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle followed by a doji with shadows inside the
     previous candle.
@@ -914,12 +932,12 @@ def harami_cross_bullish_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    H_1, L_1 = candle_1["high"], candle_1["low"]
+    H_2, L_2 = candle_2["high"], candle_2["low"]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.doji(O_2, C_2, percentile),
+            candle_1["tall_black_body"],
+            candle_2["doji"],
             L_1 < L_2,
             H_2 < H_1,
         )
@@ -927,7 +945,7 @@ def harami_cross_bullish_no_trend(
 
 
 def harami_cross_bullish_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle followed by a doji with shadows inside the
     previous candle.
@@ -937,20 +955,22 @@ def harami_cross_bullish_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    H_1, L_1 = candle_1["high"], candle_1["low"]
+    H_2, L_2 = candle_2["high"], candle_2["low"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.doji(O_2, C_2, percentile),
+            candle_1["tall_black_body"],
+            candle_2["doji"],
             L_1 < L_2,
             H_2 < H_1,
         )
     )
 
 
-def homing_pigeon_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def homing_pigeon_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall black candle followed by a short black candle with body inside
     the previous candle.
 
@@ -959,13 +979,13 @@ def homing_pigeon_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> boo
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.short_black_body(O_2, C_2, percentile),
+            candle_1["tall_black_body"],
+            candle_2["short_black_body"],
             C_1 < C_2,
             O_2 < O_1,
         )
@@ -973,7 +993,7 @@ def homing_pigeon_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> boo
 
 
 def homing_pigeon_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle followed by a short black candle with body inside
     the previous candle.
@@ -983,12 +1003,12 @@ def homing_pigeon_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.short_black_body(O_2, C_2, percentile),
+            candle_1["tall_black_body"],
+            candle_2["short_black_body"],
             C_1 < C_2,
             O_2 < O_1,
         )
@@ -996,7 +1016,7 @@ def homing_pigeon_no_trend(
 
 
 def homing_pigeon_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle followed by a short black candle with body inside
     the previous candle.
@@ -1006,20 +1026,22 @@ def homing_pigeon_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.short_black_body(O_2, C_2, percentile),
+            candle_1["tall_black_body"],
+            candle_2["short_black_body"],
             C_1 < C_2,
             O_2 < O_1,
         )
     )
 
 
-def in_neck_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def in_neck_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall black candle followed by a short white candle with open below
     the low of the previous candle. The second candle closes inside the firsts body,
     but not by much.
@@ -1029,20 +1051,22 @@ def in_neck_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    L_1, C_1 = candle_1["low"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.white_body(O_2, C_2),
+            candle_1["tall_black_body"],
+            candle_2["white_body"],
             O_2 < L_1,
-            cf.near_up(C_2, C_1, percentile),
+            cf.near_up(C_2, C_1, calibration),
         )
     )
 
 
-def in_neck_no_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def in_neck_no_trend(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall black candle followed by a short white candle with open below
     the low of the previous candle. The second candle closes inside the firsts body,
     but not by much.
@@ -1052,19 +1076,21 @@ def in_neck_no_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> b
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    L_1, C_1 = candle_1["low"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.white_body(O_2, C_2),
+            candle_1["tall_black_body"],
+            candle_2["white_body"],
             O_2 < L_1,
-            cf.near_up(C_2, C_1, percentile),
+            cf.near_up(C_2, C_1, calibration),
         )
     )
 
 
-def in_neck_opp_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def in_neck_opp_trend(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall black candle followed by a short white candle with open below
     the low of the previous candle. The second candle closes inside the firsts body,
     but not by much.
@@ -1074,20 +1100,22 @@ def in_neck_opp_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    L_1, C_1 = candle_1["low"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.white_body(O_2, C_2),
+            candle_1["tall_black_body"],
+            candle_2["white_body"],
             O_2 < L_1,
-            cf.near_up(C_2, C_1, percentile),
+            cf.near_up(C_2, C_1, calibration),
         )
     )
 
 
-def kicking_bearish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def kicking_bearish_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall white marubozu followed by a tall black marubozu, with a
     downside shadow gap.
 
@@ -1096,23 +1124,23 @@ def kicking_bearish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> b
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    L_1 = candle_1["low"]
+    H_2 = candle_2["high"]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.no_us(O_1, H_1, C_1, percentile),
-            cf.no_ls(O_1, L_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.no_us(O_2, H_2, C_2, percentile),
-            cf.no_ls(O_2, L_2, C_2, percentile),
+            candle_1["tall_white_body"],
+            candle_1["no_us"],
+            candle_1["no_ls"],
+            candle_2["tall_black_body"],
+            candle_2["no_us"],
+            candle_2["no_ls"],
             cf.down_shadow_gap(L_1, H_2),
         )
     )
 
 
 def kicking_bearish_down_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white marubozu followed by a tall black marubozu, with a
     downside shadow gap.
@@ -1122,24 +1150,24 @@ def kicking_bearish_down_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    L_1 = candle_1["low"]
+    H_2 = candle_2["high"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.no_us(O_1, H_1, C_1, percentile),
-            cf.no_ls(O_1, L_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.no_us(O_2, H_2, C_2, percentile),
-            cf.no_ls(O_2, L_2, C_2, percentile),
+            candle_1["tall_white_body"],
+            candle_1["no_us"],
+            candle_1["no_ls"],
+            candle_2["tall_black_body"],
+            candle_2["no_us"],
+            candle_2["no_ls"],
             cf.down_shadow_gap(L_1, H_2),
         )
     )
 
 
 def kicking_bearish_up_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white marubozu followed by a tall black marubozu, with a
     downside shadow gap.
@@ -1149,23 +1177,25 @@ def kicking_bearish_up_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    L_1 = candle_1["low"]
+    H_2 = candle_2["high"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.no_us(O_1, H_1, C_1, percentile),
-            cf.no_ls(O_1, L_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.no_us(O_2, H_2, C_2, percentile),
-            cf.no_ls(O_2, L_2, C_2, percentile),
+            candle_1["tall_white_body"],
+            candle_1["no_us"],
+            candle_1["no_ls"],
+            candle_2["tall_black_body"],
+            candle_2["no_us"],
+            candle_2["no_ls"],
             cf.down_shadow_gap(L_1, H_2),
         )
     )
 
 
-def kicking_bullish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def kicking_bullish_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall black marubozu followed by a tall white marubozu, with a
     upside body gap.
 
@@ -1174,23 +1204,23 @@ def kicking_bullish_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> b
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.no_us(O_1, H_1, C_1, percentile),
-            cf.no_ls(O_1, L_1, C_1, percentile),
-            cf.tall_white_body(O_2, C_2, percentile),
-            cf.no_us(O_2, H_2, C_2, percentile),
-            cf.no_ls(O_2, L_2, C_2, percentile),
+            candle_1["tall_black_body"],
+            candle_1["no_us"],
+            candle_1["no_ls"],
+            candle_2["tall_white_body"],
+            candle_2["no_us"],
+            candle_2["no_ls"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
         )
     )
 
 
 def kicking_bullish_down_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black marubozu followed by a tall white marubozu, with a
     upside body gap.
@@ -1200,24 +1230,24 @@ def kicking_bullish_down_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.no_us(O_1, H_1, C_1, percentile),
-            cf.no_ls(O_1, L_1, C_1, percentile),
-            cf.tall_white_body(O_2, C_2, percentile),
-            cf.no_us(O_2, H_2, C_2, percentile),
-            cf.no_ls(O_2, L_2, C_2, percentile),
+            candle_1["tall_black_body"],
+            candle_1["no_us"],
+            candle_1["no_ls"],
+            candle_2["tall_white_body"],
+            candle_2["no_us"],
+            candle_2["no_ls"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
         )
     )
 
 
 def kicking_bullish_up_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black marubozu followed by a tall white marubozu, with a
     upside body gap.
@@ -1227,24 +1257,24 @@ def kicking_bullish_up_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, H_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.no_us(O_1, H_1, C_1, percentile),
-            cf.no_ls(O_1, L_1, C_1, percentile),
-            cf.tall_white_body(O_2, C_2, percentile),
-            cf.no_us(O_2, H_2, C_2, percentile),
-            cf.no_ls(O_2, L_2, C_2, percentile),
+            candle_1["tall_black_body"],
+            candle_1["no_us"],
+            candle_1["no_ls"],
+            candle_2["tall_white_body"],
+            candle_2["no_us"],
+            candle_2["no_ls"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
         )
     )
 
 
 def last_engulfing_bottom_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: white candle followed by a black candle, which opens above the
     prior body and closes below it.
@@ -1254,13 +1284,13 @@ def last_engulfing_bottom_(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.white_body(O_1, C_1),
-            cf.black_body(O_2, C_2),
+            candle_1["white_body"],
+            candle_2["black_body"],
             O_1 > C_2,
             O_2 > C_1,
         )
@@ -1268,7 +1298,7 @@ def last_engulfing_bottom_(
 
 
 def last_engulfing_bottom_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: white candle followed by a black candle, which opens above the
     prior body and closes below it.
@@ -1278,15 +1308,15 @@ def last_engulfing_bottom_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
-        (cf.white_body(O_1, C_1), cf.black_body(O_2, C_2), O_1 > C_2, O_2 > C_1)
+        (candle_1["white_body"], candle_2["black_body"], O_1 > C_2, O_2 > C_1)
     )
 
 
 def last_engulfing_bottom_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: white candle followed by a black candle, which opens above the
     prior body and closes below it.
@@ -1296,20 +1326,22 @@ def last_engulfing_bottom_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.white_body(O_1, C_1),
-            cf.black_body(O_2, C_2),
+            candle_1["white_body"],
+            candle_2["black_body"],
             O_1 > C_2,
             O_2 > C_1,
         )
     )
 
 
-def last_engulfing_top_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def last_engulfing_top_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: black candle followed by a white candle, which opens above the
     prior body and closes below it.
 
@@ -1318,13 +1350,13 @@ def last_engulfing_top_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.black_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
+            candle_1["black_body"],
+            candle_2["white_body"],
             C_1 > O_2,
             C_2 > O_1,
         )
@@ -1332,7 +1364,7 @@ def last_engulfing_top_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -
 
 
 def last_engulfing_top_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: black candle followed by a white candle, which opens above the
     prior body and closes below it.
@@ -1342,15 +1374,15 @@ def last_engulfing_top_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
-        (cf.black_body(O_1, C_1), cf.white_body(O_2, C_2), C_1 > O_2, C_2 > O_1)
+        (candle_1["black_body"], candle_2["white_body"], C_1 > O_2, C_2 > O_1)
     )
 
 
 def last_engulfing_top_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: black candle followed by a white candle, which opens above the
     prior body and closes below it.
@@ -1360,20 +1392,22 @@ def last_engulfing_top_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.black_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
+            candle_1["black_body"],
+            candle_2["white_body"],
             C_1 > O_2,
             C_2 > O_1,
         )
     )
 
 
-def matching_low_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def matching_low_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall black candle and black candle with similar closing prices.
 
     Trend: down.
@@ -1381,20 +1415,20 @@ def matching_low_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    C_1 = candle_1["close"]
+    C_2 = candle_2["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.black_body(O_2, C_2),
+            candle_1["tall_black_body"],
+            candle_2["black_body"],
             C_1 == C_2,
         )
     )
 
 
 def matching_low_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle and black candle with similar closing prices.
 
@@ -1403,15 +1437,15 @@ def matching_low_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    C_1 = candle_1["close"]
+    C_2 = candle_2["close"]
     return np.logical_and.reduce(
-        (cf.tall_black_body(O_1, C_1, percentile), cf.black_body(O_2, C_2), C_1 == C_2)
+        (candle_1["tall_black_body"], candle_2["black_body"], C_1 == C_2)
     )
 
 
 def matching_low_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle and black candle with similar closing prices.
 
@@ -1420,20 +1454,20 @@ def matching_low_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    C_1 = candle_1["close"]
+    C_2 = candle_2["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.black_body(O_2, C_2),
+            candle_1["tall_black_body"],
+            candle_2["black_body"],
             C_1 == C_2,
         )
     )
 
 
 def meeting_lines_bearish_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle and tall black candle with closing prices near to
     each other.
@@ -1443,20 +1477,20 @@ def meeting_lines_bearish_(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    C_1 = candle_1["close"]
+    C_2 = candle_2["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.near(C_1, C_2, percentile),
+            candle_1["tall_white_body"],
+            candle_2["tall_black_body"],
+            cf.near(C_1, C_2, calibration),
         )
     )
 
 
 def meeting_lines_bearish_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle and tall black candle with closing prices near to
     each other.
@@ -1466,19 +1500,19 @@ def meeting_lines_bearish_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    C_1 = candle_1["close"]
+    C_2 = candle_2["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.near(C_1, C_2, percentile),
+            candle_1["tall_white_body"],
+            candle_2["tall_black_body"],
+            cf.near(C_1, C_2, calibration),
         )
     )
 
 
 def meeting_lines_bearish_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle and tall black candle with closing prices near to
     each other.
@@ -1488,20 +1522,20 @@ def meeting_lines_bearish_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    C_1 = candle_1["close"]
+    C_2 = candle_2["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.near(C_1, C_2, percentile),
+            candle_1["tall_white_body"],
+            candle_2["tall_black_body"],
+            cf.near(C_1, C_2, calibration),
         )
     )
 
 
 def meeting_lines_bullish_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle and tall white candle with closing prices equal to
     each other.
@@ -1511,20 +1545,20 @@ def meeting_lines_bullish_(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    C_1 = candle_1["close"]
+    C_2 = candle_2["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
+            candle_1["tall_white_body"],
+            candle_2["tall_black_body"],
             C_1 == C_2,
         )
     )
 
 
 def meeting_lines_bullish_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle and tall white candle with closing prices equal to
     each other.
@@ -1534,19 +1568,19 @@ def meeting_lines_bullish_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    C_1 = candle_1["close"]
+    C_2 = candle_2["close"]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
+            candle_1["tall_white_body"],
+            candle_2["tall_black_body"],
             C_1 == C_2,
         )
     )
 
 
 def meeting_lines_bullish_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle and tall white candle with closing prices equal to
     each other.
@@ -1556,19 +1590,21 @@ def meeting_lines_bullish_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    C_1 = candle_1["close"]
+    C_2 = candle_2["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
+            candle_1["tall_white_body"],
+            candle_2["tall_black_body"],
             C_1 == C_2,
         )
     )
 
 
-def on_neck_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def on_neck_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall black candle and white candle with low prices equal to each
     other and a downside shadow gap.
 
@@ -1577,20 +1613,22 @@ def on_neck_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    L_1 = candle_1["low"]
+    H_2, L_2 = candle_2["high"], candle_2["low"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.white_body(O_2, C_2),
+            candle_1["tall_black_body"],
+            candle_2["white_body"],
             cf.down_shadow_gap(L_1, H_2),
             L_1 == L_2,
         )
     )
 
 
-def on_neck_no_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def on_neck_no_trend(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall black candle and white candle with low prices equal to each
     other and a downside shadow gap.
 
@@ -1599,19 +1637,21 @@ def on_neck_no_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> b
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    L_1 = candle_1["low"]
+    H_2, L_2 = candle_2["high"], candle_2["low"]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.white_body(O_2, C_2),
+            candle_1["tall_black_body"],
+            candle_2["white_body"],
             cf.down_shadow_gap(L_1, H_2),
             L_1 == L_2,
         )
     )
 
 
-def on_neck_opp_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def on_neck_opp_trend(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: tall black candle and white candle with low prices equal to each
     other and a downside shadow gap.
 
@@ -1620,20 +1660,22 @@ def on_neck_opp_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    L_1 = candle_1["low"]
+    H_2, L_2 = candle_2["high"], candle_2["low"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.white_body(O_2, C_2),
+            candle_1["tall_black_body"],
+            candle_2["white_body"],
             cf.down_shadow_gap(L_1, H_2),
             L_1 == L_2,
         )
     )
 
 
-def piercing_pattern_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def piercing_pattern_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: black candle and white candle that opens below the previous low and
     closes between the midpoint and the opening price of the first candle.
 
@@ -1642,13 +1684,13 @@ def piercing_pattern_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, L_1, C_1 = candle_1["open"], candle_1["low"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.black_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
+            candle_1["black_body"],
+            candle_2["white_body"],
             O_2 < L_1,
             0.5 * (O_1 + C_1) < C_2,
             C_2 < O_1,
@@ -1657,7 +1699,7 @@ def piercing_pattern_(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
 
 
 def piercing_pattern_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: black candle and white candle that opens below the previous low and
     closes between the midpoint and the opening price of the first candle.
@@ -1667,12 +1709,12 @@ def piercing_pattern_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, L_1, C_1 = candle_1["open"], candle_1["low"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
-            cf.black_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
+            candle_1["black_body"],
+            candle_2["white_body"],
             O_2 < L_1,
             0.5 * (O_1 + C_1) < C_2,
             C_2 < O_1,
@@ -1681,7 +1723,7 @@ def piercing_pattern_no_trend(
 
 
 def piercing_pattern_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: black candle and white candle that opens below the previous low and
     closes between the midpoint and the opening price of the first candle.
@@ -1691,13 +1733,13 @@ def piercing_pattern_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, L_1, C_1 = candle_1["open"], candle_1["low"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.black_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
+            candle_1["black_body"],
+            candle_2["white_body"],
             O_2 < L_1,
             0.5 * (O_1 + C_1) < C_2,
             C_2 < O_1,
@@ -1706,7 +1748,7 @@ def piercing_pattern_opp_trend(
 
 
 def separating_lines_bearish_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle and tall black candle with similar opening prices.
 
@@ -1715,20 +1757,20 @@ def separating_lines_bearish_(
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1 = candle_1["open"]
+    O_2 = candle_2["open"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.near(O_1, O_2, percentile),
+            candle_1["tall_white_body"],
+            candle_2["tall_black_body"],
+            cf.near(O_1, O_2, calibration),
         )
     )
 
 
 def separating_lines_bearish_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle and tall black candle with similar opening prices.
 
@@ -1737,19 +1779,19 @@ def separating_lines_bearish_no_trend(
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1 = candle_1["open"]
+    O_2 = candle_2["open"]
     return np.logical_and.reduce(
         (
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.near(O_1, O_2, percentile),
+            candle_1["tall_white_body"],
+            candle_2["tall_black_body"],
+            cf.near(O_1, O_2, calibration),
         )
     )
 
 
 def separating_lines_bearish_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall white candle and tall black candle with similar opening prices.
 
@@ -1758,20 +1800,20 @@ def separating_lines_bearish_opp_trend(
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1 = candle_1["open"]
+    O_2 = candle_2["open"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_white_body(O_1, C_1, percentile),
-            cf.tall_black_body(O_2, C_2, percentile),
-            cf.near(O_1, O_2, percentile),
+            candle_1["tall_white_body"],
+            candle_2["tall_black_body"],
+            cf.near(O_1, O_2, calibration),
         )
     )
 
 
 def separating_lines_bullish_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle and tall white candle with similar opening prices.
 
@@ -1780,20 +1822,20 @@ def separating_lines_bullish_(
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1 = candle_1["open"]
+    O_2 = candle_2["open"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.tall_white_body(O_2, C_2, percentile),
-            cf.near(O_1, O_2, percentile),
+            candle_1["tall_black_body"],
+            candle_2["tall_white_body"],
+            cf.near(O_1, O_2, calibration),
         )
     )
 
 
 def separating_lines_bullish_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle and tall white candle with similar opening prices.
 
@@ -1802,19 +1844,19 @@ def separating_lines_bullish_no_trend(
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1 = candle_1["open"]
+    O_2 = candle_2["open"]
     return np.logical_and.reduce(
         (
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.tall_white_body(O_2, C_2, percentile),
-            cf.near(O_1, O_2, percentile),
+            candle_1["tall_black_body"],
+            candle_2["tall_white_body"],
+            cf.near(O_1, O_2, calibration),
         )
     )
 
 
 def separating_lines_bullish_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: tall black candle and tall white candle with similar opening prices.
 
@@ -1823,20 +1865,20 @@ def separating_lines_bullish_opp_trend(
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, C_1 = candle_1[:, 0], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1 = candle_1["open"]
+    O_2 = candle_2["open"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.tall_black_body(O_1, C_1, percentile),
-            cf.tall_white_body(O_2, C_2, percentile),
-            cf.near(O_1, O_2, percentile),
+            candle_1["tall_black_body"],
+            candle_2["tall_white_body"],
+            cf.near(O_1, O_2, calibration),
         )
     )
 
 
 def shooting_star_two_candle_(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: white candle, followed by a short candle of either color with an
     upper shadow at least 3x the length of the previous candles body, with no lower
@@ -1848,23 +1890,23 @@ def shooting_star_two_candle_(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.white_body(O_1, C_1),
-            np.logical_not(cf.no_us(O_1, H_1, C_1, percentile)),
-            cf.upper_shadow_length(O_2, H_2, C_2) > 3 * cf.body_height(O_1, C_1),
-            cf.short_body(O_2, C_2, percentile),
-            cf.no_ls(O_2, L_2, C_2, percentile),
+            candle_1["white_body"],
+            np.logical_not(candle_1["no_us"]),
+            candle_2["upper_shadow_length"] > 3 * candle_1["body_height"],
+            candle_2["short_body"],
+            candle_2["no_ls"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
         )
     )
 
 
 def shooting_star_two_candle_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: white candle, followed by a short candle of either color with an
     upper shadow at least 3x the length of the previous candles body, with no lower
@@ -1876,22 +1918,22 @@ def shooting_star_two_candle_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
-            cf.white_body(O_1, C_1),
-            np.logical_not(cf.no_us(O_1, H_1, C_1, percentile)),
-            cf.upper_shadow_length(O_2, H_2, C_2) > 3 * cf.body_height(O_1, C_1),
-            cf.short_body(O_2, C_2, percentile),
-            cf.no_ls(O_2, L_2, C_2, percentile),
+            candle_1["white_body"],
+            np.logical_not(candle_1["no_us"]),
+            candle_2["upper_shadow_length"] > 3 * candle_1["body_height"],
+            candle_2["short_body"],
+            candle_2["no_ls"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
         )
     )
 
 
 def shooting_star_two_candle_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: white candle, followed by a short candle of either color with an
     upper shadow at least 3x the length of the previous candles body, with no lower
@@ -1903,22 +1945,24 @@ def shooting_star_two_candle_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, H_1, C_1 = candle_1[:, 0], candle_1[:, 1], candle_1[:, 3]
-    O_2, H_2, L_2, C_2 = candle_2[:, 0], candle_2[:, 1], candle_2[:, 2], candle_2[:, 3]
+    O_1, C_1 = candle_1["open"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.white_body(O_1, C_1),
-            np.logical_not(cf.no_us(O_1, H_1, C_1, percentile)),
-            cf.upper_shadow_length(O_2, H_2, C_2) > 3 * cf.body_height(O_1, C_1),
-            cf.short_body(O_2, C_2, percentile),
-            cf.no_ls(O_2, L_2, C_2, percentile),
+            candle_1["white_body"],
+            np.logical_not(candle_1["no_us"]),
+            candle_2["upper_shadow_length"] > 3 * candle_1["body_height"],
+            candle_2["short_body"],
+            candle_2["no_ls"],
             cf.up_body_gap(O_1, C_1, O_2, C_2),
         )
     )
 
 
-def thrusting_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def thrusting_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: black candle followed by a white candle that opens below the prior
     low and closes near but below the prior midpoint.
 
@@ -1927,20 +1971,22 @@ def thrusting_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, L_1, C_1 = candle_1["open"], candle_1["low"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == -1,
-            cf.black_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
+            candle_1["black_body"],
+            candle_2["white_body"],
             O_2 < L_1,
-            cf.near_up(C_2, 0.5 * (O_1 + C_1), percentile),
+            cf.near_up(C_2, 0.5 * (O_1 + C_1), calibration),
         )
     )
 
 
-def thrusting_no_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def thrusting_no_trend(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: black candle followed by a white candle that opens below the prior
     low and closes near but below the prior midpoint.
 
@@ -1949,19 +1995,21 @@ def thrusting_no_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) ->
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, L_1, C_1 = candle_1["open"], candle_1["low"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
-            cf.black_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
+            candle_1["black_body"],
+            candle_2["white_body"],
             O_2 < L_1,
-            cf.near_up(C_2, 0.5 * (O_1 + C_1), percentile),
+            cf.near_up(C_2, 0.5 * (O_1 + C_1), calibration),
         )
     )
 
 
-def thrusting_opp_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def thrusting_opp_trend(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: black candle followed by a white candle that opens below the prior
     low and closes near but below the prior midpoint.
 
@@ -1970,20 +2018,22 @@ def thrusting_opp_trend(candles: np.ndarray, T: np.ndarray, percentile: tuple) -
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    O_1, L_1, C_1 = candle_1[:, 0], candle_1[:, 2], candle_1[:, 3]
-    O_2, C_2 = candle_2[:, 0], candle_2[:, 3]
+    O_1, L_1, C_1 = candle_1["open"], candle_1["low"], candle_1["close"]
+    O_2, C_2 = candle_2["open"], candle_2["close"]
     return np.logical_and.reduce(
         (
             T == 1,
-            cf.black_body(O_1, C_1),
-            cf.white_body(O_2, C_2),
+            candle_1["black_body"],
+            candle_2["white_body"],
             O_2 < L_1,
-            cf.near_up(C_2, 0.5 * (O_1 + C_1), percentile),
+            cf.near_up(C_2, 0.5 * (O_1 + C_1), calibration),
         )
     )
 
 
-def tweezers_bottom_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def tweezers_bottom_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: two candles of either color share the same low price.
 
     Trend: down.
@@ -1991,13 +2041,13 @@ def tweezers_bottom_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> b
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    L_1 = candle_1[:, 2]
-    L_2 = candle_2[:, 2]
+    L_1 = candle_1["low"]
+    L_2 = candle_2["low"]
     return np.logical_and.reduce((T == -1, L_1 == L_2))
 
 
 def tweezers_bottom_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two candles of either color share the same low price.
 
@@ -2006,13 +2056,13 @@ def tweezers_bottom_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    L_1 = candle_1[:, 2]
-    L_2 = candle_2[:, 2]
+    L_1 = candle_1["low"]
+    L_2 = candle_2["low"]
     return L_1 == L_2
 
 
 def tweezers_bottom_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two candles of either color share the same low price.
 
@@ -2021,12 +2071,14 @@ def tweezers_bottom_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    L_1 = candle_1[:, 2]
-    L_2 = candle_2[:, 2]
+    L_1 = candle_1["low"]
+    L_2 = candle_2["low"]
     return np.logical_and.reduce((T == 1, L_1 == L_2))
 
 
-def tweezers_top_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def tweezers_top_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: two candles of either color share the same high price.
 
     Trend: up.
@@ -2034,13 +2086,13 @@ def tweezers_top_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    H_1 = candle_1[:, 1]
-    H_2 = candle_2[:, 1]
+    H_1 = candle_1["high"]
+    H_2 = candle_2["high"]
     return np.logical_and.reduce((T == 1, H_1 == H_2))
 
 
 def tweezers_top_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two candles of either color share the same high price.
 
@@ -2049,13 +2101,13 @@ def tweezers_top_no_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    H_1 = candle_1[:, 1]
-    H_2 = candle_2[:, 1]
+    H_1 = candle_1["high"]
+    H_2 = candle_2["high"]
     return H_1 == H_2
 
 
 def tweezers_top_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two candles of either color share the same high price.
 
@@ -2064,12 +2116,14 @@ def tweezers_top_opp_trend(
     Prediction: reversal.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    H_1 = candle_1[:, 1]
-    H_2 = candle_2[:, 1]
+    H_1 = candle_1["high"]
+    H_2 = candle_2["high"]
     return np.logical_and.reduce((T == -1, H_1 == H_2))
 
 
-def window_falling_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def window_falling_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: two candles of either color with a downwards shadow gap.
 
     Trend: down.
@@ -2077,13 +2131,13 @@ def window_falling_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bo
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    L_1 = candle_1[:, 2]
-    H_2 = candle_2[:, 1]
+    L_1 = candle_1["low"]
+    H_2 = candle_2["high"]
     return np.logical_and.reduce((T == -1, cf.down_shadow_gap(L_1, H_2)))
 
 
 def window_falling_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two candles of either color with a downwards shadow gap.
 
@@ -2092,13 +2146,13 @@ def window_falling_no_trend(
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    L_1 = candle_1[:, 2]
-    H_2 = candle_2[:, 1]
+    L_1 = candle_1["low"]
+    H_2 = candle_2["high"]
     return cf.down_shadow_gap(L_1, H_2)
 
 
 def window_falling_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two candles of either color with a downwards shadow gap.
 
@@ -2107,12 +2161,14 @@ def window_falling_opp_trend(
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    L_1 = candle_1[:, 2]
-    H_2 = candle_2[:, 1]
+    L_1 = candle_1["low"]
+    H_2 = candle_2["high"]
     return np.logical_and.reduce((T == 1, cf.down_shadow_gap(L_1, H_2)))
 
 
-def window_rising_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> bool:
+def window_rising_(
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
+) -> bool:
     """Definition: two candles of either color with an upwards shadow gap.
 
     Trend: up.
@@ -2120,13 +2176,13 @@ def window_rising_(candles: np.ndarray, T: np.ndarray, percentile: tuple) -> boo
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    H_1 = candle_1[:, 1]
-    L_2 = candle_2[:, 2]
+    H_1 = candle_1["high"]
+    L_2 = candle_2["low"]
     return np.logical_and.reduce((T == 1, cf.up_shadow_gap(H_1, L_2)))
 
 
 def window_rising_no_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two candles of either color with an upwards shadow gap.
 
@@ -2135,13 +2191,13 @@ def window_rising_no_trend(
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    H_1 = candle_1[:, 1]
-    L_2 = candle_2[:, 2]
+    H_1 = candle_1["high"]
+    L_2 = candle_2["low"]
     return cf.up_shadow_gap(H_1, L_2)
 
 
 def window_rising_opp_trend(
-    candles: np.ndarray, T: np.ndarray, percentile: tuple
+    candles: list[dict[str, np.ndarray]], T: np.ndarray, calibration: dict
 ) -> bool:
     """Definition: two candles of either color with an upwards shadow gap.
 
@@ -2150,6 +2206,6 @@ def window_rising_opp_trend(
     Prediction: continuation.
     """
     candle_1, candle_2 = candles[0], candles[1]
-    H_1 = candle_1[:, 1]
-    L_2 = candle_2[:, 2]
+    H_1 = candle_1["high"]
+    L_2 = candle_2["low"]
     return np.logical_and.reduce((T == -1, cf.up_shadow_gap(H_1, L_2)))
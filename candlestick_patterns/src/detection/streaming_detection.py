@@ -0,0 +1,193 @@
+from collections import deque
+
+import numpy as np
+
+from detection import compiled_detection, pattern_detection, pattern_registry
+from detection.patterns.functions import candlestick_functions as cf
+from trend import trend_calculation
+
+# Number of bars the patterns look at, the current one and the ones it looks back.
+WINDOW = compiled_detection.MAX_LAG + 1
+
+
+def detector_state(
+    calibration: dict,
+    data_gap_handling: str,
+    *,
+    trend: dict,
+    patterns: list[dict] | None = None,
+    backend: str = "numba",
+) -> dict:
+    """
+    Sets up a streaming detector, which detects patterns bar by bar, see ``update``.
+
+    Parameters
+    ----------
+    calibration : dict
+        Calibration, see ``calibration.resolve_calibration``.
+    data_gap_handling : {"exclude", "ignore", "only"}
+        Mode of handling gaps in the data, see ``pattern_detection.handle_gaps``.
+    trend : dict
+        State of the trend calculation, see ``trend_calculation.trend_state``.
+    patterns : list[dict] | None, optional, default None
+        Patterns to detect, all patterns in ``pattern_registry.PATTERNS`` if None.
+    backend : {"numba", "numpy"}, optional, default "numba"
+        How the evaluation plan is evaluated on every bar, see
+        ``compiled_detection.detect``.
+
+    Returns
+    -------
+    dict
+        State of the detector, with the buffer of the last ``WINDOW`` bars.
+
+    Raises
+    ------
+    ValueError
+        If the backend is unknown, or a pattern averages over the current bar only,
+        which depends on all bars and cannot be streamed.
+    """
+    if patterns is None:
+        patterns = pattern_registry.PATTERNS
+    shape_patterns = pattern_detection.trend_free_patterns(patterns)
+    specs = {pattern["name"]: pattern["spec"] for pattern in shape_patterns}
+    plan = compiled_detection.pattern_plan(specs)
+    steps, outputs = plan
+
+    # In the batch detection a mean over lagged candles is always NaN, as the
+    # missing candles before the first one are part of it.
+    scalars = {}
+    threshold_values = compiled_detection.thresholds(calibration)
+    for i, (kind, argument, _) in enumerate(steps):
+        if kind == "const":
+            scalars[i] = argument
+        elif kind == "threshold":
+            scalars[i] = threshold_values[argument]
+        elif kind == "mean":
+            if not any(lag for _, _, lag in argument):
+                raise ValueError(f"Cannot stream the mean over {argument}.")
+            scalars[i] = np.nan
+
+    columns = {pattern["id"]: i for i, pattern in enumerate(shape_patterns)}
+    state = {
+        # Patterns by the column of the trend-free variant they derive from.
+        "patterns": [
+            [pattern for pattern in patterns if columns[pattern["shape_id"]] == column]
+            for column in range(len(shape_patterns))
+        ],
+        "calibration": calibration,
+        "data_gap_handling": data_gap_handling,
+        "trend": trend,
+        "backend": backend,
+        "bars": 0,
+        # Missing bars before the first one count as gaps, like in ``handle_gaps``.
+        "gaps": deque([True] * WINDOW, maxlen=WINDOW),
+        "high": np.nan,
+        "rising_highs": 0.0,
+        "out": np.zeros((1, len(outputs)), dtype=bool),
+    }
+    feature_dict = {
+        **cf.numeric_features(*np.full((4, 1), np.nan)),
+        "code": np.zeros(1, dtype=np.uint16),
+    }
+    if backend == "numba":
+        kernel, fields, tables = compiled_detection.plan_kernel(specs, feature_dict)
+        state |= {
+            "kernel": kernel,
+            "thresholds": np.array(
+                [threshold_values[n] for n in compiled_detection.THRESHOLD_NAMES]
+            ),
+            "means": np.array(
+                [scalars[i] for i, (kind, _, _) in enumerate(steps) if kind == "mean"],
+                dtype=float,
+            ),
+            "tables": compiled_detection.table_array(tables),
+        }
+    elif backend == "numpy":
+        fields = {
+            field: ("values", column)
+            for column, field in enumerate(list(feature_dict)[:-1])
+        } | {"code": ("codes", 0)}
+        state |= {"plan": plan, "scalars": scalars}
+    else:
+        raise ValueError(f"Unknown backend {backend}.")
+    # Every bar is written twice, ``WINDOW`` rows apart, so the last ``WINDOW`` bars
+    # are always a contiguous slice of the ring buffer.
+    state["fields"] = fields
+    state["arrays"] = compiled_detection.kernel_arrays(fields, 2 * WINDOW)
+    return state
+
+
+def update(state: dict, bar: dict) -> list[dict]:
+    """
+    Detects the patterns ending on the next bar.
+
+    Only the last ``WINDOW`` bars are kept, so every bar takes the same time. The
+    patterns are identical to ``pattern_detection.detection`` on all bars so far,
+    without indicator filters.
+
+    Parameters
+    ----------
+    state : dict
+        State of the detector, see ``detector_state``. Updated in place.
+    bar : dict
+        OHLC data and ``"gap"`` (whether data is missing before the bar) of the next
+        bar.
+
+    Returns
+    -------
+    list[dict]
+        Patterns from ``pattern_registry.PATTERNS`` ending on the bar.
+    """
+    OP, H, L, C = (np.float64(bar[col]) for col in ["open", "high", "low", "close"])
+    feature_dict = cf.numeric_features(OP, H, L, C)
+    feature_dict["code"] = cf.feature_codes(feature_dict, state["calibration"])
+    # The run of rising highs goes back beyond the window, so it is counted here.
+    state["rising_highs"] = state["rising_highs"] + 1 if state["high"] < H else 0.0
+    state["high"] = H
+    feature_dict["rising_highs"] = state["rising_highs"]
+    slot = state["bars"] % WINDOW
+    arrays = state["arrays"]
+    for field, (array, column) in state["fields"].items():
+        arrays[array][[slot, slot + WINDOW], column] = feature_dict[field]
+    window = {
+        array: values[slot + 1 : slot + 1 + WINDOW] for array, values in arrays.items()
+    }
+    state["bars"] += 1
+
+    out = state["out"]
+    if state["backend"] == "numba":
+        state["kernel"](
+            window["values"],
+            window["flags"],
+            window["codes"],
+            state["thresholds"],
+            state["means"],
+            state["tables"],
+            out,
+        )
+    else:
+        compiled_detection.run_plan(
+            state["plan"],
+            {
+                field: window[array][:, column]
+                for field, (array, column) in state["fields"].items()
+            },
+            state["scalars"],
+            out,
+        )
+
+    T = trend_calculation.update_trend(state["trend"], bar)
+    state["gaps"].append(bool(bar["gap"]))
+    gaps = list(state["gaps"])
+    in_gap = {
+        number_candles: any(gaps[-number_candles:])
+        for number_candles, _ in pattern_registry.PATTERN_MODULES.values()
+    }
+    mode = state["data_gap_handling"]
+    return [
+        pattern
+        for column in np.flatnonzero(out[0])
+        for pattern in state["patterns"][column]
+        if (not pattern["trend"] or pattern["trend"] == T)
+        and (mode == "ignore" or in_gap[pattern["number_candles"]] == (mode == "only"))
+    ]
@@ -1,12 +1,16 @@
 import csv
+import numbers
 import os
 
 import numba
 import numpy as np
 import pandas as pd
-import pyarrow.parquet
 
-from shared import constants, shared_functions
+from shared import constants, pattern_matrix, shared_functions
+
+# Number of candles after the entry that are checked one by one, before searching
+# the sparse tables.
+LINEAR_SCAN_LENGTH = 16
 
 
 def stop_loss_take_profit_evaluation(
@@ -28,122 +32,131 @@ def stop_loss_take_profit_evaluation(
     None
         Win %, "less" and "greater" binomial tests to disk.
     """
-    open_array = df["open"].to_numpy()
-    high_array = df["high"].to_numpy()
-    low_array = df["low"].to_numpy()
-    ATR_array = df["ATR"].to_numpy()
-
-    i = 0
-    for number_str in constants.PATTERN_NUMBERS_AS_STRING:
-        for pattern in os.listdir(f"data/runs/{run_name}/detection/{number_str}"):
-            shared_functions.print_status_bar(
-                pattern.removesuffix(".parquet"),
-                i,
-                constants.TOTAL_NUMBER_OF_PATTERNS,
-                split,
-            )
+    # The outcome of entering at a bar does not depend on the pattern, so it is found
+    # once for every bar and every pattern takes the outcomes at its hits.
+    outcomes, _ = first_passage_outcomes(df, margins)
+
+    header, data = pattern_matrix.read_pattern_matrix(
+        f"data/runs/{run_name}/detection/{split}.patterns"
+    )
+    rows = []
+    for i, (number_str, pattern) in enumerate(
+        zip(header["numbers"], header["names"], strict=True)
+    ):
+        shared_functions.print_status_bar(pattern, i, len(header["names"]), split)
+        csv_path = f"data/runs/{run_name}/evaluation/{number_str}/{pattern}"
+
+        if split == 1:
+            with open(f"{csv_path}_evaluation.csv", "w") as _:
+                pass
+
+        # Patterns with the same hits as an earlier one have the same outcome, see
+        # ``pattern_matrix.pattern_aliases``.
+        if (alias := header["aliases"][i]) != i:
+            rows.append(rows[alias])
+            write_csvs({f"{csv_path}_evaluation.csv": rows[alias]})
+            continue
+
+        # A pattern is evaluated from the candle after it, the last candle of the
+        # split has no next candle.
+        pattern_hits = pattern_matrix.pattern_hits(header, data, i)
+        pattern_hits = pattern_hits[pattern_hits < len(df) - 1] + 1
+        num_detected = len(pattern_hits)
+
+        if num_detected <= constants.MINIMAL_SIGNIFICANT_DETECTION_SIZE:
+            row = ["/"] * 2 + [0]
 
-            i += 1
-
-            df["pattern"] = (
-                pyarrow.parquet.read_table(
-                    f"data/runs/{run_name}/detection/{number_str}/{pattern}"
+        else:
+            non_pattern = np.ones(len(df), dtype=bool)
+            non_pattern[pattern_hits] = False
+            if non_pattern.sum() > (N := len(non_pattern) // 3):
+                null_hits = np.sort(
+                    np.random.choice(np.where(non_pattern)[0], size=N, replace=False)
                 )
-                .to_pandas()
-                .set_index(df.index)
-                .shift(1)
-            ).astype(bool)
-            df.loc[df.index[0], "pattern"] = False
-            num_detected = df["pattern"].sum()
-
-            csv_path = (
-                f"data/runs/{run_name}/evaluation/{number_str}/"
-                f"{pattern.removesuffix('.parquet')}"
+            else:
+                null_hits = np.flatnonzero(non_pattern)
+            eval_list = outcomes[pattern_hits]
+            null_list = outcomes[null_hits]
+
+            wins = int(np.count_nonzero(eval_list == 1))
+            number_detected = len(eval_list)
+            win_rate = wins / number_detected
+            absolute_win_rate = (
+                str(win_rate) + "+"
+                if win_rate >= 0.5  # noqa: PLR2004
+                else str(0.5 + abs(0.5 - win_rate)) + "-"
             )
 
-            if split == 1:
-                with open(f"{csv_path}_evaluation.csv", "w") as _:
-                    pass
+            null_win = int(np.count_nonzero(null_list == 1)) / len(null_list)
+            null_win = (
+                str(null_win) + "+"
+                if null_win >= 0.5  # noqa: PLR2004
+                else str(0.5 + abs(0.5 - null_win)) + "-"
+            )
 
-            if num_detected <= constants.MINIMAL_SIGNIFICANT_DETECTION_SIZE:
-                csv_data = {
-                    f"{csv_path}_evaluation.csv": ["/"] * 2 + [0],
-                }
-                write_csvs(csv_data)
+            row = [absolute_win_rate, null_win, number_detected]
+        rows.append(row)
+        write_csvs({f"{csv_path}_evaluation.csv": row})
 
-            else:
-                if all(
-                    method not in margins
-                    for method in ["ATR", "constant", "percentage"]
-                ):
-                    raise ValueError(
-                        "No correct margin method specified, choose either "
-                        "'ATR', 'constant' or 'percentage'"
-                    )
-                bool_array = df["pattern"].to_numpy()
-                non_pattern = ~bool_array
-                if non_pattern.sum() > (N := len(non_pattern) // 3):
-                    selected_indices = np.random.choice(
-                        np.where(non_pattern)[0], size=N, replace=False
-                    )
-                    null_array = np.zeros_like(bool_array, dtype=bool)
-                    null_array[selected_indices] = True
-                else:
-                    null_array = non_pattern
-                if "percentage" in margins:
-                    eval_list = find_first_breakthroughs_percent(
-                        (bool_array, open_array, high_array, low_array),
-                        margins["percentage"],
-                    )
-                    null_list = find_first_breakthroughs_percent(
-                        (null_array, open_array, high_array, low_array),
-                        margins["percentage"],
-                    )
-                elif "constant" in margins:
-                    eval_list = find_first_breakthroughs_constant(
-                        (bool_array, open_array, high_array, low_array),
-                        margins["constant"],
-                    )
-                    null_list = find_first_breakthroughs_constant(
-                        (null_array, open_array, high_array, low_array),
-                        margins["constant"],
-                    )
-                else:
-                    eval_list = find_first_breakthroughs_ATR(
-                        (bool_array, open_array, high_array, low_array, ATR_array)
-                    )
-                    null_list = find_first_breakthroughs_ATR(
-                        (null_array, open_array, high_array, low_array, ATR_array)
-                    )
-
-                df["evaluation"] = None
-                df.loc[df["pattern"], "evaluation"] = eval_list
-                del df["pattern"]
-
-                wins = int(np.nansum(eval_list))
-                number_detected = len(eval_list)
-                win_rate = wins / number_detected
-                absolute_win_rate = (
-                    str(win_rate) + "+"
-                    if win_rate >= 0.5  # noqa: PLR2004
-                    else str(0.5 + abs(0.5 - win_rate)) + "-"
-                )
 
-                null_win = int(np.nansum(null_list)) / len(null_list)
-                null_win = (
-                    str(null_win) + "+"
-                    if null_win >= 0.5  # noqa: PLR2004
-                    else str(0.5 + abs(0.5 - null_win)) + "-"
-                )
+def stop_loss_take_profit_sweep(
+    df: pd.DataFrame,
+    margin_grid: list[dict[str, float | tuple[float, float] | None]],
+    *,
+    run_name: str,
+    split: int,
+) -> None:
+    """
+    Stop loss/take profit-based candlestick pattern evaluation for every margins of
+    a sweep.
+
+    The breakthroughs of all margins are found together, see
+    ``first_passage_grid``.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        A DataFrame with OHLC data and "ATR" column. Candlestick patterns are read
+        from disk.
+    margin_grid : list[dict[str, float | tuple[float, float] | None]]
+        Margins of the sweep, see ``margin_thresholds``.
+
+    Returns
+    -------
+    None
+        Number of detections and win rate for every margins of every pattern to disk,
+        as ``sweep/margins/{split}.csv`` in the run folder. Patterns with too few
+        detections have no win rate.
+    """
+    outcomes, _ = first_passage_grid(df, margin_grid)
+
+    header, data = pattern_matrix.read_pattern_matrix(
+        f"data/runs/{run_name}/detection/{split}.patterns"
+    )
+    number_detected = np.zeros(len(header["names"]), dtype=int)
+    win_rates = np.full((len(header["names"]), len(margin_grid)), np.nan)
+    for i, alias in enumerate(header["aliases"]):
+        if alias != i:
+            number_detected[i] = number_detected[alias]
+            win_rates[i] = win_rates[alias]
+            continue
+        pattern_hits = pattern_matrix.pattern_hits(header, data, i)
+        pattern_hits = pattern_hits[pattern_hits < len(df) - 1] + 1
+        number_detected[i] = len(pattern_hits)
+        if number_detected[i] > constants.MINIMAL_SIGNIFICANT_DETECTION_SIZE:
+            win_rates[i] = (
+                np.count_nonzero(outcomes[:, pattern_hits] == 1, axis=1)
+                / number_detected[i]
+            )
 
-                csv_data = {
-                    f"{csv_path}_evaluation.csv": [
-                        absolute_win_rate,
-                        null_win,
-                        number_detected,
-                    ],
-                }
-                write_csvs(csv_data)
+    win_rate_df = pd.DataFrame(
+        win_rates,
+        index=pd.Index(header["names"], name="pattern"),
+        columns=[margin_tag(margins) for margins in margin_grid],
+    )
+    win_rate_df.insert(0, "number_detected", number_detected)
+    os.makedirs(f"data/runs/{run_name}/sweep/margins", exist_ok=True)
+    win_rate_df.to_csv(f"data/runs/{run_name}/sweep/margins/{split}.csv")
 
 
 def write_csvs(csv_data: dict) -> None:
@@ -160,133 +173,297 @@ def write_csvs(csv_data: dict) -> None:
             csv.writer(csvfile).writerow(data)
 
 
-@numba.jit
-def find_first_breakthroughs_percent(
-    arrays: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
-    *,
-    percentage: float,
-) -> list:
+def first_passage_outcomes(
+    df: pd.DataFrame, margins: dict[str, float | tuple[float, float] | None]
+) -> tuple[np.ndarray, np.ndarray]:
     """
-    Find the stop loss take profit breakthroughs. Margins are percentage-based.
+    Stop loss/take profit outcome of entering at every candle.
+
+    The margins are set around the open of the entry candle, the outcome is decided
+    by the first later candle that breaks through one of them.
 
     Parameters
     ----------
-    arrays : tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
-        Boolean array of the patterns; open, high and low array.
-    percentage : float
-        Percentage that defines the margins.
+    df : pd.DataFrame
+        A DataFrame with OHLC data and "ATR" column.
+    margins : dict[str, float | tuple[float, float] | None]
+        Margin method with its value, see ``margin_thresholds``.
 
     Returns
     -------
-    list
-        Evaluation: 0 for bottom breakthrough, 1 for upper, ``np.nan`` else.
+    np.ndarray
+        Outcome of every candle: 0 for bottom breakthrough, 1 for upper, -1 else.
+    np.ndarray
+        Number of candles until the breakthrough, -1 if there is none.
     """
+    breaches, bars_to_exit = first_passage_grid(df, [margins])
+    return breaches[0], bars_to_exit[0]
 
-    bool_array, open_array, high_array, low_array = arrays
-
-    breaches = []
-    true_indices = np.flatnonzero(bool_array)
 
-    for i in true_indices:
-        start_value = open_array[i]
-        upper_threshold = start_value * (1 + percentage / 100)
-        lower_threshold = start_value * (1 - percentage / 100)
+def first_passage_grid(
+    df: pd.DataFrame, margin_grid: list[dict[str, float | tuple[float, float] | None]]
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Stop loss/take profit outcome of entering at every candle, for every margins of
+    a sweep, see ``first_passage_outcomes``.
 
-        for j in range(i + 1, len(open_array)):
-            if high_array[j] > upper_threshold:
-                breaches.append(1)
-                break
-            if low_array[j] < lower_threshold:
-                breaches.append(0)
-                break
-        else:
-            breaches.append(np.nan)
+    Parameters
+    ----------
+    df : pd.DataFrame
+        A DataFrame with OHLC data and "ATR" column.
+    margin_grid : list[dict[str, float | tuple[float, float] | None]]
+        Margins of the sweep, see ``margin_thresholds``.
 
-    return breaches
+    Returns
+    -------
+    np.ndarray
+        Outcome of every candle, with one row per margins.
+    np.ndarray
+        Number of candles until the breakthrough, with one row per margins.
+    """
+    upper_thresholds, lower_thresholds = zip(
+        *(margin_thresholds(df, margins) for margins in margin_grid), strict=True
+    )
+    breaches = np.empty((len(margin_grid), len(df)), dtype=np.int8)
+    bars_to_exit = np.empty((len(margin_grid), len(df)), dtype=np.int64)
+    find_first_breakthroughs(
+        (
+            df["high"].to_numpy(dtype=float),
+            df["low"].to_numpy(dtype=float),
+            np.stack(upper_thresholds).astype(float),
+            np.stack(lower_thresholds).astype(float),
+        ),
+        breaches,
+        bars_to_exit,
+    )
+    return breaches, bars_to_exit
+
+
+def margin_thresholds(
+    df: pd.DataFrame, margins: dict[str, float | tuple[float, float] | None]
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Take profit and stop loss threshold of entering at every candle.
 
+    Parameters
+    ----------
+    df : pd.DataFrame
+        A DataFrame with OHLC data and "ATR" column.
+    margins : dict[str, float | tuple[float, float] | None]
+        Margin method, either ``"ATR"``, ``"constant"`` or ``"percentage"``, with its
+        value, see ``constants.STOP_LOSS_TAKE_PROFIT_MARGINS``. The value is either
+        one margin on both sides or a (stop loss, take profit) pair; ATR margins are
+        multiples of the ATR, ``None`` being the ATR itself.
 
-@numba.jit
-def find_first_breakthroughs_constant(
-    arrays: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
-    *,
-    constant: float,
-) -> list:
+    Returns
+    -------
+    np.ndarray
+        Upper (take profit) threshold of every candle.
+    np.ndarray
+        Lower (stop loss) threshold of every candle.
+
+    Raises
+    ------
+    ValueError
+        If no correct margin method is specified.
     """
-    Find the stop loss take profit breakthroughs. Margins are constant.
+    if all(method not in margins for method in ["ATR", "constant", "percentage"]):
+        raise ValueError(
+            "No correct margin method specified, choose either "
+            "'ATR', 'constant' or 'percentage'"
+        )
+    open_array = df["open"].to_numpy()
+    if "percentage" in margins:
+        stop_loss, take_profit = margin_pair(margins["percentage"])
+        upper_thresholds = open_array * (1 + take_profit / 100)
+        lower_thresholds = open_array * (1 - stop_loss / 100)
+    elif "constant" in margins:
+        stop_loss, take_profit = margin_pair(margins["constant"])
+        upper_thresholds = open_array + take_profit
+        lower_thresholds = open_array - stop_loss
+    else:
+        stop_loss, take_profit = margin_pair(margins["ATR"])
+        upper_thresholds = open_array + take_profit * df["ATR"].to_numpy()
+        lower_thresholds = open_array - stop_loss * df["ATR"].to_numpy()
+    return upper_thresholds, lower_thresholds
+
+
+def margin_pair(value: float | tuple[float, float] | None) -> tuple[float, float]:
+    """
+    Stop loss and take profit margin of a margin value, see ``margin_thresholds``.
 
     Parameters
     ----------
-    arrays : tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
-        Boolean array of the patterns; open, high and low array.
-    constant : float
-        Percentage that defines the margins.
+    value : float | tuple[float, float] | None
+        One margin on both sides, a (stop loss, take profit) pair or ``None`` for 1.
 
     Returns
     -------
-    list
-        Evaluation: 0 for bottom breakthrough, 1 for upper, ``np.nan`` else.
+    tuple[float, float]
+        Stop loss and take profit margin.
     """
+    if value is None:
+        return 1, 1
+    if isinstance(value, numbers.Real):
+        return value, value
+    stop_loss, take_profit = value
+    return stop_loss, take_profit
 
-    bool_array, open_array, high_array, low_array = arrays
 
-    breaches = []
-    true_indices = np.flatnonzero(bool_array)
+def margin_tag(margins: dict[str, float | tuple[float, float] | None]) -> str:
+    """
+    Names margins of ``stop_loss_take_profit_sweep``.
 
-    for i in true_indices:
-        start_value = open_array[i]
-        upper_threshold = start_value + constant
-        lower_threshold = start_value - constant
+    Parameters
+    ----------
+    margins : dict[str, float | tuple[float, float] | None]
+        Margin method with its value, see ``margin_thresholds``.
 
-        for j in range(i + 1, len(open_array)):
-            if high_array[j] > upper_threshold:
-                breaches.append(1)
-                break
-            if low_array[j] < lower_threshold:
-                breaches.append(0)
-                break
-        else:
-            breaches.append(np.nan)
+    Returns
+    -------
+    str
+        Tag such as ``"ATR_1-2"``, with the stop loss and take profit margin.
 
-    return breaches
+    Raises
+    ------
+    ValueError
+        If the margins do not have exactly one method.
+    """
+    if len(margins) != 1:
+        raise ValueError(
+            f"Margins {margins} of the sweep need exactly one method, either "
+            "'ATR', 'constant' or 'percentage'"
+        )
+    ((method, value),) = margins.items()
+    return f"{method}_{'-'.join(map(str, margin_pair(value)))}"
 
 
-@numba.jit
-def find_first_breakthroughs_ATR(
-    arrays: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray],
-) -> list:
+@numba.jit(parallel=True, cache=True)
+def find_first_breakthroughs(
+    arrays: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    breaches: np.ndarray,
+    bars_to_exit: np.ndarray,
+) -> None:
     """
-    Find the stop loss take profit breakthroughs. Margins are percentage-based and
-    controlled globally.
+    Find the stop loss take profit breakthroughs of every candle, for several
+    margins at once.
+
+    The first ``LINEAR_SCAN_LENGTH`` candles are scanned one by one for all margins
+    together, which is enough for tight margins and stops once the widest one is
+    broken through. Further breakthroughs are searched for on the sparse tables of
+    the high and (negated) low, see ``first_above``, which are shared by the margins.
+    The candles are divided over the threads of numba.
 
     Parameters
     ----------
-    arrays : tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
-        Boolean array of the patterns; open, high and low array; ATR array.
+    arrays : tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+        High and low array; upper and lower threshold of every candle, with one row
+        per margin.
+    breaches : np.ndarray
+        Output of shape ``(margins, candles)``, filled with the evaluation: 0 for
+        bottom breakthrough, 1 for upper, -1 else.
+    bars_to_exit : np.ndarray
+        Output of the same shape, filled with the number of candles until the
+        breakthrough, -1 if there is none.
+    """
 
-    Returns
-    -------
-    list
-        Evaluation: 0 for bottom breakthrough, 1 for upper, ``np.nan`` else.
+    high_array, low_array, upper_thresholds, lower_thresholds = arrays
+    number_margins, n = upper_thresholds.shape
+
+    high_table = max_sparse_table(high_array)
+    low_table = max_sparse_table(-low_array)
+
+    for i in numba.prange(n):
+        breaches[:, i] = -1
+        bars_to_exit[:, i] = -1
+        unresolved = number_margins
+        for j in range(i + 1, min(i + 1 + LINEAR_SCAN_LENGTH, n)):
+            for m in range(number_margins):
+                if bars_to_exit[m, i] != -1:
+                    continue
+                if high_array[j] > upper_thresholds[m, i]:
+                    breaches[m, i] = 1
+                    bars_to_exit[m, i] = j - i
+                    unresolved -= 1
+                elif low_array[j] < lower_thresholds[m, i]:
+                    breaches[m, i] = 0
+                    bars_to_exit[m, i] = j - i
+                    unresolved -= 1
+            if unresolved == 0:
+                break
+        if unresolved > 0:
+            start = i + 1 + LINEAR_SCAN_LENGTH
+            for m in range(number_margins):
+                if bars_to_exit[m, i] != -1:
+                    continue
+                upper = first_above(high_table, start, upper_thresholds[m, i])
+                lower = first_above(low_table, start, -lower_thresholds[m, i])
+                # On a candle that breaks through both margins, the upper one counts.
+                if upper <= lower and upper < n:
+                    breaches[m, i] = 1
+                    bars_to_exit[m, i] = upper - i
+                elif lower < n:
+                    breaches[m, i] = 0
+                    bars_to_exit[m, i] = lower - i
+
+
+@numba.jit(parallel=True, cache=True)
+def max_sparse_table(values: np.ndarray) -> np.ndarray:
     """
+    Sparse table of the maxima of ``values``.
 
-    bool_array, open_array, high_array, low_array, ATR_array = arrays
+    Row ``k`` holds the maximum of the ``2**k`` values starting at every index, as
+    far as they fit. NaNs are ignored, like in ``np.fmax``.
 
-    breaches = []
-    true_indices = np.flatnonzero(bool_array)
+    Parameters
+    ----------
+    values : np.ndarray
+        Array to take the maxima of.
+
+    Returns
+    -------
+    np.ndarray
+        Sparse table of shape ``(levels, len(values))``.
+    """
+    n = len(values)
+    levels = 1
+    while 1 << levels <= n:
+        levels += 1
+    table = np.full((levels, n), np.nan)
+    table[0] = values
+    for k in range(1, levels):
+        half = 1 << (k - 1)
+        for i in numba.prange(n - (1 << k) + 1):
+            first, second = table[k - 1, i], table[k - 1, i + half]
+            table[k, i] = second if first < second or np.isnan(first) else first
+    return table
+
+
+@numba.jit(cache=True)
+def first_above(table: np.ndarray, start: int, threshold: float) -> int:
+    """
+    First index from ``start`` on with a value above ``threshold``.
 
-    for i in true_indices:
-        start_value = open_array[i]
-        upper_threshold = start_value + ATR_array[i]
-        lower_threshold = start_value - ATR_array[i]
+    Skips the largest blocks of the sparse table that stay at or below the
+    threshold, one level at a time, so a search costs one step per level.
 
-        for j in range(i + 1, len(open_array)):
-            if high_array[j] > upper_threshold:
-                breaches.append(1)
-                break
-            if low_array[j] < lower_threshold:
-                breaches.append(0)
-                break
-        else:
-            breaches.append(np.nan)
+    Parameters
+    ----------
+    table : np.ndarray
+        Sparse table of the values, see ``max_sparse_table``.
+    start : int
+        Index to start the search at.
+    threshold : float
+        The value has to be strictly above the threshold.
 
-    return breaches
+    Returns
+    -------
+    int
+        The index, the number of values if there is none.
+    """
+    levels, n = table.shape
+    position = start
+    for k in range(levels - 1, -1, -1):
+        if position + (1 << k) <= n and not table[k, position] > threshold:
+            position += 1 << k
+    return position
@@ -23,6 +23,7 @@ def folder_setup(
         - 0: pass
         - 1: remake summary
         - 2: rerun from scratch
+        - 3: update with the data appended since the run
 
     Returns
     -------
@@ -52,7 +53,8 @@ def folder_setup(
 
 def handle_existing_run(*, set_mode: int | None = None) -> str:
     """
-    Handle existing runs, ask the user whether to pass, rerun summary or rerun entirely.
+    Handle existing runs, ask the user whether to pass, rerun summary, rerun entirely
+    or update with appended data.
 
     Parameters
     ----------
@@ -61,6 +63,7 @@ def handle_existing_run(*, set_mode: int | None = None) -> str:
         - 0: pass
         - 1: remake summary
         - 2: rerun from scratch
+        - 3: update with the data appended since the run
 
     Returns
     -------
@@ -71,7 +74,8 @@ def handle_existing_run(*, set_mode: int | None = None) -> str:
         mode = int(
             input(
                 "Parameter combination already present, how to proceed?\n"
-                "0: pass, 1: remake summary, 2: rerun from scratch. "
+                "0: pass, 1: remake summary, 2: rerun from scratch, "
+                "3: update with appended data. "
             )
         )
     else:
@@ -80,6 +84,8 @@ def handle_existing_run(*, set_mode: int | None = None) -> str:
         return "pass"
     if mode == 1:
         return "summary"
+    if mode == 3:  # noqa: PLR2004
+        return "update"
     return "rerun"
 
 
@@ -104,12 +110,9 @@ def make_new_folder(
         Rerun mode and unique id.
     """
     random_id = str(uuid.uuid4())[:8]
-    for parent_folder in ["detection", "evaluation"]:
-        for pattern_number in constants.PATTERN_NUMBERS_AS_STRING:
-            folder_path = (
-                f"data/runs/{random_id}_{run_name}/{parent_folder}/{pattern_number}"
-            )
-            os.makedirs(folder_path)
+    os.makedirs(f"data/runs/{random_id}_{run_name}/detection")
+    for pattern_number in constants.PATTERN_NUMBERS_AS_STRING:
+        os.makedirs(f"data/runs/{random_id}_{run_name}/evaluation/{pattern_number}")
     with open(f"data/runs/{random_id}_{run_name}/parameters.txt", "w") as file:
         file.write("#".join(input_parameters_list))
     return ("rerun", random_id)
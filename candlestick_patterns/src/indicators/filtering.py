@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -6,3 +7,28 @@ def filter_indicators(df: pd.DataFrame, *, indicators: dict) -> pd.DataFrame:
     for column, value in indicators.items():
         mask &= df[column] >= value
     return ~mask.reset_index(drop=True)
+
+
+def filter_patterns(
+    pattern: np.ndarray, filter_index: pd.Series | np.ndarray
+) -> np.ndarray:
+    """
+    Removes the patterns on candles excluded by the indicator filter.
+
+    Parameters
+    ----------
+    pattern : np.ndarray
+        Boolean array with the candlestick pattern, or its hit indices.
+    filter_index : pd.Series | np.ndarray
+        Boolean series, True for the candles to exclude, see ``filter_indicators``.
+        Converting it once to an array saves the conversion per pattern.
+
+    Returns
+    -------
+    np.ndarray
+        The filtered pattern, as boolean array or hit indices like the input.
+    """
+    excluded = np.asarray(filter_index, dtype=bool)
+    if np.issubdtype(pattern.dtype, np.integer):
+        return pattern[~excluded[pattern]]
+    return np.logical_and(pattern, ~excluded)
@@ -1,4 +1,6 @@
-from detection import pattern_detection
+from analysis import co_occurrence
+from calibration import calibration
+from detection import pattern_detection, pattern_registry
 from evaluation import cleanup, evaluation
 from folder_setup import folder_setup
 from indicators import indicators
@@ -6,11 +8,13 @@ from reading import read_data
 from shared import constants, shared_functions
 from summary import summary_table
 from trend import trend_calculation
+from update import update
 
 
 def main() -> None:
     with open("logo.txt", encoding="utf-8") as f:
         print(f.read(), end="\n\n")
+    patterns = pattern_registry.select_patterns(constants.PATTERN_SELECTION_KWARGS)
     for filename in constants.FILENAMES:
         for interval_minutes in constants.INTERVAL_MINUTES:
             run_name = (
@@ -32,16 +36,35 @@ def main() -> None:
             if mode == "pass":
                 continue
             if mode == "rerun":
-                main_sets, percentiles_list = read_data.read_and_preprocess(
+                # The calibrations of the sweep are calculated along with the one of
+                # the run, measuring the candles once.
+                grid = [
+                    {
+                        "body": constants.BODY_PERCENTILES,
+                        "shadow": constants.SHADOW_PERCENTILES,
+                    },
+                    *constants.PERCENTILE_GRID,
+                ]
+                main_sets, calibrations = read_data.read_and_preprocess(
                     filename,
                     interval_minutes,
                     constants.START_END_TIME,
                     filter_news_kwargs=constants.FILTER_NEWS_KWARGS,
+                    grid=grid,
                 )
 
-                for n, (main_set, percentiles) in enumerate(
-                    zip(main_sets, percentiles_list, strict=False)
+                sweep_tags = [
+                    calibration.grid_tag(levels) for levels in constants.PERCENTILE_GRID
+                ]
+                for n, (main_set, grid_calibrations) in enumerate(
+                    zip(main_sets, calibrations, strict=False)
                 ):
+                    # A sweep entry equal to the levels of the run has the same tag,
+                    # it is still detected as part of the sweep.
+                    split_calibration = grid_calibrations[calibration.grid_tag(grid[0])]
+                    sweep_calibrations = {
+                        tag: grid_calibrations[tag] for tag in sweep_tags
+                    }
                     main_set_with_trend = trend_calculation.calculate_trend(
                         main_set,
                         averaging_method=constants.TREND_AVERAGING_METHOD,
@@ -55,14 +78,40 @@ def main() -> None:
                         indicator_kwargs=constants.INDICATOR_KWARGS,
                     )
 
+                    if n + 1 == len(main_sets):
+                        update.save_split(
+                            main_set_with_trend,
+                            split_calibration,
+                            run_name=run_name,
+                            split=n + 1,
+                            sweep_calibrations=sweep_calibrations,
+                        )
+
                     pattern_detection.detection(
                         main_set_with_trend,
-                        percentiles,
+                        split_calibration,
                         constants.DATA_GAP_HANDLING,
                         run_name=run_name,
                         filter_kwargs=constants.INDICATOR_FILTER_KWARGS,
                         split=n + 1,
+                        engine=constants.DETECTION_ENGINE,
+                        workers=constants.DETECTION_WORKERS,
+                        patterns=patterns,
+                        storage=constants.DETECTION_STORAGE,
                     )
+                    if sweep_calibrations:
+                        pattern_detection.detection_grid(
+                            main_set_with_trend,
+                            sweep_calibrations,
+                            constants.DATA_GAP_HANDLING,
+                            run_name=run_name,
+                            filter_kwargs=constants.INDICATOR_FILTER_KWARGS,
+                            split=n + 1,
+                            engine=constants.DETECTION_ENGINE,
+                            workers=constants.DETECTION_WORKERS,
+                            patterns=patterns,
+                            storage=constants.DETECTION_STORAGE,
+                        )
 
                     evaluation.stop_loss_take_profit_evaluation(
                         main_set_with_trend,
@@ -70,10 +119,44 @@ def main() -> None:
                         run_name=run_name,
                         split=n + 1,
                     )
-                cleanup.clean(run_name)
+                    if constants.STOP_LOSS_TAKE_PROFIT_MARGIN_GRID:
+                        evaluation.stop_loss_take_profit_sweep(
+                            main_set_with_trend,
+                            constants.STOP_LOSS_TAKE_PROFIT_MARGIN_GRID,
+                            run_name=run_name,
+                            split=n + 1,
+                        )
+                cleanup.clean(run_name, patterns=patterns)
                 print()
+            if mode == "update" and not update.update_run(
+                filename,
+                interval_minutes,
+                constants.START_END_TIME,
+                run_name=run_name,
+                settings={
+                    "warm_up": constants.UPDATE_WARM_UP,
+                    "trend_kwargs": {
+                        "averaging_method": constants.TREND_AVERAGING_METHOD,
+                        "averaging_kwargs": constants.TREND_AVERAGING_METHOD_KWARGS,
+                        "decision_method": constants.TREND_DECISION_METHOD,
+                        "decision_kwargs": constants.TREND_DECISION_METHOD_KWARGS,
+                    },
+                    "indicator_kwargs": constants.INDICATOR_KWARGS,
+                    "data_gap_handling": constants.DATA_GAP_HANDLING,
+                    "filter_kwargs": constants.INDICATOR_FILTER_KWARGS,
+                    "engine": constants.DETECTION_ENGINE,
+                    "workers": constants.DETECTION_WORKERS,
+                    "margins": constants.STOP_LOSS_TAKE_PROFIT_MARGINS,
+                    "margin_grid": constants.STOP_LOSS_TAKE_PROFIT_MARGIN_GRID,
+                },
+                patterns=patterns,
+            ):
+                print("No data appended since the run.")
 
-            summary_table.make_summaries(run_name=run_name)
+            co_occurrence.co_occurrence_analysis(
+                run_name=run_name, lags=constants.CO_OCCURRENCE_LAGS
+            )
+            summary_table.make_summaries(run_name=run_name, patterns=patterns)
 
 
 if __name__ == "__main__":
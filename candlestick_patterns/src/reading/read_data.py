@@ -13,6 +13,8 @@ def read_and_preprocess(
     filename: str,
     interval_minutes: int,
     start_end_time: tuple[str, str],
+    *,
+    grid: list[dict] | None = None,
 ) -> pd.DataFrame | tuple:
     """
     Read the data from disk and perform some basic operations on it.
@@ -39,18 +41,70 @@ def read_and_preprocess(
             Which impact levels to include.
         - ``minutes_after`` : int, default 60:
             How many minutes of data to include after a news event.
+    grid : list[dict] | None, optional, default None
+        Levels of the percentiles of a sweep, see ``calibration.percentile_grid``.
 
     Returns
     -------
     pd.DataFrame
         The main dataset (starting 01/01/2007) or according to the rules of `split_data`
         with datetime index and "gap" column.
-    tuple
-        A tuple with the 10th/30th/70th percentiles of the real body (split between
-        black and white if it fails the Kolmogorov-Smirnov test);
-        10th/30th/70th/90th percentiles for upper and lower shadow length, respectively.
+    dict
+        The calibration of every main set, with the thresholds from the
+        10th/30th/70th percentiles of the real body (split between black and white if
+        it fails the Kolmogorov-Smirnov test); 10th/30th/70th/90th percentiles for
+        upper and lower shadow length, respectively, see
+        ``calibration.resolve_calibration``. With a ``grid``, a dict with the
+        calibration of all levels of the percentiles by tag instead.
     """
 
+    aggregated_df = read_and_aggregate(filename, interval_minutes, start_end_time)
+
+    tscv = TimeSeriesSplit()
+    all_splits = list(tscv.split(aggregated_df))
+    main_sets_idx = [test for _, test in all_splits]
+    init_set, _ = list(all_splits)[0]
+    reference_sets_idx = [init_set, *main_sets_idx[:-1]]
+    main_sets = [aggregated_df.iloc[x] for x in main_sets_idx]
+    reference_sets = [aggregated_df.iloc[x] for x in reference_sets_idx]
+
+    if grid is not None:
+        calibrations = [
+            calibration.percentile_grid(reference_set.to_numpy(), grid)
+            for reference_set in reference_sets
+        ]
+    else:
+        calibrations = [
+            calibration.resolve_calibration(
+                calibration.calculate_percentiles(reference_set.to_numpy())
+            )
+            for reference_set in reference_sets
+        ]
+
+    return main_sets, calibrations
+
+
+def read_and_aggregate(
+    filename: str, interval_minutes: int, start_end_time: tuple[str, str]
+) -> pd.DataFrame:
+    """
+    Read the data from disk, filter it to market time, aggregate it and calculate the
+    gaps, see ``read_and_preprocess``.
+
+    Parameters
+    ----------
+    filename : str
+        Filename of the data to read on disk.
+    interval_minutes : int
+        Number of minutes over which the data will be aggregated.
+    start_end_time : tuple[str]
+        Start and end time of the filtering operation.
+
+    Returns
+    -------
+    pd.DataFrame
+        Aggregated OHLC data with datetime index and "gap" column.
+    """
     ohlc_df = pd.read_parquet(f"data/raw/{filename}.parquet")
     ohlc_df["datetime"] = pd.to_datetime(ohlc_df["datetime"])
     datetime_ohlc_df = ohlc_df.set_index("datetime")
@@ -77,20 +131,7 @@ def read_and_preprocess(
         aggregated_df["gap"] - aggregated_df["gap"].shift(1)
     ) // 60 > interval_minutes
 
-    tscv = TimeSeriesSplit()
-    all_splits = list(tscv.split(aggregated_df))
-    main_sets_idx = [test for _, test in all_splits]
-    init_set, _ = list(all_splits)[0]
-    reference_sets_idx = [init_set, *main_sets_idx[:-1]]
-    main_sets = [aggregated_df.iloc[x] for x in main_sets_idx]
-    reference_sets = [aggregated_df.iloc[x] for x in reference_sets_idx]
-
-    percentiles_list = [
-        calibration.calculate_percentiles(reference_set.to_numpy())
-        for reference_set in reference_sets
-    ]
-
-    return main_sets, percentiles_list
+    return aggregated_df
 
 
 def calculate_missing(df: pd.DataFrame, time_idx: pd.DatetimeIndex) -> str:
@@ -44,6 +44,10 @@ INDICATOR_COLUMNS = [
 # empirical research, https://doi.org/10.1007/3-540-31314-1_64
 BODY_PERCENTILES = [10, 30, 70]
 SHADOW_PERCENTILES = [10, 30, 70, 90]
+# Calibrations of the percentile sweep, every one with "body" and "shadow" percentiles
+# like the ones above. Patterns are detected for every calibration as well, measuring
+# the candles once, and stored per calibration in the sweep folder of the run.
+PERCENTILE_GRID = []
 
 
 # Amount of years of data necessary for a dataset to be considered "of proper length".
@@ -108,8 +112,38 @@ TREND_DECISION_DEFAULTS = {
 }
 # How to handle gaps in the data
 DATA_GAP_HANDLING = "exclude"
+# Patterns to detect, evaluate and summarize, empty selects all patterns. Options are
+# lists of names, families, number_candles and globs (wildcards on the name), e.g.
+# {"number_candles": [3], "globs": ["*_no_trend"]}
+PATTERN_SELECTION_KWARGS = {}
+# Which pattern detection engine to use; options are: functions, numpy, numba, selective
+# numpy and numba evaluate the pattern definitions in detection/patterns/pattern_specs
+# as one plan that shares sub-expressions between patterns; numba compiles the plan into
+# a single kernel, which takes a few seconds once per run. selective evaluates the
+# conditions of each pattern in order of their selectivity on the data, each only on the
+# candles that passed the previous ones.
+DETECTION_ENGINE = "functions"
+# Number of threads used for pattern detection, 1 detects serially
+DETECTION_WORKERS = 1
+# How detected patterns are stored; options are: hits, packed
+# hits stores the indices of the candles with a pattern and is smallest for rare
+# patterns, packed stores one bit per candle.
+DETECTION_STORAGE = "hits"
 # Margins of the stop_loss_take_profit evaluation.
 STOP_LOSS_TAKE_PROFIT_MARGINS = {"ATR": None}
+# Margins of the margin sweep, every one like the margins above. The value is either
+# one margin on both sides or a (stop loss, take profit) pair, ATR values multiply
+# the ATR. Patterns are evaluated for all margins in one pass and their win rates
+# stored per split in the sweep folder of the run, e.g.
+# [{"ATR": 0.5}, {"ATR": 1.5}, {"ATR": (1, 2)}, {"percentage": 0.1}]
+STOP_LOSS_TAKE_PROFIT_MARGIN_GRID = []
+# Bars before the appended ones on which the trend and indicators are recalculated
+# when updating a run: at least this many bars and trading days, so that the moving
+# averages and daily volumes no longer depend on the bars before them.
+UPDATE_WARM_UP = {"bars": 2000, "days": 10}
+# Numbers of bars between two patterns for which the co-occurrence analysis counts how
+# often they occur together, 0 being the same bar.
+CO_OCCURRENCE_LAGS = [0, 1, 2, 3, 4, 5]
 
 # Dict that is included in parameters.txt
 SHARED_PARAMS_DICT = {
@@ -123,4 +157,5 @@ SHARED_PARAMS_DICT = {
     "trend_decision_method_kwargs": TREND_DECISION_METHOD_KWARGS,
     "data_gap_handling": DATA_GAP_HANDLING,
     "stop_loss_take_profit_margins": STOP_LOSS_TAKE_PROFIT_MARGINS,
+    "pattern_selection_kwargs": PATTERN_SELECTION_KWARGS,
 }
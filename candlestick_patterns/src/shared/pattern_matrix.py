@@ -0,0 +1,314 @@
+import hashlib
+import json
+
+import numpy as np
+
+# File layout: magic bytes, the length of the header, a JSON header with the pattern
+# names and the patterns in one of two layouts:
+#
+# * "packed": bit-packed patterns, one row of ``ceil(number of bars / 8)`` bytes per
+#   pattern;
+# * "hits": the sorted indices of the candles with a pattern (hit indices), of all
+#   patterns one after the other, with the offset of every pattern in the header.
+#
+# The data starts on a multiple of ``ALIGNMENT`` bytes so it can be memory mapped as
+# is. The header also lists the alias of every pattern, see ``pattern_aliases``.
+MAGIC = b"PATTERNS"
+HEADER_LENGTH_BYTES = 8
+ALIGNMENT = 64
+LAYOUTS = ["packed", "hits"]
+
+
+def write_pattern_matrix(  # noqa: PLR0913
+    path: str,
+    packed_patterns: np.ndarray,
+    *,
+    numbers: list[str],
+    names: list[str],
+    number_bars: int,
+    aliases: list[int] | None = None,
+) -> None:
+    """
+    Writes bit-packed patterns to disk.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+    packed_patterns : np.ndarray
+        Array of shape (number of patterns, ``ceil(number_bars / 8)``) with the
+        patterns packed by ``np.packbits``, one row per pattern.
+    numbers : list[str]
+        Number of candles of every pattern, as in
+        ``constants.PATTERN_NUMBERS_AS_STRING``.
+    names : list[str]
+        Function name of every pattern.
+    number_bars : int
+        Number of bars (candles) of the unpacked patterns.
+    aliases : list[int] | None, optional, default None
+        Alias of every pattern, see ``pattern_aliases``, every pattern is its own
+        alias if None.
+    """
+    _write(
+        path,
+        {
+            "layout": "packed",
+            "number_bars": number_bars,
+            "numbers": numbers,
+            "names": names,
+            "aliases": aliases or list(range(len(names))),
+        },
+        np.ascontiguousarray(packed_patterns, dtype=np.uint8),
+    )
+
+
+def write_hit_indices(  # noqa: PLR0913
+    path: str,
+    hit_indices: list[np.ndarray],
+    *,
+    numbers: list[str],
+    names: list[str],
+    number_bars: int,
+    aliases: list[int] | None = None,
+) -> None:
+    """
+    Writes the hit indices of patterns to disk, the size of the file scales with the
+    number of detected patterns rather than the number of bars.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+    hit_indices : list[np.ndarray]
+        Sorted indices of the candles with a pattern, one array per pattern.
+    numbers : list[str]
+        Number of candles of every pattern, as in
+        ``constants.PATTERN_NUMBERS_AS_STRING``.
+    names : list[str]
+        Function name of every pattern.
+    number_bars : int
+        Number of bars (candles) of the patterns.
+    aliases : list[int] | None, optional, default None
+        Alias of every pattern, see ``pattern_aliases``, every pattern is its own
+        alias if None.
+    """
+    dtype = hit_dtype(number_bars)
+    _write(
+        path,
+        {
+            "layout": "hits",
+            "number_bars": number_bars,
+            "numbers": numbers,
+            "names": names,
+            "dtype": np.dtype(dtype).name,
+            "offsets": np.cumsum([0, *map(len, hit_indices)]).tolist(),
+            "aliases": aliases or list(range(len(names))),
+        },
+        np.concatenate([np.zeros(0, dtype=dtype), *hit_indices]).astype(dtype),
+    )
+
+
+def pattern_aliases(hit_indices: list[np.ndarray]) -> list[int]:
+    """
+    Finds the patterns with the same hits as an earlier one, by hashing them.
+
+    Parameters
+    ----------
+    hit_indices : list[np.ndarray]
+        Sorted indices of the candles with a pattern, one array per pattern.
+
+    Returns
+    -------
+    list[int]
+        Position of the first pattern with the same hits, for every pattern. A
+        pattern without hits or an earlier equal one is its own alias.
+    """
+    first_positions = {}
+    aliases = []
+    for i, pattern_hits in enumerate(hit_indices):
+        key = hashlib.blake2b(np.asarray(pattern_hits, dtype=np.int64).tobytes())
+        first = first_positions.setdefault(key.digest(), i) if len(pattern_hits) else i
+        aliases.append(first if np.array_equal(pattern_hits, hit_indices[first]) else i)
+    return aliases
+
+
+def _write(path: str, header: dict, data: np.ndarray) -> None:
+    header = json.dumps(header).encode()
+    data_offset = len(MAGIC) + HEADER_LENGTH_BYTES + len(header)
+    header += b" " * (-data_offset % ALIGNMENT)
+    with open(path, "wb") as file:
+        file.write(MAGIC)
+        file.write(len(header).to_bytes(HEADER_LENGTH_BYTES, "little"))
+        file.write(header)
+        file.write(data.tobytes())
+
+
+def read_pattern_matrix(path: str) -> tuple[dict, np.ndarray]:
+    """
+    Memory maps patterns written by ``write_pattern_matrix`` or
+    ``write_hit_indices``.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+
+    Returns
+    -------
+    tuple[dict, np.ndarray]
+        Header with ``layout``, ``number_bars``, ``numbers``, ``names`` and
+        ``aliases``; read-only memory map of the data: the packed patterns, one row
+        per pattern, or the hit indices of all patterns. Use ``pattern_hits`` or
+        ``pattern_mask`` to read a single pattern in either layout.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a pattern matrix.
+    """
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a pattern matrix.")
+        header_length = int.from_bytes(file.read(HEADER_LENGTH_BYTES), "little")
+        header = json.loads(file.read(header_length))
+    header.setdefault("layout", "packed")
+    header.setdefault("aliases", list(range(len(header["names"]))))
+    offset = len(MAGIC) + HEADER_LENGTH_BYTES + header_length
+    if header["layout"] == "hits":
+        return header, np.memmap(
+            path,
+            dtype=header["dtype"],
+            mode="r",
+            offset=offset,
+            shape=(header["offsets"][-1],),
+        )
+    packed_patterns = np.memmap(
+        path,
+        dtype=np.uint8,
+        mode="r",
+        offset=offset,
+        shape=(len(header["names"]), -(-header["number_bars"] // 8)),
+    )
+    return header, packed_patterns
+
+
+def pattern_hits(header: dict, data: np.ndarray, index: int) -> np.ndarray:
+    """
+    Reads the hit indices of a single pattern.
+
+    Parameters
+    ----------
+    header : dict
+        Header, see ``read_pattern_matrix``.
+    data : np.ndarray
+        Memory mapped data, see ``read_pattern_matrix``.
+    index : int
+        Position of the pattern in ``header["names"]``.
+
+    Returns
+    -------
+    np.ndarray
+        Sorted indices of the candles with the pattern, without copying the data of
+        the "hits" layout.
+    """
+    if header["layout"] == "hits":
+        offsets = header["offsets"]
+        return np.asarray(data[offsets[index] : offsets[index + 1]])
+    return np.flatnonzero(unpack_pattern(data[index], header["number_bars"]))
+
+
+def pattern_mask(header: dict, data: np.ndarray, index: int) -> np.ndarray:
+    """
+    Reads a single pattern as a boolean array.
+
+    Parameters
+    ----------
+    header : dict
+        Header, see ``read_pattern_matrix``.
+    data : np.ndarray
+        Memory mapped data, see ``read_pattern_matrix``.
+    index : int
+        Position of the pattern in ``header["names"]``.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean array with the pattern.
+    """
+    if header["layout"] == "hits":
+        return hits_to_mask(pattern_hits(header, data, index), header["number_bars"])
+    return unpack_pattern(data[index], header["number_bars"])
+
+
+def unpack_pattern(packed_pattern: np.ndarray, number_bars: int) -> np.ndarray:
+    """
+    Unpacks a single pattern.
+
+    Parameters
+    ----------
+    packed_pattern : np.ndarray
+        Row of the packed patterns.
+    number_bars : int
+        Number of bars (candles).
+
+    Returns
+    -------
+    np.ndarray
+        Boolean array with the pattern.
+    """
+    return np.unpackbits(packed_pattern, count=number_bars).view(bool)
+
+
+def hit_dtype(number_bars: int) -> type:
+    """
+    Smallest integer type that holds the hit indices.
+
+    Parameters
+    ----------
+    number_bars : int
+        Number of bars (candles).
+
+    Returns
+    -------
+    type
+        ``np.int32`` or ``np.int64``.
+    """
+    return np.int32 if number_bars <= np.iinfo(np.int32).max else np.int64
+
+
+def mask_to_hits(pattern: np.ndarray) -> np.ndarray:
+    """
+    Converts a boolean pattern to hit indices.
+
+    Parameters
+    ----------
+    pattern : np.ndarray
+        Boolean array with the pattern.
+
+    Returns
+    -------
+    np.ndarray
+        Sorted indices of the candles with the pattern.
+    """
+    return np.flatnonzero(pattern).astype(hit_dtype(len(pattern)))
+
+
+def hits_to_mask(hit_indices: np.ndarray, number_bars: int) -> np.ndarray:
+    """
+    Converts hit indices to a boolean pattern.
+
+    Parameters
+    ----------
+    hit_indices : np.ndarray
+        Indices of the candles with the pattern.
+    number_bars : int
+        Number of bars (candles).
+
+    Returns
+    -------
+    np.ndarray
+        Boolean array with the pattern.
+    """
+    pattern = np.zeros(number_bars, dtype=bool)
+    pattern[hit_indices] = True
+    return pattern
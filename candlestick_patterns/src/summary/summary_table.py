@@ -3,12 +3,12 @@ import os
 import numpy as np
 import pandas as pd
 from scipy.stats import false_discovery_control
-from word2number import w2n
 
-from shared import constants
+from detection import pattern_registry
+from shared import constants, pattern_matrix
 
 
-def make_summary_table(*, run_name: str) -> None:
+def make_summary_table(*, run_name: str, patterns: list[dict] | None = None) -> None:
     """
     Aggregates data into a summary table. The following data is included:
     - Pattern name
@@ -18,74 +18,95 @@ def make_summary_table(*, run_name: str) -> None:
     - Win rate
     - binomial tests: "greater", "less"
     - Significance (``***``/``**``/``*``)
+    - Pattern it is an alias of, if it has the same hits in every split
+
+    Aliases are left out of the multiple testing correction and get the adjusted p
+    value of the pattern they are an alias of.
 
     Parameters
     ----------
     filename : str
         Filename of the output ``.csv`` file.
+    patterns : list[dict] | None, optional, default None
+        Patterns to summarize, the patterns of the run if None, see
+        ``pattern_registry.run_patterns``.
 
     Returns
     -------
     None
         ``filename.csv`` to disk.
     """
+    if patterns is None:
+        patterns = pattern_registry.run_patterns(run_name)
+    aliases = run_aliases(run_name=run_name, patterns=patterns)
     dataframe_rows = []
 
-    for number_str in constants.PATTERN_NUMBERS_AS_STRING:
-        for pattern in os.listdir(f"data/runs/{run_name}/evaluation/{number_str}"):
-            if not pattern.endswith("evaluation.csv"):
-                continue
+    for pattern in patterns:
+        ser = pd.Series()
 
-            ser = pd.Series()
+        obs_win_rate, null_win_rate, p_value, number_detected = pd.read_csv(
+            f"data/runs/{run_name}/evaluation/{pattern['number']}/"
+            f"{pattern['name']}_evaluation.csv",
+            header=None,
+        ).iloc[0]
 
-            obs_win_rate, null_win_rate, p_value, number_detected = pd.read_csv(
-                f"data/runs/{run_name}/evaluation/{number_str}/{pattern}",
-                header=None,
-            ).iloc[0]
+        ser["Pattern"], ser["Number of candlesticks"], ser["Number detected"] = (
+            pattern["name"].replace("_", " ").strip(),
+            pattern["number_candles"],
+            number_detected,
+        )
 
-            pattern_no_ext = pattern.removesuffix("evaluation.csv")
-            ser["Pattern"], ser["Number of candlesticks"], ser["Number detected"] = (
-                f"{pattern_no_ext.replace('_', ' ').strip()}",
-                w2n.word_to_num(number_str),
-                number_detected,
-            )
+        if any(x in str(obs_win_rate) for x in ["+", "-"]):
+            plus_minus = obs_win_rate[-1]
+            obs_win_rate = float(obs_win_rate[:-1])
+        else:
+            plus_minus = ""
+        if any(x in str(null_win_rate) for x in ["+", "-"]):
+            plus_minus = null_win_rate[-1]
+            null_win_rate = float(null_win_rate[:-1])
 
-            if any(x in str(obs_win_rate) for x in ["+", "-"]):
-                plus_minus = obs_win_rate[-1]
-                obs_win_rate = float(obs_win_rate[:-1])
-            else:
-                plus_minus = ""
-            if any(x in str(null_win_rate) for x in ["+", "-"]):
-                plus_minus = null_win_rate[-1]
-                null_win_rate = float(null_win_rate[:-1])
-
-            ser["Observed win rate"] = obs_win_rate
-            ser["Null win rate"] = null_win_rate
-            ser["p value"] = p_value
-
-            if plus_minus == "-":
-                ser["Signal type"] = "Sell"
-            elif plus_minus == "+":
-                ser["Signal type"] = "Buy"
-            else:
-                ser["Signal type"] = ""
-
-            if ser["Observed win rate"] != "/" and ser["Null win rate"] not in [
-                "/",
-                0,
-                1,
-            ]:
-                ser["Adjusted z-score"] = (
-                    (obs_win_rate - null_win_rate)
-                    / (null_win_rate * (1 - null_win_rate))
-                    * np.sqrt(number_detected)
-                    * min(np.log(number_detected), np.log(5000))
-                )
-            else:
-                ser["Adjusted z-score"] = 0
-            dataframe_rows.append(ser)
+        ser["Observed win rate"] = obs_win_rate
+        ser["Null win rate"] = null_win_rate
+        ser["p value"] = p_value
+
+        if plus_minus == "-":
+            ser["Signal type"] = "Sell"
+        elif plus_minus == "+":
+            ser["Signal type"] = "Buy"
+        else:
+            ser["Signal type"] = ""
+
+        if ser["Observed win rate"] != "/" and ser["Null win rate"] not in [
+            "/",
+            0,
+            1,
+        ]:
+            ser["Adjusted z-score"] = (
+                (obs_win_rate - null_win_rate)
+                / (null_win_rate * (1 - null_win_rate))
+                * np.sqrt(number_detected)
+                * min(np.log(number_detected), np.log(5000))
+            )
+        else:
+            ser["Adjusted z-score"] = 0
+        ser["Alias of"] = (
+            aliases[pattern["name"]].replace("_", " ").strip()
+            if aliases[pattern["name"]] != pattern["name"]
+            else ""
+        )
+        dataframe_rows.append(ser)
     data = pd.DataFrame(dataframe_rows)
-    data["p value"] = false_discovery_control(data["p value"], method="by")
+    representative = data["Alias of"] == ""
+    adjusted_p_values = dict(
+        zip(
+            data.loc[representative, "Pattern"],
+            false_discovery_control(data.loc[representative, "p value"], method="by"),
+            strict=True,
+        )
+    )
+    data["p value"] = (
+        data["Pattern"].where(representative, data["Alias of"]).map(adjusted_p_values)
+    )
     data["Significance"] = ""
     data.loc[data["p value"] < constants.ONE_STAR_SIGNIFICANCE, "Significance"] = "*"
     data.loc[data["p value"] < constants.TWO_STAR_SIGNIFICANCE, "Significance"] = "**"
@@ -95,6 +116,43 @@ def make_summary_table(*, run_name: str) -> None:
     data.to_csv(f"data/runs/{run_name}/summary.csv", index=False)
 
 
+def run_aliases(*, run_name: str, patterns: list[dict]) -> dict[str, str]:
+    """
+    Finds the patterns with the same hits as an earlier pattern in every split of a
+    run, from the aliases in the detection files, see
+    ``pattern_matrix.pattern_aliases``.
+
+    Parameters
+    ----------
+    run_name : str
+        The run name.
+    patterns : list[dict]
+        Patterns of the run.
+
+    Returns
+    -------
+    dict[str, str]
+        Function name of the first pattern with the same hits in every split, by
+        function name. A pattern without one is its own alias.
+    """
+    representatives = {pattern["name"]: [] for pattern in patterns}
+    folder = f"data/runs/{run_name}/detection"
+    for file in sorted(os.listdir(folder)):
+        if not file.endswith(".patterns"):
+            continue
+        header, _ = pattern_matrix.read_pattern_matrix(f"{folder}/{file}")
+        positions = {name: i for i, name in enumerate(header["names"])}
+        for name, split_representatives in representatives.items():
+            split_representatives.append(
+                header["names"][header["aliases"][positions[name]]]
+            )
+    first_names = {}
+    return {
+        name: first_names.setdefault(tuple(split_representatives), name)
+        for name, split_representatives in representatives.items()
+    }
+
+
 def make_meta_summary(*, run_name: str) -> None:
     """
     Make meta summary of best buy/sell patterns, most profitable pattern, number
@@ -121,7 +179,7 @@ def make_meta_summary(*, run_name: str) -> None:
     ).sum()
     low_count_signals = (data["Number detected"] == 0).sum()
     non_significant_signals = (
-        constants.TOTAL_NUMBER_OF_PATTERNS
+        len(data)
         - significant_buy_signals
         - significant_sell_signals
         - low_count_signals
@@ -205,7 +263,7 @@ def make_meta_summary(*, run_name: str) -> None:
     meta.to_csv(f"data/runs/{run_name}/meta_summary.csv", header=False)
 
 
-def make_summaries(*, run_name: str) -> None:
+def make_summaries(*, run_name: str, patterns: list[dict] | None = None) -> None:
     """
     Make the summary tables and aggregate the indicators.
 
@@ -213,6 +271,9 @@ def make_summaries(*, run_name: str) -> None:
     ----------
     run_name : str
         The run name.
+    patterns : list[dict] | None, optional, default None
+        Patterns to summarize, the patterns of the run if None, see
+        ``pattern_registry.run_patterns``.
     """
-    make_summary_table(run_name=run_name)
+    make_summary_table(run_name=run_name, patterns=patterns)
     make_meta_summary(run_name=run_name)
@@ -1,3 +1,6 @@
+import itertools
+from collections import deque
+
 import numpy as np
 import pandas as pd
 
@@ -260,3 +263,424 @@ def calculate_trend(
         del df["rolling_average"]
 
     return df
+
+
+def update_moving_average(
+    state: dict, close: float, *, averaging_kwargs: dict
+) -> float:
+    """
+    Streaming version of ``moving_average``, updated with the next close.
+
+    Follows the running sums of ``pd.Series.rolling().mean()``, including its
+    compensated summation, so the result is identical to the batch version.
+
+    Parameters
+    ----------
+    state : dict
+        Averaging state, see ``trend_state``. Updated in place.
+    close : float
+        Close of the next bar.
+    averaging_kwargs : dict
+        ``window``: window of the average.
+
+    Returns
+    -------
+    float
+        Moving average up to and including the bar.
+    """
+    window = averaging_kwargs["window"]
+    closes = state["closes"]
+    if window == 1 or not closes:
+        state.update(
+            nobs=0, sum=0.0, neg_ct=0, add_compensation=0.0, remove_compensation=0.0
+        )
+        state.update(same_ct=0, previous=close)
+    elif len(closes) == window:
+        removed = closes[0]
+        if not np.isnan(removed):
+            state["nobs"] -= 1
+            y = -removed - state["remove_compensation"]
+            t = state["sum"] + y
+            state["remove_compensation"] = t - state["sum"] - y
+            state["sum"] = t
+            state["neg_ct"] -= int(np.signbit(removed))
+    closes.append(close)
+    if not np.isnan(close):
+        state["nobs"] += 1
+        y = close - state["add_compensation"]
+        t = state["sum"] + y
+        state["add_compensation"] = t - state["sum"] - y
+        state["sum"] = t
+        state["neg_ct"] += int(np.signbit(close))
+        state["same_ct"] = state["same_ct"] + 1 if close == state["previous"] else 1
+        state["previous"] = close
+
+    nobs = state["nobs"]
+    if nobs < window:
+        return np.nan
+    if state["same_ct"] >= nobs:
+        return state["previous"]
+    average = state["sum"] / nobs
+    if (state["neg_ct"] == 0 and average < 0) or (
+        state["neg_ct"] == nobs and average > 0
+    ):
+        return 0.0
+    return average
+
+
+def update_weighted_moving_average(
+    state: dict, close: float, *, averaging_kwargs: dict
+) -> float:
+    """
+    Streaming version of ``weighted_moving_average``, updated with the next close.
+
+    Parameters
+    ----------
+    state : dict
+        Averaging state, see ``trend_state``. Updated in place.
+    close : float
+        Close of the next bar.
+    averaging_kwargs : dict
+        ``window``: window of the average.
+
+    Returns
+    -------
+    float
+        Weighted moving average up to and including the bar.
+    """
+    window = averaging_kwargs["window"]
+    closes = state["closes"]
+    closes.append(close)
+    x = np.array(closes)
+    if len(x) < window or np.isnan(x).any():
+        return np.nan
+    weights = np.arange(window, 0, -1)
+    return np.sum(weights * x) / np.sum(weights)
+
+
+def update_exponential_moving_average(
+    state: dict, close: float, *, averaging_kwargs: dict
+) -> float:
+    """
+    Streaming version of ``exponential_moving_average``, updated with the next
+    close.
+
+    Follows the recursion of ``pd.Series.ewm().mean()``, so the result is identical
+    to the batch version.
+
+    Parameters
+    ----------
+    state : dict
+        Averaging state, see ``trend_state``. Updated in place.
+    close : float
+        Close of the next bar.
+    averaging_kwargs : dict
+        ``window``: span of the average.
+
+    Returns
+    -------
+    float
+        Exponential moving average up to and including the bar.
+    """
+    old_weight_factor = 1 - 1 / (1 + (averaging_kwargs["window"] - 1) / 2)
+    is_observation = not np.isnan(close)
+    if "average" not in state:
+        state.update(average=close, old_weight=1.0, nobs=int(is_observation))
+    else:
+        state["nobs"] += is_observation
+        average = state["average"]
+        if not np.isnan(average):
+            state["old_weight"] *= old_weight_factor
+            if is_observation:
+                if average != close:
+                    average = state["old_weight"] * average + close
+                    state["average"] = average / (state["old_weight"] + 1)
+                state["old_weight"] += 1
+        elif is_observation:
+            state["average"] = close
+    return state["average"] if state["nobs"] >= 1 else np.nan
+
+
+def update_monotonic(
+    state: dict, bar: dict, average: float, *, decision_kwargs: dict
+) -> float:
+    """
+    Streaming version of ``monotonic``.
+
+    Parameters
+    ----------
+    state : dict
+        Decision state, see ``trend_state``. Updated in place.
+    bar : dict
+        OHLC data of the next bar.
+    average : float
+        Average up to and including the bar.
+    decision_kwargs : dict
+        ``span``: span over which the monotonicity is checked.
+
+    Returns
+    -------
+    float
+        1 if is strictly increasing, -1 if strictly decreasing, 0 otherwise, NaN
+        before the span is complete.
+    """
+    averages = state["averages"]
+    averages.append(average)
+    if len(averages) < decision_kwargs["span"] or any(map(np.isnan, averages)):
+        return np.nan
+    steps = list(itertools.pairwise(averages))
+    if steps and all(y > x for x, y in steps):
+        return 1.0
+    if steps and all(y < x for x, y in steps):
+        return -1.0
+    return 0.0
+
+
+def update_counting(
+    state: dict, bar: dict, average: float, *, decision_kwargs: dict
+) -> float:
+    """
+    Streaming version of ``counting``.
+
+    Parameters
+    ----------
+    state : dict
+        Decision state, see ``trend_state``. Updated in place.
+    bar : dict
+        OHLC data of the next bar.
+    average : float
+        Average up to and including the bar.
+    decision_kwargs : dict
+        ``span``: span over which in/decreases are counted.
+        ``fraction``: controls which fraction of ``span`` has to be in/decreases for it
+        to count.
+
+    Returns
+    -------
+    float
+        1 if ``fraction`` of the ``span`` is increasing, -1 if decreasing, 0 otherwise.
+    """
+    span = decision_kwargs["span"]
+    threshold = span * decision_kwargs["fraction"]
+    signs = state["signs"]
+    signs.append(np.sign(average - state.get("average", np.nan)))
+    state["average"] = average
+    if len(signs) < span or np.isnan(signs).any():
+        return 0.0
+    if np.count_nonzero(np.array(signs) > 0) >= threshold:
+        return 1.0
+    if np.count_nonzero(np.array(signs) < 0) >= threshold:
+        return -1.0
+    return 0.0
+
+
+def update_high_low(
+    state: dict, bar: dict, average: float, *, decision_kwargs: dict
+) -> float:
+    """
+    Streaming version of ``high_low``.
+
+    Parameters
+    ----------
+    state : dict
+        Decision state, see ``trend_state``. Updated in place.
+    bar : dict
+        OHLC data of the next bar.
+    average : float
+        Unused, only present for compatibility reasons.
+    decision_kwargs : dict
+        Unused, only present for compatibility reasons.
+
+    Returns
+    -------
+    float
+        -1 for simultaneous decrease, 1 for simultaneous increase, 0 otherwise.
+    """
+    previous = state.get("previous")
+    state["previous"] = bar
+    if previous is None:
+        return 0.0
+    H_diff_sign = np.sign(bar["high"] - previous["high"])
+    L_diff_sign = np.sign(bar["low"] - previous["low"])
+    if H_diff_sign == L_diff_sign and H_diff_sign != 0:
+        return float(H_diff_sign)
+    return 0.0
+
+
+def update_PSAR_trend(
+    state: dict, bar: dict, average: float, *, decision_kwargs: dict
+) -> float:
+    """
+    Streaming version of ``PSAR_trend``.
+
+    Parameters
+    ----------
+    state : dict
+        Decision state, see ``trend_state``. Updated in place.
+    bar : dict
+        OHLC data of the next bar.
+    average : float
+        Unused, only present for compatibility reasons.
+    decision_kwargs : dict
+        ``step``: how much the acceleration factor increases by per step.
+        ``max_accel_factor``: maximum possible acceleration factor.
+
+    Returns
+    -------
+    float
+        1 for uptrend, -1 for downtrend, NaN for the first two bars.
+    """
+    step = decision_kwargs["step"]
+    max_accel_factor = decision_kwargs["max_accel_factor"]
+    high, low, i = bar["high"], bar["low"], state.get("i", 0)
+    previous = state.setdefault("previous", [])
+    state["i"] = i + 1
+    if i == 0:
+        state.update(up_trend=True, accel_factor=step, max_high=high, min_low=low)
+    if i < 2:  # noqa: PLR2004
+        state["psar"] = bar["close"]
+        previous.append(bar)
+        return np.nan
+
+    psar = state["psar"]
+    up_trend = state["up_trend"]
+    if up_trend:
+        psar = psar + state["accel_factor"] * (state["max_high"] - psar)
+    else:
+        psar = psar + state["accel_factor"] * (state["min_low"] - psar)
+    reverse = False
+
+    if up_trend:
+        if low < psar:
+            state["up_trend"] = False
+            reverse = True
+            psar = state["max_high"]
+            state["min_low"] = low
+            state["accel_factor"] = step
+
+    elif high > psar:
+        state["up_trend"] = True
+        reverse = True
+        psar = state["min_low"]
+        state["max_high"] = high
+        state["accel_factor"] = step
+
+    if not reverse:
+        if state["up_trend"]:
+            if high > state["max_high"]:
+                state["max_high"] = high
+                state["accel_factor"] = min(
+                    state["accel_factor"] + step, max_accel_factor
+                )
+            psar = min(psar, previous[-1]["low"])
+            psar = min(psar, previous[-2]["low"])
+
+        else:
+            if low < state["min_low"]:
+                state["min_low"] = low
+                state["accel_factor"] = min(
+                    state["accel_factor"] + step, max_accel_factor
+                )
+            psar = max(psar, previous[-1]["high"])
+            psar = max(psar, previous[-2]["high"])
+
+    state["psar"] = psar
+    previous[:] = [previous[-1], bar]
+    return 1.0 if state["up_trend"] else -1.0
+
+
+STREAMING_AVERAGING_METHODS = {
+    "SMA": update_moving_average,
+    "WMA": update_weighted_moving_average,
+    "EMA": update_exponential_moving_average,
+}
+STREAMING_DECISION_METHODS = {
+    "monotonic": update_monotonic,
+    "counting": update_counting,
+    "high_low": update_high_low,
+    "PSAR": update_PSAR_trend,
+}
+
+
+def trend_state(
+    *,
+    averaging_method: str,
+    averaging_kwargs: dict,
+    decision_method: str,
+    decision_kwargs: dict,
+) -> dict:
+    """
+    Sets up the state of ``update_trend``, which calculates the trend bar by bar.
+
+    Parameters
+    ----------
+    averaging_method : str
+        Averaging method, see ``calculate_trend``.
+    averaging_kwargs : dict
+        Kwargs for the averaging method.
+    decision_method : str
+        Decision method, see ``calculate_trend``.
+    decision_kwargs : dict
+        Kwargs for the decision method.
+
+    Returns
+    -------
+    dict
+        State with the methods, their kwargs and the bars they still need.
+    """
+    averaging_kwargs = shared_functions.set_kwarg_defaults(
+        averaging_kwargs,
+        kwargs_to_set=AVERAGING_METHODS,
+        default_dict=constants.TREND_AVERAGING_DEFAULTS,
+    )[averaging_method]
+    decision_kwargs = shared_functions.set_kwarg_defaults(
+        decision_kwargs,
+        kwargs_to_set=DECISION_METHODS,
+        default_dict=constants.TREND_DECISION_DEFAULTS,
+    )[decision_method]
+    return {
+        "averaging_method": averaging_method,
+        "averaging_kwargs": averaging_kwargs,
+        "decision_method": decision_method,
+        "decision_kwargs": decision_kwargs,
+        "averaging": {"closes": deque(maxlen=averaging_kwargs.get("window"))},
+        "decision": {
+            "averages": deque(maxlen=decision_kwargs.get("span")),
+            "signs": deque(maxlen=decision_kwargs.get("span")),
+        },
+    }
+
+
+def update_trend(state: dict, bar: dict) -> float:
+    """
+    Calculates the trend of the next bar, identical to ``calculate_trend`` on all
+    bars so far.
+
+    Only the last bars the methods look back are kept, so every bar takes the same
+    time.
+
+    Parameters
+    ----------
+    state : dict
+        State, see ``trend_state``. Updated in place.
+    bar : dict
+        OHLC data of the next bar.
+
+    Returns
+    -------
+    float
+        Trend of the bar: 1 for up, -1 for down, 0 for no trend and NaN if unknown.
+    """
+    average = np.nan
+    if state["decision_method"] in USES_AVERAGING:
+        average = STREAMING_AVERAGING_METHODS[state["averaging_method"]](
+            state["averaging"],
+            bar["close"],
+            averaging_kwargs=state["averaging_kwargs"],
+        )
+    return STREAMING_DECISION_METHODS[state["decision_method"]](
+        state["decision"],
+        bar,
+        average,
+        decision_kwargs=state["decision_kwargs"],
+    )
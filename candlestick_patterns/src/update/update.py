@@ -0,0 +1,445 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from calibration import calibration
+from detection import compiled_detection, pattern_detection
+from detection.patterns.functions import candlestick_functions as cf
+from evaluation import cleanup, evaluation
+from indicators import indicators
+from reading import read_data
+from shared import pattern_matrix
+from trend import trend_calculation
+
+
+def save_split(
+    df: pd.DataFrame,
+    split_calibration: dict,
+    *,
+    run_name: str,
+    split: int,
+    sweep_calibrations: dict[str, dict] | None = None,
+) -> None:
+    """
+    Stores the last split of a run with its trend and indicators, so that the run can
+    be updated when data is appended to the raw data, see ``update_run``.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The split with OHLC data, "gap", trend and indicators.
+    split_calibration : dict
+        Calibration of the split, see ``calibration.resolve_calibration``.
+    run_name : str
+        The run name.
+    split : int
+        Number of the split.
+    sweep_calibrations : dict[str, dict] | None, optional, default None
+        Calibrations of the percentile sweep of the split by tag, see
+        ``pattern_detection.detection_grid``, stored as ``sweep/{tag}/{split}.json``.
+    """
+    os.makedirs(f"data/runs/{run_name}/update", exist_ok=True)
+    df.to_parquet(f"data/runs/{run_name}/update/{split}.parquet")
+    calibration.save_calibration(
+        f"data/runs/{run_name}/update/{split}.json", split_calibration
+    )
+    for tag, sweep_calibration in (sweep_calibrations or {}).items():
+        os.makedirs(f"data/runs/{run_name}/update/sweep/{tag}", exist_ok=True)
+        calibration.save_calibration(
+            f"data/runs/{run_name}/update/sweep/{tag}/{split}.json", sweep_calibration
+        )
+
+
+def load_split(run_name: str) -> tuple[pd.DataFrame, tuple, int]:
+    """
+    Loads the split stored by ``save_split``.
+
+    Parameters
+    ----------
+    run_name : str
+        The run name.
+
+    Returns
+    -------
+    tuple[pd.DataFrame, tuple, int]
+        The split, its calibration and its number.
+
+    Raises
+    ------
+    ValueError
+        If the run has no stored split.
+    """
+    folder = f"data/runs/{run_name}/update"
+    splits = (
+        [int(file[:-8]) for file in os.listdir(folder) if file.endswith(".parquet")]
+        if os.path.isdir(folder)
+        else []
+    )
+    if not splits:
+        raise ValueError(f"Run {run_name} has no stored split, rerun from scratch.")
+    split = max(splits)
+    return (
+        pd.read_parquet(f"{folder}/{split}.parquet"),
+        calibration.load_calibration(f"{folder}/{split}.json"),
+        split,
+    )
+
+
+def load_sweep_calibrations(run_name: str, split: int) -> dict[str, dict]:
+    """
+    Loads the calibrations of the percentile sweep stored by ``save_split``.
+
+    Parameters
+    ----------
+    run_name : str
+        The run name.
+    split : int
+        Number of the split.
+
+    Returns
+    -------
+    dict[str, dict]
+        Calibration by tag, empty if the run has no percentile sweep.
+    """
+    folder = f"data/runs/{run_name}/update/sweep"
+    if not os.path.isdir(folder):
+        return {}
+    return {
+        tag: calibration.load_calibration(f"{folder}/{tag}/{split}.json")
+        for tag in sorted(os.listdir(folder))
+        if os.path.isfile(f"{folder}/{tag}/{split}.json")
+    }
+
+
+def appended_start(stored_df: pd.DataFrame, aggregated_df: pd.DataFrame) -> int:
+    """
+    Finds where the stored bars and the bars read from disk start to differ.
+
+    Bars differ when they were appended, or when they were missing before, such as
+    the rest of a day that was only partly in the raw data.
+
+    Parameters
+    ----------
+    stored_df : pd.DataFrame
+        The stored bars.
+    aggregated_df : pd.DataFrame
+        The bars read from disk from the first stored bar on, with the same columns.
+
+    Returns
+    -------
+    int
+        Position of the first bar that differs, ``len(aggregated_df)`` if none do.
+
+    Raises
+    ------
+    ValueError
+        If bars were removed rather than appended.
+    """
+    number_bars = min(len(stored_df), len(aggregated_df))
+    stored = stored_df.iloc[:number_bars]
+    read = aggregated_df.iloc[:number_bars]
+    differs = stored.index != read.index
+    for column in aggregated_df.columns:
+        stored_values, read_values = stored[column].to_numpy(), read[column].to_numpy()
+        differs |= (stored_values != read_values) & ~(
+            pd.isna(stored_values) & pd.isna(read_values)
+        )
+    start = int(np.argmax(differs)) if differs.any() else number_bars
+    if start < len(stored_df) and (
+        start == len(aggregated_df)
+        or aggregated_df.index[start] > stored_df.index[start]
+    ):
+        raise ValueError(f"Bar {stored_df.index[start]} is no longer in the data.")
+    return start
+
+
+def warm_up_start(index: pd.DatetimeIndex, start: int, *, warm_up: dict) -> int:
+    """
+    Finds the first bar needed to recalculate the trend and indicators from a bar on.
+
+    Parameters
+    ----------
+    index : pd.DatetimeIndex
+        Index of the bars.
+    start : int
+        Position of the first bar to recalculate.
+    warm_up : dict
+        Minimal number of ``"bars"`` and trading ``"days"`` before the bar, see
+        ``constants.UPDATE_WARM_UP``. The warm-up starts at the start of a day.
+
+    Returns
+    -------
+    int
+        Position of the first bar of the warm-up.
+    """
+    dates = index[: start + 1].normalize()
+    unique_dates = dates.unique()
+    first_date = min(
+        dates[max(start - warm_up["bars"], 0)],
+        unique_dates[max(len(unique_dates) - 1 - warm_up["days"], 0)],
+    )
+    return int(np.searchsorted(dates, first_date))
+
+
+def recalculate_tail(
+    df: pd.DataFrame,
+    start: int,
+    *,
+    warm_up: dict,
+    trend_kwargs: dict,
+    indicator_kwargs: dict,
+) -> pd.DataFrame:
+    """
+    Recalculates the trend and indicators from a bar on, using only the bars of the
+    warm-up before it.
+
+    The moving averages and windows forget the bars before the warm-up, so this
+    matches a calculation on all bars, up to the weight exponential averages and the
+    parabolic SAR give to those bars, which vanishes for a long enough warm-up.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Bars with OHLC data and "gap", with trend and indicators before ``start``.
+    start : int
+        Position of the first bar to recalculate.
+    warm_up : dict
+        Length of the warm-up, see ``warm_up_start``.
+    trend_kwargs : dict
+        Methods and kwargs of ``trend_calculation.calculate_trend``.
+    indicator_kwargs : dict
+        Additional parameters for the indicators.
+
+    Returns
+    -------
+    pd.DataFrame
+        The bars with trend and indicators.
+    """
+    first = warm_up_start(df.index, start, warm_up=warm_up)
+    # The trend and indicators overwrite their columns.
+    tail = df.iloc[first:].copy()
+    tail = trend_calculation.calculate_trend(tail, **trend_kwargs)
+    tail = indicators.calculate_indicators(tail, indicator_kwargs=indicator_kwargs)
+    return pd.concat([df.iloc[:start], tail.iloc[start - first :]])
+
+
+def merge_hits(
+    path: str, hit_indices: list[np.ndarray], start: int
+) -> tuple[list[np.ndarray], str]:
+    """
+    Replaces the patterns of a detection file from a bar on.
+
+    Parameters
+    ----------
+    path : str
+        Path of the detection file.
+    hit_indices : list[np.ndarray]
+        Sorted indices of the candles with a pattern from ``start`` on, one array
+        per pattern in the order of the file.
+    start : int
+        Position of the first bar to replace.
+
+    Returns
+    -------
+    tuple[list[np.ndarray], str]
+        Sorted indices of the candles with a pattern, one array per pattern, and the
+        layout of the file.
+    """
+    header, data = pattern_matrix.read_pattern_matrix(path)
+    merged = []
+    for i, pattern_hits in enumerate(hit_indices):
+        old_hits = pattern_matrix.pattern_hits(header, data, i)
+        merged.append(
+            np.concatenate([old_hits[old_hits < start], pattern_hits]).astype(np.int64)
+        )
+    return merged, header["layout"]
+
+
+def update_detection(  # noqa: PLR0913
+    path: str,
+    split_df: pd.DataFrame,
+    split_calibration: dict,
+    start: int,
+    *,
+    settings: dict,
+    split: int,
+    patterns: list[dict],
+    features: dict | None = None,
+) -> None:
+    """
+    Detects the patterns on the bars from ``start`` on and merges them into a
+    detection file, see ``merge_hits``.
+
+    Parameters
+    ----------
+    path : str
+        Path of the detection file.
+    split_df : pd.DataFrame
+        The split with OHLC data, "gap", trend and indicators.
+    split_calibration : dict
+        Calibration of the detection file, see ``calibration.resolve_calibration``.
+    start : int
+        Position of the first bar to detect patterns on.
+    settings : dict
+        Settings of the run, see ``update_run``.
+    split : int
+        Number of the split.
+    patterns : list[dict]
+        Patterns of the run.
+    features : dict | None, optional, default None
+        Numeric features of the bars the patterns look back on, from
+        ``compiled_detection.MAX_LAG`` bars before ``start`` on, see
+        ``pattern_detection.detect_hit_indices``.
+    """
+    # The bars before the appended ones that the patterns look back on.
+    first = max(start - compiled_detection.MAX_LAG, 0)
+    hit_indices = pattern_detection.detect_hit_indices(
+        split_df.iloc[first:],
+        split_calibration,
+        settings["data_gap_handling"],
+        filter_kwargs=settings["filter_kwargs"],
+        split=split,
+        engine=settings["engine"],
+        workers=settings["workers"],
+        patterns=patterns,
+        features=features,
+    )
+    hit_indices, storage = merge_hits(
+        path,
+        [
+            pattern_hits[pattern_hits >= start - first] + first
+            for pattern_hits in hit_indices
+        ],
+        start,
+    )
+    pattern_detection.write_detection(
+        path, hit_indices, patterns=patterns, number_bars=len(split_df), storage=storage
+    )
+
+
+def restore_split_rows(run_name: str, *, patterns: list[dict], split: int) -> None:
+    """
+    Restores the evaluation rows of the splits before ``split``, which
+    ``cleanup.clean`` keeps next to the aggregated evaluation.
+
+    Parameters
+    ----------
+    run_name : str
+        The run name.
+    patterns : list[dict]
+        The evaluated patterns.
+    split : int
+        Number of the split that is evaluated again.
+    """
+    for pattern in patterns:
+        csv_path = (
+            f"data/runs/{run_name}/evaluation/{pattern['number']}/{pattern['name']}"
+        )
+        with open(f"{csv_path}_splits.csv") as file:
+            rows = file.readlines()[: split - 1]
+        with open(f"{csv_path}_evaluation.csv", "w") as file:
+            file.writelines(rows)
+
+
+def update_run(  # noqa: PLR0913
+    filename: str,
+    interval_minutes: int,
+    start_end_time: tuple[str, str],
+    *,
+    run_name: str,
+    settings: dict,
+    patterns: list[dict],
+) -> bool:
+    """
+    Updates a run with the bars appended to its raw data since it was run.
+
+    The splits and calibrations of the run are kept, the appended bars extend its last
+    split. The trend and indicators are only recalculated on the appended bars and
+    their warm-up, and patterns are only detected on the appended bars, for the
+    calibration of the run and for those of its percentile sweep. The last split is
+    evaluated again, also for the margins of the margin sweep, which resolves the
+    patterns that had no outcome before the end of the data, and the evaluation is
+    aggregated again.
+
+    Parameters
+    ----------
+    filename : str
+        Filename of the data to read on disk.
+    interval_minutes : int
+        Number of minutes over which the data is aggregated.
+    start_end_time : tuple[str]
+        Start and end time of the filtering operation.
+    run_name : str
+        The run name.
+    settings : dict
+        Settings of the run, with ``"warm_up"`` (see ``warm_up_start``),
+        ``"trend_kwargs"``, ``"indicator_kwargs"``, ``"data_gap_handling"``,
+        ``"filter_kwargs"``, ``"engine"``, ``"workers"``, ``"margins"`` and
+        ``"margin_grid"`` (see ``evaluation.stop_loss_take_profit_sweep``).
+    patterns : list[dict]
+        Patterns of the run.
+
+    Returns
+    -------
+    bool
+        Whether bars were appended.
+    """
+    stored_df, split_calibration, split = load_split(run_name)
+    aggregated_df = read_data.read_and_aggregate(
+        filename, interval_minutes, start_end_time
+    )
+    aggregated_df = aggregated_df[aggregated_df.index >= stored_df.index[0]]
+    start = appended_start(stored_df[aggregated_df.columns], aggregated_df)
+    if start == len(aggregated_df) == len(stored_df):
+        return False
+
+    split_df = recalculate_tail(
+        pd.concat([stored_df.iloc[:start], aggregated_df.iloc[start:]]),
+        start,
+        warm_up=settings["warm_up"],
+        trend_kwargs=settings["trend_kwargs"],
+        indicator_kwargs=settings["indicator_kwargs"],
+    )
+
+    update_detection(
+        f"data/runs/{run_name}/detection/{split}.patterns",
+        split_df,
+        split_calibration,
+        start,
+        settings=settings,
+        split=split,
+        patterns=patterns,
+    )
+    if sweep_calibrations := load_sweep_calibrations(run_name, split):
+        # The candles are measured once for all calibrations of the sweep.
+        first = max(start - compiled_detection.MAX_LAG, 0)
+        features = cf.numeric_features(
+            *(
+                split_df[col].iloc[first:].to_numpy(dtype=float)
+                for col in ["open", "high", "low", "close"]
+            )
+        )
+        for tag, sweep_calibration in sweep_calibrations.items():
+            update_detection(
+                f"data/runs/{run_name}/sweep/{tag}/{split}.patterns",
+                split_df,
+                sweep_calibration,
+                start,
+                settings=settings,
+                split=split,
+                patterns=patterns,
+                features=features,
+            )
+    save_split(split_df, split_calibration, run_name=run_name, split=split)
+
+    restore_split_rows(run_name, patterns=patterns, split=split)
+    evaluation.stop_loss_take_profit_evaluation(
+        split_df, settings["margins"], run_name=run_name, split=split
+    )
+    if settings["margin_grid"]:
+        evaluation.stop_loss_take_profit_sweep(
+            split_df, settings["margin_grid"], run_name=run_name, split=split
+        )
+    cleanup.clean(run_name, patterns=patterns)
+    return True
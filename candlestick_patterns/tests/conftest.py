@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from calibration import calibration
+
+
+@pytest.fixture
+def ohlc_df() -> pd.DataFrame:
+    """Random walk bars with opening gaps, a trend and gaps in the data."""
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.integers(-3, 4, 3000)) / 10
+    bars = pd.DataFrame(
+        {"open": np.roll(close, 1) + rng.integers(-1, 2, 3000) / 10, "close": close}
+    )
+    bars["high"] = bars[["open", "close"]].max(axis=1) + rng.integers(0, 3, 3000) / 10
+    bars["low"] = bars[["open", "close"]].min(axis=1) - rng.integers(0, 3, 3000) / 10
+    bars["trend"] = rng.integers(-1, 2, 3000).astype(float)
+    bars.loc[:9, "trend"] = np.nan
+    bars["gap"] = rng.random(3000) < 0.02
+    return bars
+
+
+@pytest.fixture
+def percentile() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Unified body percentiles and upper and lower shadow percentiles."""
+    return (
+        np.array([0.05, 0.15, 0.35]),
+        np.array([0.05, 0.1, 0.15, 0.25]),
+        np.array([0.05, 0.1, 0.15, 0.25]),
+    )
+
+
+@pytest.fixture
+def thresholds(percentile: tuple) -> dict:
+    """Calibration of ``percentile``."""
+    return calibration.resolve_calibration(percentile)
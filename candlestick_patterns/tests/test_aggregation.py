@@ -1,6 +1,6 @@
 import pandas as pd
 
-from src.aggregation import aggregate
+from aggregation import aggregate
 
 default_data = {
     "open": [100, 105, 110, 115, 120, 125],
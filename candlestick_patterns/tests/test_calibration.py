@@ -0,0 +1,23 @@
+from pathlib import Path
+
+import numpy as np
+
+from calibration import calibration
+
+
+def test_unified_calibration_matches_split(percentile: tuple) -> None:
+    unified = calibration.resolve_calibration(percentile)
+    split = calibration.resolve_calibration((percentile[0], *percentile))
+    assert calibration.calibration_json(unified) == calibration.calibration_json(split)
+    assert unified["doji"] == 0.05
+    np.testing.assert_array_equal(unified["short_body"], [0.05, 0.15])
+
+
+def test_calibration_round_trip(tmp_path: Path, percentile: tuple) -> None:
+    split = calibration.resolve_calibration((np.array([0.1, 0.2, 0.4]), *percentile))
+    path = str(tmp_path / "1.json")
+    calibration.save_calibration(path, split)
+    loaded = calibration.load_calibration(path)
+    assert calibration.calibration_json(loaded) == calibration.calibration_json(split)
+    assert loaded["near"] == (0.2 + 0.15) / 2
+    np.testing.assert_array_equal(loaded["short_body"], [0.1, 0.15])
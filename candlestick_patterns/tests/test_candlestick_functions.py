@@ -0,0 +1,106 @@
+import numpy as np
+
+from calibration import calibration
+from detection.patterns.functions import candlestick_functions as cf
+
+OP = np.array([100.0, 104.0, 104.0, 120.0, np.nan])
+H = np.array([105.0, 106.0, 104.5, 121.0, np.nan])
+L = np.array([99.0, 100.0, 103.5, 101.0, np.nan])
+C = np.array([104.0, 101.0, 104.0, 102.0, np.nan])
+default_calibration = calibration.resolve_calibration(
+    (
+        np.array([1.0, 3.0, 10.0]),
+        np.array([0.5, 1.0, 2.0, 4.0]),
+        np.array([0.5, 1.0, 2.0, 4.0]),
+    )
+)
+split_calibration = calibration.resolve_calibration(
+    (
+        np.array([1.0, 4.0, 15.0]),
+        np.array([0.5, 2.0, 8.0]),
+        np.array([0.5, 1.0, 2.0, 4.0]),
+        np.array([0.5, 1.0, 2.0, 4.0]),
+    )
+)
+
+
+def test_candle_features_match_helpers() -> None:
+    for thresholds in [default_calibration, split_calibration]:
+        features = cf.candle_features(OP, H, L, C, thresholds)
+        np.testing.assert_array_equal(features["body_height"], cf.body_height(OP, C))
+        np.testing.assert_array_equal(
+            features["upper_shadow_length"], cf.upper_shadow_length(OP, H, C)
+        )
+        np.testing.assert_array_equal(
+            features["tall_black_body"], cf.tall_black_body(OP, C, thresholds)
+        )
+        np.testing.assert_array_equal(
+            features["short_body"], cf.short_body(OP, C, thresholds)
+        )
+        np.testing.assert_array_equal(
+            features["exlong_ls"], cf.exlong_ls(OP, L, C, thresholds)
+        )
+
+
+def test_candle_codes_match_features() -> None:
+    rng = np.random.default_rng(0)
+    C = 100 + np.cumsum(rng.integers(-3, 4, 1000)) / 2
+    OP = np.roll(C, 1) + rng.integers(-1, 2, 1000) / 2
+    H = np.maximum(OP, C) + rng.integers(0, 9, 1000) / 2
+    L = np.minimum(OP, C) - rng.integers(0, 9, 1000) / 2
+    OP[3], H[5], L[7], C[9] = np.nan, np.nan, np.nan, np.nan
+    for thresholds in [default_calibration, split_calibration]:
+        features = cf.candle_features(OP, H, L, C, thresholds)
+        decoded = cf.code_features(cf.candle_codes(OP, H, L, C, thresholds))
+        assert set(decoded) == {
+            name for name, feature in features.items() if feature.dtype == bool
+        }
+        for name, feature in decoded.items():
+            np.testing.assert_array_equal(feature, features[name])
+    assert not any(
+        feature.any()
+        for feature in cf.code_features(np.zeros(1, dtype=np.uint16)).values()
+    )
+
+
+def test_candle_features_missing_candle() -> None:
+    features = cf.candle_features(OP, H, L, C, default_calibration)
+    assert np.isnan(features["body_height"][-1])
+    assert not any(
+        feature[-1] for feature in features.values() if feature.dtype == bool
+    )
+
+
+def test_shift() -> None:
+    features = cf.candle_features(OP, H, L, C, default_calibration)
+    shifted_black = cf.shift(features["black_body"], 2)
+    shifted_body = cf.shift(features["body_height"], 2)
+    assert shifted_black.dtype == bool
+    assert not shifted_black[:2].any()
+    np.testing.assert_array_equal(shifted_black[2:], features["black_body"][:-2])
+    assert np.isnan(shifted_body[:2]).all()
+    np.testing.assert_array_equal(shifted_body[2:], features["body_height"][:-2])
+    assert cf.shift(features["doji"], 0) is features["doji"]
+
+
+def test_lagged_features() -> None:
+    features = cf.candle_features(OP, H, L, C, default_calibration)
+    lagged = cf.lagged_features(features, 3)
+    assert len(lagged) == 4
+    for n, lagged_dict in enumerate(lagged):
+        for name, feature in features.items():
+            np.testing.assert_array_equal(lagged_dict[name], cf.shift(feature, n))
+    assert np.shares_memory(lagged[0]["doji"], lagged[3]["doji"])
+    assert not lagged[1]["close"].flags.writeable
+
+
+def test_rising_highs_match_shifted_comparisons() -> None:
+    rng = np.random.default_rng(6)
+    highs = np.cumsum(rng.integers(-1, 4, (2, 300)), axis=1).astype(float)
+    highs[0, 50] = np.nan
+    rising = cf.rising_highs(highs)
+    for k in range(2, 14):
+        expected = np.logical_and.reduce(
+            [cf.shift(highs, n + 1) < cf.shift(highs, n) for n in range(k - 1)]
+        )
+        np.testing.assert_array_equal(rising >= k - 1, expected)
@@ -0,0 +1,20 @@
+import numpy as np
+
+from analysis import co_occurrence
+
+
+def test_co_occurrence_matches_masks() -> None:
+    rng = np.random.default_rng(5)
+    masks = rng.random((6, 500)) < [[0.0], [0.01], [0.05], [0.1], [0.3], [0.3]]
+    masks[5] = masks[4]
+    hit_indices = [np.flatnonzero(mask) for mask in masks]
+    counts = co_occurrence.co_occurrence(hit_indices, 500, lags=[0, 2])
+    for i in range(6):
+        for j in range(6):
+            assert counts[0, i, j] == (masks[i] & masks[j]).sum()
+            assert counts[1, i, j] == (masks[i, :-2] & masks[j, 2:]).sum()
+
+    similarity = co_occurrence.jaccard(counts[0])
+    assert np.isnan(similarity[0, 0])
+    assert similarity[4, 5] == 1
+    assert similarity[1, 2] == (masks[1] & masks[2]).sum() / (masks[1] | masks[2]).sum()
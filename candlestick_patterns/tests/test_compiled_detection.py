@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from detection import compiled_detection, pattern_registry
+from detection.patterns.functions import candlestick_functions as cf
+
+
+@pytest.mark.parametrize("backend", ["numpy", "numba"])
+def test_compiled_detection_matches_functions(
+    backend: str, ohlc_df: pd.DataFrame, thresholds: dict
+) -> None:
+    OP, H, L, C = ohlc_df[["open", "high", "low", "close"]].to_numpy().T
+    T = ohlc_df["trend"].to_numpy()
+    candles = [
+        {
+            name: cf.shift(feature, n)
+            for name, feature in cf.candle_features(OP, H, L, C, thresholds).items()
+        }
+        for n in range(12, -1, -1)
+    ]
+    feature_dict = {
+        **cf.numeric_features(OP, H, L, C),
+        "code": cf.candle_codes(OP, H, L, C, thresholds),
+    }
+    patterns = [
+        pattern
+        for pattern in pattern_registry.PATTERNS
+        if pattern["shape_id"] == pattern["id"]
+    ]
+    specs = {pattern["name"]: pattern["spec"] for pattern in patterns}
+    compiled_patterns = compiled_detection.detect(
+        specs, feature_dict, thresholds, backend=backend
+    )
+    assert compiled_patterns.any()
+    np.testing.assert_array_equal(
+        compiled_detection.detect(
+            specs, feature_dict, thresholds, backend=backend, workers=3
+        ),
+        compiled_patterns,
+    )
+    for column, pattern in enumerate(patterns):
+        number_candles = pattern["number_candles"]
+        pattern_candles = (
+            candles[-1] if number_candles == 1 else candles[-number_candles:]
+        )
+        np.testing.assert_array_equal(
+            compiled_patterns[:, column],
+            pattern["function"](pattern_candles, T, thresholds),
+        )
+
+
+def test_evaluation_plan_shares_subexpressions() -> None:
+    steps, outputs = compiled_detection.evaluation_plan(
+        [
+            compiled_detection.spec_expression(spec)
+            for spec in [
+                {"candles": 2, "conditions": ["near(c1.close, c2.close)"]},
+                {
+                    "candles": 3,
+                    "conditions": ["c2.close > c1.open", "near(c2.close, c3.close)"],
+                },
+                {"candles": 3, "conditions": ["c1.open < c2.close"]},
+            ]
+        ]
+    )
+    (near_step, near_lag), _, (compare_step, compare_lag) = outputs
+    assert (near_lag, compare_lag) == (0, 1)
+    assert set(steps[outputs[1][0]][2]) == {(near_step, 0), (compare_step, 1)}
+
+
+def test_spec_with_unknown_candle() -> None:
+    with pytest.raises(ValueError, match="Cannot compile"):
+        compiled_detection.spec_expression(
+            {"candles": 2, "conditions": ["c3.close > c1.close"]}
+        )
+
+
+def test_selective_detection_matches_plan(
+    ohlc_df: pd.DataFrame, thresholds: dict
+) -> None:
+    OP, H, L, C = ohlc_df[["open", "high", "low", "close"]].to_numpy().T
+    feature_dict = {
+        **cf.numeric_features(OP, H, L, C),
+        "code": cf.candle_codes(OP, H, L, C, thresholds),
+    }
+    specs = {
+        pattern["name"]: pattern["spec"]
+        for pattern in pattern_registry.PATTERNS
+        if pattern["shape_id"] == pattern["id"]
+    }
+    selective_patterns, statistics = compiled_detection.detect_selective(
+        specs, feature_dict, thresholds, workers=2
+    )
+    np.testing.assert_array_equal(
+        selective_patterns,
+        compiled_detection.detect(specs, feature_dict, thresholds, backend="numpy"),
+    )
+    for column, conditions in enumerate(statistics.values()):
+        assert conditions[0]["evaluated"] == len(C)
+        for condition, next_condition in zip(conditions, conditions[1:], strict=False):
+            assert condition["passed"] == next_condition["evaluated"]
+        assert conditions[-1]["passed"] == selective_patterns[:, column].sum()
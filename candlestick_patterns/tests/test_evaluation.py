@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from evaluation import evaluation
+
+rng = np.random.default_rng(7)
+open_array = 100 + np.cumsum(rng.normal(0, 0.1, 500))
+bars = pd.DataFrame(
+    {
+        "open": open_array,
+        "high": open_array + rng.exponential(0.1, 500),
+        "low": open_array - rng.exponential(0.1, 500),
+        "ATR": rng.uniform(0.1, 0.5, 500),
+    }
+)
+bars.iloc[200:230, :3] = np.nan
+bars.iloc[:14, 3] = np.nan
+
+
+@pytest.mark.parametrize(
+    ("margins", "half_width"),
+    [
+        ({"ATR": None}, bars["ATR"].to_numpy()),
+        ({"constant": 0.3}, np.full(500, 0.3)),
+        ({"percentage": 0.2}, open_array * 0.002),
+        ({"constant": 1.5}, np.full(500, 1.5)),
+    ],
+)
+def test_outcomes_match_forward_scan(margins: dict, half_width: np.ndarray) -> None:
+    outcomes, bars_to_exit = evaluation.first_passage_outcomes(bars, margins)
+    open_, high, low, _ = bars.to_numpy().T
+    for i in range(500):
+        upper = np.flatnonzero(high[i + 1 :] > open_[i] + half_width[i])
+        lower = np.flatnonzero(low[i + 1 :] < open_[i] - half_width[i])
+        exit_at = min([*upper[:1], *lower[:1], np.inf])
+        if exit_at == np.inf:
+            assert outcomes[i] == -1
+            assert bars_to_exit[i] == -1
+        else:
+            assert outcomes[i] == (upper[:1] == exit_at).any()
+            assert bars_to_exit[i] == exit_at + 1
+    with pytest.raises(ValueError, match="No correct margin"):
+        evaluation.first_passage_outcomes(bars, {"fixed": 1})
+
+
+def test_margin_grid_matches_single_margins() -> None:
+    margin_grid = [{"ATR": 0.5}, {"ATR": (1, 3)}, {"percentage": (1, 0.2)}]
+    outcomes, bars_to_exit = evaluation.first_passage_grid(bars, margin_grid)
+    for m, margins in enumerate(margin_grid):
+        expected = evaluation.first_passage_outcomes(bars, margins)
+        np.testing.assert_array_equal(outcomes[m], expected[0])
+        np.testing.assert_array_equal(bars_to_exit[m], expected[1])
+    assert evaluation.margin_tag(margin_grid[1]) == "ATR_1-3"
+    assert evaluation.margin_tag({"constant": np.float32(0.5)}) == "constant_0.5-0.5"
+    with pytest.raises(ValueError, match="exactly one method"):
+        evaluation.margin_tag({"ATR": 1, "constant": 0.5})
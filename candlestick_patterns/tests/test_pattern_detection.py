@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+
+from calibration import calibration
+from detection import pattern_detection, pattern_registry
+from detection.patterns import one_patterns, two_patterns
+from detection.patterns.functions import candlestick_functions as cf
+
+rng = np.random.default_rng(1)
+
+
+def test_trend_variants_match_functions(
+    ohlc_df: pd.DataFrame, thresholds: dict
+) -> None:
+    candles = [
+        {
+            name: cf.shift(feature, n)
+            for name, feature in cf.candle_features(
+                *(ohlc_df[col].to_numpy() for col in ["open", "high", "low", "close"]),
+                thresholds,
+            ).items()
+        }
+        for n in range(1, -1, -1)
+    ]
+    T = ohlc_df["trend"].to_numpy()
+    for pattern, patterns in pattern_detection.detect_patterns(
+        ohlc_df, thresholds, engine="functions"
+    ):
+        if pattern["number"] == "one":
+            expected = getattr(one_patterns, pattern["name"])(
+                candles[-1], T, thresholds
+            )
+        elif pattern["number"] == "two":
+            expected = getattr(two_patterns, pattern["name"])(candles, T, thresholds)
+        else:
+            continue
+        np.testing.assert_array_equal(patterns, expected)
+
+
+def test_parallel_detection_matches_serial(
+    ohlc_df: pd.DataFrame, thresholds: dict
+) -> None:
+    for (_, serial), (_, parallel) in zip(
+        pattern_detection.detect_patterns(ohlc_df, thresholds, engine="functions"),
+        pattern_detection.detect_patterns(
+            ohlc_df, thresholds, engine="functions", workers=3
+        ),
+        strict=True,
+    ):
+        np.testing.assert_array_equal(serial, parallel)
+
+
+def test_detect_selected_patterns(ohlc_df: pd.DataFrame, thresholds: dict) -> None:
+    selected = pattern_registry.select_patterns({"globs": ["hammer_*", "doji_*"]})
+    all_patterns = {
+        pattern["name"]: pattern_mask
+        for pattern, pattern_mask in pattern_detection.detect_patterns(
+            ohlc_df, thresholds, engine="functions"
+        )
+    }
+    detected = list(
+        pattern_detection.detect_patterns(
+            ohlc_df, thresholds, engine="functions", patterns=selected
+        )
+    )
+    assert [pattern for pattern, _ in detected] == selected
+    for pattern, pattern_mask in detected:
+        np.testing.assert_array_equal(pattern_mask, all_patterns[pattern["name"]])
+
+
+def test_handle_gaps_on_hit_indices() -> None:
+    gap = pd.Series(rng.random(3000) < 0.05)
+    pattern_mask = rng.random(3000) < 0.2
+    for mode in ["exclude", "ignore", "only"]:
+        np.testing.assert_array_equal(
+            pattern_detection.handle_gaps(np.flatnonzero(pattern_mask), gap, 3, mode),
+            np.flatnonzero(pattern_detection.handle_gaps(pattern_mask, gap, 3, mode)),
+        )
+
+
+def test_panel_detection_matches_single_assets(
+    ohlc_df: pd.DataFrame, thresholds: dict, percentile: tuple
+) -> None:
+    second_df = ohlc_df.iloc[::-1].reset_index(drop=True)
+    second_df["trend"] = ohlc_df["trend"]
+    second_thresholds = calibration.resolve_calibration(
+        (
+            np.array([0.05, 0.1, 0.3]),
+            np.array([0.1, 0.2, 0.4]),
+            *percentile[1:],
+        )
+    )
+    panel = {
+        col: np.stack([ohlc_df[col], second_df[col]])
+        for col in ["open", "high", "low", "close", "trend"]
+    }
+    for engine in ["functions", "numpy"]:
+        for (_, panel_mask), (_, first), (_, second) in zip(
+            pattern_detection.detect_panel(
+                panel, [thresholds, second_thresholds], engine=engine
+            ),
+            pattern_detection.detect_patterns(ohlc_df, thresholds, engine=engine),
+            pattern_detection.detect_patterns(
+                second_df, second_thresholds, engine=engine
+            ),
+            strict=True,
+        ):
+            np.testing.assert_array_equal(panel_mask, [first, second])
+
+
+def test_gap_windows_match_shifted_gaps() -> None:
+    gap = pd.Series(rng.random(3000) < 0.05)
+    windows = pattern_detection.gap_windows(gap, range(1, 14))
+    for number_candles, window in windows.items():
+        shifted = [gap.shift(n, fill_value=True) for n in range(number_candles)]
+        np.testing.assert_array_equal(window, np.logical_or.reduce(shifted))
+    assert pattern_detection.gap_windows(gap.iloc[:2], [5])[5].all()
+
+
+def test_percentile_grid_shares_features(ohlc_df: pd.DataFrame) -> None:
+    ohlc = ohlc_df[["open", "high", "low", "close"]].to_numpy()
+    default = {"body": [10, 30, 70], "shadow": [10, 30, 70, 90]}
+    grid_calibrations = calibration.percentile_grid(
+        ohlc, [default, {"body": [20, 40, 60], "shadow": [5, 25, 75, 95]}]
+    )
+    assert list(grid_calibrations) == [
+        "body_10-30-70_shadow_10-30-70-90",
+        "body_20-40-60_shadow_5-25-75-95",
+    ]
+    expected = calibration.resolve_calibration(calibration.calculate_percentiles(ohlc))
+    for name, threshold in grid_calibrations[calibration.grid_tag(default)].items():
+        np.testing.assert_array_equal(threshold, expected[name])
+
+    features = cf.numeric_features(*ohlc.T)
+    for grid_calibration in grid_calibrations.values():
+        for (_, expected), (_, shared) in zip(
+            pattern_detection.detect_patterns(
+                ohlc_df, grid_calibration, engine="numpy"
+            ),
+            pattern_detection.detect_patterns(
+                ohlc_df, grid_calibration, engine="numpy", features=features
+            ),
+            strict=True,
+        ):
+            np.testing.assert_array_equal(shared, expected)
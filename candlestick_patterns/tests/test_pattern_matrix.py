@@ -0,0 +1,60 @@
+from pathlib import Path
+
+import numpy as np
+
+from shared import pattern_matrix
+
+
+def test_pattern_matrix_roundtrip(tmp_path: Path) -> None:
+    rng = np.random.default_rng(0)
+    patterns = rng.random((3, 21)) < 0.3
+    path = str(tmp_path / "1.patterns")
+    pattern_matrix.write_pattern_matrix(
+        path,
+        np.packbits(patterns, axis=1),
+        numbers=["one", "one", "two"],
+        names=["doji_", "doji_no_trend", "engulfing_bullish_"],
+        number_bars=21,
+    )
+    header, packed_patterns = pattern_matrix.read_pattern_matrix(path)
+    assert header["numbers"] == ["one", "one", "two"]
+    assert header["names"][2] == "engulfing_bullish_"
+    assert packed_patterns.offset % pattern_matrix.ALIGNMENT == 0
+    for packed_pattern, pattern in zip(packed_patterns, patterns, strict=True):
+        np.testing.assert_array_equal(
+            pattern_matrix.unpack_pattern(packed_pattern, 21), pattern
+        )
+
+
+def test_hit_indices_roundtrip(tmp_path: Path) -> None:
+    rng = np.random.default_rng(0)
+    patterns = rng.random((3, 21)) < 0.1
+    path = str(tmp_path / "1.patterns")
+    pattern_matrix.write_hit_indices(
+        path,
+        [pattern_matrix.mask_to_hits(pattern) for pattern in patterns],
+        numbers=["one", "one", "two"],
+        names=["doji_", "doji_no_trend", "engulfing_bullish_"],
+        number_bars=21,
+    )
+    header, data = pattern_matrix.read_pattern_matrix(path)
+    assert header["layout"] == "hits"
+    assert data.offset % pattern_matrix.ALIGNMENT == 0
+    for i, pattern in enumerate(patterns):
+        np.testing.assert_array_equal(
+            pattern_matrix.pattern_hits(header, data, i), np.flatnonzero(pattern)
+        )
+        np.testing.assert_array_equal(
+            pattern_matrix.pattern_mask(header, data, i), pattern
+        )
+
+
+def test_pattern_aliases() -> None:
+    hit_indices = [
+        np.array([1, 5, 8]),
+        np.array([], dtype=int),
+        np.array([1, 5, 8], dtype=np.int32),
+        np.array([], dtype=int),
+        np.array([1, 5]),
+    ]
+    assert pattern_matrix.pattern_aliases(hit_indices) == [0, 1, 0, 3, 4]
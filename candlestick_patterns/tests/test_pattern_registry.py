@@ -0,0 +1,89 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from detection import pattern_detection, pattern_registry
+from detection.patterns import one_patterns
+from shared import constants
+
+
+def test_trend_variant() -> None:
+    assert pattern_registry.trend_variant("hammer_", one_patterns) == (
+        "hammer",
+        "hammer_no_trend",
+        -1,
+    )
+    assert pattern_registry.trend_variant("hammer_opp_trend", one_patterns) == (
+        "hammer",
+        "hammer_no_trend",
+        1,
+    )
+    assert pattern_registry.trend_variant(
+        "doji_long_legged_up_trend", one_patterns
+    ) == (
+        "doji_long_legged",
+        "doji_long_legged_",
+        1,
+    )
+
+
+def test_registry() -> None:
+    patterns = pattern_registry.PATTERNS
+    assert len(patterns) == constants.TOTAL_NUMBER_OF_PATTERNS
+    assert [pattern["id"] for pattern in patterns] == list(range(len(patterns)))
+    hammer = pattern_registry.PATTERNS_BY_NAME["hammer_"]
+    assert hammer["number"] == "one"
+    assert hammer["number_candles"] == 1
+    assert hammer["family"] == "hammer"
+    assert hammer["trend_variant"] == ""
+    assert hammer["expected_signal"] == "buy"
+    assert patterns[hammer["shape_id"]]["name"] == "hammer_no_trend"
+    assert pattern_registry.PATTERNS_BY_NAME["hammer_opp_trend"]["expected_signal"] == (
+        "sell"
+    )
+    assert (
+        pattern_registry.PATTERNS_BY_NAME["doji_long_legged_"]["expected_signal"]
+        == "any"
+    )
+
+
+def test_select_patterns() -> None:
+    assert pattern_registry.select_patterns({}) == pattern_registry.PATTERNS
+    selected = pattern_registry.select_patterns(
+        {"number_candles": [1, 2], "globs": ["*_no_trend"]}
+    )
+    assert selected
+    assert all(pattern["name"].endswith("_no_trend") for pattern in selected)
+    assert {pattern["number_candles"] for pattern in selected} == {1, 2}
+    assert [
+        pattern["name"]
+        for pattern in pattern_registry.select_patterns({"families": ["hammer"]})
+    ] == ["hammer_", "hammer_no_trend", "hammer_opp_trend"]
+    with pytest.raises(ValueError, match="Unknown"):
+        pattern_registry.select_patterns({"colors": ["white"]})
+    with pytest.raises(ValueError, match="No patterns"):
+        pattern_registry.select_patterns({"names": ["not_a_pattern"]})
+
+
+def test_specs_match_docstrings() -> None:
+    for pattern in pattern_registry.PATTERNS:
+        spec = pattern["spec"]
+        assert spec["candles"] == pattern["number_candles"]
+        assert f"Trend: {spec['trend']}." in pattern["function"].__doc__
+        assert f"Prediction: {spec['prediction']}." in pattern["function"].__doc__
+
+
+def test_run_patterns(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    selected = pattern_registry.select_patterns({"globs": ["hammer_*", "doji_*"]})
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("data/runs/run/detection")
+    pattern_detection.write_detection(
+        "data/runs/run/detection/1.patterns",
+        [np.array([3, 5])] * len(selected),
+        patterns=selected,
+        number_bars=10,
+        storage="hits",
+    )
+    assert pattern_registry.run_patterns("run") == selected
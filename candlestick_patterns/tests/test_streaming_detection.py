@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from detection import pattern_detection, pattern_registry, streaming_detection
+from trend import trend_calculation
+
+trend_kwargs = {
+    "averaging_method": "EMA",
+    "averaging_kwargs": {},
+    "decision_method": "monotonic",
+    "decision_kwargs": {},
+}
+
+
+@pytest.fixture
+def streamed_df(ohlc_df: pd.DataFrame) -> pd.DataFrame:
+    """The bars without trend, with missing bars."""
+    streamed_df = ohlc_df.drop(columns="trend")
+    streamed_df.loc[700:702, ["open", "high", "low", "close"]] = np.nan
+    return streamed_df
+
+
+@pytest.mark.parametrize(
+    ("backend", "mode", "selection"),
+    [
+        ("numpy", "exclude", {}),
+        ("numpy", "only", {"number_candles": [1, 3, 13]}),
+        ("numba", "ignore", {"number_candles": [2, 5, 10]}),
+    ],
+)
+def test_streaming_matches_batch(
+    backend: str,
+    mode: str,
+    selection: dict,
+    streamed_df: pd.DataFrame,
+    thresholds: dict,
+) -> None:
+    patterns = pattern_registry.select_patterns(selection)
+    batch_df = trend_calculation.calculate_trend(streamed_df.copy(), **trend_kwargs)
+    batch_hits = {
+        pattern["name"]: pattern_detection.handle_gaps(
+            np.flatnonzero(pattern_mask),
+            batch_df["gap"],
+            pattern["number_candles"],
+            mode,
+        )
+        for pattern, pattern_mask in pattern_detection.detect_patterns(
+            batch_df, thresholds, engine="functions", patterns=patterns
+        )
+    }
+    state = streaming_detection.detector_state(
+        thresholds,
+        mode,
+        trend=trend_calculation.trend_state(**trend_kwargs),
+        patterns=patterns,
+        backend=backend,
+    )
+    streamed_hits = {pattern["name"]: [] for pattern in patterns}
+    for i, bar in enumerate(streamed_df.to_dict("records")):
+        for pattern in streaming_detection.update(state, bar):
+            streamed_hits[pattern["name"]].append(i)
+    assert any(len(hits) for hits in batch_hits.values())
+    for name, hits in batch_hits.items():
+        np.testing.assert_array_equal(streamed_hits[name], hits)
+
+
+def test_streaming_trend_matches_batch(streamed_df: pd.DataFrame) -> None:
+    for averaging_method in ["SMA", "WMA", "EMA"]:
+        for decision_method in ["monotonic", "counting", "high_low", "PSAR"]:
+            kwargs = {
+                "averaging_method": averaging_method,
+                "averaging_kwargs": {},
+                "decision_method": decision_method,
+                "decision_kwargs": {},
+            }
+            state = trend_calculation.trend_state(**kwargs)
+            np.testing.assert_array_equal(
+                [
+                    trend_calculation.update_trend(state, bar)
+                    for bar in streamed_df.to_dict("records")
+                ],
+                trend_calculation.calculate_trend(streamed_df.copy(), **kwargs)[
+                    "trend"
+                ],
+            )
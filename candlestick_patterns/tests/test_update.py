@@ -0,0 +1,227 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from detection import pattern_detection, pattern_registry
+from evaluation import cleanup, evaluation
+from indicators import indicators
+from reading import read_data
+from shared import constants, pattern_matrix
+from trend import trend_calculation
+from update import update
+
+rng = np.random.default_rng(4)
+index = pd.DatetimeIndex(
+    np.concatenate(
+        [
+            pd.date_range(f"{date.date()} 09:35", f"{date.date()} 16:00", freq="5min")
+            for date in pd.bdate_range("2021-03-01", periods=40)
+        ]
+    )
+)
+close = 100 + np.cumsum(rng.integers(-5, 6, len(index))) / 100
+bars = pd.DataFrame(
+    {
+        "open": np.roll(close, 1),
+        "close": close,
+        "volume": rng.integers(1, 99, len(index)),
+    },
+    index=index,
+)
+bars["high"] = (
+    bars[["open", "close"]].max(axis=1) + rng.integers(0, 4, len(index)) / 100
+)
+bars["low"] = bars[["open", "close"]].min(axis=1) - rng.integers(0, 4, len(index)) / 100
+bars["gap"] = False
+trend_kwargs = {
+    "averaging_method": "EMA",
+    "averaging_kwargs": {},
+    "decision_method": "monotonic",
+    "decision_kwargs": {},
+}
+
+
+def calculate(split_df: pd.DataFrame) -> pd.DataFrame:
+    split_df = trend_calculation.calculate_trend(split_df, **trend_kwargs)
+    return indicators.calculate_indicators(split_df, indicator_kwargs={})
+
+
+def test_appended_start() -> None:
+    stored = bars.iloc[:1000].copy()
+    stored.iloc[990:, :4] = np.nan
+    assert update.appended_start(stored, bars) == 990
+    assert update.appended_start(bars, bars) == len(bars)
+    with pytest.raises(ValueError, match="no longer"):
+        update.appended_start(bars, bars.drop(index[500]))
+
+
+def test_recalculated_tail_matches_full_calculation() -> None:
+    expected = calculate(bars.copy())
+    stored = calculate(bars.iloc[:2500].copy())
+    tail = update.recalculate_tail(
+        pd.concat([stored, bars.iloc[2500:]]),
+        2500,
+        warm_up={"bars": 1000, "days": 10},
+        trend_kwargs=trend_kwargs,
+        indicator_kwargs={},
+    )
+    pd.testing.assert_frame_equal(tail, expected[tail.columns], rtol=1e-9)
+
+
+def detected_hits(path: str) -> list[np.ndarray]:
+    header, data = pattern_matrix.read_pattern_matrix(path)
+    return [
+        pattern_matrix.pattern_hits(header, data, i)
+        for i in range(len(header["names"]))
+    ]
+
+
+@pytest.mark.parametrize("storage", ["hits", "packed"])
+def test_update_detection_matches_full_detection(
+    storage: str,
+    thresholds: dict,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("data/runs/run/detection")
+    path = "data/runs/run/detection/1.patterns"
+    patterns = pattern_registry.select_patterns({"number_candles": [1, 2, 10, 12]})
+    split_df = trend_calculation.calculate_trend(bars.copy(), **trend_kwargs)
+    # Ten and twelve new price lines are detected on the first bars from start on.
+    start = 2410
+    split_df.iloc[[start - 12, start + 8], split_df.columns.get_loc("gap")] = True
+    settings = {
+        "data_gap_handling": "exclude",
+        "filter_kwargs": {},
+        "engine": "numpy",
+        "workers": 1,
+    }
+
+    def hit_indices(detected_df: pd.DataFrame) -> list[np.ndarray]:
+        return pattern_detection.detect_hit_indices(
+            detected_df,
+            thresholds,
+            "exclude",
+            split=1,
+            patterns=patterns,
+            **{key: settings[key] for key in ["filter_kwargs", "engine", "workers"]},
+        )
+
+    pattern_detection.write_detection(
+        path,
+        hit_indices(split_df.iloc[:start]),
+        patterns=patterns,
+        number_bars=start,
+        storage=storage,
+    )
+    update.update_detection(
+        path,
+        split_df,
+        thresholds,
+        start,
+        settings=settings,
+        split=1,
+        patterns=patterns,
+    )
+    header, _ = pattern_matrix.read_pattern_matrix(path)
+    assert header["number_bars"] == len(split_df)
+    assert header["layout"] == storage
+    expected = hit_indices(split_df)
+    assert any(
+        (
+            (pattern_hits >= start) & (pattern_hits < start + pattern["number_candles"])
+        ).any()
+        for pattern, pattern_hits in zip(patterns, expected, strict=True)
+        if pattern["number_candles"] > 8
+    )
+    for pattern_hits, expected_hits in zip(detected_hits(path), expected, strict=True):
+        np.testing.assert_array_equal(pattern_hits, expected_hits)
+
+
+def test_restore_split_rows(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    patterns = pattern_registry.select_patterns({"names": ["hammer_"]})
+    csv_path = f"data/runs/run/evaluation/{patterns[0]['number']}/hammer_"
+    os.makedirs(os.path.dirname(csv_path))
+    with open(f"{csv_path}_splits.csv", "w") as file:
+        file.writelines(f"0.{split}+,0.5+,{split}\n" for split in range(1, 6))
+    with open(f"{csv_path}_evaluation.csv", "w") as file:
+        file.write("aggregated\n")
+    update.restore_split_rows("run", patterns=patterns, split=4)
+    with open(f"{csv_path}_evaluation.csv") as file:
+        assert file.read() == "0.1+,0.5+,1\n0.2+,0.5+,2\n0.3+,0.5+,3\n"
+
+
+def test_update_run_matches_detection_of_updated_split(
+    thresholds: dict, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    patterns = pattern_registry.select_patterns({"number_candles": [1, 3, 13]})
+    for folder in ["raw", "runs/run/detection"] + [
+        f"runs/run/evaluation/{number}"
+        for number in constants.PATTERN_NUMBERS_AS_STRING
+    ]:
+        os.makedirs(f"data/{folder}")
+    raw = bars[["open", "high", "low", "close", "volume"]].reset_index(names="datetime")
+    raw.iloc[:2000].to_parquet("data/raw/bars.parquet")
+    split_df = calculate(
+        read_data.read_and_aggregate("bars", 5, constants.START_END_TIME)
+    )
+    update.save_split(split_df, thresholds, run_name="run", split=1)
+    pattern_detection.detection(
+        split_df,
+        thresholds,
+        "exclude",
+        run_name="run",
+        filter_kwargs={},
+        split=1,
+        engine="numpy",
+        workers=1,
+        patterns=patterns,
+    )
+    evaluation.stop_loss_take_profit_evaluation(
+        split_df, {"ATR": None}, run_name="run", split=1
+    )
+    cleanup.clean("run", patterns=patterns)
+
+    raw.to_parquet("data/raw/bars.parquet")
+    settings = {
+        "warm_up": {"bars": 1000, "days": 10},
+        "trend_kwargs": trend_kwargs,
+        "indicator_kwargs": {},
+        "data_gap_handling": "exclude",
+        "filter_kwargs": {},
+        "engine": "numpy",
+        "workers": 1,
+        "margins": {"ATR": None},
+        "margin_grid": [],
+    }
+    update_kwargs = {"run_name": "run", "settings": settings, "patterns": patterns}
+    assert update.update_run("bars", 5, constants.START_END_TIME, **update_kwargs)
+    assert not update.update_run("bars", 5, constants.START_END_TIME, **update_kwargs)
+
+    updated_df, _, split = update.load_split("run")
+    assert len(updated_df) > len(split_df)
+    expected = pattern_detection.detect_hit_indices(
+        updated_df,
+        thresholds,
+        "exclude",
+        filter_kwargs={},
+        split=split,
+        engine="numpy",
+        workers=1,
+        patterns=patterns,
+    )
+    detected = detected_hits("data/runs/run/detection/1.patterns")
+    for pattern_hits, expected_hits in zip(detected, expected, strict=True):
+        np.testing.assert_array_equal(pattern_hits, expected_hits)
+    evaluated = pd.read_csv(
+        f"data/runs/run/evaluation/{patterns[0]['number']}/"
+        f"{patterns[0]['name']}_splits.csv",
+        header=None,
+    )
+    assert len(evaluated) == 1